@@ -13,11 +13,19 @@ from baserow.api.decorators import (
 )
 from baserow.api.schemas import get_error_schema
 from baserow.api.utils import DiscriminatorCustomFieldsMappingSerializer
-from baserow.core.jobs.exceptions import JobDoesNotExist, MaxJobCountExceeded
+from baserow.core.jobs.exceptions import (
+    JobDoesNotExist,
+    JobNotCancellable,
+    MaxJobCountExceeded,
+)
 from baserow.core.jobs.handler import JobHandler
 from baserow.core.jobs.registries import job_type_registry
 
-from .errors import ERROR_JOB_DOES_NOT_EXIST, ERROR_MAX_JOB_COUNT_EXCEEDED
+from .errors import (
+    ERROR_JOB_DOES_NOT_EXIST,
+    ERROR_JOB_NOT_CANCELLABLE,
+    ERROR_MAX_JOB_COUNT_EXCEEDED,
+)
 from .serializers import CreateJobSerializer, JobSerializer, ListJobQuerySerializer
 
 
@@ -161,3 +169,46 @@ class JobView(APIView):
         job = JobHandler().get_job(request.user, job_id)
         serializer = job_type_registry.get_serializer(job, JobSerializer)
         return Response(serializer.data)
+
+
+class CancelJobView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The job id to cancel.",
+            )
+        ],
+        tags=["Jobs"],
+        operation_id="cancel_job",
+        description=(
+            "Cancels the provided pending or running job. Only job types that "
+            "commit their work in chunks can be cancelled. The work that has "
+            "already been committed is cleaned up in the background."
+        ),
+        request=None,
+        responses={
+            200: DiscriminatorCustomFieldsMappingSerializer(
+                job_type_registry, JobSerializer
+            ),
+            400: get_error_schema(["ERROR_JOB_NOT_CANCELLABLE"]),
+            404: get_error_schema(["ERROR_JOB_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            JobDoesNotExist: ERROR_JOB_DOES_NOT_EXIST,
+            JobNotCancellable: ERROR_JOB_NOT_CANCELLABLE,
+        }
+    )
+    def post(self, request, job_id):
+        """Cancels the job related to the provided id."""
+
+        job = JobHandler().get_job(request.user, job_id)
+        job = JobHandler().cancel_job(job.specific)
+        serializer = job_type_registry.get_serializer(job, JobSerializer)
+        return Response(serializer.data)
@@ -3,6 +3,7 @@ from django.urls import include, path
 
 from drf_spectacular.views import SpectacularJSONAPIView, SpectacularRedocView
 
+from baserow.core.profiling import metrics_view
 from baserow.core.registries import application_type_registry, plugin_registry
 
 from .applications import urls as application_urls
@@ -42,6 +43,7 @@ urlpatterns = (
         path("jobs/", include(jobs_urls, namespace="jobs")),
         path("snapshots/", include(snapshots_urls, namespace="snapshots")),
         path("_health/", public_health_check, name="public_health_check"),
+        path("_metrics/", metrics_view, name="metrics"),
     ]
     + application_type_registry.api_urls
     + plugin_registry.api_urls
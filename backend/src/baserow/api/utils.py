@@ -1,6 +1,8 @@
 from contextlib import contextmanager
 from typing import Callable, Dict, Optional, Tuple, Type, Union
 
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import parse_etags, patch_cache_control
 from django.utils.encoding import force_str
 
 from rest_framework import serializers, status
@@ -429,3 +431,50 @@ class DiscriminatorMappingSerializer:
         self.type_field_name = type_field_name
         self.many = many
         self.partial = False
+
+
+def _strip_weak_etag_prefix(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def get_not_modified_response(
+    request: Request, etag: Optional[str]
+) -> Optional[HttpResponseNotModified]:
+    """
+    Returns a `304 Not Modified` response if the `If-None-Match` header of the request
+    matches the provided etag. The etags are compared using the weak comparison
+    because the responses are only semantically equivalent.
+
+    :param request: The request that might contain the `If-None-Match` header.
+    :param etag: The etag of the response that would be returned. If None, the
+        response doesn't have an etag and is never considered not modified.
+    :return: The not modified response if the etag matches, None otherwise.
+    """
+
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if etag is None or not if_none_match:
+        return None
+
+    etags = {_strip_weak_etag_prefix(e) for e in parse_etags(if_none_match)}
+    if "*" not in etags and _strip_weak_etag_prefix(etag) not in etags:
+        return None
+
+    response = HttpResponseNotModified()
+    set_etag_headers(response, etag)
+    return response
+
+
+def set_etag_headers(response: HttpResponse, etag: Optional[str]):
+    """
+    Adds the etag to the response. The client must revalidate the response before
+    using it again, because the etag is the only thing telling if it changed.
+
+    :param response: The response to add the etag to.
+    :param etag: The etag of the response. Nothing is added if None.
+    """
+
+    if etag is None:
+        return
+
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
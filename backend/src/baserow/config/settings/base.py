@@ -77,12 +77,14 @@ if BASEROW_BACKEND_PLUGIN_NAMES:
     INSTALLED_APPS.extend(BASEROW_BACKEND_PLUGIN_NAMES)
 
 MIDDLEWARE = [
+    "baserow.middleware.RequestProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "baserow.middleware.ReadReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "baserow.middleware.BaserowCustomHttp404Middleware",
@@ -129,6 +131,97 @@ BASEROW_GROUP_STORAGE_USAGE_QUEUE = os.getenv(
 
 BASEROW_COUNT_ROWS_ENABLED = os.getenv("BASEROW_COUNT_ROWS_ENABLED", "false") == "true"
 
+# When enabled, every row change is appended to the change log of its table so that
+# integrations can fetch the changes since their last sync.
+BASEROW_ROW_CHANGE_LOG_ENABLED = (
+    os.getenv("BASEROW_ROW_CHANGE_LOG_ENABLED", "false") == "true"
+)
+BASEROW_ROW_CHANGE_LOG_RETENTION_HOURS = int(
+    os.getenv("BASEROW_ROW_CHANGE_LOG_RETENTION_HOURS", 24 * 7)
+)
+BASEROW_ROW_CHANGE_LOG_CLEANUP_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_ROW_CHANGE_LOG_CLEANUP_INTERVAL_MINUTES", 60)
+)
+
+# When enabled, btree indexes are created in the background for the fields that are
+# sorted on or filtered by in the views of tables with at least
+# BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS rows, and dropped again when not used anymore.
+BASEROW_FIELD_INDEX_ADVISOR_ENABLED = (
+    os.getenv("BASEROW_FIELD_INDEX_ADVISOR_ENABLED", "false") == "true"
+)
+BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS = int(
+    os.getenv("BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS", 10000)
+)
+BASEROW_FIELD_INDEX_ADVISOR_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_FIELD_INDEX_ADVISOR_INTERVAL_MINUTES", 60)
+)
+BASEROW_FIELD_INDEX_ADVISOR_RETRY_SECONDS = int(
+    os.getenv("BASEROW_FIELD_INDEX_ADVISOR_RETRY_SECONDS", 60)
+)
+
+# Queries on the rows of a table that take longer than this number of milliseconds are
+# stored in the slow table query log together with the configuration of the view and
+# an `EXPLAIN (ANALYZE, BUFFERS)` sample. Disabled if 0.
+BASEROW_SLOW_TABLE_QUERY_THRESHOLD_MS = int(
+    os.getenv("BASEROW_SLOW_TABLE_QUERY_THRESHOLD_MS", 0)
+)
+# At most one slow query per table and view is captured within this number of seconds.
+BASEROW_SLOW_TABLE_QUERY_COOLDOWN_SECONDS = int(
+    os.getenv("BASEROW_SLOW_TABLE_QUERY_COOLDOWN_SECONDS", 60)
+)
+BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES = int(
+    os.getenv("BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES", 1000)
+)
+BASEROW_SLOW_TABLE_QUERY_EXPLAIN = (
+    os.getenv("BASEROW_SLOW_TABLE_QUERY_EXPLAIN", "true") == "true"
+)
+BASEROW_SLOW_TABLE_QUERY_EXPLAIN_TIMEOUT_MS = int(
+    os.getenv("BASEROW_SLOW_TABLE_QUERY_EXPLAIN_TIMEOUT_MS", 30000)
+)
+
+# The responses of the public grid and gallery view row endpoints are cached for this
+# number of seconds. A cached response is only served as long as the data of the table
+# hasn't changed, so this mainly limits the memory used by responses of requests that
+# are never repeated. Disabled if 0.
+BASEROW_PUBLIC_VIEW_ROWS_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_PUBLIC_VIEW_ROWS_CACHE_TIMEOUT", 300)
+)
+
+# The realtime events of a table are buffered for this number of milliseconds after
+# the first one and then sent to the subscribed clients as a single batch in which
+# consecutive row updates are merged. Disabled if 0.
+BASEROW_WS_COALESCE_WINDOW_MS = int(os.getenv("BASEROW_WS_COALESCE_WINDOW_MS", 0))
+# The buffered events are sent before the window ends when there are this many.
+BASEROW_WS_COALESCE_MAX_MESSAGES = int(
+    os.getenv("BASEROW_WS_COALESCE_MAX_MESSAGES", 100)
+)
+
+# When enabled, the query count and the time spent in the database, cache, model
+# generation, serialization and permission checks are measured for every request and
+# celery task, and exposed as Prometheus histograms at /api/_metrics/. The histograms
+# are stored in redis hashes shared by all the processes, or in the memory of every
+# process if the default cache isn't backed by redis.
+BASEROW_REQUEST_PROFILING_ENABLED = (
+    os.getenv("BASEROW_REQUEST_PROFILING_ENABLED", "false") == "true"
+)
+# Labels the request histograms with the id of the table in the url as well. Note that
+# this creates a series per table and endpoint.
+BASEROW_REQUEST_PROFILING_TABLE_LABEL = (
+    os.getenv("BASEROW_REQUEST_PROFILING_TABLE_LABEL", "false") == "true"
+)
+# If set, the metrics endpoint can only be scraped with this value as bearer token.
+BASEROW_REQUEST_PROFILING_METRICS_TOKEN = os.getenv(
+    "BASEROW_REQUEST_PROFILING_METRICS_TOKEN", ""
+)
+# Profiled requests and tasks that take longer than this number of milliseconds are
+# logged together with their slowest queries. Disabled if 0.
+BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS = int(
+    os.getenv("BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS", 0)
+)
+BASEROW_SLOW_REQUEST_LOG_TOP_QUERIES = int(
+    os.getenv("BASEROW_SLOW_REQUEST_LOG_TOP_QUERIES", 5)
+)
+
 CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
     "baserow.contrib.database.export.tasks.run_export_job": {"queue": "export"},
@@ -194,19 +287,25 @@ else:
         }
     }
 
+# The time spent in the cache is only measured when request profiling is enabled.
+CACHE_OPTIONS = (
+    {"CLIENT_CLASS": "baserow.core.profiling.ProfilingCacheClient"}
+    if BASEROW_REQUEST_PROFILING_ENABLED
+    else {}
+)
 GENERATED_MODEL_CACHE_NAME = "generated-models"
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": REDIS_URL,
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": CACHE_OPTIONS,
         "KEY_PREFIX": "baserow-default-cache",
         "VERSION": VERSION,
     },
     GENERATED_MODEL_CACHE_NAME: {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": REDIS_URL,
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": CACHE_OPTIONS,
         "KEY_PREFIX": f"baserow-{GENERATED_MODEL_CACHE_NAME}-cache",
         "VERSION": None,
     },
@@ -217,6 +316,26 @@ CACHES = {
 # going to be any relations between the application schema and the user schema.
 USER_TABLE_DATABASE = "default"
 
+# A comma separated list of database urls of read only replicas of the default
+# database. The read queries of API requests are spread over these replicas until the
+# request writes something, see `baserow.core.db_router.ReadReplicaRouter`.
+BASEROW_READ_REPLICA_DATABASES = []
+for index, replica_url in enumerate(
+    url.strip()
+    for url in os.getenv("BASEROW_READ_REPLICA_DATABASE_URLS", "").split(",")
+    if url.strip()
+):
+    replica_alias = f"read-replica-{index}"
+    DATABASES[replica_alias] = dj_database_url.parse(replica_url, conn_max_age=600)
+    DATABASES[replica_alias]["TEST"] = {"MIRROR": "default"}
+    BASEROW_READ_REPLICA_DATABASES.append(replica_alias)
+# The number of seconds that a user keeps reading from the default database after
+# writing something, so that the replication lag doesn't hide their own changes.
+BASEROW_READ_REPLICA_STICKY_SECONDS = int(
+    os.getenv("BASEROW_READ_REPLICA_STICKY_SECONDS", 10)
+)
+DATABASE_ROUTERS = ["baserow.core.db_router.ReadReplicaRouter"]
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -488,6 +607,12 @@ FROM_EMAIL = os.getenv("FROM_EMAIL", "no-reply@localhost")
 RESET_PASSWORD_TOKEN_MAX_AGE = 60 * 60 * 48  # 48 hours
 
 ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
+# How many related values of a link row, multiple select or multiple collaborators
+# cell can be requested at once, both as preview when listing rows and when
+# paginating through the related values of a single cell.
+RELATED_VALUES_PAGE_SIZE_LIMIT = int(
+    os.getenv("BASEROW_RELATED_VALUES_PAGE_SIZE_LIMIT", 200)
+)
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
@@ -561,6 +686,11 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of trash entries, like rows of the same table, that are
+# permanently deleted together in one transaction.
+BASEROW_TRASH_PERMANENT_DELETION_CHUNK_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_CHUNK_SIZE", 1000)
+)
 
 MAX_ROW_COMMENT_LENGTH = 10000
 
@@ -576,6 +706,16 @@ MAX_FIELD_REFERENCE_DEPTH = 1000
 DONT_UPDATE_FORMULAS_AFTER_MIGRATION = bool(
     os.getenv("DONT_UPDATE_FORMULAS_AFTER_MIGRATION", "")
 )
+# The number of parsed formula expressions kept in memory per process, so that the
+# same formula doesn't have to be parsed again every time a model is generated.
+BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_EXPRESSION_CACHE_SIZE", 1000)
+)
+# The number of databases of which the field dependency graph is kept in memory per
+# process, so that finding the dependants of changed fields doesn't need a query.
+BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE = int(
+    os.getenv("BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE", 100)
+)
 
 BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES", 8)
@@ -644,6 +784,17 @@ BASEROW_JOB_SOFT_TIME_LIMIT = int(
 BASEROW_JOB_CLEANUP_INTERVAL_MINUTES = int(
     os.getenv("BASEROW_JOB_CLEANUP_INTERVAL_MINUTES", 5)  # 5 minutes
 )
+# The minimum amount of seconds between two progress writes of a running job. Progress
+# updates happening in between are coalesced in memory. State changes and reaching 100%
+# are always written immediately.
+BASEROW_JOB_PROGRESS_PERSIST_INTERVAL_SECONDS = float(
+    os.getenv("BASEROW_JOB_PROGRESS_PERSIST_INTERVAL_SECONDS", 1)
+)
+# The number of rows that are converted per committed chunk when the type of a field is
+# converted online.
+BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE = int(
+    os.getenv("BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE", 10000)
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
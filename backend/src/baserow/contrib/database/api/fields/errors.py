@@ -110,9 +110,19 @@ ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_UNIQUE_VALUES = (
     HTTP_400_BAD_REQUEST,
     "The requested field type is not compatible with generating unique values.",
 )
+ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES = (
+    "ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES",
+    HTTP_400_BAD_REQUEST,
+    "The requested field type does not have a list of related values.",
+)
 ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT = (
     "ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT",
     HTTP_409_CONFLICT,
     "The requested field is already being updated or used by another operation, "
     "please try again after other concurrent operations have finished.",
 )
+ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE = (
+    "ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE",
+    HTTP_400_BAD_REQUEST,
+    "{e}",
+)
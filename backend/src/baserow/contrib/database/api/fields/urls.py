@@ -3,6 +3,7 @@ from django.urls import re_path
 from baserow.contrib.database.fields.registries import field_type_registry
 
 from .views import (
+    AsyncConvertFieldView,
     AsyncDuplicateFieldView,
     FieldsView,
     FieldView,
@@ -24,4 +25,9 @@ urlpatterns = field_type_registry.api_urls + [
         AsyncDuplicateFieldView.as_view(),
         name="async_duplicate",
     ),
+    re_path(
+        r"(?P<field_id>[0-9]+)/convert/async/$",
+        AsyncConvertFieldView.as_view(),
+        name="async_convert",
+    ),
 ]
@@ -29,6 +29,8 @@ from baserow.api.schemas import (
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.utils import (
     DiscriminatorCustomFieldsMappingSerializer,
+    get_not_modified_response,
+    set_etag_headers,
     type_from_data_or_registry,
     validate_data_custom_fields,
 )
@@ -51,6 +53,7 @@ from baserow.contrib.database.api.tables.errors import (
 )
 from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
 from baserow.contrib.database.api.tokens.errors import ERROR_NO_PERMISSION_TO_TABLE
+from baserow.contrib.database.api.utils import get_table_data_etag
 from baserow.contrib.database.fields.actions import (
     CreateFieldActionType,
     DeleteFieldActionType,
@@ -72,7 +75,10 @@ from baserow.contrib.database.fields.exceptions import (
     ReservedBaserowFieldNameException,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.job_types import DuplicateFieldJobType
+from baserow.contrib.database.fields.job_types import (
+    ConvertFieldJobType,
+    DuplicateFieldJobType,
+)
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.operations import (
     CreateFieldOperationType,
@@ -110,6 +116,9 @@ from .serializers import (
 DuplicateFieldJobTypeSerializer = job_type_registry.get(
     DuplicateFieldJobType.type
 ).get_serializer_class(base_class=JobSerializer)
+ConvertFieldJobTypeSerializer = job_type_registry.get(
+    ConvertFieldJobType.type
+).get_serializer_class(base_class=JobSerializer)
 
 
 class FieldsView(APIView):
@@ -179,6 +188,11 @@ class FieldsView(APIView):
             request, ["read", "create", "update"], table, False
         )
 
+        etag = get_table_data_etag(request, table)
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         fields = specific_iterator(
             Field.objects.filter(table=table)
             .select_related("content_type")
@@ -189,7 +203,9 @@ class FieldsView(APIView):
             field_type_registry.get_serializer(field, FieldSerializer).data
             for field in fields
         ]
-        return Response(data)
+        response = Response(data)
+        set_etag_headers(response, etag)
+        return response
 
     @extend_schema(
         parameters=[
@@ -594,3 +610,77 @@ class AsyncDuplicateFieldView(APIView):
 
         serializer = job_type_registry.get_serializer(job, JobSerializer)
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class AsyncConvertFieldView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The field to convert.",
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table fields"],
+        operation_id="convert_table_field",
+        description=(
+            "Starts a job that updates the field with the provided `field_id` like "
+            "the update field endpoint, but converts the data of the field to the new "
+            "type in the background without locking the table. The rows can still be "
+            "read and changed while the data is converted. Only fields that store "
+            "their value in a column of the table and don't need a field converter "
+            "can be converted this way, otherwise the "
+            "`ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE` error is returned."
+        ),
+        request=DiscriminatorCustomFieldsMappingSerializer(
+            field_type_registry,
+            UpdateFieldSerializer,
+            request=True,
+        ),
+        responses={
+            202: ConvertFieldJobTypeSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_MAX_JOB_COUNT_EXCEEDED",
+                    "ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE",
+                    "ERROR_INCOMPATIBLE_PRIMARY_FIELD_TYPE",
+                ]
+            ),
+            404: get_error_schema(["ERROR_FIELD_DOES_NOT_EXIST"]),
+            409: get_error_schema(["ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            MaxJobCountExceeded: ERROR_MAX_JOB_COUNT_EXCEEDED,
+        }
+    )
+    def post(self, request: Request, field_id: int) -> Response:
+        """Creates a job to convert a field to another type online."""
+
+        field = FieldHandler().get_field(field_id)
+        type_name = type_from_data_or_registry(request.data, field_type_registry, field)
+        field_values = {
+            key: value for key, value in request.data.items() if key != "type"
+        }
+
+        job_type = job_type_registry.get(ConvertFieldJobType.type)
+        with job_type.map_api_exceptions():
+            job = JobHandler().create_and_start_job(
+                request.user,
+                ConvertFieldJobType.type,
+                field_id=field_id,
+                new_type=type_name,
+                field_values=field_values,
+            )
+
+        serializer = job_type_registry.get_serializer(job, JobSerializer)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
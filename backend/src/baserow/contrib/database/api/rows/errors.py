@@ -11,3 +11,34 @@ ERROR_ROW_IDS_NOT_UNIQUE = (
     HTTP_400_BAD_REQUEST,
     "The provided row ids {e.ids} are not unique.",
 )
+
+ERROR_INVALID_UPSERT_MATCH_FIELD = (
+    "ERROR_INVALID_UPSERT_MATCH_FIELD",
+    HTTP_400_BAD_REQUEST,
+    "The provided match field can't be used to find existing rows.",
+)
+
+ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE = (
+    "ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE",
+    HTTP_400_BAD_REQUEST,
+    "The provided match field values {e.values} are not unique.",
+)
+
+ERROR_ROW_CHANGE_LOG_DISABLED = (
+    "ERROR_ROW_CHANGE_LOG_DISABLED",
+    HTTP_400_BAD_REQUEST,
+    "The row change log is not enabled on this instance.",
+)
+
+ERROR_INVALID_ROW_CHANGE_CURSOR = (
+    "ERROR_INVALID_ROW_CHANGE_CURSOR",
+    HTTP_400_BAD_REQUEST,
+    "The provided cursor is invalid.",
+)
+
+ERROR_ROW_CHANGE_CURSOR_EXPIRED = (
+    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+    HTTP_400_BAD_REQUEST,
+    "The changes after the provided cursor are no longer available, all rows must "
+    "be synchronized again.",
+)
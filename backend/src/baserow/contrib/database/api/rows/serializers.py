@@ -10,7 +10,9 @@ from rest_framework import serializers
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.api.utils import get_serializer_class
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.row_changes.models import RowChange
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.core.profiling import profile_section
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,10 @@ class RowSerializer(serializers.ModelSerializer):
         )
         extra_kwargs = {"id": {"read_only": True}, "order": {"read_only": True}}
 
+    @profile_section("serialization")
+    def to_representation(self, instance):
+        return super().to_representation(instance)
+
 
 def get_row_serializer_class(
     model,
@@ -343,6 +349,39 @@ class BatchCreateRowsQueryParamsSerializer(serializers.Serializer):
     before = serializers.IntegerField(required=False)
 
 
+class BatchUpsertRowsQueryParamsSerializer(serializers.Serializer):
+    match_field = serializers.CharField(required=True)
+
+
+class ListRowChangesQueryParamsSerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(
+        required=False,
+        default=100,
+        min_value=1,
+        max_value=settings.BATCH_ROWS_SIZE_LIMIT,
+    )
+
+
+class RowChangeSerializer(serializers.ModelSerializer):
+    action = serializers.CharField(source="get_action_display")
+
+    class Meta:
+        model = RowChange
+        fields = ("action", "row_ids", "field_ids", "created_on")
+
+
+class RowChangesSerializer(serializers.Serializer):
+    cursor = serializers.CharField(
+        allow_null=True,
+        help_text="The cursor that must be provided to get the next changes.",
+    )
+    has_more = serializers.BooleanField(
+        help_text="Indicates whether more changes are available right away."
+    )
+    changes = RowChangeSerializer(many=True)
+
+
 class ListRowsQueryParamsSerializer(serializers.Serializer):
     user_field_names = serializers.BooleanField(required=False, default=False)
     search = serializers.CharField(required=False)
@@ -351,6 +390,9 @@ class ListRowsQueryParamsSerializer(serializers.Serializer):
     exclude = serializers.CharField(required=False)
     filter_type = serializers.CharField(required=False, default="")
     view_id = serializers.IntegerField(required=False)
+    related_values_limit = serializers.IntegerField(
+        required=False, min_value=1, max_value=settings.RELATED_VALUES_PAGE_SIZE_LIMIT
+    )
 
 
 class BatchUpdateRowsSerializer(serializers.Serializer):
@@ -3,9 +3,12 @@ from django.urls import re_path
 from .views import (
     BatchDeleteRowsView,
     BatchRowsView,
+    BatchUpsertRowsView,
     RowAdjacentView,
+    RowChangesView,
     RowMoveView,
     RowNamesView,
+    RowRelatedValuesView,
     RowsView,
     RowView,
 )
@@ -29,11 +32,27 @@ urlpatterns = [
         BatchRowsView.as_view(),
         name="batch",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/batch-upsert/$",
+        BatchUpsertRowsView.as_view(),
+        name="batch-upsert",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/batch-delete/$",
         BatchDeleteRowsView.as_view(),
         name="batch-delete",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/changes/$",
+        RowChangesView.as_view(),
+        name="changes",
+    ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/field/(?P<field_id>[0-9]+)/"
+        r"related-values/$",
+        RowRelatedValuesView.as_view(),
+        name="related_values",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/move/$",
         RowMoveView.as_view(),
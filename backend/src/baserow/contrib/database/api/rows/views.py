@@ -28,17 +28,25 @@ from baserow.api.schemas import (
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
     get_error_schema,
 )
+from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
-from baserow.api.utils import validate_data
+from baserow.api.utils import get_not_modified_response, set_etag_headers, validate_data
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FILTER_FIELD_NOT_FOUND,
+    ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES,
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
 )
+from baserow.contrib.database.api.fields.serializers import LinkRowValueSerializer
 from baserow.contrib.database.api.rows.errors import (
+    ERROR_INVALID_ROW_CHANGE_CURSOR,
+    ERROR_INVALID_UPSERT_MATCH_FIELD,
+    ERROR_ROW_CHANGE_CURSOR_EXPIRED,
+    ERROR_ROW_CHANGE_LOG_DISABLED,
     ERROR_ROW_DOES_NOT_EXIST,
     ERROR_ROW_IDS_NOT_UNIQUE,
+    ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE,
 )
 from baserow.contrib.database.api.rows.serializers import (
     GetRowAdjacentSerializer,
@@ -47,7 +55,10 @@ from baserow.contrib.database.api.rows.serializers import (
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
 from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
 from baserow.contrib.database.api.tokens.errors import ERROR_NO_PERMISSION_TO_TABLE
-from baserow.contrib.database.api.utils import get_include_exclude_fields
+from baserow.contrib.database.api.utils import (
+    get_include_exclude_fields,
+    get_table_data_etag,
+)
 from baserow.contrib.database.api.views.errors import (
     ERROR_VIEW_DOES_NOT_EXIST,
     ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
@@ -56,6 +67,7 @@ from baserow.contrib.database.api.views.errors import (
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FilterFieldNotFound,
+    IncompatibleFieldTypeForRelatedValues,
     OrderByFieldNotFound,
     OrderByFieldNotPossible,
 )
@@ -63,6 +75,15 @@ from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
 )
+from baserow.contrib.database.fields.related_values_preview import (
+    get_related_values_counts,
+)
+from baserow.contrib.database.row_changes.exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+    RowChangeLogDisabled,
+)
+from baserow.contrib.database.row_changes.handler import RowChangeHandler
 from baserow.contrib.database.rows.actions import (
     CreateRowActionType,
     CreateRowsActionType,
@@ -71,8 +92,14 @@ from baserow.contrib.database.rows.actions import (
     MoveRowActionType,
     UpdateRowActionType,
     UpdateRowsActionType,
+    UpsertRowsActionType,
+)
+from baserow.contrib.database.rows.exceptions import (
+    InvalidUpsertMatchField,
+    RowDoesNotExist,
+    RowIdsNotUnique,
+    UpsertMatchValuesNotUnique,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.operations import (
     ReadAdjacentRowDatabaseRowOperationType,
@@ -103,9 +130,12 @@ from .schemas import row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
+    BatchUpsertRowsQueryParamsSerializer,
     CreateRowQueryParamsSerializer,
+    ListRowChangesQueryParamsSerializer,
     ListRowsQueryParamsSerializer,
     MoveRowQueryParamsSerializer,
+    RowChangesSerializer,
     RowSerializer,
     get_batch_row_serializer_class,
     get_example_batch_rows_serializer_class,
@@ -244,6 +274,20 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Includes all the filters and sorts of the provided view.",
             ),
+            OpenApiParameter(
+                name="related_values_limit",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description=(
+                    "If provided only the first related values up to this limit are "
+                    "returned for every link row, multiple select and multiple "
+                    "collaborators cell. The total number of related values of these "
+                    "cells is then added to the response in the "
+                    "`related_values_counts` object keyed by the row id and the field "
+                    "name. All the related values of a cell can be listed with the "
+                    "**list_database_table_row_related_values** endpoint."
+                ),
+            ),
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
@@ -317,12 +361,19 @@ class RowsView(APIView):
         )
 
         TokenHandler().check_table_permissions(request, "read", table, False)
+
+        etag = get_table_data_etag(request, table)
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         search = query_params.get("search")
         order_by = query_params.get("order_by")
         include = query_params.get("include")
         exclude = query_params.get("exclude")
         user_field_names = query_params.get("user_field_names")
         view_id = query_params.get("view_id")
+        related_values_limit = query_params.get("related_values_limit")
         fields = get_include_exclude_fields(
             table, include, exclude, user_field_names=user_field_names
         )
@@ -331,7 +382,9 @@ class RowsView(APIView):
             fields=fields,
             field_ids=[] if fields else None,
         )
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            related_values_limit=related_values_limit
+        )
 
         if view_id:
             view_handler = ViewHandler()
@@ -364,8 +417,23 @@ class RowsView(APIView):
             model, RowSerializer, is_response=True, user_field_names=user_field_names
         )
         serializer = serializer_class(page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+
+        if related_values_limit is not None:
+            field_names = {
+                field_object["field"].id: (
+                    field_object["field"].name
+                    if user_field_names
+                    else field_object["name"]
+                )
+                for field_object in model._field_objects.values()
+            }
+            response.data.update(
+                related_values_counts=get_related_values_counts(page, field_names)
+            )
 
-        return paginator.get_paginated_response(serializer.data)
+        set_etag_headers(response, etag)
+        return response
 
     @extend_schema(
         parameters=[
@@ -1206,6 +1274,143 @@ class BatchRowsView(APIView):
         return Response(response_serializer.data)
 
 
+class BatchUpsertRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Upserts the rows in the table.",
+            ),
+            OpenApiParameter(
+                name="match_field",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description=(
+                    "The id of the field used to find the existing rows, or the "
+                    "name of the field if `user_field_names` is provided."
+                ),
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect and return the user specified field names instead of "
+                    "internal Baserow field names (field_123 etc)."
+                ),
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+            CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_upsert_database_table_rows",
+        description=(
+            "Updates the existing rows in the table that have the same value for "
+            "the `match_field` as the provided rows and creates the rows for which "
+            "no existing row is found, if the user has access to the related "
+            "table's group. The accepted body fields are the same as the "
+            "**batch_create_database_table_rows** endpoint. The match field can't "
+            "be a read only or a many to many field. If multiple existing rows have "
+            "the same match value, the one with the lowest id is updated. The rows "
+            "are returned in the same order as they were provided."
+            "\n\n **WARNING:** This endpoint doesn't yet work with row created and "
+            "updated webhooks."
+        ),
+        request=get_example_batch_rows_serializer_class(
+            example_type="post", user_field_names=True
+        ),
+        responses={
+            200: get_example_batch_rows_serializer_class(
+                example_type="get", user_field_names=True
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                    "ERROR_INVALID_UPSERT_MATCH_FIELD",
+                    "ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            InvalidUpsertMatchField: ERROR_INVALID_UPSERT_MATCH_FIELD,
+            UpsertMatchValuesNotUnique: ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    @validate_query_parameters(BatchUpsertRowsQueryParamsSerializer)
+    def post(self, request: Request, table_id: int, query_params) -> Response:
+        """
+        Updates the existing rows having the same match field value as the provided
+        rows and creates the others for the given table_id.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "create", table, False)
+        TokenHandler().check_table_permissions(request, "update", table, False)
+        model = table.get_model()
+
+        user_field_names = "user_field_names" in request.GET
+        match_field_value = query_params["match_field"]
+        try:
+            match_field = next(
+                field_object["field"]
+                for field_object in model._field_objects.values()
+                if (
+                    field_object["field"].name == match_field_value
+                    if user_field_names
+                    else str(field_object["field"].id) == match_field_value
+                )
+            )
+        except StopIteration:
+            raise FieldDoesNotExist(
+                f"The field {match_field_value} does not exist in the table."
+            )
+
+        row_validation_serializer = get_row_serializer_class(
+            model, user_field_names=user_field_names
+        )
+        validation_serializer = get_batch_row_serializer_class(
+            row_validation_serializer
+        )
+        data = validate_data(
+            validation_serializer, request.data, partial=True, return_validated=True
+        )
+
+        try:
+            rows = action_type_registry.get_by_type(UpsertRowsActionType).do(
+                request.user, table, data["items"], match_field, model
+            )
+        except ValidationError as exc:
+            raise RequestBodyValidationException(detail=exc.message)
+
+        response_row_serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        response_serializer_class = get_batch_row_serializer_class(
+            response_row_serializer_class
+        )
+        response_serializer = response_serializer_class({"items": rows})
+        return Response(response_serializer.data)
+
+
 class BatchDeleteRowsView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
     permission_classes = (IsAuthenticated,)
@@ -1273,6 +1478,97 @@ class BatchDeleteRowsView(APIView):
         return Response(status=204)
 
 
+class RowChangesView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Lists the row changes of the table related to the "
+                "provided id.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="The cursor returned by the previous request. If not "
+                "provided, the changes are listed from the oldest retained change.",
+            ),
+            OpenApiParameter(
+                name="limit",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum number of changes to return, defaults to "
+                "100.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_changes",
+        description=(
+            "Lists the changes of the rows in the table in the order in which they "
+            "were committed, starting after the provided `cursor`. Every change "
+            "contains the action, the ids of the changed rows and, for updates, the "
+            "ids of the updated fields. The returned `cursor` must be provided in "
+            "the next request to only get the changes after the returned ones. If "
+            "`has_more` is true, more changes are available right away. Changes are "
+            "only kept for a limited amount of time, if the cursor is older than "
+            "that the `ERROR_ROW_CHANGE_CURSOR_EXPIRED` error is returned and all "
+            "the rows must be synchronized again."
+        ),
+        responses={
+            200: RowChangesSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                    "ERROR_ROW_CHANGE_LOG_DISABLED",
+                    "ERROR_INVALID_ROW_CHANGE_CURSOR",
+                    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            RowChangeLogDisabled: ERROR_ROW_CHANGE_LOG_DISABLED,
+            InvalidRowChangeCursor: ERROR_INVALID_ROW_CHANGE_CURSOR,
+            RowChangeCursorExpired: ERROR_ROW_CHANGE_CURSOR_EXPIRED,
+        }
+    )
+    @validate_query_parameters(ListRowChangesQueryParamsSerializer)
+    def get(self, request: Request, table_id: int, query_params) -> Response:
+        """
+        Lists the changes of the rows in the table after the provided cursor.
+        """
+
+        table = TableHandler().get_table(table_id)
+
+        CoreHandler().check_permissions(
+            request.user,
+            ListRowsDatabaseTableOperationType.type,
+            group=table.database.group,
+            context=table,
+        )
+        TokenHandler().check_table_permissions(request, "read", table, False)
+
+        changes, cursor, has_more = RowChangeHandler.get_changes(
+            table, query_params.get("cursor"), query_params["limit"]
+        )
+        serializer = RowChangesSerializer(
+            {"cursor": cursor, "has_more": has_more, "changes": changes}
+        )
+        return Response(serializer.data)
+
+
 class RowAdjacentView(APIView):
     permission_classes = (IsAuthenticated,)
 
@@ -1413,3 +1709,112 @@ class RowAdjacentView(APIView):
         serializer = serializer_class(adjacent_row)
 
         return Response(serializer.data)
+
+
+class RowRelatedValuesView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The table where the row is in.",
+            ),
+            OpenApiParameter(
+                name="row_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Returns the related values of this row.",
+            ),
+            OpenApiParameter(
+                name="field_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Returns the related values of this link row, multiple "
+                "select or multiple collaborators field.",
+            ),
+            OpenApiParameter(
+                name="page",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="Defines which page of related values should be returned.",
+            ),
+            OpenApiParameter(
+                name="size",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="Defines how many related values should be returned per "
+                "page.",
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_related_values",
+        description=(
+            "Lists all the related values of a single link row, multiple select or "
+            "multiple collaborators cell paginated. This can be used to fetch the "
+            "remaining values of a cell if the rows have been listed with the "
+            "`related_values_limit` query parameter. The format of the values is the "
+            "same as the format of the values in the cell of the row."
+        ),
+        responses={
+            200: get_example_pagination_serializer_class(
+                LinkRowValueSerializer,
+                serializer_name="PaginationSerializerRowRelatedValues",
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_PAGE_SIZE_LIMIT",
+                    "ERROR_INVALID_PAGE",
+                    "ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                [
+                    "ERROR_TABLE_DOES_NOT_EXIST",
+                    "ERROR_ROW_DOES_NOT_EXIST",
+                    "ERROR_FIELD_DOES_NOT_EXIST",
+                ]
+            ),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            IncompatibleFieldTypeForRelatedValues: ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    def get(self, request: Request, table_id: int, row_id: int, field_id: int):
+        """
+        Responds with the paginated related values of the cell of the provided row
+        and field.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "read", table, False)
+
+        model = table.get_model()
+        queryset = RowHandler().get_related_values_queryset(
+            request.user, table, row_id, int(field_id), model
+        )
+
+        paginator = PageNumberPagination(
+            limit_page_size=settings.RELATED_VALUES_PAGE_SIZE_LIMIT
+        )
+        page = paginator.paginate_queryset(queryset, request, self)
+        field_object = model._field_objects[int(field_id)]
+        serializer_field = field_object["type"].get_response_serializer_field(
+            field_object["field"]
+        )
+
+        return paginator.get_paginated_response(
+            serializer_field.to_representation(page)
+        )
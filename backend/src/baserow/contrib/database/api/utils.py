@@ -1,6 +1,13 @@
+import hashlib
 import re
+from typing import Optional
 
+from rest_framework.request import Request
+
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.models import Table
+from baserow.core.db_router import reads_from_read_replicas
 from baserow.core.utils import split_comma_separated_string
 
 
@@ -119,3 +126,34 @@ def extract_field_ids_from_string(value):
         for v in value.split(",")
         if any(c.isdigit() for c in v)
     ]
+
+
+def get_table_data_etag(request: Request, table: Table) -> Optional[str]:
+    """
+    Returns a weak etag for a response that only depends on the rows, fields and
+    views of the table and the request. It changes when the data version of the
+    table, the model version of the table, the requesting user or any of the query
+    parameters change, so it can be computed without querying the rows.
+
+    No etag is returned if the response is read from a read replica. The data
+    version is always the latest one, but the replica can lag behind, so a stale
+    response would otherwise be served with the etag of the latest data until the
+    table changes again.
+
+    :param request: The request of which the response depends on the table.
+    :param table: The table whose data is returned in the response.
+    :return: The weak etag, or None if the response must not have one.
+    """
+
+    if reads_from_read_replicas():
+        return None
+
+    key = "|".join(
+        [
+            TableDataVersionHandler.get_version(table.id),
+            table.version,
+            str(request.user.id),
+            request.get_full_path(),
+        ]
+    )
+    return f'W/"{hashlib.sha256(key.encode("utf-8")).hexdigest()}"'
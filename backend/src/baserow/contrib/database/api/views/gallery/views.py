@@ -31,7 +31,10 @@ from baserow.contrib.database.api.views.gallery.serializers import (
     GalleryViewFieldOptionsSerializer,
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_cached_public_view_rows_response_data,
+    get_public_view_authorization_token,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FilterFieldNotFound,
@@ -396,43 +399,49 @@ class PublicGalleryViewRowsView(APIView):
             GalleryView,
             authorization_token=get_public_view_authorization_token(request),
         )
-        view_type = view_type_registry.get_by_model(view)
-        model = view.table.get_model()
-
-        (
-            queryset,
-            field_ids,
-            publicly_visible_field_options,
-        ) = ViewHandler().get_public_rows_queryset_and_field_ids(
-            view,
-            search=search,
-            order_by=order_by,
-            include_fields=include_fields,
-            exclude_fields=exclude_fields,
-            filter_type=filter_type,
-            filter_object=filter_object,
-            table_model=model,
-            view_type=view_type,
-        )
 
-        if count:
-            return Response({"count": queryset.count()})
+        def get_response_data():
+            view_type = view_type_registry.get_by_model(view)
+            model = view.table.get_model()
 
-        paginator = GalleryLimitOffsetPagination()
-        page = paginator.paginate_queryset(queryset, request, self)
+            (
+                queryset,
+                field_ids,
+                publicly_visible_field_options,
+            ) = ViewHandler().get_public_rows_queryset_and_field_ids(
+                view,
+                search=search,
+                order_by=order_by,
+                include_fields=include_fields,
+                exclude_fields=exclude_fields,
+                filter_type=filter_type,
+                filter_object=filter_object,
+                table_model=model,
+                view_type=view_type,
+            )
 
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
-        )
-        serializer = serializer_class(page, many=True)
+            if count:
+                return {"count": queryset.count()}
 
-        response = paginator.get_paginated_response(serializer.data)
+            paginator = GalleryLimitOffsetPagination()
+            page = paginator.paginate_queryset(queryset, request, self)
 
-        if field_options:
-            context = {"field_options": publicly_visible_field_options}
-            serializer_class = view_type.get_field_options_serializer_class(
-                create_if_missing=True
+            serializer_class = get_row_serializer_class(
+                model, RowSerializer, is_response=True, field_ids=field_ids
             )
-            response.data.update(**serializer_class(view, context=context).data)
+            serializer = serializer_class(page, many=True)
 
-        return response
+            response = paginator.get_paginated_response(serializer.data)
+
+            if field_options:
+                context = {"field_options": publicly_visible_field_options}
+                serializer_class = view_type.get_field_options_serializer_class(
+                    create_if_missing=True
+                )
+                response.data.update(**serializer_class(view, context=context).data)
+
+            return response.data
+
+        return Response(
+            get_cached_public_view_rows_response_data(request, view, get_response_data)
+        )
@@ -11,6 +11,7 @@ from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
 from baserow.api.pagination import PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.serializers import get_example_pagination_serializer_class
+from baserow.api.utils import get_not_modified_response, set_etag_headers
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FIELD_NOT_IN_TABLE,
@@ -24,7 +25,10 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_serializer_class,
     get_row_serializer_class,
 )
-from baserow.contrib.database.api.utils import get_include_exclude_field_ids
+from baserow.contrib.database.api.utils import (
+    get_include_exclude_field_ids,
+    get_table_data_etag,
+)
 from baserow.contrib.database.api.views.errors import (
     ERROR_AGGREGATION_TYPE_DOES_NOT_EXIST,
     ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
@@ -35,7 +39,10 @@ from baserow.contrib.database.api.views.grid.serializers import (
     GridViewFieldOptionsSerializer,
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
-from baserow.contrib.database.api.views.utils import get_public_view_authorization_token
+from baserow.contrib.database.api.views.utils import (
+    get_cached_public_view_rows_response_data,
+    get_public_view_authorization_token,
+)
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
     FieldNotInTable,
@@ -256,6 +263,12 @@ class GridViewView(APIView):
             context=view.table,
             allow_if_template=True,
         )
+
+        etag = get_table_data_etag(request, view.table)
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         field_ids = get_include_exclude_field_ids(
             view.table, include_fields, exclude_fields
         )
@@ -264,7 +277,9 @@ class GridViewView(APIView):
         queryset = view_handler.get_queryset(view, search, model)
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            response = Response({"count": queryset.count()})
+            set_etag_headers(response, etag)
+            return response
 
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
@@ -295,6 +310,7 @@ class GridViewView(APIView):
             )
             response.data.update(row_metadata=row_metadata)
 
+        set_etag_headers(response, etag)
         return response
 
     @extend_schema(
@@ -783,45 +799,51 @@ class PublicGridViewRowsView(APIView):
             GridView,
             authorization_token=get_public_view_authorization_token(request),
         )
-        view_type = view_type_registry.get_by_model(view)
-        model = view.table.get_model()
 
-        (
-            queryset,
-            field_ids,
-            publicly_visible_field_options,
-        ) = ViewHandler().get_public_rows_queryset_and_field_ids(
-            view,
-            search=search,
-            order_by=order_by,
-            include_fields=include_fields,
-            exclude_fields=exclude_fields,
-            filter_type=filter_type,
-            filter_object=filter_object,
-            table_model=model,
-            view_type=view_type,
-        )
-
-        if count:
-            return Response({"count": queryset.count()})
+        def get_response_data():
+            view_type = view_type_registry.get_by_model(view)
+            model = view.table.get_model()
+
+            (
+                queryset,
+                field_ids,
+                publicly_visible_field_options,
+            ) = ViewHandler().get_public_rows_queryset_and_field_ids(
+                view,
+                search=search,
+                order_by=order_by,
+                include_fields=include_fields,
+                exclude_fields=exclude_fields,
+                filter_type=filter_type,
+                filter_object=filter_object,
+                table_model=model,
+                view_type=view_type,
+            )
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
-        else:
-            paginator = PageNumberPagination()
+            if count:
+                return {"count": queryset.count()}
 
-        page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
-        )
-        serializer = serializer_class(page, many=True)
-        response = paginator.get_paginated_response(serializer.data)
+            if LimitOffsetPagination.limit_query_param in request.GET:
+                paginator = LimitOffsetPagination()
+            else:
+                paginator = PageNumberPagination()
 
-        if field_options:
-            context = {"field_options": publicly_visible_field_options}
-            serializer_class = view_type.get_field_options_serializer_class(
-                create_if_missing=False
+            page = paginator.paginate_queryset(queryset, request, self)
+            serializer_class = get_row_serializer_class(
+                model, RowSerializer, is_response=True, field_ids=field_ids
             )
-            response.data.update(**serializer_class(view, context=context).data)
+            serializer = serializer_class(page, many=True)
+            response = paginator.get_paginated_response(serializer.data)
 
-        return response
+            if field_options:
+                context = {"field_options": publicly_visible_field_options}
+                serializer_class = view_type.get_field_options_serializer_class(
+                    create_if_missing=False
+                )
+                response.data.update(**serializer_class(view, context=context).data)
+
+            return response.data
+
+        return Response(
+            get_cached_public_view_rows_response_data(request, view, get_response_data)
+        )
@@ -1,9 +1,20 @@
-from typing import Optional
+import hashlib
+from typing import Any, Callable, Dict, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 
+from redis.exceptions import LockNotOwnedError
 from rest_framework.request import Request
 
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
+from baserow.contrib.database.views.models import View
+from baserow.core.db_router import use_default_database
+
+# The maximum number of seconds that concurrent requests wait for the request that
+# computes a missing public view rows response, before computing it themselves.
+PUBLIC_VIEW_ROWS_CACHE_LOCK_TIMEOUT = 10
+
 
 def get_public_view_authorization_token(request: Request) -> Optional[str]:
     """
@@ -19,3 +30,73 @@ def get_public_view_authorization_token(request: Request) -> Optional[str]:
     except (AttributeError, ValueError):
         return None
     return token
+
+
+def get_public_view_rows_cache_key(request: Request, view: View) -> str:
+    """
+    Returns the cache key of the response of a public view rows request. It contains
+    the data version of the table, so the cached response is automatically stale
+    when the rows, fields or view change. The absolute url is part of the key
+    because the response depends on all the query parameters and the pagination
+    links contain the host.
+    """
+
+    version = TableDataVersionHandler.get_version(view.table_id)
+    url_hash = hashlib.sha256(request.build_absolute_uri().encode("utf-8")).hexdigest()
+    return f"public_view_rows_{view.id}_{version}_{url_hash}"
+
+
+def get_cached_public_view_rows_response_data(
+    request: Request, view: View, get_response_data: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Returns the cached response data of a public view rows request or computes and
+    caches it using the provided function. When many requests for the same missing
+    response arrive at the same time, only one of them computes the response while
+    the others wait for it to be cached.
+
+    :param request: The request of which the response must be returned.
+    :param view: The public view whose rows are requested.
+    :param get_response_data: The function that computes the response data.
+    :return: The response data.
+    """
+
+    timeout = settings.BASEROW_PUBLIC_VIEW_ROWS_CACHE_TIMEOUT
+    if not timeout:
+        return get_response_data()
+
+    cache_key = get_public_view_rows_cache_key(request, view)
+    data = cache.get(cache_key)
+    if data is not None:
+        return data
+
+    # The lock is optional. It only avoids that the same response is computed many
+    # times, so requests compute the response themselves if they fail to get it.
+    cache_lock = None
+    if hasattr(cache, "lock"):
+        cache_lock = cache.lock(
+            f"{cache_key}_lock", timeout=PUBLIC_VIEW_ROWS_CACHE_LOCK_TIMEOUT
+        )
+        if cache_lock.acquire(blocking_timeout=PUBLIC_VIEW_ROWS_CACHE_LOCK_TIMEOUT):
+            data = cache.get(cache_key)
+        else:
+            cache_lock = None
+
+    try:
+        if data is None:
+            # The data version has been read from the cache before the rows, so the
+            # rows are read from the default database. A lagging read replica could
+            # otherwise cache old rows under the new version.
+            with use_default_database():
+                data = get_response_data()
+            cache.set(cache_key, data, timeout=timeout)
+    finally:
+        if cache_lock is not None:
+            try:
+                cache_lock.release()
+            except LockNotOwnedError:
+                # The lock has expired and might have been acquired by another
+                # request in the meantime, which doesn't break anything.
+                pass
+
+    return data
@@ -32,6 +32,8 @@ from baserow.api.utils import (
     CustomFieldRegistryMappingSerializer,
     DiscriminatorCustomFieldsMappingSerializer,
     MappingSerializer,
+    get_not_modified_response,
+    set_etag_headers,
     validate_data,
     validate_data_custom_fields,
 )
@@ -41,6 +43,7 @@ from baserow.contrib.database.api.fields.errors import (
 )
 from baserow.contrib.database.api.fields.serializers import LinkRowValueSerializer
 from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIST
+from baserow.contrib.database.api.utils import get_table_data_etag
 from baserow.contrib.database.api.views.serializers import PublicViewInfoSerializer
 from baserow.contrib.database.fields.exceptions import (
     FieldDoesNotExist,
@@ -263,6 +266,11 @@ class ViewsView(APIView):
             allow_if_template=True,
         )
 
+        etag = get_table_data_etag(request, table)
+        not_modified_response = get_not_modified_response(request, etag)
+        if not_modified_response is not None:
+            return not_modified_response
+
         views = View.objects.filter(table=table).select_related("content_type", "table")
 
         if query_params["type"]:
@@ -294,7 +302,9 @@ class ViewsView(APIView):
             ).data
             for view in views
         ]
-        return Response(data)
+        response = Response(data)
+        set_etag_headers(response, etag)
+        return response
 
     @extend_schema(
         parameters=[
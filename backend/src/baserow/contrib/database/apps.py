@@ -90,6 +90,7 @@ class DatabaseConfig(AppConfig):
             MoveRowActionType,
             UpdateRowActionType,
             UpdateRowsActionType,
+            UpsertRowsActionType,
         )
 
         action_type_registry.register(CreateRowActionType())
@@ -100,6 +101,7 @@ class DatabaseConfig(AppConfig):
         action_type_registry.register(MoveRowActionType())
         action_type_registry.register(UpdateRowActionType())
         action_type_registry.register(UpdateRowsActionType())
+        action_type_registry.register(UpsertRowsActionType())
 
         from baserow.contrib.database.views.actions import (
             CreateDecorationActionType,
@@ -432,7 +434,7 @@ class DatabaseConfig(AppConfig):
         from baserow.core.jobs.registries import job_type_registry
 
         from .airtable.job_type import AirtableImportJobType
-        from .fields.job_types import DuplicateFieldJobType
+        from .fields.job_types import ConvertFieldJobType, DuplicateFieldJobType
         from .file_import.job_type import FileImportJobType
         from .table.job_types import DuplicateTableJobType
 
@@ -440,6 +442,7 @@ class DatabaseConfig(AppConfig):
         job_type_registry.register(FileImportJobType())
         job_type_registry.register(DuplicateTableJobType())
         job_type_registry.register(DuplicateFieldJobType())
+        job_type_registry.register(ConvertFieldJobType())
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
@@ -628,6 +631,9 @@ class DatabaseConfig(AppConfig):
 
         # The signals must always be imported last because they use the registries
         # which need to be filled first.
+        import baserow.contrib.database.data_versions.signals  # noqa: F403, F401
+        import baserow.contrib.database.field_indexes.signals  # noqa: F403, F401
+        import baserow.contrib.database.row_changes.signals  # noqa: F403, F401
         import baserow.contrib.database.ws.signals  # noqa: F403, F401
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
@@ -0,0 +1,54 @@
+from typing import Iterable
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class TableDataVersionHandler:
+    """
+    Keeps track of a version of the data of every table in the cache. The version
+    changes whenever the rows, fields or views of the table change, which makes it
+    usable as part of the cache keys of responses that depend on that data.
+    """
+
+    @classmethod
+    def get_cache_key(cls, table_id: int) -> str:
+        return f"table_data_version_{table_id}"
+
+    @classmethod
+    def get_version(cls, table_id: int) -> str:
+        """
+        Returns the current data version of the table.
+
+        :param table_id: The id of the table to get the data version of.
+        :return: An opaque string that changes when the data of the table changes.
+        """
+
+        key = cls.get_cache_key(table_id)
+        version = cache.get(key)
+        if version is None:
+            # A new random version instead of a counter makes sure that a response
+            # cached before the key got evicted can never match again.
+            cache.add(key, uuid4().hex, timeout=None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def bump_versions_on_commit(cls, table_ids: Iterable[int]):
+        """
+        Changes the data versions of the provided tables when the current
+        transaction commits. The versions are not changed before that because other
+        processes can't see the changes yet and could otherwise cache the old data
+        under the new version.
+
+        :param table_ids: The ids of the tables whose data has changed.
+        """
+
+        keys = {cls.get_cache_key(table_id) for table_id in table_ids}
+        if not keys:
+            return
+
+        transaction.on_commit(
+            lambda: cache.set_many({key: uuid4().hex for key in keys}, timeout=None)
+        )
@@ -0,0 +1,85 @@
+from typing import Set
+
+from django.dispatch import receiver
+
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.fields.models import LinkRowField
+from baserow.contrib.database.rows import signals as row_signals
+from baserow.contrib.database.table import signals as table_signals
+from baserow.contrib.database.views import signals as view_signals
+
+from .handler import TableDataVersionHandler
+
+
+def get_ids_of_tables_linking_to(table_id: int) -> Set[int]:
+    """
+    Returns the ids of the tables that have a link row field to the provided table.
+    The cells of those fields show the primary values of the rows in the provided
+    table, which is also the case for link row fields without a related field.
+    """
+
+    return set(
+        LinkRowField.objects.filter(link_row_table_id=table_id).values_list(
+            "table_id", flat=True
+        )
+    )
+
+
+@receiver(row_signals.rows_created)
+@receiver(row_signals.rows_updated)
+@receiver(row_signals.rows_deleted)
+def rows_changed(sender, table, **kwargs):
+    # The formula and lookup values in other tables that depend on the changed rows
+    # are bumped by the update collector that recalculates them.
+    TableDataVersionHandler.bump_versions_on_commit(
+        {table.id, *get_ids_of_tables_linking_to(table.id)}
+    )
+
+
+@receiver(field_signals.field_created)
+@receiver(field_signals.field_updated)
+@receiver(field_signals.field_deleted)
+@receiver(field_signals.field_restored)
+def field_changed(sender, field, related_fields, **kwargs):
+    table_ids = {
+        field.table_id,
+        *[related_field.table_id for related_field in related_fields],
+    }
+    if field.primary:
+        table_ids.update(get_ids_of_tables_linking_to(field.table_id))
+    TableDataVersionHandler.bump_versions_on_commit(table_ids)
+
+
+@receiver(table_signals.table_updated)
+@receiver(view_signals.views_reordered)
+def table_changed(sender, table, **kwargs):
+    TableDataVersionHandler.bump_versions_on_commit([table.id])
+
+
+@receiver(view_signals.view_created)
+@receiver(view_signals.view_updated)
+@receiver(view_signals.view_deleted)
+@receiver(view_signals.view_field_options_updated)
+def view_changed(sender, view, **kwargs):
+    TableDataVersionHandler.bump_versions_on_commit([view.table_id])
+
+
+@receiver(view_signals.view_filter_created)
+@receiver(view_signals.view_filter_updated)
+@receiver(view_signals.view_filter_deleted)
+def view_filter_changed(sender, view_filter, **kwargs):
+    TableDataVersionHandler.bump_versions_on_commit([view_filter.view.table_id])
+
+
+@receiver(view_signals.view_sort_created)
+@receiver(view_signals.view_sort_updated)
+@receiver(view_signals.view_sort_deleted)
+def view_sort_changed(sender, view_sort, **kwargs):
+    TableDataVersionHandler.bump_versions_on_commit([view_sort.view.table_id])
+
+
+@receiver(view_signals.view_decoration_created)
+@receiver(view_signals.view_decoration_updated)
+@receiver(view_signals.view_decoration_deleted)
+def view_decoration_changed(sender, view_decoration, **kwargs):
+    TableDataVersionHandler.bump_versions_on_commit([view_decoration.view.table_id])
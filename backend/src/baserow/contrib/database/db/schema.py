@@ -1,4 +1,5 @@
 import contextlib
+from typing import Dict, Tuple, Union
 
 from django.db import connection, transaction
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
@@ -8,6 +9,53 @@ from django.db.backends.utils import strip_quotes
 from .sql_queries import sql_create_try_cast, sql_drop_try_cast
 
 
+def get_try_cast_function_sql(
+    name: str,
+    db_type: str,
+    alter_column_prepare_old_value: Union[str, Tuple[str, Dict[str, str]]] = "",
+    alter_column_prepare_new_value: Union[str, Tuple[str, Dict[str, str]]] = "",
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Returns the SQL and the variables to create a function with the given name that
+    casts the `p_in` text value to the provided database type. The value can first
+    be converted by the alter column prepare statements of the field types. If the
+    value can't be casted, null is returned.
+
+    :param name: The name of the function.
+    :param db_type: The database type that the value must be casted to.
+    :param alter_column_prepare_old_value: Optionally a query statement, or a tuple
+        containing the statement and its variables, converting the `p_in` value to a
+        string format.
+    :param alter_column_prepare_new_value: Optionally a query statement, or a tuple
+        containing the statement and its variables, converting the `p_in` text value
+        to the new type.
+    :return: The SQL and the variables that must be executed to create the function.
+    """
+
+    variables = {}
+    if isinstance(alter_column_prepare_old_value, tuple):
+        alter_column_prepare_old_value, v = alter_column_prepare_old_value
+        variables = {**variables, **v}
+
+    if isinstance(alter_column_prepare_new_value, tuple):
+        alter_column_prepare_new_value, v = alter_column_prepare_new_value
+        variables = {**variables, **v}
+
+    for key, value in variables.items():
+        variables[key] = value.replace("$FUNCTION$", "")
+
+    return (
+        sql_create_try_cast
+        % {
+            "name": name,
+            "type": db_type,
+            "alter_column_prepare_old_value": alter_column_prepare_old_value or "",
+            "alter_column_prepare_new_value": alter_column_prepare_new_value or "",
+        },
+        variables,
+    )
+
+
 class PostgresqlLenientDatabaseSchemaEditor:
     """
     Class changes the behavior of the postgres database schema editor slightly. Normally
@@ -50,32 +98,14 @@ class PostgresqlLenientDatabaseSchemaEditor:
             old_type = f"{old_type}_forced"
 
         if old_type != new_type:
-            variables = {}
-            if isinstance(self.alter_column_prepare_old_value, tuple):
-                alter_column_prepare_old_value, v = self.alter_column_prepare_old_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_old_value = self.alter_column_prepare_old_value
-
-            if isinstance(self.alter_column_prepare_new_value, tuple):
-                alter_column_prepare_new_value, v = self.alter_column_prepare_new_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_new_value = self.alter_column_prepare_new_value
-
-            quoted_column_name = self.quote_name(new_field.column)
-            for key, value in variables.items():
-                variables[key] = value.replace("$FUNCTION$", "")
             self.execute(sql_drop_try_cast)
             self.execute(
-                sql_create_try_cast
-                % {
-                    "column": quoted_column_name,
-                    "type": new_type,
-                    "alter_column_prepare_old_value": alter_column_prepare_old_value,
-                    "alter_column_prepare_new_value": alter_column_prepare_new_value,
-                },
-                variables,
+                *get_try_cast_function_sql(
+                    "pg_temp.try_cast",
+                    new_type,
+                    self.alter_column_prepare_old_value,
+                    self.alter_column_prepare_new_value,
+                )
             )
 
         return super()._alter_field(
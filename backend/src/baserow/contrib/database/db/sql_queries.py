@@ -1,6 +1,6 @@
 sql_drop_try_cast = "DROP FUNCTION IF EXISTS pg_temp.try_cast(text, int)"
 sql_create_try_cast = """
-    create or replace function pg_temp.try_cast(
+    create or replace function %(name)s(
         p_in text,
         p_default int default null
     )
@@ -25,6 +25,7 @@ from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.views.exceptions import ViewNotInTable
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db_router import use_read_replicas
 from baserow.core.handler import CoreHandler
 
 from .exceptions import (
@@ -276,9 +277,12 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
         else:
             serializer = queryset_serializer_class.for_view(job.view)
 
-        serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
-        )
+        # The export only reads the rows, so it doesn't have to wait for the
+        # progress updates that it writes to be replicated.
+        with use_read_replicas(stick_after_write=False):
+            serializer.write_to_file(
+                PaginatedExportJobFileWriter(file, job), **job.export_options
+            )
 
     return job
 
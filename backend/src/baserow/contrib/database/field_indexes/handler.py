@@ -0,0 +1,316 @@
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+
+from psycopg2 import sql
+
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.contrib.database.views.models import ViewFilter, ViewSort
+from baserow.contrib.database.views.registries import view_filter_type_registry
+
+from .models import FieldIndex
+
+
+class FieldUsage(NamedTuple):
+    field: Field
+    db_column: str
+    sort_count: int
+    filter_count: int
+    descending: bool
+
+
+# The database types of columns that can contain values of any length. A btree
+# index entry can't be larger than about a third of a page, so writing a large
+# value into an indexed column of one of these types would fail.
+UNBOUNDED_DB_TYPES = {"text", "json", "jsonb", "bytea"}
+
+
+class FieldIndexHandler:
+    @classmethod
+    def get_index_name(cls, field: Field, descending: bool = False) -> str:
+        direction = "_desc" if descending else ""
+        return f"tbl_{field.table_id}_fld_{field.id}{direction}_advised_idx"
+
+    @classmethod
+    def can_index_column(cls, model_field) -> bool:
+        """
+        Indicates whether the values of the column of the model field are always
+        small enough to fit in a btree index entry.
+        """
+
+        db_type = model_field.db_type(connection)
+        return (
+            db_type is not None
+            and db_type not in UNBOUNDED_DB_TYPES
+            and not db_type.endswith("[]")
+        )
+
+    @classmethod
+    def get_indexed_filter_types(cls) -> List[str]:
+        return [
+            filter_type.type
+            for filter_type in view_filter_type_registry.get_all()
+            if filter_type.can_use_index
+        ]
+
+    @classmethod
+    def get_field_usages(
+        cls, table: Table, model: Optional[GeneratedTableModel] = None
+    ) -> Dict[int, FieldUsage]:
+        """
+        Finds the fields of the table that are sorted on or filtered by in the views
+        of the table in a way that a btree index on the column of the field can be
+        used. Relationship fields are never included because their columns are
+        already indexed, and neither are the fields whose values can be too large
+        for an index entry, like text and long text fields.
+
+        :param table: The table to find the used fields of.
+        :param model: The model of the table, will be generated if not provided.
+        :return: A dict containing the usage of every field that would benefit from
+            an index, keyed by the field id.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        sort_counts = defaultdict(int)
+        descending_sort_counts = defaultdict(int)
+        for field_id, order, count in (
+            ViewSort.objects.filter(view__table=table, view__trashed=False)
+            .order_by()
+            .values("field_id", "order")
+            .annotate(count=Count("id"))
+            .values_list("field_id", "order", "count")
+        ):
+            sort_counts[field_id] += count
+            if order == "DESC":
+                descending_sort_counts[field_id] += count
+
+        filter_counts = defaultdict(
+            int,
+            ViewFilter.objects.filter(
+                view__table=table,
+                view__trashed=False,
+                view__filters_disabled=False,
+                type__in=cls.get_indexed_filter_types(),
+            )
+            .order_by()
+            .values("field_id")
+            .annotate(count=Count("id"))
+            .values_list("field_id", "count"),
+        )
+
+        usages = {}
+        for field_id in set(sort_counts) | set(filter_counts):
+            # Trashed fields are not part of the model.
+            if field_id not in model._field_objects:
+                continue
+
+            field_object = model._field_objects[field_id]
+            field, field_type = field_object["field"], field_object["type"]
+            model_field = model._meta.get_field(field_object["name"])
+            if (
+                model_field.is_relation
+                or not model_field.concrete
+                or not cls.can_index_column(model_field)
+            ):
+                continue
+
+            # Sorting only uses the index if the rows are ordered by the column
+            # itself and not by a custom expression.
+            sort_count = sort_counts[field_id]
+            if not field_type.check_can_order_by(field) or field_type.get_order(
+                field, field_object["name"], "ASC"
+            ):
+                sort_count = 0
+
+            if sort_count or filter_counts[field_id]:
+                usages[field_id] = FieldUsage(
+                    field,
+                    model_field.column,
+                    sort_count,
+                    filter_counts[field_id],
+                    # The index follows the direction most of the sorts use.
+                    descending=descending_sort_counts[field_id] * 2 > sort_count,
+                )
+
+        return usages
+
+    @classmethod
+    def estimate_row_count(cls, table: Table) -> int:
+        """
+        Returns the number of rows in the table as estimated by the planner
+        statistics of Postgres, which is a lot cheaper than counting them.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+                [table.get_database_table_name()],
+            )
+            result = cursor.fetchone()
+        # Tables that have never been analyzed have a negative estimate.
+        return max(int(result[0]), 0) if result else 0
+
+    @classmethod
+    def get_existing_indexes(cls, table: Table) -> Dict[str, bool]:
+        """
+        Returns the names of the indexes that actually exist on the database table
+        of the table, together with whether they are valid. A failed concurrent
+        build leaves an invalid index behind.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT index_class.relname, pg_index.indisvalid
+                FROM pg_index
+                INNER JOIN pg_class index_class
+                    ON index_class.oid = pg_index.indexrelid
+                WHERE pg_index.indrelid = to_regclass(%s)
+                """,
+                [table.get_database_table_name()],
+            )
+            return dict(cursor.fetchall())
+
+    @classmethod
+    def _execute_index_statement(cls, statement: str, **identifiers: str):
+        # Indexes can only be created concurrently outside of a transaction, which
+        # is the case when running in the background task.
+        concurrently = "" if connection.in_atomic_block else " CONCURRENTLY"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(statement).format(
+                    concurrently=sql.SQL(concurrently),
+                    **{
+                        key: sql.Identifier(value) for key, value in identifiers.items()
+                    },
+                )
+            )
+
+    @classmethod
+    def create_index(
+        cls, table: Table, name: str, db_column: str, descending: bool = False
+    ):
+        """
+        Creates a btree index on the column that matches the sort order of a view
+        in the provided direction. The rows are always tie-broken by the ascending
+        order and id, so a view sorted in the other direction can't scan the index
+        backwards. Equality and range filters on the column can use it as well.
+        """
+
+        direction = "DESC NULLS LAST" if descending else "ASC NULLS FIRST"
+        cls._execute_index_statement(
+            "CREATE INDEX{concurrently} IF NOT EXISTS {name} ON {table} "
+            f'({{column}} {direction}, "order", "id")',
+            name=name,
+            table=table.get_database_table_name(),
+            column=db_column,
+        )
+
+    @classmethod
+    def drop_index(cls, name: str):
+        cls._execute_index_statement(
+            "DROP INDEX{concurrently} IF EXISTS {name}", name=name
+        )
+
+    @classmethod
+    def sync_table_indexes(cls, table: Table) -> Tuple[List[FieldIndex], List[str]]:
+        """
+        Makes sure that the fields of the table that are used in view sorts and
+        filters have an index if the table contains at least
+        `BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS` rows, and drops the previously created
+        indexes that are not used anymore. Indexes that have disappeared because the
+        column of the field was recreated during a field conversion are created
+        again, and indexes are replaced when most of the sorts on the field changed
+        direction.
+
+        :param table: The table to synchronize the indexes of.
+        :return: The field indexes that have been created and the names of the
+            indexes that have been dropped.
+        """
+
+        usages = cls.get_field_usages(table)
+        existing_field_indexes = {
+            field_index.field_id: field_index
+            for field_index in FieldIndex.objects.filter(table=table)
+        }
+        existing_indexes = cls.get_existing_indexes(table)
+        large_enough = (
+            cls.estimate_row_count(table)
+            >= settings.BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS
+        )
+
+        dropped = []
+        for field_id, field_index in existing_field_indexes.items():
+            if field_id not in usages:
+                cls.drop_index(field_index.name)
+                field_index.delete()
+                dropped.append(field_index.name)
+
+        created = []
+        for field_id, usage in usages.items():
+            field_index = existing_field_indexes.get(field_id)
+            if field_index is None and not large_enough:
+                continue
+
+            name = cls.get_index_name(usage.field, usage.descending)
+            if field_index is not None and field_index.name != name:
+                cls.drop_index(field_index.name)
+                dropped.append(field_index.name)
+                field_index.name = name
+                field_index.save(update_fields=["name", "updated_on"])
+
+            if existing_indexes.get(name) is False:
+                # Retry a previously failed concurrent build.
+                cls.drop_index(name)
+            if not existing_indexes.get(name):
+                cls.create_index(table, name, usage.db_column, usage.descending)
+
+            if field_index is None:
+                created.append(
+                    FieldIndex.objects.create(
+                        table=table,
+                        field=usage.field,
+                        name=name,
+                        sort_count=usage.sort_count,
+                        filter_count=usage.filter_count,
+                    )
+                )
+            elif (field_index.sort_count, field_index.filter_count) != (
+                usage.sort_count,
+                usage.filter_count,
+            ):
+                field_index.sort_count = usage.sort_count
+                field_index.filter_count = usage.filter_count
+                field_index.save(
+                    update_fields=["sort_count", "filter_count", "updated_on"]
+                )
+
+        return created, dropped
+
+    @classmethod
+    def get_tables_to_sync(cls):
+        """
+        Returns the tables that have view sorts, view filters or existing field
+        indexes and therefore might need their indexes to be synchronized.
+        """
+
+        table_ids = (
+            set(
+                ViewSort.objects.filter(view__trashed=False).values_list(
+                    "view__table_id", flat=True
+                )
+            )
+            | set(
+                ViewFilter.objects.filter(view__trashed=False).values_list(
+                    "view__table_id", flat=True
+                )
+            )
+            | set(FieldIndex.objects.values_list("table_id", flat=True))
+        )
+        return Table.objects.filter(id__in=table_ids).order_by("id")
@@ -0,0 +1,31 @@
+from django.db import models
+
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.models import Table
+
+
+class FieldIndex(models.Model):
+    """
+    An index that has been created automatically on the column of a field because
+    the field is sorted on or filtered by in the views of its table. The usage counts
+    explain why the index exists and are updated every time the indexes of the table
+    are synchronized.
+    """
+
+    table = models.ForeignKey(Table, on_delete=models.CASCADE, related_name="+")
+    field = models.OneToOneField(Field, on_delete=models.CASCADE, related_name="+")
+    name = models.CharField(max_length=63, unique=True)
+    sort_count = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of view sorts on the field during the last sync.",
+    )
+    filter_count = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of view filters that can use the index during the last "
+        "sync.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("id",)
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import transaction
+from django.dispatch import receiver
+
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.views import signals as view_signals
+
+from .tasks import sync_field_indexes
+
+
+def _sync_field_indexes_on_commit(table_id: int):
+    if settings.BASEROW_FIELD_INDEX_ADVISOR_ENABLED:
+        transaction.on_commit(lambda: sync_field_indexes.delay(table_id))
+
+
+@receiver(view_signals.view_sort_created)
+@receiver(view_signals.view_sort_updated)
+def view_sort_changed(sender, view_sort, **kwargs):
+    _sync_field_indexes_on_commit(view_sort.view.table_id)
+
+
+@receiver(view_signals.view_sort_deleted)
+def view_sort_deleted(sender, view_sort, **kwargs):
+    _sync_field_indexes_on_commit(view_sort.view.table_id)
+
+
+@receiver(view_signals.view_filter_created)
+@receiver(view_signals.view_filter_updated)
+def view_filter_changed(sender, view_filter, **kwargs):
+    _sync_field_indexes_on_commit(view_filter.view.table_id)
+
+
+@receiver(view_signals.view_filter_deleted)
+def view_filter_deleted(sender, view_filter, **kwargs):
+    _sync_field_indexes_on_commit(view_filter.view.table_id)
+
+
+@receiver(view_signals.view_deleted)
+def view_deleted(sender, view, **kwargs):
+    _sync_field_indexes_on_commit(view.table_id)
+
+
+@receiver(field_signals.field_updated)
+@receiver(field_signals.field_deleted)
+@receiver(field_signals.field_restored)
+def field_changed(sender, field, **kwargs):
+    _sync_field_indexes_on_commit(field.table_id)
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from baserow.config.celery import app
+
+SYNC_LOCK_TIMEOUT = 60 * 60
+
+
+def _get_sync_lock_key(table_id: int) -> str:
+    return f"field_index_sync_lock_{table_id}"
+
+
+@app.task(bind=True, queue="export")
+def sync_field_indexes(self, table_id: int):
+    """
+    Creates and drops the automatically managed field indexes of a table. The
+    indexes are built concurrently, so the table remains writable while they're
+    created.
+    """
+
+    from baserow.contrib.database.table.models import Table
+
+    from .handler import FieldIndexHandler
+
+    # Only one sync can run per table at the same time, a sync that is requested
+    # while another one is running is tried again later.
+    lock_key = _get_sync_lock_key(table_id)
+    if not cache.add(lock_key, True, timeout=SYNC_LOCK_TIMEOUT):
+        sync_field_indexes.apply_async(
+            (table_id,), countdown=settings.BASEROW_FIELD_INDEX_ADVISOR_RETRY_SECONDS
+        )
+        return
+
+    try:
+        try:
+            table = Table.objects.get(id=table_id)
+        except Table.DoesNotExist:
+            return
+
+        FieldIndexHandler.sync_table_indexes(table)
+    finally:
+        cache.delete(lock_key)
+
+
+@app.task(bind=True, queue="export")
+def sync_all_field_indexes(self):
+    """
+    Schedules an index sync for every table with view sorts, filters or existing
+    field indexes, so that indexes are created when a table grows large enough.
+    """
+
+    from .handler import FieldIndexHandler
+
+    for table_id in FieldIndexHandler.get_tables_to_sync().values_list("id", flat=True):
+        sync_field_indexes.delay(table_id)
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    if settings.BASEROW_FIELD_INDEX_ADVISOR_ENABLED:
+        sender.add_periodic_task(
+            timedelta(minutes=settings.BASEROW_FIELD_INDEX_ADVISOR_INTERVAL_MINUTES),
+            sync_all_field_indexes.s(),
+        )
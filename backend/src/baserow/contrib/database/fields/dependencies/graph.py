@@ -0,0 +1,189 @@
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import FieldDependency
+
+# The in memory dependency graphs of this process, keyed by database id. Every
+# value is a tuple containing the version the graph was loaded for and the graph.
+_graphs: "OrderedDict[int, Tuple[str, FieldDependencyGraph]]" = OrderedDict()
+_graphs_lock = Lock()
+
+
+class FieldDependencyGraph:
+    """
+    An in memory adjacency representation of all the `FieldDependency` rows of a
+    single database. It only contains the ids of the dependency rows so that
+    finding which dependencies are affected by a change is a dictionary walk
+    instead of a database query.
+    """
+
+    def __init__(self, dependencies: Iterable[Tuple[int, int, int, int, int]]):
+        """
+        :param dependencies: An iterable of tuples containing the id, dependant id,
+            dependency id, via id and related field id of the via of every field
+            dependency in the database.
+        """
+
+        self.by_dependency: Dict[int, List[int]] = defaultdict(list)
+        self.by_via: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+
+        for (
+            row_id,
+            dependant_id,
+            dependency_id,
+            via_id,
+            via_related_field_id,
+        ) in dependencies:
+            if dependency_id is not None:
+                self.by_dependency[dependency_id].append(row_id)
+            if via_id is not None:
+                self.by_via[via_id].append((row_id, dependant_id))
+            if via_related_field_id is not None:
+                self.by_via[via_related_field_id].append((row_id, dependant_id))
+
+    @classmethod
+    def load(cls, database_id: int) -> "FieldDependencyGraph":
+        return cls(
+            FieldDependency.objects.filter(
+                dependant__table__database_id=database_id
+            ).values_list(
+                "id",
+                "dependant_id",
+                "dependency_id",
+                "via_id",
+                "via__link_row_related_field_id",
+            )
+        )
+
+    def get_dependency_ids(
+        self, field_ids: Iterable[int], associated_relations_changed: bool
+    ) -> List[int]:
+        """
+        Returns the ids of the field dependencies which are affected when the
+        provided fields change. This mirrors the filter used by
+        `FieldDependencyHandler.get_dependant_fields_with_type`.
+
+        :param field_ids: The ids of the fields that have changed.
+        :param associated_relations_changed: Whether the relations of the provided
+            link row fields have changed as well.
+        :return: The sorted ids of the affected field dependencies.
+        """
+
+        field_ids = set(field_ids)
+        row_ids: Set[int] = set()
+        for field_id in field_ids:
+            row_ids.update(self.by_dependency.get(field_id, []))
+            if associated_relations_changed:
+                row_ids.update(
+                    row_id
+                    for row_id, dependant_id in self.by_via.get(field_id, [])
+                    if dependant_id not in field_ids
+                )
+        return sorted(row_ids)
+
+
+def _get_version_cache_key(database_id: int) -> str:
+    return f"field_dependency_graph_version_{database_id}"
+
+
+def _get_version(database_id: int) -> str:
+    key = _get_version_cache_key(database_id)
+    version = cache.get(key)
+    if version is None:
+        # A new random version instead of a counter makes sure that a graph loaded
+        # before the key got evicted can never match again.
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+class _InvalidateGraphOnCommit:
+    """
+    The `transaction.on_commit` callback which bumps the version of the dependency
+    graph of a database. As long as it's pending, the current transaction has
+    changed dependencies that other processes can't see yet.
+    """
+
+    def __init__(self, database_id: int):
+        self.database_id = database_id
+        self.executed = False
+
+    def __call__(self):
+        self.executed = True
+        cache.set(_get_version_cache_key(self.database_id), uuid4().hex, timeout=None)
+
+
+def _has_uncommitted_changes(database_id: int) -> bool:
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        return False
+
+    # The callbacks of rolled back savepoints and transactions are discarded by
+    # Django, so only changes that can still be committed are found here.
+    return any(
+        isinstance(callback[1], _InvalidateGraphOnCommit)
+        and callback[1].database_id == database_id
+        and not callback[1].executed
+        for callback in connection.run_on_commit
+    )
+
+
+@lru_cache(maxsize=settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE * 10)
+def _get_database_id_of_table(table_id: int) -> int:
+    from baserow.contrib.database.table.models import Table
+
+    return Table.objects_and_trash.values_list("database_id", flat=True).get(
+        id=table_id
+    )
+
+
+def get_field_dependency_graph(table_id: int) -> Optional[FieldDependencyGraph]:
+    """
+    Returns the in memory dependency graph of the database that the table belongs
+    to. The graph is only loaded from the database if it has been changed since it
+    was last loaded by this process.
+
+    :param table_id: The id of a table in the database to get the graph of.
+    :return: The dependency graph, or None if the current transaction has changed
+        the dependencies in the database and the graph can't be used.
+    """
+
+    database_id = _get_database_id_of_table(table_id)
+    if _has_uncommitted_changes(database_id):
+        return None
+
+    version = _get_version(database_id)
+    with _graphs_lock:
+        cached = _graphs.get(database_id)
+        if cached is not None and cached[0] == version:
+            _graphs.move_to_end(database_id)
+            return cached[1]
+
+    graph = FieldDependencyGraph.load(database_id)
+
+    with _graphs_lock:
+        _graphs[database_id] = (version, graph)
+        _graphs.move_to_end(database_id)
+        while len(_graphs) > settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE:
+            _graphs.popitem(last=False)
+
+    return graph
+
+
+def invalidate_field_dependency_graph(database_id: int):
+    """
+    Marks the dependency graph of the database as changed. Every process will
+    reload the graph once the current transaction commits, until then the current
+    transaction doesn't use the graph at all.
+
+    :param database_id: The id of the database whose dependencies have changed.
+    """
+
+    transaction.on_commit(_InvalidateGraphOnCommit(database_id))
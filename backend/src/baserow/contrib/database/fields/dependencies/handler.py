@@ -11,6 +11,7 @@ from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 
+from .graph import get_field_dependency_graph, invalidate_field_dependency_graph
 from .models import FieldDependency
 
 FieldDependants = List[Tuple[Field, FieldType, List[LinkRowField]]]
@@ -45,6 +46,7 @@ class FieldDependencyHandler:
 
         update_fields_with_broken_references(field)
         rebuild_field_dependencies(field, field_cache)
+        invalidate_field_dependency_graph(field.table.database_id)
 
     @classmethod
     def break_dependencies_delete_dependants(cls, field):
@@ -56,6 +58,7 @@ class FieldDependencyHandler:
         """
 
         break_dependencies_for_field(field)
+        invalidate_field_dependency_graph(field.table.database_id)
 
     @classmethod
     def get_dependant_fields_with_type(
@@ -88,15 +91,21 @@ class FieldDependencyHandler:
         if not field_ids:
             return []
 
-        dependant_filter = Q(dependency_id__in=field_ids)
-        if associated_relations_changed:
-            # Any m2m relationships associated with the provided field_ids have changed.
-            # So we want to lookup all fields which are dependant via these link row
-            # m2m relationships to properly update them also.
-            dependant_filter |= (
-                Q(via_id__in=field_ids)
-                | Q(via__link_row_related_field_id__in=field_ids)
-            ) & ~Q(dependant_id__in=field_ids)
+        # The in memory graph tells us which dependencies are affected without a
+        # query, so nothing has to be fetched at all if there aren't any.
+        graph = get_field_dependency_graph(table_id)
+        if graph is not None:
+            dependency_ids = graph.get_dependency_ids(
+                field_ids, associated_relations_changed
+            )
+            if not dependency_ids:
+                return []
+            dependant_filter = Q(id__in=dependency_ids)
+        else:
+            dependant_filter = cls._get_dependant_filter(
+                field_ids, associated_relations_changed
+            )
+
         queryset = (
             FieldDependency.objects.filter(dependant_filter)
             .select_related("dependant", "dependency", "via")
@@ -134,6 +143,21 @@ class FieldDependencyHandler:
             )
         return result
 
+    @classmethod
+    def _get_dependant_filter(
+        cls, field_ids: Iterable[int], associated_relations_changed: bool
+    ) -> Q:
+        dependant_filter = Q(dependency_id__in=field_ids)
+        if associated_relations_changed:
+            # Any m2m relationships associated with the provided field_ids have changed.
+            # So we want to lookup all fields which are dependant via these link row
+            # m2m relationships to properly update them also.
+            dependant_filter |= (
+                Q(via_id__in=field_ids)
+                | Q(via__link_row_related_field_id__in=field_ids)
+            ) & ~Q(dependant_id__in=field_ids)
+        return dependant_filter
+
     @classmethod
     def get_via_dependants_of_link_field(cls, field: "LinkRowField") -> FieldDependants:
         broken_via_dep_filter = Q(via_id=field.id) & ~Q(dependant_id=field.id)
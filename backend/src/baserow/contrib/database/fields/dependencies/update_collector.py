@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Set, Tuple, cast
 
 from django.db.models import Expression, Q
 
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
 from baserow.contrib.database.fields.dependencies.exceptions import InvalidViaPath
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -248,6 +249,11 @@ class FieldUpdateCollector:
             self._starting_row_ids,
             deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
         )
+        # The cells of the updated fields have changed, also in the dependant tables
+        # that don't receive a signal for the changed rows.
+        TableDataVersionHandler.bump_versions_on_commit(
+            self._updated_fields_per_table.keys()
+        )
         return self._for_table(self._starting_table)
 
     def send_additional_field_updated_signals(self):
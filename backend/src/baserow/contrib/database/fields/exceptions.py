@@ -210,8 +210,19 @@ class IncompatibleFieldTypeForUniqueValues(Exception):
     """Raised when the unique values of an incompatible field are requested."""
 
 
+class IncompatibleFieldTypeForRelatedValues(Exception):
+    """Raised when the related values of an incompatible field are requested."""
+
+
 class FailedToLockFieldDueToConflict(LockConflict):
     """
     Raised when a user tried to update a field which was locked by another
     concurrent operation
     """
+
+
+class FieldCannotBeConvertedOnline(Exception):
+    """
+    Raised when a field is converted online to a field type that requires the data
+    to be converted in another way than casting the value of its column.
+    """
@@ -1097,30 +1097,40 @@ class LinkRowFieldType(FieldType):
     _can_order_by = False
     can_be_primary_field = False
     can_get_unique_values = False
+    can_preview_related_values = True
 
     def enhance_queryset(self, queryset, field, name):
         """
-        Makes sure that the related rows are prefetched by Django. We also want to
-        enhance the primary field of the related queryset. If for example the primary
-        field is a single select field then the dropdown options need to be
-        prefetched in order to prevent many queries.
+        Makes sure that the related rows are prefetched by Django.
         """
 
         remote_model = queryset.model._meta.get_field(name).remote_field.model
-        related_queryset = remote_model.objects.all()
+        related_queryset = self.enhance_related_values_queryset(
+            remote_model.objects.all(), field
+        )
+        return queryset.prefetch_related(
+            models.Prefetch(name, queryset=related_queryset)
+        )
+
+    def enhance_related_values_queryset(self, queryset, field):
+        """
+        We also want to enhance the primary field of the related queryset. If for
+        example the primary field is a single select field then the dropdown options
+        need to be prefetched in order to prevent many queries.
+        """
 
         try:
             primary_field_object = next(
                 object
-                for object in remote_model._field_objects.values()
+                for object in queryset.model._field_objects.values()
                 if object["field"].primary
             )
             # Because we only need the primary value for serialization, we only have
             # to select and enhance that one. This will improve the performance of
             # large related tables significantly.
-            related_queryset = related_queryset.only(primary_field_object["name"])
-            related_queryset = primary_field_object["type"].enhance_queryset(
-                related_queryset,
+            queryset = queryset.only(primary_field_object["name"])
+            queryset = primary_field_object["type"].enhance_queryset(
+                queryset,
                 primary_field_object["field"],
                 primary_field_object["name"],
             )
@@ -1129,9 +1139,7 @@ class LinkRowFieldType(FieldType):
             # need to enhance the queryset.
             pass
 
-        return queryset.prefetch_related(
-            models.Prefetch(name, queryset=related_queryset)
-        )
+        return queryset
 
     def get_export_value(self, value, field_object, rich_value=False):
         def map_to_export_value(inner_value, inner_field_object):
@@ -2433,6 +2441,7 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
     type = "multiple_select"
     model_class = MultipleSelectField
     can_get_unique_values = False
+    can_preview_related_values = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -3378,6 +3387,7 @@ class MultipleCollaboratorsFieldType(FieldType):
     type = "multiple_collaborators"
     model_class = MultipleCollaboratorsField
     can_get_unique_values = False
+    can_preview_related_values = True
     can_be_in_form_view = False
 
     def get_serializer_field(self, instance, **kwargs):
@@ -23,13 +23,11 @@ from django.db.utils import DatabaseError, DataError, ProgrammingError
 from psycopg2 import sql
 
 from baserow.contrib.database.db.schema import (
+    get_try_cast_function_sql,
     lenient_schema_editor,
     safe_django_schema_editor,
 )
-from baserow.contrib.database.db.sql_queries import (
-    sql_create_try_cast,
-    sql_drop_try_cast,
-)
+from baserow.contrib.database.db.sql_queries import sql_drop_try_cast
 from baserow.contrib.database.fields.constants import (
     RESERVED_BASEROW_FIELD_NAMES,
     UPSERT_OPTION_DICT_KEY,
@@ -75,7 +73,7 @@ from .exceptions import (
     ReservedBaserowFieldNameException,
 )
 from .field_cache import FieldCache
-from .models import Field, SelectOption, SpecificFieldForUpdate
+from .models import ConvertFieldJob, Field, SelectOption, SpecificFieldForUpdate
 from .registries import field_converter_registry, field_type_registry
 from .signals import (
     before_field_deleted,
@@ -362,6 +360,8 @@ class FieldHandler:
         after_schema_change_callback: Optional[
             Callable[[SpecificFieldForUpdate], None]
         ] = None,
+        do_schema_change: bool = True,
+        conversion_job_id: Optional[int] = None,
         **kwargs,
     ) -> Union[SpecificFieldForUpdate, Tuple[SpecificFieldForUpdate, List[Field]]]:
         """
@@ -381,8 +381,16 @@ class FieldHandler:
         :param after_schema_change_callback: If specified this callback is called
             after the field has had it's schema updated but before any dependant
             fields have been updated.
+        :param do_schema_change: Indicates whether the column of the field must be
+            altered. Can be set to False if the column already contains the converted
+            data, for example because the field has been converted online.
+        :param conversion_job_id: The id of the `ConvertFieldJob` on whose behalf
+            the field is updated. Only that job can update the field until it has
+            finished.
         :param kwargs: The field values that need to be updated
         :raises ValueError: When the provided field is not an instance of Field.
+        :raises FailedToLockFieldDueToConflict: When the field is being converted
+            online by another job. The job would otherwise overwrite the changes.
         :raises CannotChangeFieldType: When the database server responds with an
             error while trying to change the field type. This should rarely happen
             because of the lenient schema editor, which replaces the value with null
@@ -405,6 +413,18 @@ class FieldHandler:
             user, UpdateFieldOperationType.type, group=group, context=field
         )
 
+        # The conversion job replaces the column and the properties of the field
+        # when it finishes, so any other change in the meantime would be lost.
+        unfinished_conversion_jobs = ConvertFieldJob.objects.filter(
+            field_id=field.id
+        ).is_pending_or_running()
+        if conversion_job_id is not None:
+            unfinished_conversion_jobs = unfinished_conversion_jobs.exclude(
+                id=conversion_job_id
+            )
+        if unfinished_conversion_jobs.exists():
+            raise FailedToLockFieldDueToConflict()
+
         old_field = deepcopy(field)
         from_field_type = field_type_registry.get_by_model(field)
         from_model = field.table.get_model(field_ids=[], fields=[field])
@@ -476,7 +496,7 @@ class FieldHandler:
             from_model, old_field, field
         )
 
-        if converter:
+        if converter and do_schema_change:
             # If a field data converter is found we are going to use that one to alter
             # the field and maybe do some data conversion.
             converter.alter_field(
@@ -489,7 +509,7 @@ class FieldHandler:
                 user,
                 connection,
             )
-        else:
+        elif do_schema_change:
             if baserow_field_type_changed:
                 # If the baserow type has changed we always want to force run any alter
                 # column SQL as otherwise it might not run if the two baserow fields
@@ -1029,14 +1049,6 @@ class FieldHandler:
         alter_column_prepare_old_value = field_type.get_alter_column_prepare_old_value(
             connection, field, TextField()
         )
-        variables = ()
-
-        # In some cases, the `get_alter_column_prepare_old_value` returns a tuple
-        # where the first part if the psql and the second variables that must be
-        # safely be injected.
-        if isinstance(alter_column_prepare_old_value, tuple):
-            variables = alter_column_prepare_old_value[1]
-            alter_column_prepare_old_value = alter_column_prepare_old_value[0]
 
         # Create the temporary function try cast function. This function makes sure
         # the that if the casting fails, the query doesn't fail hard, but falls back
@@ -1044,14 +1056,9 @@ class FieldHandler:
         with connection.cursor() as cursor:
             cursor.execute(sql_drop_try_cast)
             cursor.execute(
-                sql_create_try_cast
-                % {
-                    "alter_column_prepare_old_value": alter_column_prepare_old_value
-                    or "",
-                    "alter_column_prepare_new_value": "",
-                    "type": "text",
-                },
-                variables,
+                *get_try_cast_function_sql(
+                    "pg_temp.try_cast", "text", alter_column_prepare_old_value
+                )
             )
 
         # If `split_comma_separated` is `True`, then we first need to explode the raw
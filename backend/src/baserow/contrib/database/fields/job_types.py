@@ -1,21 +1,44 @@
+from django.conf import settings
+
 from rest_framework import serializers
 
 from baserow.api.errors import ERROR_GROUP_DOES_NOT_EXIST, ERROR_USER_NOT_IN_GROUP
+from baserow.api.utils import validate_data_custom_fields
+from baserow.contrib.database.api.fields.errors import (
+    ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT,
+    ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE,
+    ERROR_FIELD_DOES_NOT_EXIST,
+    ERROR_INCOMPATIBLE_PRIMARY_FIELD_TYPE,
+)
 from baserow.contrib.database.api.fields.serializers import (
     FieldSerializer,
     FieldSerializerWithRelatedFields,
+    UpdateFieldSerializer,
 )
 from baserow.contrib.database.db.atomic import (
     read_repeatable_read_single_table_transaction,
 )
 from baserow.contrib.database.fields.actions import DuplicateFieldActionType
+from baserow.contrib.database.fields.exceptions import (
+    FailedToLockFieldDueToConflict,
+    FieldCannotBeConvertedOnline,
+    FieldDoesNotExist,
+    IncompatiblePrimaryFieldTypeError,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import DuplicateFieldJob
-from baserow.contrib.database.fields.operations import DuplicateFieldOperationType
+from baserow.contrib.database.fields.models import ConvertFieldJob, DuplicateFieldJob
+from baserow.contrib.database.fields.online_conversion_handler import (
+    OnlineFieldConversionHandler,
+)
+from baserow.contrib.database.fields.operations import (
+    DuplicateFieldOperationType,
+    UpdateFieldOperationType,
+)
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.core.action.registries import action_type_registry
 from baserow.core.exceptions import GroupDoesNotExist, UserNotInGroup
 from baserow.core.handler import CoreHandler
-from baserow.core.jobs.registries import JobType
+from baserow.core.jobs.registries import CheckpointedJobType, JobType
 
 
 class DuplicateFieldJobType(JobType):
@@ -82,3 +105,151 @@ class DuplicateFieldJobType(JobType):
         job.save(update_fields=("duplicated_field",))
 
         return new_field_clone, updated_fields
+
+
+class ConvertFieldJobType(CheckpointedJobType):
+    """
+    Converts a field to another type online, so that the rows of the table can
+    still be read and written while the data is converted. The converted values are
+    written into a shadow column in committed batches, after which the columns are
+    swapped and the field is updated. See `OnlineFieldConversionHandler`.
+    """
+
+    type = "convert_field"
+    model_class = ConvertFieldJob
+    max_count = 1
+
+    api_exceptions_map = {
+        UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+        GroupDoesNotExist: ERROR_GROUP_DOES_NOT_EXIST,
+        FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+        FailedToLockFieldDueToConflict: ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT,
+        FieldCannotBeConvertedOnline: ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE,
+        IncompatiblePrimaryFieldTypeError: ERROR_INCOMPATIBLE_PRIMARY_FIELD_TYPE,
+    }
+
+    job_exceptions_map = {
+        FieldCannotBeConvertedOnline: "{e}",
+        FieldDoesNotExist: "The field has been deleted during the conversion.",
+    }
+
+    request_serializer_field_names = ["field_id", "new_type", "field_values"]
+
+    request_serializer_field_overrides = {
+        "field_id": serializers.IntegerField(
+            help_text="The ID of the field to convert.",
+        ),
+        "new_type": serializers.CharField(
+            help_text="The type that the field must be converted to.",
+        ),
+        "field_values": serializers.DictField(
+            required=False,
+            default=dict,
+            help_text="The other values of the field that must be updated, like "
+            "when updating the field.",
+        ),
+    }
+
+    serializer_field_names = ["field"]
+    serializer_field_overrides = {
+        "field": FieldSerializer(read_only=True),
+    }
+
+    def prepare_values(self, values, user):
+        field = FieldHandler().get_field(values["field_id"]).specific
+        CoreHandler().check_permissions(
+            user,
+            UpdateFieldOperationType.type,
+            group=field.table.database.group,
+            context=field,
+        )
+
+        if ConvertFieldJob.objects.filter(field=field).is_pending_or_running().exists():
+            raise FailedToLockFieldDueToConflict()
+
+        field_values = validate_data_custom_fields(
+            values["new_type"],
+            field_type_registry,
+            {**values.get("field_values", {}), "type": values["new_type"]},
+            base_serializer_class=UpdateFieldSerializer,
+        )
+        field_values.pop("type", None)
+
+        OnlineFieldConversionHandler.check_can_convert_online(
+            field,
+            OnlineFieldConversionHandler.get_to_field(
+                field, values["new_type"], field_values
+            ),
+        )
+
+        return {
+            "field": field,
+            "new_type": values["new_type"],
+            "field_values": field_values,
+        }
+
+    def get_initial_checkpoint(self, job):
+        return {"last_id": None}
+
+    def run_chunk(self, job, progress, checkpoint):
+        handler = OnlineFieldConversionHandler
+        field = FieldHandler().get_specific_field_for_update(job.field_id)
+        to_field = handler.get_to_field(field, job.new_type, job.field_values)
+        from_type = field_type_registry.get_by_model(field).type
+
+        if checkpoint["last_id"] is None:
+            if not handler.requires_conversion(field, to_field):
+                self._update_field(job, field, do_schema_change=True)
+                progress.increment(progress.total - progress.progress)
+                return None
+
+            handler.check_can_convert_online(field, to_field)
+            return {
+                "table_id": field.table_id,
+                "field_id": field.id,
+                "from_type": from_type,
+                "last_id": 0,
+                "max_id": handler.prepare(field, to_field) or 0,
+            }
+
+        if from_type != checkpoint["from_type"]:
+            raise FieldCannotBeConvertedOnline(
+                "The type of the field has been changed during the conversion."
+            )
+
+        last_id, max_id = checkpoint["last_id"], checkpoint["max_id"]
+        if last_id < max_id:
+            until_id = min(
+                last_id + settings.BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE, max_id
+            )
+            handler.convert_rows(field, to_field, last_id, until_id)
+            # The last percentage is reserved for swapping the columns.
+            progress.increment(99 * until_id // max_id - progress.progress)
+            return {**checkpoint, "last_id": until_id}
+
+        handler.swap_columns(field)
+        self._update_field(job, field, do_schema_change=False)
+        progress.increment(progress.total - progress.progress)
+        return None
+
+    def _update_field(self, job, field, do_schema_change):
+        FieldHandler().update_field(
+            job.user,
+            field,
+            job.new_type,
+            do_schema_change=do_schema_change,
+            conversion_job_id=job.id,
+            **job.field_values,
+        )
+
+    def cleanup(self, job, checkpoint):
+        if "table_id" in checkpoint:
+            OnlineFieldConversionHandler.clean_up(
+                checkpoint["table_id"], checkpoint["field_id"]
+            )
+
+    def on_error(self, job, error):
+        # The shadow column and trigger of the committed chunks must be removed,
+        # otherwise every write to the table keeps converting the value. Cancelled
+        # and abandoned jobs are cleaned up the same way by the job handler.
+        self.clean_up_committed_work(job)
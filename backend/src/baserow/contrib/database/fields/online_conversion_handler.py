@@ -0,0 +1,383 @@
+from copy import deepcopy
+from typing import Any, Dict, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import Field as DjangoField
+
+from psycopg2 import sql
+
+from baserow.contrib.database.db.schema import (
+    get_try_cast_function_sql,
+    safe_django_schema_editor,
+)
+from baserow.contrib.database.fields.exceptions import (
+    FieldCannotBeConvertedOnline,
+    IncompatiblePrimaryFieldTypeError,
+)
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.registries import (
+    field_converter_registry,
+    field_type_registry,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.core.utils import extract_allowed, set_allowed_attrs
+
+
+class OnlineFieldConversionHandler:
+    """
+    Converts the data of a field to another field type without locking the table
+    for the duration of the conversion. Instead of altering the type of the column,
+    which rewrites the whole table while holding an exclusive lock, the converted
+    values are written into a shadow column of the new type:
+
+    1. The shadow column is added together with a trigger that converts the value of
+       every row that is inserted or whose column is updated in the meantime.
+    2. The existing rows are converted in small batches that are committed
+       separately, so that the rows are only locked for the duration of a batch.
+    3. The old column is dropped and the shadow column is renamed, which only changes
+       the metadata of the table.
+
+    The values are converted with the same try cast function that the lenient schema
+    editor uses, so the result is the same as a regular field type conversion.
+    """
+
+    @classmethod
+    def get_table_name(cls, table_id: int) -> str:
+        return f"{Table.USER_TABLE_DATABASE_NAME_PREFIX}{table_id}"
+
+    @classmethod
+    def get_shadow_column_name(cls, field_id: int) -> str:
+        return f"field_{field_id}_conversion"
+
+    @classmethod
+    def get_trigger_name(cls, field_id: int) -> str:
+        return f"field_{field_id}_conversion"
+
+    @classmethod
+    def get_function_name(cls, table_id: int, field_id: int) -> str:
+        return f"{cls.get_table_name(table_id)}_field_{field_id}_convert"
+
+    @classmethod
+    def get_trigger_function_name(cls, table_id: int, field_id: int) -> str:
+        return f"{cls.get_function_name(table_id, field_id)}_trigger"
+
+    @classmethod
+    def get_to_field(
+        cls, field: Field, new_type_name: str, field_values: Dict[str, Any]
+    ) -> Field:
+        """
+        Returns an unsaved instance of the field like it will be after the
+        conversion. It's used to generate the column and conversion SQL of the new
+        field type without changing the field itself.
+
+        :param field: The specific field that is going to be converted.
+        :param new_type_name: The type that the field is converted to.
+        :param field_values: The new values of the field.
+        :return: The unsaved specific field instance.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get(new_type_name)
+
+        if from_field_type.type == to_field_type.type:
+            to_field = deepcopy(field)
+        else:
+            to_field = to_field_type.model_class(
+                **{
+                    model_field.attname: getattr(field, model_field.attname)
+                    for model_field in Field._meta.concrete_fields
+                    if model_field.name != "content_type"
+                }
+            )
+            to_field.content_type = ContentType.objects.get_for_model(
+                to_field_type.model_class
+            )
+
+        allowed_fields = ["name"] + to_field_type.allowed_fields
+        return set_allowed_attrs(
+            extract_allowed(field_values, allowed_fields), allowed_fields, to_field
+        )
+
+    @classmethod
+    def check_can_convert_online(cls, field: Field, to_field: Field):
+        """
+        Checks whether the field can be converted online. This is only possible if
+        both the old and the new field store their value in a column of the table
+        and no field converter is needed, because the field converters also change
+        related data like select options or relations.
+
+        :param field: The specific field that is going to be converted.
+        :param to_field: The unsaved field like it will be after the conversion.
+        :raises IncompatiblePrimaryFieldTypeError: When the field is the primary
+            field and the new type can't be primary.
+        :raises FieldCannotBeConvertedOnline: When the field can't be converted
+            online.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get_by_model(to_field)
+
+        if field.primary and not to_field_type.can_be_primary_field:
+            raise IncompatiblePrimaryFieldTypeError(to_field_type.type)
+
+        if from_field_type.read_only or to_field_type.read_only:
+            raise FieldCannotBeConvertedOnline(
+                "Read only fields can't be converted online."
+            )
+
+        from_model = field.table.get_model(
+            field_ids=[], fields=[field], add_dependencies=False
+        )
+        if field_converter_registry.find_applicable_converter(
+            from_model, field, to_field
+        ):
+            raise FieldCannotBeConvertedOnline(
+                f"The {from_field_type.type} field can't be converted to a "
+                f"{to_field_type.type} field online."
+            )
+
+        for model_field in [
+            from_model._meta.get_field(field.db_column),
+            cls._get_model_field(to_field),
+        ]:
+            if model_field.is_relation or not model_field.concrete:
+                raise FieldCannotBeConvertedOnline(
+                    "Only fields that store their value in a column of the table can "
+                    "be converted online."
+                )
+
+    @classmethod
+    def requires_conversion(cls, field: Field, to_field: Field) -> bool:
+        """
+        Indicates whether the column of the field must be altered, in the same way as
+        `FieldHandler.update_field` decides to alter it. If not, the field can be
+        updated right away without converting it online.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get_by_model(to_field)
+
+        return (
+            from_field_type.type != to_field_type.type
+            or to_field_type.force_same_type_alter_column(field, to_field)
+            or cls._get_model_field(field).db_parameters(connection)["type"]
+            != cls._get_model_field(to_field).db_parameters(connection)["type"]
+        )
+
+    @classmethod
+    def _get_model_field(cls, field: Field) -> DjangoField:
+        model = field.table.get_model(
+            field_ids=[], fields=[field], add_dependencies=False
+        )
+        return model._meta.get_field(field.db_column)
+
+    @classmethod
+    def _get_default(cls, model_field: DjangoField) -> Any:
+        # The try cast function falls back to null, which is not allowed if the
+        # column of the new field is not nullable.
+        return None if model_field.null else model_field.get_default()
+
+    @classmethod
+    def _get_conversion_sql(
+        cls, table_id: int, field_id: int, value: sql.Composable, default: Any
+    ) -> sql.Composable:
+        conversion = sql.SQL("{function}({value}::text)").format(
+            function=sql.Identifier(cls.get_function_name(table_id, field_id)),
+            value=value,
+        )
+        if default is not None:
+            conversion = sql.SQL("coalesce({conversion}, {default})").format(
+                conversion=conversion, default=sql.Literal(default)
+            )
+        return conversion
+
+    @classmethod
+    def prepare(cls, field: Field, to_field: Field) -> Optional[int]:
+        """
+        Adds the shadow column of the new type and the trigger that keeps it up to
+        date when rows are inserted or updated. Any leftovers of a previous
+        conversion of the field are removed first. Must be committed before the
+        existing rows are converted.
+
+        :param field: The specific field that is going to be converted.
+        :param to_field: The unsaved field like it will be after the conversion.
+        :return: The highest id of the rows that existed before the trigger was
+            created and must be converted with `convert_rows`.
+        """
+
+        table_id = field.table_id
+        cls.clean_up(table_id, field.id)
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get_by_model(to_field)
+        to_model_field = cls._get_model_field(to_field)
+
+        # The shadow column gets the same constraints as the column of the new field,
+        # so that it can replace it without rewriting the table. It can be added
+        # even if it's not nullable because the column default is used for the
+        # existing rows, and the conversion falls back to the same default.
+        shadow_model_field = deepcopy(to_model_field)
+        shadow_model_field.column = cls.get_shadow_column_name(field.id)
+        with safe_django_schema_editor(atomic=False) as schema_editor:
+            schema_editor.add_field(to_model_field.model, shadow_model_field)
+
+        table_name = cls.get_table_name(table_id)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                *get_try_cast_function_sql(
+                    connection.ops.quote_name(
+                        cls.get_function_name(table_id, field.id)
+                    ),
+                    to_model_field.db_parameters(connection)["type"],
+                    from_field_type.get_alter_column_prepare_old_value(
+                        connection, field, to_field
+                    ),
+                    to_field_type.get_alter_column_prepare_new_value(
+                        connection, field, to_field
+                    ),
+                )
+            )
+            cursor.execute(
+                sql.SQL(
+                    """
+                    CREATE FUNCTION {trigger_function}() RETURNS trigger AS $$
+                    BEGIN
+                        NEW.{shadow_column} := {conversion};
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql;
+
+                    CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE OF {column}
+                    ON {table} FOR EACH ROW EXECUTE PROCEDURE {trigger_function}();
+                    """
+                ).format(
+                    trigger_function=sql.Identifier(
+                        cls.get_trigger_function_name(table_id, field.id)
+                    ),
+                    shadow_column=sql.Identifier(shadow_model_field.column),
+                    conversion=cls._get_conversion_sql(
+                        table_id,
+                        field.id,
+                        sql.SQL("NEW.{column}").format(
+                            column=sql.Identifier(field.db_column)
+                        ),
+                        cls._get_default(to_model_field),
+                    ),
+                    trigger=sql.Identifier(cls.get_trigger_name(field.id)),
+                    column=sql.Identifier(field.db_column),
+                    table=sql.Identifier(table_name),
+                )
+            )
+            cursor.execute(
+                sql.SQL("SELECT max(id) FROM {table}").format(
+                    table=sql.Identifier(table_name)
+                )
+            )
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def convert_rows(
+        cls, field: Field, to_field: Field, after_id: int, until_id: int
+    ) -> int:
+        """
+        Writes the converted values of the rows with an id in the provided range
+        into the shadow column.
+
+        :param field: The specific field that is being converted.
+        :param to_field: The unsaved field like it will be after the conversion.
+        :param after_id: Only rows with a higher id are converted.
+        :param until_id: Only rows with a lower or equal id are converted.
+        :return: The number of converted rows.
+        """
+
+        # The trigger only fires when the column of the field is updated, so it
+        # doesn't convert the value again.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "UPDATE {table} SET {shadow_column} = {conversion} "
+                    "WHERE id > %s AND id <= %s"
+                ).format(
+                    table=sql.Identifier(cls.get_table_name(field.table_id)),
+                    shadow_column=sql.Identifier(cls.get_shadow_column_name(field.id)),
+                    conversion=cls._get_conversion_sql(
+                        field.table_id,
+                        field.id,
+                        sql.Identifier(field.db_column),
+                        cls._get_default(cls._get_model_field(to_field)),
+                    ),
+                ),
+                [after_id, until_id],
+            )
+            return cursor.rowcount
+
+    @classmethod
+    def swap_columns(cls, field: Field):
+        """
+        Replaces the column of the field with the shadow column containing the
+        converted values. This only changes the metadata of the table, so the
+        exclusive lock is only held for a short moment. Must be called in the same
+        transaction as the `FieldHandler.update_field` call that updates the field
+        without altering its column.
+
+        :param field: The field that is being converted.
+        """
+
+        table_id = field.table_id
+        cls._drop_trigger(table_id, field.id)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    ALTER TABLE {table} DROP COLUMN {column};
+                    ALTER TABLE {table} RENAME COLUMN {shadow_column} TO {column};
+                    """
+                ).format(
+                    table=sql.Identifier(cls.get_table_name(table_id)),
+                    column=sql.Identifier(field.db_column),
+                    shadow_column=sql.Identifier(cls.get_shadow_column_name(field.id)),
+                )
+            )
+
+    @classmethod
+    def clean_up(cls, table_id: int, field_id: int):
+        """
+        Removes the shadow column, trigger and functions of an unfinished conversion
+        of the field. Nothing happens if they, or the table, don't exist.
+
+        :param table_id: The id of the table that contains the field.
+        :param field_id: The id of the field that was being converted.
+        """
+
+        cls._drop_trigger(table_id, field_id)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE IF EXISTS {table} DROP COLUMN IF EXISTS "
+                    "{shadow_column}"
+                ).format(
+                    table=sql.Identifier(cls.get_table_name(table_id)),
+                    shadow_column=sql.Identifier(cls.get_shadow_column_name(field_id)),
+                )
+            )
+
+    @classmethod
+    def _drop_trigger(cls, table_id: int, field_id: int):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    DROP TRIGGER IF EXISTS {trigger} ON {table};
+                    DROP FUNCTION IF EXISTS {trigger_function}();
+                    DROP FUNCTION IF EXISTS {function}(text, int);
+                    """
+                ).format(
+                    trigger=sql.Identifier(cls.get_trigger_name(field_id)),
+                    table=sql.Identifier(cls.get_table_name(table_id)),
+                    trigger_function=sql.Identifier(
+                        cls.get_trigger_function_name(table_id, field_id)
+                    ),
+                    function=sql.Identifier(cls.get_function_name(table_id, field_id)),
+                )
+            )
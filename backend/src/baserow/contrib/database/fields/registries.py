@@ -95,6 +95,13 @@ class FieldType(
     `FieldHandler::get_unique_row_values` method.
     """
 
+    can_preview_related_values = False
+    """
+    Indicates whether the value of the field is a list of related objects of which
+    only the first ones can be fetched when listing rows. See
+    `TableModelQuerySet.enhance_by_fields` for more information.
+    """
+
     read_only = False
     """Indicates whether the field allows inserting/updating row values or if it is
     read only."""
@@ -201,6 +208,22 @@ class FieldType(
 
         return queryset
 
+    def enhance_related_values_queryset(
+        self, queryset: QuerySet, field: Field
+    ) -> QuerySet:
+        """
+        This hook can be used to enhance the queryset that fetches the related objects
+        of a field that can preview its related values. It's used when only the first
+        related values of every row are fetched and when all the related values of a
+        single cell are listed.
+
+        :param queryset: The queryset of the related model that can be enhanced.
+        :param field: The related field's instance.
+        :return: The enhanced queryset.
+        """
+
+        return queryset
+
     def empty_query(
         self,
         field_name: str,
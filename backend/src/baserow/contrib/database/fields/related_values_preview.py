@@ -0,0 +1,160 @@
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from django.db import connection
+from django.db.models import Count, F, QuerySet, Window
+from django.db.models.functions import RowNumber
+
+from .fields import MultipleSelectManyToManyField
+
+
+class RelatedValuesPreview(NamedTuple):
+    field_id: int
+    name: str
+    limit: int
+    related_queryset: QuerySet
+
+
+def get_related_values_order_by(model_field) -> List[Any]:
+    """
+    Returns the order of the related objects relative to the through table of the
+    many to many field. The order must match the order in which all the related
+    values are returned when they are not limited.
+    """
+
+    if isinstance(model_field, MultipleSelectManyToManyField):
+        # The related manager orders the relations by the id of the through table.
+        return [F("id").asc()]
+
+    target = model_field.m2m_reverse_field_name()
+    order_by = []
+    for name in [*model_field.remote_field.model._meta.ordering, "id"]:
+        if name.startswith("-"):
+            order_by.append(F(f"{target}__{name[1:]}").desc())
+        else:
+            order_by.append(F(f"{target}__{name}").asc())
+    return order_by
+
+
+def get_related_values_preview_ids(
+    model_field, related_queryset: QuerySet, row_ids: List[int], limit: int
+) -> Dict[int, Tuple[List[int], int]]:
+    """
+    Finds the ids of the first `limit` related objects of every row and the total
+    number of related objects in a single query. The relations are numbered per row
+    with a window function and because Django can't filter on a window function, the
+    numbered query is wrapped in a subquery that is filtered instead. This way the
+    related objects themselves only have to be fetched for the returned ids.
+
+    :param model_field: The many to many field of the table model.
+    :param related_queryset: The queryset of the related objects, only the
+        relations to objects in this queryset are included.
+    :param row_ids: The ids of the rows to find the related objects of.
+    :param limit: The maximum number of related object ids per row.
+    :return: A dict containing the ordered related object ids and the total count
+        keyed by the row id. Rows without relations are not included.
+    """
+
+    source = model_field.m2m_field_name()
+    target = model_field.m2m_reverse_field_name()
+    through_queryset = model_field.remote_field.through.objects.filter(
+        **{
+            f"{source}__in": row_ids,
+            f"{target}__in": related_queryset.values("id"),
+        }
+    )
+
+    additional_filters = getattr(model_field, "additional_filters", None)
+    if additional_filters:
+        through_queryset = through_queryset.filter(
+            **{f"{target}__{key}": value for key, value in additional_filters.items()}
+        )
+
+    numbered_queryset = through_queryset.annotate(
+        row_number=Window(
+            expression=RowNumber(),
+            partition_by=[F(source)],
+            order_by=get_related_values_order_by(model_field),
+        ),
+        total=Window(expression=Count("id"), partition_by=[F(source)]),
+    ).values_list(source, target, "row_number", "total")
+
+    sql, params = numbered_queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT * FROM ({sql}) numbered "  # nosec B608
+            f"WHERE numbered.row_number <= %s ORDER BY numbered.row_number",
+            [*params, limit],
+        )
+        results = cursor.fetchall()
+
+    related_ids = {}
+    for row_id, related_id, _, total in results:
+        ids, _ = related_ids.setdefault(row_id, ([], total))
+        ids.append(related_id)
+    return related_ids
+
+
+def prefetch_related_values_previews(
+    rows: List[Any], previews: List[RelatedValuesPreview]
+):
+    """
+    Fetches the first related values of every preview for all the provided rows and
+    stores them in the prefetched objects cache of the rows, so that the many to many
+    field of a row returns only those when accessed. The total number of related
+    values is stored in the `_related_values_counts` dict of every row keyed by the
+    field id.
+
+    :param rows: The rows of the table model to fetch the related values of.
+    :param previews: The previews that must be fetched.
+    """
+
+    if not rows:
+        return
+
+    row_ids = [row.id for row in rows]
+    for row in rows:
+        row._related_values_counts = {}
+        if not hasattr(row, "_prefetched_objects_cache"):
+            row._prefetched_objects_cache = {}
+
+    for preview in previews:
+        model_field = rows[0]._meta.get_field(preview.name)
+        related_ids = get_related_values_preview_ids(
+            model_field, preview.related_queryset, row_ids, preview.limit
+        )
+        related_objects = preview.related_queryset.in_bulk(
+            {related_id for ids, _ in related_ids.values() for related_id in ids}
+        )
+
+        for row in rows:
+            ids, total = related_ids.get(row.id, ([], 0))
+            manager = getattr(row, preview.name)
+            queryset = manager.get_queryset()
+            queryset._result_cache = [
+                related_objects[related_id]
+                for related_id in ids
+                if related_id in related_objects
+            ]
+            queryset._prefetch_done = True
+            row._prefetched_objects_cache[manager.prefetch_cache_name] = queryset
+            row._related_values_counts[preview.field_id] = total
+
+
+def get_related_values_counts(
+    rows: List[Any], field_names: Dict[int, str]
+) -> Dict[int, Dict[str, int]]:
+    """
+    Returns the total number of related values of the previewed fields of the rows
+    keyed by the row id and the provided name of the field.
+
+    :param rows: The rows of which the related values have been previewed.
+    :param field_names: The names that must be used in the response keyed by the
+        field id.
+    """
+
+    counts = defaultdict(dict)
+    for row in rows:
+        for field_id, count in getattr(row, "_related_values_counts", {}).items():
+            counts[row.id][field_names[field_id]] = count
+    return dict(counts)
@@ -1,6 +1,8 @@
 import typing
+from functools import lru_cache
 from typing import Dict, Optional, Set, Type
 
+from django.conf import settings
 from django.db.models import Expression, Model
 
 from baserow.contrib.database.fields.dependencies.types import FieldDependencies
@@ -36,6 +38,7 @@ from baserow.contrib.database.formula.types.typer import (
     recreate_formula_field_if_needed,
 )
 from baserow.contrib.database.formula.types.visitors import (
+    ExpressionCopyingVisitor,
     FieldDependencyExtractingVisitor,
     FunctionsUsedVisitor,
 )
@@ -70,6 +73,24 @@ def _expression_requires_refresh_after_insert(expression: BaserowExpression):
     return any(f.requires_refresh_after_insert for f in functions_used)
 
 
+@lru_cache(maxsize=settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE)
+def _cached_raw_formula_to_untyped_expression(
+    formula: str, formula_version: int
+) -> BaserowExpression:
+    """
+    Parsing a formula with the Antlr runtime is slow, so the untyped expressions are
+    kept in a bounded LRU cache. The formula version is part of the key because the
+    resulting expression depends on the functions and grammar of that version. The
+    returned expressions are shared and must never be modified, copy them first.
+
+    :param formula: A string possibly in the format of a Baserow Formula.
+    :param formula_version: The version of the formula language.
+    :return: A shared untyped BaserowExpression representing the formula.
+    """
+
+    return raw_formula_to_untyped_expression(formula)
+
+
 class FormulaHandler:
     """
     Contains all the methods used to interact with formulas and formula fields in
@@ -251,7 +272,11 @@ class FormulaHandler:
             expression language.
         """
 
-        return raw_formula_to_untyped_expression(formula_string)
+        # The typing process modifies the expression, so a copy of the cached one is
+        # returned. Copying is much cheaper than parsing the formula again.
+        return _cached_raw_formula_to_untyped_expression(
+            formula_string, BASEROW_FORMULA_VERSION
+        ).accept(ExpressionCopyingVisitor())
 
     @classmethod
     def get_formula_type_from_field(cls, formula_field) -> BaserowFormulaType:
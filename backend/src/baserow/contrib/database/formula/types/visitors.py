@@ -69,6 +69,57 @@ class FunctionsUsedVisitor(
         return set()
 
 
+class ExpressionCopyingVisitor(BaserowFormulaASTVisitor[Any, BaserowExpression]):
+    """
+    Creates a copy of an expression where every node is a new instance. Typing an
+    expression modifies its nodes, so a shared expression must be copied before it
+    can be typed.
+    """
+
+    def visit_field_reference(self, field_reference: BaserowFieldReference):
+        return BaserowFieldReference(
+            field_reference.referenced_field_name,
+            field_reference.target_field,
+            field_reference.expression_type,
+        )
+
+    def visit_string_literal(
+        self, string_literal: BaserowStringLiteral
+    ) -> BaserowExpression:
+        return BaserowStringLiteral(
+            string_literal.literal, string_literal.expression_type
+        )
+
+    def visit_boolean_literal(
+        self, boolean_literal: BaserowBooleanLiteral
+    ) -> BaserowExpression:
+        return BaserowBooleanLiteral(
+            boolean_literal.literal, boolean_literal.expression_type
+        )
+
+    def visit_function_call(
+        self, function_call: BaserowFunctionCall
+    ) -> BaserowExpression:
+        return BaserowFunctionCall(
+            function_call.function_def,
+            [arg.accept(self) for arg in function_call.args],
+            function_call.expression_type,
+            requires_aggregate_wrapper=function_call.requires_aggregate_wrapper,
+        )
+
+    def visit_int_literal(
+        self, int_literal: BaserowIntegerLiteral
+    ) -> BaserowExpression:
+        return BaserowIntegerLiteral(int_literal.literal, int_literal.expression_type)
+
+    def visit_decimal_literal(
+        self, decimal_literal: BaserowDecimalLiteral
+    ) -> BaserowExpression:
+        return BaserowDecimalLiteral(
+            decimal_literal.literal, decimal_literal.expression_type
+        )
+
+
 class FieldDependencyExtractingVisitor(
     BaserowFormulaASTVisitor[UnTyped, FieldDependencies]
 ):
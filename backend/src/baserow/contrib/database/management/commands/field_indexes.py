@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.field_indexes.handler import FieldIndexHandler
+from baserow.contrib.database.field_indexes.models import FieldIndex
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Lists the indexes that have been created automatically for the fields that "
+        "are sorted on or filtered by in views, and why they exist. Optionally "
+        "synchronizes the indexes first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table-id",
+            type=int,
+            help="Only show the indexes of the table with this ID.",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Create and drop the indexes of the tables right away instead of "
+            "waiting for the periodic task.",
+        )
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        tables = (
+            Table.objects.filter(id=table_id)
+            if table_id
+            else FieldIndexHandler.get_tables_to_sync()
+        )
+
+        if options["sync"]:
+            for table in tables:
+                created, dropped = FieldIndexHandler.sync_table_indexes(table)
+                self.stdout.write(
+                    f"Table {table.name}({table.id}): created {len(created)} and "
+                    f"dropped {len(dropped)} index(es)."
+                )
+
+        field_indexes = FieldIndex.objects.select_related("table", "field").order_by(
+            "table_id", "field_id"
+        )
+        if table_id:
+            field_indexes = field_indexes.filter(table_id=table_id)
+
+        for field_index in field_indexes:
+            self.stdout.write(
+                f"Table {field_index.table.name}({field_index.table_id}) field "
+                f"{field_index.field.name}({field_index.field_id}): "
+                f"{field_index.name} used by {field_index.sort_count} sort(s) and "
+                f"{field_index.filter_count} filter(s), created on "
+                f"{field_index.created_on.isoformat()}."
+            )
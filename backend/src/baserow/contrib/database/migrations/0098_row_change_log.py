@@ -0,0 +1,67 @@
+# Generated by Django 3.2.13 on 2026-10-19 10:49
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0097_add_ip_address_to_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RowChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "transaction_id",
+                    models.BigIntegerField(
+                        help_text="The id of the transaction in which the rows were changed."
+                    ),
+                ),
+                (
+                    "action",
+                    models.PositiveSmallIntegerField(
+                        choices=[(1, "created"), (2, "updated"), (3, "deleted")]
+                    ),
+                ),
+                (
+                    "row_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(), size=None
+                    ),
+                ),
+                (
+                    "field_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        help_text="The ids of the fields that were updated, only set for updates.",
+                        null=True,
+                        size=None,
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("transaction_id", "id"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="rowchange",
+            index=models.Index(
+                fields=["table", "transaction_id", "id"],
+                name="database_ro_table_i_6bc5b7_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 3.2.13 on 2026-10-19 11:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0098_row_change_log"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FieldIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=63, unique=True)),
+                (
+                    "sort_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of view sorts on the field during the last sync.",
+                    ),
+                ),
+                (
+                    "filter_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of view filters that can use the index during the last sync.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                (
+                    "field",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
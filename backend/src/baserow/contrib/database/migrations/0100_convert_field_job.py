@@ -0,0 +1,73 @@
+# Generated by Django 3.2.13 on 2026-10-19 12:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0043_job_checkpoint"),
+        ("database", "0099_field_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConvertFieldJob",
+            fields=[
+                (
+                    "job_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="core.job",
+                    ),
+                ),
+                (
+                    "user_ip_address",
+                    models.GenericIPAddressField(
+                        help_text="The user IP address.", null=True
+                    ),
+                ),
+                (
+                    "user_websocket_id",
+                    models.CharField(
+                        help_text="The user websocket uuid needed to manage signals sent correctly.",
+                        max_length=36,
+                        null=True,
+                    ),
+                ),
+                (
+                    "new_type",
+                    models.CharField(
+                        help_text="The type that the field is converted to.",
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "field_values",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The other values of the field that are updated.",
+                    ),
+                ),
+                (
+                    "field",
+                    models.ForeignKey(
+                        help_text="The Baserow field to convert.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="converted_by_jobs",
+                        to="database.field",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+            bases=("core.job", models.Model),
+        ),
+    ]
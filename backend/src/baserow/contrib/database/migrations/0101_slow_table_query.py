@@ -0,0 +1,71 @@
+# Generated by Django 3.2.13 on 2026-10-19 13:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0100_convert_field_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowTableQuery",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "duration_ms",
+                    models.FloatField(
+                        help_text="The duration of the query in milliseconds when it was captured."
+                    ),
+                ),
+                ("sql", models.TextField()),
+                ("params", models.JSONField(default=list)),
+                (
+                    "explain",
+                    models.TextField(
+                        help_text="The output of `EXPLAIN (ANALYZE, BUFFERS)` of the query when it was analyzed after it was captured.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "context",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The search and the filter and sort configuration of the view when the query was captured.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+                (
+                    "view",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="database.view",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-id",),
+            },
+        ),
+    ]
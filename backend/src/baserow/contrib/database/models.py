@@ -1,6 +1,7 @@
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.core.models import Application
 
+from .field_indexes.models import FieldIndex
 from .fields.models import (
     BooleanField,
     DateField,
@@ -14,6 +15,8 @@ from .fields.models import (
     TextField,
     URLField,
 )
+from .row_changes.models import RowChange
+from .slow_queries.models import SlowTableQuery
 from .table.models import Table
 from .tokens.models import Token, TokenPermission
 from .views.models import (
@@ -62,6 +65,9 @@ __all__ = [
     "TableWebhookHeader",
     "TableWebhookCall",
     "FieldDependency",
+    "RowChange",
+    "FieldIndex",
+    "SlowTableQuery",
 ]
 
 
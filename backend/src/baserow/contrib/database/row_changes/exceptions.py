@@ -0,0 +1,14 @@
+class RowChangeLogDisabled(Exception):
+    """Raised when the change log is requested while it's disabled."""
+
+
+class InvalidRowChangeCursor(Exception):
+    """Raised when the provided change log cursor can't be parsed."""
+
+
+class RowChangeCursorExpired(Exception):
+    """
+    Raised when the change that the provided cursor points to has been deleted
+    because it's older than the retention period. Changes after the cursor could
+    have been deleted as well, so the rows must be fully synchronized again.
+    """
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from baserow.contrib.database.table.models import Table
+
+from .exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+    RowChangeLogDisabled,
+)
+from .models import RowChange
+
+
+class RowChangeHandler:
+    @classmethod
+    def record_changes(
+        cls,
+        table: Table,
+        action: int,
+        row_ids: Iterable[int],
+        field_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        Appends an entry to the change log of the table. It's created in the same
+        transaction as the change itself, so that it's only visible if the change is
+        committed.
+
+        :param table: The table in which the rows have changed.
+        :param action: One of the `RowChange` actions.
+        :param row_ids: The ids of the changed rows.
+        :param field_ids: The ids of the updated fields, only relevant for updates.
+        """
+
+        row_ids = list(row_ids)
+        if not settings.BASEROW_ROW_CHANGE_LOG_ENABLED or not row_ids:
+            return
+
+        RowChange.objects.create(
+            table=table,
+            transaction_id=RawSQL("txid_current()", ()),
+            action=action,
+            row_ids=row_ids,
+            field_ids=sorted(field_ids) if field_ids is not None else None,
+        )
+
+    @classmethod
+    def encode_cursor(cls, change: RowChange) -> str:
+        return f"{change.transaction_id}-{change.id}"
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> Tuple[int, int]:
+        try:
+            transaction_id, change_id = cursor.split("-")
+            return int(transaction_id), int(change_id)
+        except ValueError:
+            raise InvalidRowChangeCursor()
+
+    @classmethod
+    def get_changes(
+        cls, table: Table, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[RowChange], Optional[str], bool]:
+        """
+        Returns the changes of the table after the provided cursor in the order in
+        which they were committed. Only changes made by transactions older than the
+        oldest transaction still in progress are returned. This makes sure that a
+        change that is committed later can never end up before a returned cursor.
+
+        :param table: The table to get the changes of.
+        :param cursor: The cursor returned by a previous call. If not provided, the
+            changes are returned from the start of the retained change log.
+        :param limit: The maximum number of changes to return.
+        :raises RowChangeLogDisabled: When the change log is disabled.
+        :raises InvalidRowChangeCursor: When the cursor can't be parsed.
+        :raises RowChangeCursorExpired: When the change of the cursor no longer
+            exists because it's older than the retention period.
+        :return: The changes, the cursor to use for the next call and whether there
+            are more changes available right away.
+        """
+
+        if not settings.BASEROW_ROW_CHANGE_LOG_ENABLED:
+            raise RowChangeLogDisabled()
+
+        # The changes of the current transaction itself are visible as well, which
+        # only matters if rows have been changed in the same transaction.
+        queryset = RowChange.objects.filter(
+            Q(
+                transaction_id__lt=RawSQL(
+                    "txid_snapshot_xmin(txid_current_snapshot())", ()
+                )
+            )
+            | Q(transaction_id=RawSQL("txid_current_if_assigned()", ())),
+            table=table,
+        )
+
+        if cursor:
+            transaction_id, change_id = cls.decode_cursor(cursor)
+            if not RowChange.objects.filter(
+                id=change_id, table=table, transaction_id=transaction_id
+            ).exists():
+                raise RowChangeCursorExpired()
+            queryset = queryset.filter(
+                Q(transaction_id__gt=transaction_id)
+                | Q(transaction_id=transaction_id, id__gt=change_id)
+            )
+
+        changes = list(queryset.order_by("transaction_id", "id")[: limit + 1])
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        next_cursor = cls.encode_cursor(changes[-1]) if changes else cursor
+        return changes, next_cursor, has_more
+
+    @classmethod
+    def delete_expired_changes(cls) -> int:
+        """
+        Deletes the changes that are older than the configured retention period.
+
+        :return: The number of deleted changes.
+        """
+
+        expired_before = timezone.now() - timedelta(
+            hours=settings.BASEROW_ROW_CHANGE_LOG_RETENTION_HOURS
+        )
+        queryset = RowChange.objects.filter(created_on__lt=expired_before)
+        return queryset._raw_delete(queryset.db)
@@ -0,0 +1,36 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from baserow.contrib.database.table.models import Table
+
+
+class RowChange(models.Model):
+    """
+    An append only entry in the change log of a table. One entry is created for
+    every batch of rows that is created, updated or deleted, so only the ids of the
+    rows and fields are stored. The transaction id is used to order the changes in
+    the order in which they were committed.
+    """
+
+    CREATED = 1
+    UPDATED = 2
+    DELETED = 3
+    ACTIONS = ((CREATED, "created"), (UPDATED, "updated"), (DELETED, "deleted"))
+
+    id = models.BigAutoField(primary_key=True)
+    table = models.ForeignKey(Table, on_delete=models.CASCADE, related_name="+")
+    transaction_id = models.BigIntegerField(
+        help_text="The id of the transaction in which the rows were changed."
+    )
+    action = models.PositiveSmallIntegerField(choices=ACTIONS)
+    row_ids = ArrayField(models.IntegerField())
+    field_ids = ArrayField(
+        models.IntegerField(),
+        null=True,
+        help_text="The ids of the fields that were updated, only set for updates.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ("transaction_id", "id")
+        indexes = [models.Index(fields=["table", "transaction_id", "id"])]
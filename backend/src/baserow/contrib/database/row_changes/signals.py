@@ -0,0 +1,26 @@
+from django.dispatch import receiver
+
+from baserow.contrib.database.rows import signals as row_signals
+
+from .handler import RowChangeHandler
+from .models import RowChange
+
+
+@receiver(row_signals.rows_created)
+def rows_created(sender, rows, table, **kwargs):
+    RowChangeHandler.record_changes(table, RowChange.CREATED, [row.id for row in rows])
+
+
+@receiver(row_signals.rows_updated)
+def rows_updated(sender, rows, table, updated_field_ids=None, **kwargs):
+    RowChangeHandler.record_changes(
+        table,
+        RowChange.UPDATED,
+        [row.id for row in rows],
+        updated_field_ids if updated_field_ids is not None else [],
+    )
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted(sender, rows, table, **kwargs):
+    RowChangeHandler.record_changes(table, RowChange.DELETED, [row.id for row in rows])
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def delete_expired_row_changes(self):
+    """
+    Deletes the entries of the row change logs that are older than the configured
+    retention period.
+    """
+
+    from .handler import RowChangeHandler
+
+    RowChangeHandler.delete_expired_changes()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    if settings.BASEROW_ROW_CHANGE_LOG_ENABLED:
+        sender.add_periodic_task(
+            timedelta(minutes=settings.BASEROW_ROW_CHANGE_LOG_CLEANUP_INTERVAL_MINUTES),
+            delete_expired_row_changes.s(),
+        )
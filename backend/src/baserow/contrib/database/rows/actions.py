@@ -10,6 +10,7 @@ from baserow.contrib.database.action.scopes import (
     TABLE_ACTION_CONTEXT,
     TableActionScopeType,
 )
+from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.rows.handler import (
     GeneratedTableModelForUpdate,
     RowHandler,
@@ -765,3 +766,138 @@ class UpdateRowsActionType(UndoableActionType):
     def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
         table = TableHandler().get_table(params.table_id)
         RowHandler().update_rows(user, table, params.row_values)
+
+
+class UpsertRowsActionType(UndoableActionType):
+    type = "upsert_rows"
+    description = ActionTypeDescription(
+        _("Upsert rows"), _("Rows (%(row_ids)s) upserted"), TABLE_ACTION_CONTEXT
+    )
+
+    @dataclasses.dataclass
+    class Params:
+        table_id: int
+        table_name: str
+        database_id: int
+        database_name: str
+        row_ids: List[int]
+        created_row_ids: List[int]
+        row_values: List[Dict[str, Any]]
+        original_rows_values: List[Dict[str, Any]]
+        trashed_rows_entry_id: Optional[int] = None
+
+    @classmethod
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        rows: List[Dict[str, Any]],
+        match_field: Field,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModel]:
+        """
+        Updates the existing rows having the same match field value as the provided
+        rows and creates the others. See the
+        baserow.contrib.database.rows.handler.RowHandler.upsert_rows for more
+        information.
+        Undoing this action trashes the created rows and restores the original
+        values of the updated rows. Redoing restores the created rows and sets the
+        new values again.
+
+        :param user: The user of whose behalf the rows are upserted.
+        :param table: The table in which the rows must be upserted.
+        :param rows: The rows values keyed by the field names.
+        :param match_field: The field used to match the provided rows with the
+            existing rows.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The created and updated rows in the same order as the provided
+            rows.
+        """
+
+        row_handler = RowHandler()
+
+        if model is None:
+            model = table.get_model()
+
+        matched_row_ids = row_handler.get_upsert_matched_row_ids(
+            model, match_field, rows
+        )
+        rows_keys_map = {
+            row_id: row.keys()
+            for row, row_id in zip(rows, matched_row_ids)
+            if row_id is not None
+        }
+        original_rows = row_handler.get_rows_for_update(model, rows_keys_map.keys())
+
+        original_rows_values = []
+        for row in original_rows:
+            original_row_values = row_handler.get_internal_values_for_fields(
+                row, rows_keys_map[row.id]
+            )
+            original_row_values["id"] = row.id
+            original_rows_values.append(original_row_values)
+
+        new_rows_values = [
+            {**deepcopy(row), "id": row_id}
+            for row, row_id in zip(rows, matched_row_ids)
+            if row_id is not None
+        ]
+
+        upserted_rows = row_handler.upsert_rows(
+            user,
+            table,
+            rows,
+            match_field,
+            model=model,
+            matched_row_ids=matched_row_ids,
+            rows_to_update=original_rows,
+        )
+
+        group = table.database.group
+        params = cls.Params(
+            table.id,
+            table.name,
+            table.database.id,
+            table.database.name,
+            [row.id for row in upserted_rows],
+            [
+                row.id
+                for row, row_id in zip(upserted_rows, matched_row_ids)
+                if row_id is None
+            ],
+            new_rows_values,
+            original_rows_values,
+        )
+        cls.register_action(user, params, cls.scope(table.id), group=group)
+
+        return upserted_rows
+
+    @classmethod
+    def scope(cls, table_id) -> ActionScopeStr:
+        return TableActionScopeType.value(table_id)
+
+    @classmethod
+    def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        table = TableHandler().get_table(params.table_id)
+        if params.original_rows_values:
+            RowHandler().update_rows(user, table, params.original_rows_values)
+        if params.created_row_ids:
+            trashed_rows_trash_entry = RowHandler().delete_rows(
+                user, table, params.created_row_ids
+            )
+            params.trashed_rows_entry_id = trashed_rows_trash_entry.id
+            action_being_undone.params = params
+
+    @classmethod
+    def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        table = TableHandler().get_table(params.table_id)
+        if params.trashed_rows_entry_id is not None:
+            TrashHandler.restore_item(
+                user,
+                "rows",
+                params.trashed_rows_entry_id,
+                parent_trash_item_id=params.table_id,
+            )
+        if params.row_values:
+            RowHandler().update_rows(user, table, deepcopy(params.row_values))
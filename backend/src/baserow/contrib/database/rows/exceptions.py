@@ -24,3 +24,18 @@ class ReportMaxErrorCountExceeded(Exception):
     def __init__(self, report, *args, **kwargs):
         self.report = report
         super().__init__("Too many errors", *args, **kwargs)
+
+
+class InvalidUpsertMatchField(Exception):
+    """
+    Raised when a field that can't be used to match existing rows is provided
+    when upserting rows.
+    """
+
+
+class UpsertMatchValuesNotUnique(Exception):
+    """Raised when multiple upserted rows have the same match field value."""
+
+    def __init__(self, values, *args, **kwargs):
+        self.values = values
+        super().__init__(*args, **kwargs)
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, NewType, Optional, Set, Tuple, Type, cast
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import F, Max, Q, QuerySet
+from django.db.models import F, Max, Model, Q, QuerySet
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.utils.encoding import force_str
 
@@ -16,13 +16,17 @@ from baserow.contrib.database.fields.dependencies.handler import FieldDependency
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
 )
+from baserow.contrib.database.fields.exceptions import (
+    FieldDoesNotExist,
+    IncompatibleFieldTypeForRelatedValues,
+)
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_OR,
     AnnotatedQ,
     FilterBuilder,
 )
-from baserow.contrib.database.fields.models import LinkRowField
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.table.operations import (
@@ -30,13 +34,19 @@ from baserow.contrib.database.table.operations import (
     ImportRowsDatabaseTableOperationType,
 )
 from baserow.contrib.database.trash.models import TrashedRows
+from baserow.core.db import bulk_update_from_values
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import Progress, get_non_unique_values, grouper
 
 from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION
 from .error_report import RowErrorReport
-from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .exceptions import (
+    InvalidUpsertMatchField,
+    RowDoesNotExist,
+    RowIdsNotUnique,
+    UpsertMatchValuesNotUnique,
+)
 from .operations import (
     DeleteDatabaseRowOperationType,
     MoveRowDatabaseRowOperationType,
@@ -346,6 +356,52 @@ class RowHandler:
 
         return row
 
+    def get_related_values_queryset(
+        self,
+        user: AbstractUser,
+        table: Table,
+        row_id: int,
+        field_id: int,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> QuerySet:
+        """
+        Returns a queryset containing all the related values of a single cell of a
+        field that can preview its related values. This can be used to paginate
+        through the values of a cell when only the first ones have been fetched
+        when listing the rows.
+
+        :param user: The user of whose behalf the related values are requested.
+        :param table: The table where the row must be fetched from.
+        :param row_id: The id of the row of the cell.
+        :param field_id: The id of the field of the cell.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :raises FieldDoesNotExist: When the field does not exist in the table.
+        :raises IncompatibleFieldTypeForRelatedValues: When the field does not have
+            a list of related values.
+        :raises RowDoesNotExist: When the row with the provided id does not exist.
+        :return: The ordered queryset of the related values.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        try:
+            field_object = model._field_objects[field_id]
+        except KeyError:
+            raise FieldDoesNotExist(f"The field {field_id} does not exist.")
+
+        field_type = field_object["type"]
+        if not field_type.can_preview_related_values:
+            raise IncompatibleFieldTypeForRelatedValues(
+                f"The field type `{field_type.type}` does not have related values."
+            )
+
+        row = self.get_row(user, table, row_id, model)
+        return field_type.enhance_related_values_queryset(
+            getattr(row, field_object["name"]).all(), field_object["field"]
+        )
+
     def get_adjacent_row(self, row, original_queryset, previous=False, view=None):
         """
         Fetches the adjacent row of the provided row. By default, the next row will
@@ -699,7 +755,11 @@ class RowHandler:
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(fields)
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table, model, fields, [instance.id], rows_created=True
+        )
+        view_handler.field_value_updated(fields, aggregations_delta=aggregations_delta)
 
         return instance
 
@@ -809,6 +869,13 @@ class RowHandler:
             updated_field_ids=updated_field_ids,
         )
 
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table, model, updated_fields, [row.id]
+        )
+
         values = self.prepare_values(model._field_objects, values)
         values, manytomany_values = self.extract_manytomany_values(values, model)
 
@@ -863,9 +930,9 @@ class RowHandler:
         # query for the rows updated values instead.
         row.refresh_from_db(fields=model.fields_requiring_refresh_after_update())
 
-        from baserow.contrib.database.views.handler import ViewHandler
-
-        ViewHandler().field_value_updated(updated_fields)
+        view_handler.field_value_updated(
+            updated_fields, aggregations_delta=aggregations_delta
+        )
 
         rows_updated.send(
             self,
@@ -1024,7 +1091,17 @@ class RowHandler:
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
-        ViewHandler().field_value_updated(updated_fields)
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table,
+            model,
+            updated_fields,
+            [row.id for row in inserted_rows],
+            rows_created=True,
+        )
+        view_handler.field_value_updated(
+            updated_fields, aggregations_delta=aggregations_delta
+        )
 
         if send_signal:
             rows_to_return = list(
@@ -1341,6 +1418,14 @@ class RowHandler:
             updated_field_ids=updated_field_ids,
         )
 
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        updated_fields = [o["field"] for o in model._field_objects.values()]
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table, model, updated_fields, row_ids
+        )
+
         rows_relationships = []
         for obj in rows_to_update:
             # The `updated_on` field is not updated with `bulk_update`,
@@ -1371,9 +1456,8 @@ class RowHandler:
                     model._meta.get_field(field_name).pre_save(obj, add=False),
                 )
 
-        many_to_many = defaultdict(list)
-        row_column_name = None
-        row_ids_change_m2m_per_field = defaultdict(set)
+        many_to_many = defaultdict(dict)
+        many_to_many_columns = {}
 
         # This update can remove link row connections with other rows. We need to keep
         # track of these so we can later update any dependant cells in those rows that
@@ -1401,21 +1485,19 @@ class RowHandler:
                     if type(field) is not ForeignKey:
                         continue
 
-                    row_ids_change_m2m_per_field[field_name].add(row.id)
-
                     if is_referencing_the_same_table:
                         # django creates 'from_tableXmodel' and 'to_tableXmodel'
                         # columns for self-referencing many_to_many relations.
                         row_column = field.get_attname_column()[1]
-                        row_column_name = row_column
                         value_column = row_column.replace("from", "to")
                         break
                     elif field.remote_field.model == model:
                         row_column = field.get_attname_column()[1]
-                        row_column_name = row_column
                     else:
                         value_column = field.get_attname_column()[1]
 
+                many_to_many_columns[field_name] = (row_column, value_column)
+
                 # If this m2m field is a link row we need to find out all connections
                 # which will be removed by this update. This is so we can update
                 # rows which previously were connected to an updated row, but no
@@ -1429,49 +1511,43 @@ class RowHandler:
                     deleted_m2m_rels_per_link_field[field.id].update(
                         m2m_rels_before_update
                     )
+                    # After we have discarded all connections the user has provided
+                    # we will be left with only the deleted connections as desired.
+                    deleted_m2m_rels_per_link_field[field.id].difference_update(value)
 
-                if len(value) == 0:
-                    many_to_many[field_name].append(None)
-                else:
-                    for i in value:
-                        # After we have discarded all connections the user has provided
-                        # we will be left with only the deleted connections as desired.
-                        deleted_m2m_rels_per_link_field[field.id].discard(i)
-                        many_to_many[field_name].append(
-                            getattr(model, field_name).through(
-                                **{
-                                    row_column: row.id,
-                                    value_column: i,
-                                }
-                            )
-                        )
+                many_to_many[field_name][row.id] = list(value)
 
         # The many to many relations need to be updated first because they need to
         # exist when the rows are updated in bulk. Otherwise, the formula and lookup
         # fields can't see the relations.
-        for field_name, values in many_to_many.items():
-            through = getattr(model, field_name).through
-            filter = {
-                f"{row_column_name}__in": row_ids_change_m2m_per_field[field_name]
-            }
-            delete_qs = through.objects.all().filter(**filter)
-            delete_qs._raw_delete(delete_qs.db)
-            through.objects.bulk_create([v for v in values if v is not None])
+        for field_name, values_per_row in many_to_many.items():
+            row_column, value_column = many_to_many_columns[field_name]
+            self._update_many_to_many_relations(
+                getattr(model, field_name).through,
+                row_column,
+                value_column,
+                values_per_row,
+                # The order of link row relations is determined by the related rows,
+                # for the other fields it's the order in which they were added.
+                keep_order=not isinstance(
+                    field_name_to_field[field_name], LinkRowField
+                ),
+            )
 
+        # Only the fields provided in the rows and the fields that must be refreshed
+        # after every update, like the last modified fields, have to be written.
+        fields_to_update = {
+            model._field_objects[field_id]["name"] for field_id in updated_field_ids
+        }
+        fields_to_update.update(model.fields_requiring_refresh_after_update())
         bulk_update_fields = ["updated_on"]
-        for field in model._field_objects.values():
-            field_name = field["name"]
+        for field_name in sorted(fields_to_update):
             model_field = model._meta.get_field(field_name)
-            # For now all valid fields that don't represent a relationship will be
-            # used in the bulk_update() call. This could be optimized in the future
-            # if we can select just fields that need to be updated (fields that are
-            # passed in + read only fields that need updating too)
             not_m2m = not isinstance(model_field, ManyToManyField)
             if not_m2m and getattr(model_field, "valid_for_bulk_update", True):
                 bulk_update_fields.append(field_name)
 
-        if len(bulk_update_fields) > 0:
-            model.objects.bulk_update(rows_to_update, bulk_update_fields)
+        bulk_update_from_values(model, rows_to_update, bulk_update_fields)
 
         update_collector = FieldUpdateCollector(
             table,
@@ -1498,10 +1574,9 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
 
-        from baserow.contrib.database.views.handler import ViewHandler
-
-        updated_fields = [o["field"] for o in model._field_objects.values()]
-        ViewHandler().field_value_updated(updated_fields)
+        view_handler.field_value_updated(
+            updated_fields, aggregations_delta=aggregations_delta
+        )
 
         rows_to_return = list(
             model.objects.all().enhance_by_fields().filter(id__in=row_ids)
@@ -1518,6 +1593,77 @@ class RowHandler:
 
         return rows_to_return
 
+    def _update_many_to_many_relations(
+        self,
+        through: Type[Model],
+        row_column: str,
+        value_column: str,
+        values_per_row: Dict[int, List[int]],
+        keep_order: bool,
+    ):
+        """
+        Changes the relations in the through table of a many to many field so that
+        the provided rows relate to exactly the provided values. Instead of deleting
+        and recreating all the relations, only the relations that actually change
+        are deleted or created.
+
+        :param through: The through model of the many to many field.
+        :param row_column: The column in the through table containing the row id.
+        :param value_column: The column in the through table containing the value.
+        :param values_per_row: The new values keyed by the id of the row.
+        :param keep_order: Whether the relations are ordered by the id of the
+            through table. If so, existing relations are only kept if all the
+            relations before it are kept as well, so that the order of the new
+            values is respected.
+        """
+
+        existing_per_row = defaultdict(list)
+        for relation_id, row_id, value in (
+            through.objects.filter(**{f"{row_column}__in": values_per_row.keys()})
+            .order_by("id")
+            .values_list("id", row_column, value_column)
+        ):
+            existing_per_row[row_id].append((relation_id, value))
+
+        relation_ids_to_delete = []
+        relations_to_create = []
+        for row_id, values in values_per_row.items():
+            existing = existing_per_row[row_id]
+            if keep_order:
+                kept = 0
+                while (
+                    kept < len(existing)
+                    and kept < len(values)
+                    and existing[kept][1] == values[kept]
+                ):
+                    kept += 1
+                relation_ids_to_delete.extend(
+                    relation_id for relation_id, _ in existing[kept:]
+                )
+                values_to_create = values[kept:]
+            else:
+                new_values = set(values)
+                existing_values = {value for _, value in existing}
+                relation_ids_to_delete.extend(
+                    relation_id
+                    for relation_id, value in existing
+                    if value not in new_values
+                )
+                values_to_create = [
+                    value for value in values if value not in existing_values
+                ]
+
+            relations_to_create.extend(
+                through(**{row_column: row_id, value_column: value})
+                for value in values_to_create
+            )
+
+        if relation_ids_to_delete:
+            delete_qs = through.objects.filter(id__in=relation_ids_to_delete)
+            delete_qs._raw_delete(delete_qs.db)
+        if relations_to_create:
+            through.objects.bulk_create(relations_to_create)
+
     def get_rows_for_update(
         self, model: GeneratedTableModel, row_ids: List[int]
     ) -> RowsForUpdate:
@@ -1532,6 +1678,139 @@ class RowHandler:
             .filter(id__in=row_ids),
         )
 
+    def get_upsert_matched_row_ids(
+        self,
+        model: Type[GeneratedTableModel],
+        match_field: Field,
+        rows: List[Dict[str, Any]],
+    ) -> List[Optional[int]]:
+        """
+        Finds the ids of the existing rows that have the same value for the match
+        field as the provided rows, using a single query. If multiple existing rows
+        have the same value, the one with the lowest id is matched.
+
+        :param model: The model of the table that the rows are upserted in.
+        :param match_field: The field used to match the provided rows with the
+            existing rows.
+        :param rows: The rows values keyed by the field names (`field_{id}`).
+        :raises InvalidUpsertMatchField: When the match field isn't a field of the
+            table or its values can't be compared.
+        :raises UpsertMatchValuesNotUnique: When multiple rows have the same match
+            field value.
+        :return: A list containing the id of the matched existing row for every
+            provided row, or None if the row doesn't exist yet.
+        """
+
+        field_object = model._field_objects.get(match_field.id)
+        if field_object is None:
+            raise InvalidUpsertMatchField()
+
+        field_name = field_object["name"]
+        field_type = field_object["type"]
+        model_field = model._meta.get_field(field_name)
+        if (
+            field_type.read_only
+            or isinstance(model_field, ManyToManyField)
+            or not field_type.check_can_order_by(field_object["field"])
+        ):
+            raise InvalidUpsertMatchField()
+
+        match_values = [row.get(field_name) for row in rows]
+        non_unique_values = get_non_unique_values(
+            [value for value in match_values if value is not None]
+        )
+        if len(non_unique_values) > 0:
+            raise UpsertMatchValuesNotUnique(non_unique_values)
+
+        existing_row_ids = {}
+        lookup_values = [value for value in match_values if value is not None]
+        if lookup_values:
+            for value, row_id in (
+                model.objects.filter(**{f"{field_name}__in": lookup_values})
+                .order_by("id")
+                .values_list(field_name, "id")
+            ):
+                existing_row_ids.setdefault(value, row_id)
+
+        return [
+            existing_row_ids.get(value) if value is not None else None
+            for value in match_values
+        ]
+
+    def upsert_rows(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows: List[Dict[str, Any]],
+        match_field: Field,
+        model: Optional[Type[GeneratedTableModel]] = None,
+        matched_row_ids: Optional[List[Optional[int]]] = None,
+        rows_to_update: Optional[RowsForUpdate] = None,
+    ) -> List[GeneratedTableModel]:
+        """
+        Updates the existing rows having the same match field value as the provided
+        rows and creates the rows that don't exist yet. The rows are created and
+        updated using `create_rows` and `update_rows`, so dependant fields are
+        updated and the related signals are sent exactly the same way.
+
+        :param user: The user of whose behalf the rows are upserted.
+        :param table: The table in which the rows must be upserted.
+        :param rows: The rows values keyed by the field names (`field_{id}`).
+        :param match_field: The field used to match the provided rows with the
+            existing rows.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param matched_row_ids: If the existing rows have already been matched using
+            `get_upsert_matched_row_ids`, they can be provided so that they don't
+            have to be matched again.
+        :param rows_to_update: If the matched rows to update have already been
+            fetched it can be provided so that it does not have to be fetched for a
+            second time.
+        :return: The created and updated rows in the same order as the provided
+            rows.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        if matched_row_ids is None:
+            matched_row_ids = self.get_upsert_matched_row_ids(model, match_field, rows)
+
+        rows_values_to_create = []
+        rows_values_to_update = []
+        for row_values, row_id in zip(rows, matched_row_ids):
+            if row_id is None:
+                rows_values_to_create.append(row_values)
+            else:
+                rows_values_to_update.append({**row_values, "id": row_id})
+
+        created_rows = []
+        if rows_values_to_create:
+            created_rows = self.create_rows(
+                user, table, rows_values_to_create, model=model
+            )
+
+        updated_rows_by_id = {}
+        if rows_values_to_update:
+            updated_rows_by_id = {
+                row.id: row
+                for row in self.update_rows(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    model=model,
+                    rows_to_update=rows_to_update,
+                )
+            }
+
+        created_rows_iterator = iter(created_rows)
+        return [
+            next(created_rows_iterator)
+            if row_id is None
+            else updated_rows_by_id[row_id]
+            for row_id in matched_row_ids
+        ]
+
     def move_row_by_id(
         self,
         user: AbstractUser,
@@ -1698,10 +1977,6 @@ class RowHandler:
             self, rows=[row], user=user, table=table, model=model
         )
 
-        TrashHandler.trash(user, group, table.database, row, parent_id=table.id)
-
-        update_collector = FieldUpdateCollector(table, starting_row_ids=[row.id])
-        field_cache = FieldCache()
         updated_field_ids = []
         updated_fields = []
 
@@ -1710,6 +1985,18 @@ class RowHandler:
             field = field_object["field"]
             updated_fields.append(field)
 
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table, model, updated_fields, [row.id]
+        )
+
+        TrashHandler.trash(user, group, table.database, row, parent_id=table.id)
+
+        update_collector = FieldUpdateCollector(table, starting_row_ids=[row.id])
+        field_cache = FieldCache()
+
         for (
             dependant_field,
             dependant_field_type,
@@ -1729,9 +2016,9 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
 
-        from baserow.contrib.database.views.handler import ViewHandler
-
-        ViewHandler().field_value_updated(updated_fields)
+        view_handler.field_value_updated(
+            updated_fields, aggregations_delta=aggregations_delta
+        )
 
         rows_deleted.send(
             self,
@@ -1786,6 +2073,20 @@ class RowHandler:
             self, rows=rows, user=user, table=table, model=model
         )
 
+        updated_field_ids = []
+        updated_fields = []
+        for field_id, field_object in model._field_objects.items():
+            updated_field_ids.append(field_id)
+            field = field_object["field"]
+            updated_fields.append(field)
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        view_handler = ViewHandler()
+        aggregations_delta = view_handler.prepare_field_aggregations_delta(
+            table, model, updated_fields, row_ids
+        )
+
         trashed_rows = TrashedRows.objects.create(row_ids=row_ids, table=table)
         # It's a bit on a hack, but we're storing the fetched row objects on the
         # trashed_rows object, so that they can optionally be used later. This is for
@@ -1796,13 +2097,6 @@ class RowHandler:
             user, group, table.database, trashed_rows, parent_id=table.id
         )
 
-        updated_field_ids = []
-        updated_fields = []
-        for field_id, field_object in model._field_objects.items():
-            updated_field_ids.append(field_id)
-            field = field_object["field"]
-            updated_fields.append(field)
-
         update_collector = FieldUpdateCollector(table, starting_row_ids=row_ids)
         field_cache = FieldCache()
         for (
@@ -1824,9 +2118,9 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
 
-        from baserow.contrib.database.views.handler import ViewHandler
-
-        ViewHandler().field_value_updated(updated_fields)
+        view_handler.field_value_updated(
+            updated_fields, aggregations_delta=aggregations_delta
+        )
 
         rows_deleted.send(
             self,
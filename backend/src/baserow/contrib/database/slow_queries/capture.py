@@ -0,0 +1,85 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+_capturing: ContextVar[bool] = ContextVar("slow_table_query_capturing", default=False)
+
+
+def _get_cooldown_cache_key(table_id: int, view_id: int) -> str:
+    return f"slow_table_query_cooldown_{table_id}_{view_id}"
+
+
+def _params_to_json(params):
+    # Values that can't be serialized, like dates and decimals, are stored as their
+    # string representation.
+    return json.loads(json.dumps(list(params or []), default=str))
+
+
+@contextmanager
+def capture_slow_table_queries(queryset):
+    """
+    Captures the queries executed in the context that take longer than
+    `BASEROW_SLOW_TABLE_QUERY_THRESHOLD_MS` and schedules a task that stores them in
+    the slow table query log, together with the query context of the queryset. To
+    prevent that a frequently requested slow view floods the log, at most one query
+    per table and view is captured every `BASEROW_SLOW_TABLE_QUERY_COOLDOWN_SECONDS`.
+
+    :param queryset: The table model queryset of which the queries are executed.
+    """
+
+    threshold = settings.BASEROW_SLOW_TABLE_QUERY_THRESHOLD_MS
+    # Queries of nested querysets, like the prefetched related rows, are captured
+    # as part of the outermost queryset.
+    if not threshold or _capturing.get():
+        yield
+        return
+
+    captured = []
+
+    def capture(execute, sql, params, many, context):
+        start = perf_counter()
+        result = execute(sql, params, many, context)
+        duration_ms = (perf_counter() - start) * 1000
+        if duration_ms >= threshold and not many:
+            bound_sql = context["cursor"].mogrify(sql, params)
+            captured.append((sql, params, bound_sql, duration_ms))
+        return result
+
+    token = _capturing.set(True)
+    try:
+        with connections[queryset.db].execute_wrapper(capture):
+            yield
+    finally:
+        _capturing.reset(token)
+
+    if not captured:
+        return
+
+    table_id = queryset.model.baserow_table_id
+    view_id = queryset._query_context.get("view_id")
+    if not cache.add(
+        _get_cooldown_cache_key(table_id, view_id),
+        True,
+        timeout=settings.BASEROW_SLOW_TABLE_QUERY_COOLDOWN_SECONDS,
+    ):
+        return
+
+    from .tasks import store_slow_table_query
+
+    sql, params, bound_sql, duration_ms = max(captured, key=lambda query: query[3])
+    if isinstance(bound_sql, bytes):
+        bound_sql = bound_sql.decode("utf-8")
+    store_slow_table_query.delay(
+        table_id,
+        view_id,
+        sql,
+        _params_to_json(params),
+        bound_sql,
+        duration_ms,
+        queryset._query_context.get("search"),
+    )
@@ -0,0 +1,133 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.views.models import View, ViewFilter, ViewSort
+
+from .models import SlowTableQuery
+
+LOCKING_CLAUSE_REGEX = re.compile(
+    r"\bFOR\s+(NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.IGNORECASE
+)
+
+
+class SlowTableQueryHandler:
+    @classmethod
+    def explain(cls, bound_sql: str) -> Optional[str]:
+        """
+        Executes the query again with `EXPLAIN (ANALYZE, BUFFERS)` and returns the
+        plan. The query is executed in a savepoint that is rolled back afterwards
+        and with a statement timeout, so that analyzing an extremely slow query
+        can't block the worker. Only select queries without a locking clause are
+        analyzed because the analyzed query is actually executed, and it would
+        otherwise lock the rows of the live table.
+        """
+
+        is_select = bound_sql.lstrip().upper().startswith("SELECT")
+        if not is_select or LOCKING_CLAUSE_REGEX.search(bound_sql):
+            return None
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL statement_timeout = %s",
+                    [settings.BASEROW_SLOW_TABLE_QUERY_EXPLAIN_TIMEOUT_MS],
+                )
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {bound_sql}")  # nosec B608
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            # Rolling back the savepoint also resets the statement timeout.
+            transaction.set_rollback(True)
+        return plan
+
+    @classmethod
+    def get_view_context(cls, view: View) -> Dict[str, Any]:
+        """
+        Returns the filter and sort configuration of the view that determined the
+        captured query.
+        """
+
+        return {
+            "filter_type": view.filter_type,
+            "filters_disabled": view.filters_disabled,
+            "filters": list(
+                ViewFilter.objects.filter(view=view)
+                .order_by("id")
+                .values("field_id", "type", "value")
+            ),
+            "sorts": list(
+                ViewSort.objects.filter(view=view)
+                .order_by("id")
+                .values("field_id", "order")
+            ),
+        }
+
+    @classmethod
+    def store(
+        cls,
+        table_id: int,
+        view_id: Optional[int],
+        sql: str,
+        params: List[Any],
+        bound_sql: str,
+        duration_ms: float,
+        search: Optional[str] = None,
+    ) -> Optional[SlowTableQuery]:
+        """
+        Stores a captured slow query in the log together with the configuration of
+        the view and, if enabled, an `EXPLAIN (ANALYZE, BUFFERS)` sample. The oldest
+        entries are removed when the log contains more than
+        `BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES` entries.
+
+        :param table_id: The id of the table that was queried.
+        :param view_id: The id of the view that was queried, if any.
+        :param sql: The SQL of the query containing placeholders.
+        :param params: The parameters of the query.
+        :param bound_sql: The SQL of the query including the parameters.
+        :param duration_ms: The duration of the query in milliseconds.
+        :param search: The search term that was applied to the query.
+        :return: The created log entry or None if the table doesn't exist anymore.
+        """
+
+        table = Table.objects.filter(id=table_id).first()
+        if table is None:
+            return None
+
+        view = View.objects.filter(id=view_id).first() if view_id else None
+        context = {"search": search}
+        if view is not None:
+            context.update(cls.get_view_context(view))
+
+        explain = None
+        if settings.BASEROW_SLOW_TABLE_QUERY_EXPLAIN:
+            explain = cls.explain(bound_sql)
+
+        slow_query = SlowTableQuery.objects.create(
+            table=table,
+            view=view,
+            duration_ms=duration_ms,
+            sql=sql,
+            params=params,
+            explain=explain,
+            context=context,
+        )
+        cls.rotate()
+        return slow_query
+
+    @classmethod
+    def rotate(cls):
+        """
+        Deletes the oldest log entries so that at most
+        `BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES` entries are kept.
+        """
+
+        max_entries = settings.BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES
+        oldest_id_to_keep = (
+            SlowTableQuery.objects.order_by("-id")
+            .values_list("id", flat=True)[max_entries - 1 : max_entries]
+            .first()
+        )
+        if oldest_id_to_keep is not None:
+            SlowTableQuery.objects.filter(id__lt=oldest_id_to_keep).delete()
@@ -0,0 +1,35 @@
+from django.db import models
+
+from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.views.models import View
+
+
+class SlowTableQuery(models.Model):
+    """
+    A query on the rows of a table that took longer than the configured threshold.
+    Only the last `BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES` queries are kept.
+    """
+
+    table = models.ForeignKey(Table, on_delete=models.CASCADE, related_name="+")
+    view = models.ForeignKey(
+        View, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    duration_ms = models.FloatField(
+        help_text="The duration of the query in milliseconds when it was captured."
+    )
+    sql = models.TextField()
+    params = models.JSONField(default=list)
+    explain = models.TextField(
+        null=True,
+        help_text="The output of `EXPLAIN (ANALYZE, BUFFERS)` of the query when it "
+        "was analyzed after it was captured.",
+    )
+    context = models.JSONField(
+        default=dict,
+        help_text="The search and the filter and sort configuration of the view "
+        "when the query was captured.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-id",)
@@ -0,0 +1,17 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def store_slow_table_query(
+    self, table_id, view_id, sql, params, bound_sql, duration_ms, search=None
+):
+    """
+    Analyzes and stores a captured slow table query outside of the request in
+    which it was executed.
+    """
+
+    from .handler import SlowTableQueryHandler
+
+    SlowTableQueryHandler.store(
+        table_id, view_id, sql, params, bound_sql, duration_ms, search
+    )
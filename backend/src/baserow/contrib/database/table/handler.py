@@ -28,11 +28,13 @@ from baserow.contrib.database.operations import (
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.view_types import GridViewType
+from baserow.core.db import bulk_create_specific
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import application_type_registry
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import ChildProgressBuilder, Progress, find_unused_name
 
+from .cache import invalidate_table_in_model_cache
 from .constants import TABLE_CREATION
 from .exceptions import (
     FailedToLockTableDueToConflict,
@@ -212,22 +214,29 @@ class TableHandler:
         )
 
         # Let's create the fields before creating the model so that the whole
-        # table schema is created right away.
-        field_options_dict = {}
+        # table schema is created right away. The fields are inserted in bulk because
+        # tables can be imported with hundreds of them.
+        field_options_list = []
         for index, (name, field_type_name, field_config) in enumerate(fields):
-            field_options = field_config.pop("field_options", None)
+            field_options_list.append(field_config.pop("field_options", None))
             field_type = field_type_registry.get(field_type_name)
             FieldModel = field_type.model_class
 
-            fields[index] = FieldModel.objects.create(
+            fields[index] = FieldModel(
                 table=table,
                 order=index,
                 primary=index == 0,
                 name=name,
                 **field_config,
             )
-            if field_options:
-                field_options_dict[fields[index].id] = field_options
+        bulk_create_specific(Field, fields)
+        invalidate_table_in_model_cache(table.id)
+
+        field_options_dict = {
+            field.id: field_options
+            for field, field_options in zip(fields, field_options_list)
+            if field_options
+        }
 
         # Creates a default view
         view_handler = ViewHandler()
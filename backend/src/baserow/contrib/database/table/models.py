@@ -1,10 +1,11 @@
 import re
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Optional, Type, Union
 
 from django.apps import apps
 from django.conf import settings
 from django.db import models
 from django.db.models import F, JSONField, Q, QuerySet
+from django.db.models.query import ModelIterable
 
 from baserow.contrib.database.fields.exceptions import (
     FilterFieldNotFound,
@@ -19,6 +20,11 @@ from baserow.contrib.database.fields.field_filters import (
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.models import CreatedOnField, LastModifiedField
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.related_values_preview import (
+    RelatedValuesPreview,
+    prefetch_related_values_previews,
+)
+from baserow.contrib.database.slow_queries.capture import capture_slow_table_queries
 from baserow.contrib.database.table.cache import (
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
@@ -38,6 +44,7 @@ from baserow.core.mixins import (
     OrderableMixin,
     TrashableModelMixin,
 )
+from baserow.core.profiling import profile_section
 from baserow.core.utils import split_comma_separated_string
 
 deconstruct_filter_key_regex = re.compile(
@@ -46,19 +53,97 @@ deconstruct_filter_key_regex = re.compile(
 
 
 class TableModelQuerySet(models.QuerySet):
-    def enhance_by_fields(self):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._related_values_previews = []
+        self._related_values_previews_done = False
+        self._query_context = {}
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._related_values_previews = self._related_values_previews[:]
+        clone._query_context = self._query_context.copy()
+        return clone
+
+    def with_query_context(self, **context):
+        """
+        Returns a copy of the queryset that remembers where it was created from,
+        like the id of the view and the search term, so that a slow query can be
+        traced back to its origin.
+        """
+
+        clone = self._chain()
+        clone._query_context.update(context)
+        return clone
+
+    def count(self):
+        with capture_slow_table_queries(self):
+            return super().count()
+
+    def exists(self):
+        with capture_slow_table_queries(self):
+            return super().exists()
+
+    def aggregate(self, *args, **kwargs):
+        with capture_slow_table_queries(self):
+            return super().aggregate(*args, **kwargs)
+
+    def _fetch_all(self):
+        with capture_slow_table_queries(self):
+            super()._fetch_all()
+        if (
+            self._related_values_previews
+            and not self._related_values_previews_done
+            and issubclass(self._iterable_class, ModelIterable)
+        ):
+            prefetch_related_values_previews(
+                self._result_cache, self._related_values_previews
+            )
+            self._related_values_previews_done = True
+
+    def enhance_by_fields(self, related_values_limit: Optional[int] = None):
         """
         Enhances the queryset based on the `enhance_queryset` for each field in the
         table. For example the `link_row` field adds the `prefetch_related` to prevent
         N queries per row. This helper should only be used when multiple rows are going
         to be fetched.
 
+        A single cell can be linked to thousands of rows. If the
+        `related_values_limit` is provided, then only the first related values of
+        every row are fetched for the fields that can preview their related values.
+        This happens in one query per field right after the rows have been fetched.
+        The total number of related values is stored in the `_related_values_counts`
+        dict of every row keyed by the field id.
+
+        :param related_values_limit: If provided, the maximum number of related
+            values that are fetched per row for the fields that support it.
         :return: The enhanced queryset.
         :rtype: QuerySet
         """
 
         for field_object in self.model._field_objects.values():
-            self = field_object["type"].enhance_queryset(
+            field_type = field_object["type"]
+            if (
+                related_values_limit is not None
+                and field_type.can_preview_related_values
+            ):
+                remote_model = self.model._meta.get_field(
+                    field_object["name"]
+                ).remote_field.model
+                self = self._chain()
+                self._related_values_previews.append(
+                    RelatedValuesPreview(
+                        field_object["field"].id,
+                        field_object["name"],
+                        related_values_limit,
+                        field_type.enhance_related_values_queryset(
+                            remote_model.objects.all(), field_object["field"]
+                        ),
+                    )
+                )
+                continue
+
+            self = field_type.enhance_queryset(
                 self, field_object["field"], field_object["name"]
             )
         return self
@@ -433,6 +518,7 @@ class Table(
     def get_database_table_name(self):
         return f"{self.USER_TABLE_DATABASE_NAME_PREFIX}{self.id}"
 
+    @profile_section("model_generation")
     def get_model(
         self,
         fields=None,
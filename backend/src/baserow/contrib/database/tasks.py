@@ -1,3 +1,15 @@
+from baserow.contrib.database.field_indexes.tasks import (
+    setup_periodic_tasks as setup_field_indexes_periodic_tasks,
+)
+from baserow.contrib.database.row_changes.tasks import (
+    setup_periodic_tasks as setup_row_changes_periodic_tasks,
+)
+from baserow.contrib.database.slow_queries.tasks import store_slow_table_query
 from baserow.contrib.database.table.tasks import setup_periodic_tasks
 
-__all__ = ["setup_periodic_tasks"]
+__all__ = [
+    "setup_periodic_tasks",
+    "setup_row_changes_periodic_tasks",
+    "setup_field_indexes_periodic_tasks",
+    "store_slow_table_query",
+]
@@ -313,9 +313,19 @@ class RowTrashableItemType(TrashableItemType):
             user=None,
         )
 
+    can_permanently_delete_in_bulk = True
+
     def permanently_delete_item(self, row, trash_item_lookup_cache=None):
         row.delete()
 
+    def permanently_delete_items(
+        self, trash_item_ids, parent_id, trash_item_lookup_cache=None
+    ):
+        model = self._get_cached_table_model(parent_id, trash_item_lookup_cache)
+        # Deleting via the queryset removes the rows and their relations with a
+        # single query per table instead of a query per row.
+        model.trash.filter(id__in=trash_item_ids).delete()
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -330,21 +340,9 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
@@ -355,6 +353,18 @@ class RowTrashableItemType(TrashableItemType):
         table = self._get_table(table_id)
         return table.get_model()
 
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
     def get_restore_operation_type(self) -> str:
         return RestoreDatabaseRowOperationType.type
 
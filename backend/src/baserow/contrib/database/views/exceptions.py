@@ -93,6 +93,13 @@ class FieldAggregationNotSupported(Exception):
     """Raised when the view type does not support field aggregation."""
 
 
+class AggregationCannotBeUpdatedIncrementally(Exception):
+    """
+    Raised when the new value of an aggregation can't be derived from its previous
+    value and the changed rows, so it must be fully recomputed.
+    """
+
+
 class AggregationTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get an aggregation type that does not exist."""
 
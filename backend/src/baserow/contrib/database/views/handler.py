@@ -9,17 +9,19 @@ from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models as django_models
-from django.db.models import Count, F
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q
 from django.db.models.query import QuerySet
 
 import jwt
 from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_filters import FILTER_TYPE_AND, FilterBuilder
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
@@ -56,6 +58,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
@@ -596,7 +599,11 @@ class ViewHandler:
         ) in decorator_value_provider_type_registry.get_all():
             decorator_value_provider_type.after_field_type_change(field)
 
-    def field_value_updated(self, updated_fields: Union[Iterable[Field], Field]):
+    def field_value_updated(
+        self,
+        updated_fields: Union[Iterable[Field], Field],
+        aggregations_delta: Optional["FieldAggregationsDelta"] = None,
+    ):
         """
         Called after a field value has been modified because of a row creation,
         modification, deletion. This method is called for each directly or indirectly
@@ -605,6 +612,9 @@ class ViewHandler:
         Calls the `.after_field_value_update(updated_fields)` of each view type.
 
         :param updated_fields: The field or list of fields that are affected.
+        :param aggregations_delta: Optionally the cached aggregations prepared with
+            `prepare_field_aggregations_delta` before the row change. They're updated
+            incrementally instead of being recomputed on the next request.
         """
 
         if not isinstance(updated_fields, list):
@@ -614,6 +624,9 @@ class ViewHandler:
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
 
+        if aggregations_delta is not None:
+            self._apply_field_aggregations_delta(aggregations_delta)
+
     def field_updated(self, updated_fields: Union[Iterable[Field], Field]):
         """
         Called for each field modification. This include indirect modification when
@@ -1403,7 +1416,11 @@ class ViewHandler:
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = (
+            model.objects.all()
+            .enhance_by_fields()
+            .with_query_context(view_id=view.id, search=search)
+        )
 
         view_type = view_type_registry.get_by_model(view.specific_class)
         if view_type.can_filter:
@@ -1600,6 +1617,13 @@ class ViewHandler:
                             "value": value,
                             "version": need_computation[key]["version"],
                         }
+                        # Make sure the version exists so that it can be incremented
+                        # atomically, which is required to update the value
+                        # incrementally later.
+                        cache.add(
+                            self._get_aggregation_version_cache_key(view, key),
+                            need_computation[key]["version"],
+                        )
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
@@ -1624,6 +1648,7 @@ class ViewHandler:
         model: Union[GeneratedTableModel, None] = None,
         with_total: bool = False,
         search: Union[str, None] = None,
+        row_ids: Optional[Iterable[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -1638,6 +1663,7 @@ class ViewHandler:
         :param with_total: Whether the total row count should be returned in the
             result.
         :param search: the search string to considerate.
+        :param row_ids: If provided, only the rows with these ids are aggregated.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -1663,6 +1689,8 @@ class ViewHandler:
             queryset = self.apply_filters(view, queryset)
         if search is not None:
             queryset = queryset.search_all_fields(search)
+        if row_ids is not None:
+            queryset = queryset.filter(id__in=row_ids)
 
         aggregation_dict = {}
 
@@ -1691,6 +1719,188 @@ class ViewHandler:
 
         return queryset.aggregate(**aggregation_dict)
 
+    def _table_has_cross_row_dependencies(
+        self, table: Table, model: GeneratedTableModel
+    ) -> bool:
+        """
+        Checks whether changing a row of the table can change the cell values of other
+        rows of the same table. This happens with a link row field to the table itself
+        or when a field looks up values that depend on the rows of this table again.
+        """
+
+        for field_object in model._field_objects.values():
+            field = field_object["field"]
+            if isinstance(field, LinkRowField) and field.link_row_table_id == table.id:
+                return True
+
+        return (
+            FieldDependency.objects.filter(
+                dependant__table_id=table.id, via__isnull=False
+            )
+            .filter(
+                Q(dependency__dependencies__isnull=False)
+                | Q(dependency__linkrowfield__isnull=False)
+            )
+            .exists()
+        )
+
+    def prepare_field_aggregations_delta(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        updated_fields: List[Field],
+        row_ids: List[int],
+        rows_created: bool = False,
+    ) -> Optional["FieldAggregationsDelta"]:
+        """
+        Must be called before the provided rows change, except when they have just
+        been created. It collects the cached aggregations of the updated fields that
+        can be updated incrementally, together with the aggregated values of the
+        changed rows before the change. The result must be passed to
+        `field_value_updated` after the change so that the cached values are updated
+        with the difference instead of being recomputed by scanning the whole table.
+
+        :param table: The table of the changed rows.
+        :param model: The model of the table.
+        :param updated_fields: The fields whose values are going to be changed.
+        :param row_ids: The ids of the changed rows.
+        :param rows_created: Indicates that the rows have just been created, so
+            they didn't have any value before.
+        :return: The cached aggregations to update or None if there isn't any.
+        """
+
+        aggregations_by_view = {}
+        for view_type in view_type_registry.get_all():
+            if not view_type.can_aggregate_field:
+                continue
+            for view, aggregations in view_type.get_aggregations_by_view(
+                updated_fields
+            ).items():
+                aggregations = [
+                    (field, aggregation_type_name)
+                    for field, aggregation_type_name in aggregations
+                    if view_aggregation_type_registry.get(
+                        aggregation_type_name
+                    ).can_be_updated_incrementally
+                ]
+                if aggregations:
+                    aggregations_by_view[view] = aggregations
+
+        if not aggregations_by_view:
+            return None
+
+        cached_keys = []
+        for view, aggregations in aggregations_by_view.items():
+            for field, _ in aggregations:
+                cached_keys += [
+                    self._get_aggregation_value_cache_key(view, field.db_column),
+                    self._get_aggregation_version_cache_key(view, field.db_column),
+                ]
+        cached = cache.get_many(cached_keys)
+
+        delta = FieldAggregationsDelta(model=model, row_ids=row_ids, views=[])
+        for view, aggregations in aggregations_by_view.items():
+            # Only the aggregations which have an up to date value in the cache can
+            # be updated. A missing version key would be recreated non atomically,
+            # so we can't rely on it to detect concurrent changes.
+            cached_values = {}
+            for field, _ in aggregations:
+                name = field.db_column
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, name)
+                )
+                cached_version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name)
+                )
+                if (
+                    cached_value is not None
+                    and cached_version is not None
+                    and cached_value["version"] == cached_version
+                ):
+                    cached_values[name] = cached_value
+
+            aggregations = [
+                agg for agg in aggregations if agg[0].db_column in cached_values
+            ]
+            if aggregations:
+                delta.views.append(
+                    {
+                        "view": view,
+                        "aggregations": aggregations,
+                        "cached_values": cached_values,
+                    }
+                )
+
+        if not delta.views or self._table_has_cross_row_dependencies(table, model):
+            return None
+
+        for view_delta in delta.views:
+            if rows_created:
+                view_delta["removed_values"] = {}
+            else:
+                view_delta["removed_values"] = self.get_field_aggregations(
+                    view_delta["view"],
+                    view_delta["aggregations"],
+                    model,
+                    row_ids=row_ids,
+                )
+
+        return delta
+
+    def _apply_field_aggregations_delta(self, delta: "FieldAggregationsDelta"):
+        """
+        Computes the new values of the aggregations prepared by
+        `prepare_field_aggregations_delta` and caches them once the transaction
+        commits. The aggregation cache versions must have been incremented by the view
+        types before. If a version has been incremented more than once since the
+        preparation, another change happened concurrently and the aggregation is left
+        for a full recomputation.
+        """
+
+        version_keys = [
+            self._get_aggregation_version_cache_key(view_delta["view"], name)
+            for view_delta in delta.views
+            for name in view_delta["cached_values"].keys()
+        ]
+        versions = cache.get_many(version_keys)
+
+        to_cache = {}
+        for view_delta in delta.views:
+            view = view_delta["view"]
+            added_values = self.get_field_aggregations(
+                view, view_delta["aggregations"], delta.model, row_ids=delta.row_ids
+            )
+
+            for field, aggregation_type_name in view_delta["aggregations"]:
+                name = field.db_column
+                version = view_delta["cached_values"][name]["version"] + 1
+                if (
+                    versions.get(self._get_aggregation_version_cache_key(view, name))
+                    != version
+                ):
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                try:
+                    value = aggregation_type.apply_delta(
+                        view_delta["cached_values"][name]["value"],
+                        view_delta["removed_values"].get(name),
+                        added_values.get(name),
+                    )
+                except AggregationCannotBeUpdatedIncrementally:
+                    continue
+
+                to_cache[self._get_aggregation_value_cache_key(view, name)] = {
+                    "value": value,
+                    "version": version,
+                }
+
+        if to_cache:
+            # The values must only be visible if the changes are actually committed.
+            transaction.on_commit(lambda: cache.set_many(to_cache))
+
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
         Rotates the slug of the provided view.
@@ -2113,6 +2323,7 @@ class CachingPublicViewRowChecker:
         self._public_views = (
             table.view_set.filter(public=True).prefetch_related("viewfilter_set").all()
         )
+        self._model = model
         self._updated_field_ids = updated_field_ids
         self._views_with_filters = []
         self._always_visible_views = []
@@ -2153,17 +2364,12 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view({row.id})
+        views = [
+            view
+            for view, _, _ in self._views_with_filters
+            if row.id in visible_row_ids_per_view[view.id]
+        ]
 
         return views + self._always_visible_views
 
@@ -2183,26 +2389,15 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
-        visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view(
+            {row.id for row in rows}
+        )
 
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        visible_views_rows = []
+        for view, _, _ in self._views_with_filters:
+            visible_ids = visible_row_ids_per_view[view.id]
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -2211,16 +2406,57 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_visible_row_ids_per_view(self, row_ids: Set[int]) -> Dict[int, Set[int]]:
+        """
+        Figures out in which of the views with filters the provided rows are visible.
+        The results which are not cached already are computed with a single query for
+        all the views, no matter how many there are.
+
+        :param row_ids: The ids of the rows to check.
+        :return: A dict where the key is the view id and the value the set of the
+            provided row ids which are visible in that view.
+        """
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        visible_row_ids_per_view = {}
+        views_to_check = []
+        for view, filter_qs, can_use_cache in self._views_with_filters:
+            cached_checks = self._view_row_check_cache[view.id]
+            if can_use_cache and all(row_id in cached_checks for row_id in row_ids):
+                visible_row_ids_per_view[view.id] = {
+                    row_id for row_id in row_ids if cached_checks[row_id]
+                }
+            else:
+                views_to_check.append((view, filter_qs, can_use_cache))
+
+        if len(views_to_check) == 0:
+            return visible_row_ids_per_view
+
+        # Every view filter is evaluated in its own correlated subquery, so that the
+        # annotations and joins of one view can't affect the result of another one.
+        visibility_annotations = {
+            f"visible_in_view_{view.id}": Exists(
+                filter_qs.filter(id=OuterRef("id")).values("id")
+            )
+            for view, filter_qs, _ in views_to_check
+        }
+        rows_visibility = (
+            self._model.objects.filter(id__in=row_ids)
+            .annotate(**visibility_annotations)
+            .values("id", *visibility_annotations.keys())
         )
 
+        for view, _, _ in views_to_check:
+            visible_row_ids_per_view[view.id] = set()
+        for row_visibility in rows_visibility:
+            for view, _, can_use_cache in views_to_check:
+                visible = row_visibility[f"visible_in_view_{view.id}"]
+                if visible:
+                    visible_row_ids_per_view[view.id].add(row_visibility["id"])
+                if can_use_cache:
+                    self._view_row_check_cache[view.id][row_visibility["id"]] = visible
+
+        return visible_row_ids_per_view
+
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
             return True
@@ -2235,3 +2471,15 @@ class CachingPublicViewRowChecker:
         # filters and so the result of the first check will be still
         # valid for any subsequent checks.
         return True
+
+
+@dataclass
+class FieldAggregationsDelta:
+    """
+    Keeps track of the cached field aggregations that will be updated incrementally
+    after a change of some rows. See `ViewHandler.prepare_field_aggregations_delta`.
+    """
+
+    model: GeneratedTableModel
+    row_ids: List[int]
+    views: List[Dict[str, Any]]
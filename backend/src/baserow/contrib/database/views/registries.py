@@ -35,6 +35,7 @@ from baserow.core.registry import (
 )
 
 from .exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
     AggregationTypeAlreadyRegistered,
     AggregationTypeDoesNotExist,
     DecoratorTypeAlreadyRegistered,
@@ -537,6 +538,23 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_aggregations_by_view(
+        self, fields: Iterable["Field"]
+    ) -> Dict["View", List[Tuple["Field", str]]]:
+        """
+        Should return the aggregations of all the views of this type that aggregate
+        at least one of the provided fields. Only the aggregations of the provided
+        fields are included.
+
+        returns a dict where the key is the view and the value a list of tuple
+        (Field, aggregation_type)
+        """
+
+        raise NotImplementedError(
+            "If the view supports field aggregation it must implement "
+            "`get_aggregations_by_view` method."
+        )
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -700,6 +718,13 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    can_use_index: bool = False
+    """
+    Indicates whether the filter compares the column of the field in a way that a
+    btree index on that column can be used, like with `=`, `<` or `>`. The field
+    index advisor only creates indexes for filters that can use them.
+    """
+
     def default_filter_on_exception(self):
         """The default Q to use when the filter value is of an incompatible type."""
 
@@ -834,6 +859,32 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    can_be_updated_incrementally = False
+    """
+    Indicates whether a cached value of this aggregation can be updated with the
+    `apply_delta` method after a row change instead of being fully recomputed.
+    """
+
+    def apply_delta(self, value: Any, removed_value: Any, added_value: Any) -> Any:
+        """
+        Computes the new value of the aggregation after some rows have changed,
+        without having to scan all the rows again. The `removed_value` is the
+        aggregation of the changed rows before the change and `added_value` the
+        aggregation of the same rows after the change. Both are `None` if there were
+        no such rows, for example when the rows have just been created or deleted.
+
+        :param value: The previous value of the aggregation for all the rows.
+        :param removed_value: The aggregation of the changed rows before the change.
+        :param added_value: The aggregation of the changed rows after the change.
+        :raises AggregationCannotBeUpdatedIncrementally: When the new value can't be
+            derived from the provided values.
+        :return: The new value of the aggregation.
+        """
+
+        raise AggregationCannotBeUpdatedIncrementally(
+            f"The {self.type} aggregation can't be updated incrementally."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
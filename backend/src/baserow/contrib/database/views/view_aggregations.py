@@ -28,12 +28,35 @@ from baserow.contrib.database.formula import (
     BaserowFormulaTextType,
 )
 
+from .exceptions import AggregationCannotBeUpdatedIncrementally
 from .registries import ViewAggregationType
 
 # See official django documentation for list of aggregator:
 # https://docs.djangoproject.com/en/4.0/ref/models/querysets/#aggregation-functions
 
 
+def apply_extremum_delta(value, removed_value, added_value, pick):
+    """
+    Updates a min or max aggregation value, depending on the `pick` function, with
+    the values of changed rows. It's only possible as long as the changed rows didn't
+    hold the extremum before the change, otherwise the next one is unknown.
+    """
+
+    if removed_value is not None and (
+        value is None or pick(removed_value, value) == removed_value
+    ):
+        if added_value is not None and (
+            value is None or pick(added_value, value) == added_value
+        ):
+            return added_value
+        raise AggregationCannotBeUpdatedIncrementally(
+            "The changed rows might have held the extremum."
+        )
+
+    values = [v for v in (value, added_value) if v is not None]
+    return pick(values) if values else None
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -75,6 +98,11 @@ class EmptyCountViewAggregationType(ViewAggregationType):
             filter=field_type.empty_query(field_name, model_field, field),
         )
 
+    can_be_updated_incrementally = True
+
+    def apply_delta(self, value, removed_value, added_value):
+        return value - (removed_value or 0) + (added_value or 0)
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -151,6 +179,11 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    can_be_updated_incrementally = True
+
+    def apply_delta(self, value, removed_value, added_value):
+        return apply_extremum_delta(value, removed_value, added_value, min)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -175,6 +208,11 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    can_be_updated_incrementally = True
+
+    def apply_delta(self, value, removed_value, added_value):
+        return apply_extremum_delta(value, removed_value, added_value, max)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -194,6 +232,21 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    can_be_updated_incrementally = True
+
+    def apply_delta(self, value, removed_value, added_value):
+        if value is None:
+            # There were no values to sum, so the changed rows didn't have any.
+            return added_value
+
+        if added_value is None and removed_value == value:
+            # We can't know if any value remains, in which case the sum is `None`.
+            raise AggregationCannotBeUpdatedIncrementally(
+                "The changed rows might have held all the values."
+            )
+
+        return value - (removed_value or 0) + (added_value or 0)
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -1,12 +1,13 @@
 from collections import defaultdict
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, tzinfo
 from decimal import Decimal
 from math import ceil, floor
-from typing import Dict, Union
+from typing import Optional, Tuple, Union
 
 from django.contrib.postgres.aggregates.general import ArrayAgg
-from django.db.models import DateTimeField, IntegerField, Q
+from django.db.models import DateTimeField, Field, IntegerField, Q
 from django.db.models.functions import Cast, Length
+from django.utils.timezone import get_current_timezone
 
 from dateutil import parser
 from dateutil.parser import ParserError
@@ -53,7 +54,57 @@ from baserow.core.models import GroupUser
 from .registries import ViewFilterType
 
 
+def get_date_range_filter(
+    field_name: str,
+    model_field: Field,
+    start: Optional[date],
+    end: Optional[date],
+    date_timezone: tzinfo,
+) -> Q:
+    """
+    Returns a half-open range filter matching the values of which the date is on or
+    after `start` and before `end`. The column itself is compared to the boundaries,
+    instead of the date extracted from it, so that Postgres can use an index on the
+    column.
+
+    :param field_name: The name of the field that must be filtered.
+    :param model_field: The field extracted from the model.
+    :param start: The first date in the range or None if the range has no start.
+    :param end: The first date after the range or None if the range has no end.
+    :param date_timezone: The timezone in which the dates of datetime values are
+        compared.
+    :return: The filter matching the values in the range.
+    """
+
+    def to_boundary(value: date) -> Union[date, datetime]:
+        if isinstance(model_field, DateTimeField):
+            return date_timezone.localize(datetime.combine(value, time.min))
+        return value
+
+    q = Q()
+    if start is not None:
+        q &= Q(**{f"{field_name}__gte": to_boundary(start)})
+    if end is not None:
+        q &= Q(**{f"{field_name}__lt": to_boundary(end)})
+    return q
+
+
+def get_field_timezone(field, fallback_timezone_string: str = None) -> tzinfo:
+    """
+    Returns the timezone in which the dates of the values of the field are
+    compared. Fields with a timezone are compared in their own timezone, or the
+    fallback if provided. Other datetimes are compared in the current timezone.
+    """
+
+    if hasattr(field, "timezone"):
+        return timezone(fallback_timezone_string or field.get_timezone())
+    return get_current_timezone()
+
+
 class NotViewFilterTypeMixin:
+    # A negated comparison matches most of the rows, so an index doesn't help.
+    can_use_index = False
+
     def default_filter_on_exception(self):
         return Q()
 
@@ -70,6 +121,7 @@ class EqualViewFilterType(ViewFilterType):
     """
 
     type = "equal"
+    can_use_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -220,6 +272,7 @@ class HigherThanViewFilterType(ViewFilterType):
     """
 
     type = "higher_than"
+    can_use_index = True
     compatible_field_types = [
         NumberFieldType.type,
         RatingFieldType.type,
@@ -255,6 +308,7 @@ class LowerThanViewFilterType(ViewFilterType):
     """
 
     type = "lower_than"
+    can_use_index = True
     compatible_field_types = [
         NumberFieldType.type,
         RatingFieldType.type,
@@ -290,6 +344,7 @@ class DateEqualViewFilterType(ViewFilterType):
     """
 
     type = "date_equal"
+    can_use_index = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -318,33 +373,21 @@ class DateEqualViewFilterType(ViewFilterType):
             return Q()
 
         # If the length of the string value is lower than 10 characters we know it is
-        # only a date so we can match only on year, month and day level. This way if a
-        # date is provided, but if it tries to compare with a models.DateTimeField it
-        # will still give back accurate results.
+        # only a date so we can match the whole day. This way if a date is provided,
+        # but if it tries to compare with a models.DateTimeField it will still give
+        # back accurate results.
         # Since the LastModified and CreateOn fields are stored for a specific timezone
         # we need to make sure to take this timezone into account when comparing to
         # the "equals_date"
-        has_timezone = hasattr(field, "timezone")
         if len(value) <= 10:
-
-            def query_dict(query_field_name):
-                return {
-                    f"{query_field_name}__year": parsed_datetime.year,
-                    f"{query_field_name}__month": parsed_datetime.month,
-                    f"{query_field_name}__day": parsed_datetime.day,
-                }
-
-            if has_timezone:
-                timezone_string = field.get_timezone()
-                tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-                return AnnotatedQ(
-                    annotation={
-                        f"{tmp_field_name}": Timezone(field_name, timezone_string)
-                    },
-                    q=query_dict(tmp_field_name),
-                )
-            else:
-                return Q(**query_dict(field_name))
+            day = parsed_datetime.date()
+            return get_date_range_filter(
+                field_name,
+                model_field,
+                day,
+                day + timedelta(days=1),
+                get_field_timezone(field),
+            )
         else:
             return Q(**{field_name: parsed_datetime})
 
@@ -363,11 +406,13 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
     '__lte'
     '__gt'
     '__gte'
+    and the `get_date_range` method must return the matching range of dates, which
+    is used to compare the date part of a DateTimeField without extracting it.
     """
 
     type = "base_date_field_lookup_type"
+    can_use_index = True
     query_field_lookup = ""
-    query_date_lookup = ""
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -406,40 +451,41 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
         except ValueError:
             return False
 
+    def get_date_range(self, day: date) -> Tuple[Optional[date], Optional[date]]:
+        """
+        Should return the half-open range of dates that match the filter when the
+        date part of a datetime is compared with the provided date.
+
+        :param day: The date provided as filter value.
+        :return: The first date in the range and the first date after the range,
+            either of which can be None if the range is open on that side.
+        """
+
+        raise NotImplementedError("Each must have his own get_date_range method.")
+
     def get_filter(self, field_name, value, model_field, field):
-        # in order to only compare the date part of a datetime field
-        # we need to verify that we are in fact dealing with a datetime field
-        # if so the django query lookup '__date' gets appended to the field_name
-        # otherwise (i.e. it is a date field) nothing gets appended
-        query_date_lookup = self.query_date_lookup
-        if (
-            isinstance(model_field, DateTimeField)
-            and self.is_date(value)
-            and not query_date_lookup
-        ):
-            query_date_lookup = "__date"
         try:
             parsed_date = self.parse_date(value)
-            has_timezone = hasattr(field, "timezone")
-            field_key = f"{field_name}{query_date_lookup}{self.query_field_lookup}"
-            if has_timezone:
-                timezone_string = field.get_timezone()
-                tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-                field_key = (
-                    f"{tmp_field_name}{query_date_lookup}{self.query_field_lookup}"
-                )
-
-                return AnnotatedQ(
-                    annotation={
-                        f"{tmp_field_name}": Timezone(field_name, timezone_string)
-                    },
-                    q={field_key: parsed_date},
-                )
-            else:
-                return Q(**{field_key: parsed_date})
         except (ParserError, ValueError):
             return Q()
 
+        if isinstance(model_field, DateTimeField):
+            field_timezone = get_field_timezone(field)
+            # In order to only compare the date part of a datetime field, the range
+            # of datetimes matching the date is compared instead.
+            if self.is_date(value):
+                start, end = self.get_date_range(parsed_date.date())
+                return get_date_range_filter(
+                    field_name, model_field, start, end, field_timezone
+                )
+
+            # Fields with a timezone compare their local time with the provided
+            # time, so the provided time is converted to that timezone.
+            if hasattr(field, "timezone"):
+                parsed_date = field_timezone.localize(parsed_date.replace(tzinfo=None))
+
+        return Q(**{f"{field_name}{self.query_field_lookup}": parsed_date})
+
 
 class DateBeforeViewFilterType(BaseDateFieldLookupFilterType):
     """
@@ -451,6 +497,9 @@ class DateBeforeViewFilterType(BaseDateFieldLookupFilterType):
     type = "date_before"
     query_field_lookup = "__lt"
 
+    def get_date_range(self, day):
+        return None, day
+
 
 class DateAfterViewFilterType(BaseDateFieldLookupFilterType):
     """
@@ -462,6 +511,9 @@ class DateAfterViewFilterType(BaseDateFieldLookupFilterType):
     type = "date_after"
     query_field_lookup = "__gt"
 
+    def get_date_range(self, day):
+        return day + timedelta(days=1), None
+
 
 class DateCompareTodayViewFilterType(ViewFilterType):
     """
@@ -478,18 +530,19 @@ class DateCompareTodayViewFilterType(ViewFilterType):
 
         raise NotImplementedError
 
-    def make_query_dict(self, field_name: str, now: datetime) -> Dict:
+    def get_date_range(self, today: date) -> Tuple[Optional[date], Optional[date]]:
         """
-        Creates a query dict for the specific view_filter, given the field name
+        Returns the half-open range of dates that match the specific view_filter
         based on today's date.
 
-        :param field_name: The field name to use in the query dict.
-        :param now: The current date.
-        :return: The query dict.
+        :param today: The current date.
+        :return: The first date in the range and the first date after the range,
+            either of which can be None if the range is open on that side.
         """
 
         raise NotImplementedError
 
+    can_use_index = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -502,17 +555,16 @@ class DateCompareTodayViewFilterType(ViewFilterType):
     def get_filter(self, field_name, value, model_field, field):
         timezone_string = value if value in all_timezones else "UTC"
         timezone_object = timezone(timezone_string)
-        field_has_timezone = hasattr(field, "timezone")
         now = datetime.utcnow().astimezone(timezone_object)
 
-        if field_has_timezone:
-            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-            return AnnotatedQ(
-                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
-                q=self.make_query_dict(tmp_field_name, now),
-            )
-        else:
-            return Q(**self.make_query_dict(field_name, now))
+        start, end = self.get_date_range(now.date())
+        return get_date_range_filter(
+            field_name,
+            model_field,
+            start,
+            end,
+            get_field_timezone(field, timezone_string),
+        )
 
 
 class DateEqualsTodayViewFilterType(DateCompareTodayViewFilterType):
@@ -522,12 +574,8 @@ class DateEqualsTodayViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_equals_today"
 
-    def make_query_dict(self, field_name, now):
-        return {
-            f"{field_name}__day": now.day,
-            f"{field_name}__month": now.month,
-            f"{field_name}__year": now.year,
-        }
+    def get_date_range(self, today):
+        return today, today + timedelta(days=1)
 
 
 class DateBeforeTodayViewFilterType(DateCompareTodayViewFilterType):
@@ -537,9 +585,8 @@ class DateBeforeTodayViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_before_today"
 
-    def make_query_dict(self, field_name, now):
-        min_today = datetime.combine(now, time.min)
-        return {f"{field_name}__lt": min_today}
+    def get_date_range(self, today):
+        return None, today
 
 
 class DateAfterTodayViewFilterType(DateCompareTodayViewFilterType):
@@ -549,9 +596,8 @@ class DateAfterTodayViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_after_today"
 
-    def make_query_dict(self, field_name, now):
-        max_today = datetime.combine(now, time.max)
-        return {f"{field_name}__gt": max_today}
+    def get_date_range(self, today):
+        return today + timedelta(days=1), None
 
 
 class DateEqualsXAgoViewFilterType(ViewFilterType):
@@ -559,8 +605,7 @@ class DateEqualsXAgoViewFilterType(ViewFilterType):
     Base class for is days, months, years ago filter.
     """
 
-    query_for = ["year", "month", "day"]
-
+    can_use_index = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -595,6 +640,19 @@ class DateEqualsXAgoViewFilterType(ViewFilterType):
             "Each subclass must have its own get_date_to_compare method."
         )
 
+    def get_date_range(self, day: date) -> Tuple[date, date]:
+        """
+        Should be overriden in subclasses and return the half-open range of dates
+        that match the computed date.
+
+        :param day: The date returned by get_date_to_compare.
+        :return: The first date in the range and the first date after the range.
+        """
+
+        raise NotImplementedError(
+            "Each subclass must have its own get_date_range method."
+        )
+
     def get_filter(self, field_name, value, model_field, field):
         timezone_string, x_units_ago = self._extract_values(value)
         if x_units_ago is None:
@@ -602,33 +660,21 @@ class DateEqualsXAgoViewFilterType(ViewFilterType):
             return Q()
 
         timezone_object = timezone(timezone_string)
-        field_has_timezone = hasattr(field, "timezone")
         now = datetime.utcnow().astimezone(timezone_object)
         try:
             when = self.get_date_to_compare(now, x_units_ago)
+            start, end = self.get_date_range(when.date())
         except Exception:
             # return nothing when the filter can't be computed
             return Q(pk__in=[])
 
-        def make_query_dict(query_field_name):
-            query_dict = dict()
-            if "year" in self.query_for:
-                query_dict[f"{query_field_name}__year"] = when.year
-            if "month" in self.query_for:
-                query_dict[f"{query_field_name}__month"] = when.month
-            if "day" in self.query_for:
-                query_dict[f"{query_field_name}__day"] = when.day
-
-            return query_dict
-
-        if field_has_timezone:
-            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-            return AnnotatedQ(
-                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
-                q=make_query_dict(tmp_field_name),
-            )
-        else:
-            return Q(**make_query_dict(field_name))
+        return get_date_range_filter(
+            field_name,
+            model_field,
+            start,
+            end,
+            get_field_timezone(field, timezone_string),
+        )
 
 
 class DateEqualsDaysAgoViewFilterType(DateEqualsXAgoViewFilterType):
@@ -645,6 +691,9 @@ class DateEqualsDaysAgoViewFilterType(DateEqualsXAgoViewFilterType):
     def get_date_to_compare(self, now, x_units_ago):
         return now - timedelta(days=x_units_ago)
 
+    def get_date_range(self, day):
+        return day, day + timedelta(days=1)
+
 
 class DateEqualsMonthsAgoViewFilterType(DateEqualsXAgoViewFilterType):
     """
@@ -656,11 +705,14 @@ class DateEqualsMonthsAgoViewFilterType(DateEqualsXAgoViewFilterType):
     """
 
     type = "date_equals_months_ago"
-    query_for = ["year", "month"]
 
     def get_date_to_compare(self, now, x_units_ago):
         return now + relativedelta(months=-x_units_ago)
 
+    def get_date_range(self, day):
+        first_day = day.replace(day=1)
+        return first_day, first_day + relativedelta(months=1)
+
 
 class DateEqualsYearsAgoViewFilterType(DateEqualsXAgoViewFilterType):
     """
@@ -672,11 +724,14 @@ class DateEqualsYearsAgoViewFilterType(DateEqualsXAgoViewFilterType):
     """
 
     type = "date_equals_years_ago"
-    query_for = ["year"]
 
     def get_date_to_compare(self, now, x_units_ago):
         return now + relativedelta(years=-x_units_ago)
 
+    def get_date_range(self, day):
+        first_day = day.replace(month=1, day=1)
+        return first_day, first_day + relativedelta(years=1)
+
 
 class DateEqualsCurrentWeekViewFilterType(DateCompareTodayViewFilterType):
     """
@@ -686,12 +741,9 @@ class DateEqualsCurrentWeekViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_equals_week"
 
-    def make_query_dict(self, field_name, now):
-        week_of_year = now.isocalendar()[1]
-        return {
-            f"{field_name}__week": week_of_year,
-            f"{field_name}__year": now.year,
-        }
+    def get_date_range(self, today):
+        monday = today - timedelta(days=today.weekday())
+        return monday, monday + timedelta(days=7)
 
 
 class DateEqualsCurrentMonthViewFilterType(DateCompareTodayViewFilterType):
@@ -702,11 +754,9 @@ class DateEqualsCurrentMonthViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_equals_month"
 
-    def make_query_dict(self, field_name, now):
-        return {
-            f"{field_name}__month": now.month,
-            f"{field_name}__year": now.year,
-        }
+    def get_date_range(self, today):
+        first_day = today.replace(day=1)
+        return first_day, first_day + relativedelta(months=1)
 
 
 class DateEqualsCurrentYearViewFilterType(DateCompareTodayViewFilterType):
@@ -717,10 +767,9 @@ class DateEqualsCurrentYearViewFilterType(DateCompareTodayViewFilterType):
 
     type = "date_equals_year"
 
-    def make_query_dict(self, field_name, now):
-        return {
-            f"{field_name}__year": now.year,
-        }
+    def get_date_range(self, today):
+        first_day = today.replace(month=1, day=1)
+        return first_day, first_day + relativedelta(years=1)
 
 
 class DateNotEqualViewFilterType(NotViewFilterTypeMixin, DateEqualViewFilterType):
@@ -734,7 +783,8 @@ class DateEqualsDayOfMonthViewFilterType(BaseDateFieldLookupFilterType):
     """
 
     type = "date_equals_day_of_month"
-    query_date_lookup = "__day"
+    # The day of the month can't be compared using a range.
+    can_use_index = False
 
     @staticmethod
     def parse_date(value: str) -> str:
@@ -748,6 +798,22 @@ class DateEqualsDayOfMonthViewFilterType(BaseDateFieldLookupFilterType):
 
         return value
 
+    def get_filter(self, field_name, value, model_field, field):
+        try:
+            day_of_month = self.parse_date(value)
+        except ValueError:
+            return Q()
+
+        if hasattr(field, "timezone"):
+            timezone_string = field.get_timezone()
+            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
+            return AnnotatedQ(
+                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
+                q={f"{tmp_field_name}__day": day_of_month},
+            )
+        else:
+            return Q(**{f"{field_name}__day": day_of_month})
+
 
 class SingleSelectEqualViewFilterType(ViewFilterType):
     """
@@ -255,28 +255,39 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
-    def after_field_value_update(self, updated_fields):
+    def get_aggregations_by_view(self, fields):
         """
-        When a field value change, we need to invalidate the aggregation cache for this
-        field.
+        Returns the (Field, aggregation_type) list of the provided fields for each
+        grid view that aggregates at least one of them.
         """
 
-        to_clear = defaultdict(list)
-        view_map = {}
+        aggregations_by_view = defaultdict(list)
 
         field_options = (
-            GridViewFieldOptions.objects.filter(field__in=updated_fields)
+            GridViewFieldOptions.objects.filter(field__in=fields)
             .exclude(aggregation_raw_type="")
             .select_related("grid_view", "field")
         )
 
         for options in field_options:
-            to_clear[options.grid_view.id].append(options.field.db_column)
-            view_map[options.grid_view.id] = options.grid_view
+            aggregations_by_view[options.grid_view].append(
+                (options.field, options.aggregation_raw_type)
+            )
+
+        return aggregations_by_view
+
+    def after_field_value_update(self, updated_fields):
+        """
+        When a field value change, we need to invalidate the aggregation cache for this
+        field.
+        """
 
         view_handler = ViewHandler()
-        for view_id, names in to_clear.items():
-            view_handler.clear_aggregation_cache(view_map[view_id], names + ["total"])
+        for grid_view, aggregations in self.get_aggregations_by_view(
+            updated_fields
+        ).items():
+            names = [field.db_column for field, _ in aggregations]
+            view_handler.clear_aggregation_cache(grid_view, names + ["total"])
 
     def after_field_update(self, updated_fields):
         """
@@ -21,6 +21,7 @@ from baserow.ws.registries import PageType
 class TablePageType(PageType):
     type = "table"
     parameters = ["table_id"]
+    coalesce_broadcasts = True
 
     def can_add(self, user, web_socket_id, table_id, **kwargs):
         """
@@ -48,6 +49,18 @@ class TablePageType(PageType):
     def get_group_name(self, table_id, **kwargs):
         return f"table-{table_id}"
 
+    def merge_payloads(self, payload, next_payload):
+        """
+        Consecutive updates of rows, for example when they're updated one by one
+        during an import, are merged into a single `rows_updated` payload.
+        """
+
+        from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
+
+        if payload["type"] == next_payload["type"] == "rows_updated":
+            return RealtimeRowMessages.merge_rows_updated(payload, next_payload)
+        return None
+
 
 class PublicViewPageType(PageType):
     type = "view"
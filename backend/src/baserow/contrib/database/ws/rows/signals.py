@@ -135,3 +135,30 @@ class RealtimeRowMessages:
             "rows": serialized_rows,
             "metadata": metadata,
         }
+
+    @staticmethod
+    def merge_rows_updated(
+        payload: Dict[str, Any], next_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Merges two consecutive `rows_updated` payloads of the same table into one.
+        Rows updated in both keep their state from before the first update and get
+        their state after the second update.
+        """
+
+        rows_before_update = {
+            row["id"]: row for row in next_payload["rows_before_update"]
+        }
+        rows_before_update.update(
+            {row["id"]: row for row in payload["rows_before_update"]}
+        )
+        rows = {row["id"]: row for row in payload["rows"]}
+        rows.update({row["id"]: row for row in next_payload["rows"]})
+        return RealtimeRowMessages.rows_updated(
+            table_id=payload["table_id"],
+            serialized_rows_before_update=[
+                rows_before_update[row_id] for row_id in rows
+            ],
+            serialized_rows=list(rows.values()),
+            metadata={**payload["metadata"], **next_payload["metadata"]},
+        )
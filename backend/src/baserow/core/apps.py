@@ -1,5 +1,6 @@
 from django.apps import AppConfig
 from django.conf import settings
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_migrate
 
 
@@ -218,6 +219,18 @@ class CoreConfig(AppConfig):
         # Create all operations from registry
         post_migrate.connect(sync_operations_after_migrate, sender=self)
 
+        from celery.signals import task_postrun, task_prerun
+
+        from baserow.core.profiling import (
+            install_query_profiler,
+            on_task_postrun,
+            on_task_prerun,
+        )
+
+        connection_created.connect(install_query_profiler)
+        task_prerun.connect(on_task_prerun)
+        task_postrun.connect(on_task_postrun)
+
 
 # noinspection PyPep8Naming
 def start_sync_templates_task_after_migrate(sender, **kwargs):
@@ -1,9 +1,9 @@
 import contextlib
 from collections import defaultdict
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
 from django.contrib.contenttypes.models import ContentType
-from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db import DEFAULT_DB_ALIAS, connection, router, transaction
 from django.db.models import Model, QuerySet
 from django.db.models.sql.query import LOOKUP_SEP
 from django.db.transaction import Atomic, get_connection
@@ -160,6 +160,64 @@ def specific_iterator(
     return ordered_specific_objects
 
 
+def bulk_create_specific(
+    base_model: Type[Model], objs: List[Model], batch_size: int = 1000
+) -> List[Model]:
+    """
+    Creates the provided specific objects, which extend the `base_model` using
+    multi table inheritance, in bulk. Django's `bulk_create` doesn't support multi
+    table inheritance, so the rows of the base table are inserted first in a single
+    query, after which the rows of every specific table are inserted with one query
+    per specific model. This only works with models having the
+    `PolymorphicContentTypeMixin`.
+
+    Just like with `bulk_create`, the `save` method is not called, so objects of a
+    model that overrides the `save` method of the base model, for example to
+    validate the values, are saved individually instead.
+
+    :param base_model: The base model that all the objects extend.
+    :param objs: The unsaved specific objects to create.
+    :param batch_size: The maximum number of rows to insert per query.
+    :return: The created objects with their primary keys set.
+    """
+
+    bulk_objs = []
+    for obj in objs:
+        model = type(obj)
+        if model.save is not base_model.save or model._meta.get_parent_list() != [
+            base_model
+        ]:
+            obj.save()
+            continue
+
+        if not obj.content_type_id:
+            obj.content_type = ContentType.objects.get_for_model(model)
+        bulk_objs.append(obj)
+
+    if not bulk_objs:
+        return objs
+
+    base_model._base_manager.bulk_create(bulk_objs, batch_size=batch_size)
+
+    objs_per_model = defaultdict(list)
+    for obj in bulk_objs:
+        model = type(obj)
+        parent_link = model._meta.parents[base_model]
+        setattr(obj, parent_link.attname, getattr(obj, base_model._meta.pk.attname))
+        objs_per_model[model].append(obj)
+
+    for model, model_objs in objs_per_model.items():
+        using = router.db_for_write(model)
+        for index in range(0, len(model_objs), batch_size):
+            model._base_manager.all()._insert(
+                model_objs[index : index + batch_size],
+                fields=model._meta.local_concrete_fields,
+                using=using,
+            )
+
+    return objs
+
+
 class IsolationLevel:
     READ_COMMITTED = "READ COMMITTED"
     REPEATABLE_READ = "REPEATABLE READ"
@@ -187,3 +245,83 @@ def transaction_atomic(
                 first_sql, first_args = first_sql_to_run_in_transaction_with_args
                 cursor.execute(first_sql, first_args)
         yield a
+
+
+def bulk_update_from_values(
+    model: Type[Model],
+    objs: List[Model],
+    field_names: List[str],
+    batch_size: int = 1000,
+):
+    """
+    Updates the provided fields of the objects in bulk, similar to Django's
+    `bulk_update`. Instead of a `CASE WHEN` expression per column, it executes a
+    single `UPDATE ... FROM (VALUES ...)` query per batch, which keeps the query
+    small and fast to plan, even for many columns. Fields having an expression as
+    value on any of the objects are updated using Django's `bulk_update` after that,
+    so that they can reference the already updated values.
+
+    :param model: The model of the objects that must be updated.
+    :param objs: The objects containing the new values.
+    :param field_names: The names of the fields that must be updated.
+    :param batch_size: The maximum number of objects updated per query.
+    """
+
+    if not objs or not field_names:
+        return
+
+    fields = [model._meta.get_field(name) for name in field_names]
+    value_fields, expression_fields = [], []
+    for field in fields:
+        if any(
+            hasattr(getattr(obj, field.attname), "resolve_expression") for obj in objs
+        ):
+            expression_fields.append(field)
+        else:
+            value_fields.append(field)
+
+    if value_fields:
+        pk_field = model._meta.pk
+        columns = [pk_field] + value_fields
+        placeholder = sql.SQL("({})").format(
+            sql.SQL(", ").join(
+                sql.SQL("%s::{}").format(sql.SQL(field.cast_db_type(connection)))
+                for field in columns
+            )
+        )
+        table = sql.Identifier(model._meta.db_table)
+        query = sql.SQL(
+            "UPDATE {table} SET {assignments} FROM (VALUES {values}) AS "
+            "new_values ({columns}) WHERE {table}.{pk} = new_values.{pk}"
+        )
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(objs), batch_size):
+                batch = objs[start : start + batch_size]
+                params = [
+                    field.get_db_prep_save(getattr(obj, field.attname), connection)
+                    for obj in batch
+                    for field in columns
+                ]
+                cursor.execute(
+                    query.format(
+                        table=table,
+                        assignments=sql.SQL(", ").join(
+                            sql.SQL("{column} = new_values.{column}").format(
+                                column=sql.Identifier(field.column)
+                            )
+                            for field in value_fields
+                        ),
+                        values=sql.SQL(", ").join([placeholder] * len(batch)),
+                        columns=sql.SQL(", ").join(
+                            sql.Identifier(field.column) for field in columns
+                        ),
+                        pk=sql.Identifier(pk_field.column),
+                    ),
+                    params,
+                )
+
+    if expression_fields:
+        model.objects.bulk_update(
+            objs, [field.name for field in expression_fields], batch_size=batch_size
+        )
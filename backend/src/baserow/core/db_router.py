@@ -0,0 +1,172 @@
+import contextlib
+import random
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject, empty
+
+
+class ReadReplicaState:
+    """
+    Holds the read replica routing state of a single request or
+    `use_read_replicas` block. One replica is picked for the whole block, so that
+    all its reads see the same data even if the replicas lag behind differently.
+    """
+
+    def __init__(
+        self, request: Optional[HttpRequest] = None, stick_after_write: bool = True
+    ):
+        self.request = request
+        self.stick_after_write = stick_after_write
+        self.written = False
+        self.user_is_sticky: Optional[bool] = None
+        replicas = settings.BASEROW_READ_REPLICA_DATABASES
+        self.replica: Optional[str] = (
+            random.choice(replicas) if replicas else None  # nosec
+        )
+
+    def is_sticky(self) -> bool:
+        """
+        Indicates whether the reads must go to the default database because either
+        something has been written in this state, or the authenticated user has
+        written something during the last `BASEROW_READ_REPLICA_STICKY_SECONDS`.
+        """
+
+        if self.written:
+            return True
+
+        if self.user_is_sticky is None:
+            user_id = get_authenticated_user_id(self.request)
+            if user_id is None:
+                # The user isn't known yet, so it's checked again on the next read.
+                return False
+            self.user_is_sticky = cache.get(get_sticky_user_cache_key(user_id), False)
+
+        return self.user_is_sticky
+
+
+_read_replica_state: ContextVar[Optional[ReadReplicaState]] = ContextVar(
+    "read_replica_state", default=None
+)
+
+
+def get_sticky_user_cache_key(user_id: int) -> str:
+    return f"read_replica_sticky_user_{user_id}"
+
+
+def get_authenticated_user_id(request: Optional[HttpRequest]) -> Optional[int]:
+    if request is None:
+        return None
+
+    user = getattr(request, "user", None)
+    # Resolving the lazy session user would query the database from within the
+    # router, the user is only used when it has been resolved already. DRF replaces
+    # it with the authenticated user before the view is called.
+    if user is None or (isinstance(user, SimpleLazyObject) and user._wrapped is empty):
+        return None
+
+    return user.id if user.is_authenticated else None
+
+
+@contextlib.contextmanager
+def use_read_replicas(
+    request: Optional[HttpRequest] = None, stick_after_write: bool = True
+):
+    """
+    Allows the read queries executed within the block to be routed to the read
+    replicas configured in `BASEROW_READ_REPLICA_DATABASES`. Queries inside of a
+    transaction are always executed on the default database.
+
+    :param request: The request that is handled within the block. If the
+        authenticated user of the request has recently written something, all the
+        queries go to the default database.
+    :param stick_after_write: When true, all the reads following a write in the
+        block go to the default database so that the written data can be read back.
+    """
+
+    token = _read_replica_state.set(ReadReplicaState(request, stick_after_write))
+    try:
+        yield _read_replica_state.get()
+    finally:
+        _read_replica_state.reset(token)
+
+
+@contextlib.contextmanager
+def use_default_database():
+    """
+    Executes all the queries within the block on the default database, even if the
+    block is nested in a `use_read_replicas` block. This is needed when the read data
+    must be at least as recent as something else that has been read, for example a
+    version in the cache, because the replicas can lag behind.
+    """
+
+    token = _read_replica_state.set(None)
+    try:
+        yield
+    finally:
+        _read_replica_state.reset(token)
+
+
+def get_read_replica_state() -> Optional[ReadReplicaState]:
+    return _read_replica_state.get()
+
+
+def reads_from_read_replicas() -> bool:
+    """
+    Indicates whether the read queries executed at this point are routed to a read
+    replica. The data read from a replica can lag behind the default database.
+    """
+
+    if not settings.BASEROW_READ_REPLICA_DATABASES:
+        return False
+
+    state = _read_replica_state.get()
+    return (
+        state is not None
+        and state.replica is not None
+        and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        and not state.is_sticky()
+    )
+
+
+class ReadReplicaRouter:
+    """
+    Routes the read queries executed within a `use_read_replicas` block to the read
+    replica picked for the block, and all the other queries to the default database.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.BASEROW_READ_REPLICA_DATABASES
+        if not replicas:
+            return None
+
+        if not reads_from_read_replicas():
+            return DEFAULT_DB_ALIAS
+
+        return _read_replica_state.get().replica
+
+    def db_for_write(self, model, **hints):
+        if not settings.BASEROW_READ_REPLICA_DATABASES:
+            return None
+
+        state = _read_replica_state.get()
+        if state is not None and state.stick_after_write:
+            state.written = True
+        # Objects that have been read from a replica must still be written to the
+        # default database.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.BASEROW_READ_REPLICA_DATABASES}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.BASEROW_READ_REPLICA_DATABASES:
+            return False
+        return None
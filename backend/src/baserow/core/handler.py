@@ -69,6 +69,7 @@ from .operations import (
     UpdateGroupUserOperationType,
     UpdateSettingsOperationType,
 )
+from .profiling import profile_section
 from .registries import (
     application_type_registry,
     object_scope_type_registry,
@@ -161,6 +162,7 @@ class CoreHandler:
         settings_instance.save()
         return settings_instance
 
+    @profile_section("permission_check")
     def check_permissions(
         self,
         actor: AbstractUser,
@@ -310,6 +312,7 @@ class CoreHandler:
 
         return result
 
+    @profile_section("permission_check")
     def filter_queryset(
         self,
         actor: AbstractUser,
@@ -14,6 +14,14 @@ class MaxJobCountExceeded(Exception):
     """
 
 
+class JobCancelled(Exception):
+    """Raised when a running job notices that it has been cancelled."""
+
+
+class JobNotCancellable(Exception):
+    """Raised when trying to cancel a job that can't be cancelled."""
+
+
 class JobTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get a job type that does not exist."""
 
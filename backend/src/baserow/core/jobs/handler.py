@@ -1,10 +1,12 @@
 import logging
+import time
 from typing import List, Optional, Type
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db import transaction
+from django.db import DatabaseError, transaction
 from django.db.models import Q, QuerySet
 from django.utils import timezone
 
@@ -12,54 +14,113 @@ from baserow.core.utils import Progress
 
 from .cache import job_progress_key
 from .constants import JOB_FAILED
-from .exceptions import JobDoesNotExist, MaxJobCountExceeded
+from .exceptions import JobDoesNotExist, JobNotCancellable, MaxJobCountExceeded
 from .models import Job
 from .registries import job_type_registry
+from .signals import job_updated
 from .tasks import run_async_job
 from .types import AnyJob
 
 logger = logging.getLogger(__name__)
 
 
+class JobProgressPersister:
+    """
+    Callback that can be registered as updated event of a `Progress` object. It
+    coalesces the progress updates of a job in memory and only persists them to the
+    database and the Redis cache at a bounded rate. Every time the progress is
+    persisted, the `job_updated` signal is sent so that the owner of the job can be
+    notified in real time without having to poll.
+    """
+
+    def __init__(self, job: AnyJob, interval: Optional[float] = None):
+        """
+        :param job: The job of which the progress must be persisted.
+        :param interval: The minimum amount of seconds between two writes. Defaults
+            to the `BASEROW_JOB_PROGRESS_PERSIST_INTERVAL_SECONDS` setting.
+        """
+
+        self.job = job
+        self.interval = (
+            settings.BASEROW_JOB_PROGRESS_PERSIST_INTERVAL_SECONDS
+            if interval is None
+            else interval
+        )
+        self.last_persisted_at = None
+        self.pending = False
+
+    def __call__(self, percentage: int, state: Optional[str]):
+        """
+        Every time the progress of the job changes, this callback function is
+        called. If the percentage or the state has changed, the job will be updated.
+        A state change or reaching 100% is persisted immediately, percentage changes
+        are persisted at most once per interval.
+        """
+
+        job = self.job
+        state_changed = state is not None and job.state != state
+
+        if job.progress_percentage == percentage and not state_changed:
+            return
+
+        job.progress_percentage = percentage
+        if state_changed:
+            job.state = state
+
+        self.pending = True
+
+        if (
+            state_changed
+            or percentage >= 100
+            or self.last_persisted_at is None
+            or time.monotonic() - self.last_persisted_at >= self.interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """
+        Persists the coalesced progress if there is anything that hasn't been
+        written yet.
+        """
+
+        if not self.pending:
+            return
+
+        job = self.job
+
+        # The progress must also be stored in the Redis cache. Because we're
+        # currently in a transaction, other database connections don't know
+        # about the progress and this way, we can still communicate it to
+        # the user.
+        cache.set(
+            job_progress_key(job.id),
+            {
+                "progress_percentage": job.progress_percentage,
+                "state": job.state,
+            },
+            timeout=None,
+        )
+        job.save()
+
+        self.pending = False
+        self.last_persisted_at = time.monotonic()
+
+        job_updated.send(self, job=job)
+
+
 class JobHandler:
     def run(self, job: AnyJob):
-        def progress_updated(percentage, state):
-            """
-            Every time the progress of the job changes, this callback function is
-            called. If the percentage or the state has changed, the job will be updated.
-            """
-
-            nonlocal job
-
-            if job.progress_percentage != percentage:
-                job.progress_percentage = percentage
-                changed = True
-
-            if state is not None and job.state != state:
-                job.state = state
-                changed = True
-
-            if changed:
-                # The progress must also be stored in the Redis cache. Because we're
-                # currently in a transaction, other database connections don't know
-                # about the progress and this way, we can still communicate it to
-                # the user.
-                cache.set(
-                    job_progress_key(job.id),
-                    {
-                        "progress_percentage": job.progress_percentage,
-                        "state": job.state,
-                    },
-                    timeout=None,
-                )
-                job.save()
-
+        progress_persister = JobProgressPersister(job)
         progress = Progress(100)
-        progress.register_updated_event(progress_updated)
+        progress.register_updated_event(progress_persister)
 
         job_type = job_type_registry.get_by_model(job)
 
-        return job_type.run(job, progress)
+        result = job_type.run(job, progress)
+        # Make sure that the last coalesced progress update is not lost.
+        progress_persister.flush()
+
+        return result
 
     @staticmethod
     def get_job(
@@ -178,9 +239,78 @@ class JobHandler:
 
         return job
 
+    def resume_job(self, job: AnyJob):
+        """
+        Schedules a new task for a checkpointed job that has been interrupted. The job
+        will continue from the checkpoint of its last committed chunk.
+
+        :param job: The job that must be resumed.
+        """
+
+        job.resume_count += 1
+        job.save(update_fields=("resume_count", "updated_on"))
+        transaction.on_commit(lambda: run_async_job.delay(job.id))
+
+    def cancel_job(self, job: AnyJob) -> AnyJob:
+        """
+        Cancels a pending or running checkpointed job. If a task is running a chunk of
+        the job, it notices the cancellation before starting its next chunk and calls
+        the cleanup method of the job type to undo the work that has already been
+        committed. Otherwise, because the job is waiting to be resumed or its worker
+        has died, the work is cleaned up right away.
+
+        :param job: The job that must be cancelled.
+        :raises JobNotCancellable: If the job type doesn't support cancelling or if
+            the job has already finished.
+        :return: The cancelled job.
+        """
+
+        job_type = job_type_registry.get_by_model(job)
+        if not job_type.checkpointed:
+            raise JobNotCancellable(f"The {job_type.type} job can't be cancelled.")
+
+        with transaction.atomic():
+            # The job row is locked for the duration of every chunk, so if it can't
+            # be locked right away, a task is running and will do the cleanup.
+            try:
+                with transaction.atomic():
+                    Job.objects.select_for_update(nowait=True).get(id=job.id)
+                task_is_running = False
+            except DatabaseError:
+                task_is_running = True
+
+            # The update waits for the chunk that is currently running to be
+            # committed.
+            cancelled = (
+                Job.objects.filter(id=job.id)
+                .is_pending_or_running()
+                .update(
+                    state=JOB_FAILED,
+                    error="Cancelled",
+                    human_readable_error=(
+                        f"The {job_type.type} job has been cancelled."
+                    ),
+                    updated_on=timezone.now(),
+                )
+            )
+            if not cancelled:
+                raise JobNotCancellable(
+                    f"The job with id {job.id} has already finished."
+                )
+
+            if not task_is_running:
+                job_type.clean_up_committed_work(job)
+
+        job.refresh_from_db()
+        return job
+
     def clean_up_jobs(self):
         """
         Terminate running jobs after the soft limit and delete expired jobs.
+        Checkpointed jobs are only considered stale when they haven't committed a chunk
+        within the soft limit, in which case they are resumed if possible. Otherwise,
+        the work of their committed chunks is cleaned up, just like for expired jobs
+        that have failed.
         """
 
         # Delete old job
@@ -199,9 +329,33 @@ class JobHandler:
             seconds=(settings.BASEROW_JOB_SOFT_TIME_LIMIT + 1)
         )
 
+        checkpointed_content_types = [
+            ContentType.objects.get_for_model(job_type.model_class)
+            for job_type in job_type_registry.get_all()
+            if job_type.checkpointed
+        ]
+        resumed_job_ids = []
+        failed_checkpointed_jobs = []
+        for stale_job in Job.objects.filter(
+            updated_on__lte=limit_date,
+            content_type__in=checkpointed_content_types,
+        ).is_running():
+            stale_job = stale_job.specific
+            job_type = job_type_registry.get_by_model(stale_job)
+            if job_type.can_be_resumed(stale_job):
+                self.resume_job(stale_job)
+                resumed_job_ids.append(stale_job.id)
+            else:
+                failed_checkpointed_jobs.append(stale_job)
+
         (
             Job.objects.filter(created_on__lte=limit_date)
             .is_running()
+            .exclude(
+                content_type__in=checkpointed_content_types,
+                updated_on__gt=limit_date,
+            )
+            .exclude(id__in=resumed_job_ids)
             .update(
                 state=JOB_FAILED,
                 human_readable_error=(
@@ -211,3 +365,9 @@ class JobHandler:
                 updated_on=timezone.now(),
             )
         )
+
+        # The stale checkpointed jobs that can't be resumed anymore have been marked
+        # as failed, so the work of their committed chunks must be undone.
+        for failed_job in failed_checkpointed_jobs:
+            job_type = job_type_registry.get_by_model(failed_job)
+            job_type.clean_up_committed_work(failed_job)
@@ -57,6 +57,17 @@ class Job(CreatedAndUpdatedOnMixin, PolymorphicContentTypeMixin, models.Model):
         default="",
         help_text="A human readable error message indicating what went wrong.",
     )
+    checkpoint = models.JSONField(
+        null=True,
+        default=None,
+        help_text="The state of a checkpointed job after the last committed chunk. "
+        "It's used to resume the job where it left off.",
+    )
+    resume_count = models.PositiveIntegerField(
+        default=0,
+        help_text="How many times a checkpointed job has been resumed after it was "
+        "interrupted.",
+    )
 
     objects = JobQuerySet.as_manager()
 
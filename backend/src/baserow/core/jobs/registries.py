@@ -1,4 +1,5 @@
-from typing import Any, Dict
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
 
 from django.contrib.auth.models import AbstractUser
 
@@ -14,7 +15,8 @@ from baserow.core.registry import (
 )
 from baserow.core.utils import Progress
 
-from .exceptions import JobTypeAlreadyRegistered, JobTypeDoesNotExist
+from .constants import JOB_FAILED, JOB_FINISHED
+from .exceptions import JobCancelled, JobTypeAlreadyRegistered, JobTypeDoesNotExist
 from .models import Job
 from .types import AnyJob
 
@@ -38,6 +40,12 @@ class JobType(
     messages.
     """
 
+    checkpointed = False
+    """
+    Indicates whether the job type commits its work in chunks with checkpoints. Only
+    those jobs can be resumed after an interruption and can be cancelled.
+    """
+
     def transaction_atomic_context(self, job: Job):
         """
         This method gives the possibility to change the transaction context per request.
@@ -98,6 +106,155 @@ class JobType(
         :param error: the exception raised.
         """
 
+    def can_be_resumed(self, job: AnyJob) -> bool:
+        """
+        Indicates whether the job can be resumed after it was interrupted by a soft
+        time limit or a crashing worker.
+
+        :param job: the specific instance of the related job instance
+        :return: True if the job can be scheduled again.
+        """
+
+        return False
+
+
+class CheckpointedJobType(JobType):
+    """
+    A job type that processes its work in chunks instead of in one single
+    transaction. Every chunk is committed together with a checkpoint describing
+    where to continue. If the job is interrupted by the soft time limit or a crashing
+    worker, it will be resumed from the last checkpoint without losing the work that
+    has already been committed. Because locks are only held for the duration of a
+    chunk, the job can also be cancelled while it's running, in which case the
+    `cleanup` method is called to undo the committed work.
+    """
+
+    checkpointed = True
+
+    max_resume_count = 5
+    """
+    The maximum amount of times the job is resumed before it's marked as failed.
+    """
+
+    def transaction_atomic_context(self, job: Job):
+        # Every chunk is committed in its own transaction in the `run` method.
+        return nullcontext()
+
+    def get_initial_checkpoint(self, job: AnyJob) -> Any:
+        """
+        Returns the checkpoint that is passed into the first chunk. It must be JSON
+        serializable.
+
+        :param job: the specific instance of the related job instance
+        :return: The initial checkpoint.
+        """
+
+        return {}
+
+    def run_chunk(self, job: AnyJob, progress: Progress, checkpoint: Any) -> Any:
+        """
+        Processes the next chunk of work. This method is called in a transaction that
+        is committed together with the returned checkpoint, so it should only do a
+        bounded amount of work.
+
+        :param job: the specific instance of the related job instance
+        :param progress: A progress object that can be used to track the progress of
+            the task. It starts at the percentage of the last committed chunk.
+        :param checkpoint: The checkpoint returned by the previous chunk or the
+            initial checkpoint.
+        :return: The new JSON serializable checkpoint or None if all the work has been
+            done.
+        """
+
+        raise NotImplementedError("The run_chunk method must be implemented.")
+
+    def cleanup(self, job: AnyJob, checkpoint: Any):
+        """
+        Called in a transaction when the job has been cancelled or won't be continued
+        for another reason. It should undo the work that has been committed by the
+        chunks until the given checkpoint. It's called at most once per job, see
+        `clean_up_committed_work`.
+
+        :param job: the specific instance of the related job instance
+        :param checkpoint: The checkpoint of the last committed chunk.
+        """
+
+    def clean_up_committed_work(self, job: AnyJob):
+        """
+        Calls the `cleanup` method with the checkpoint of the last committed chunk of
+        the job, if any. The checkpoint is removed in the same transaction, so that
+        the work is never cleaned up twice when for example the task and the
+        cancellation both try to clean it up.
+
+        :param job: the specific instance of the related job instance
+        """
+
+        with transaction_atomic():
+            checkpoint = (
+                Job.objects.select_for_update()
+                .values_list("checkpoint", flat=True)
+                .get(id=job.id)
+            )
+            if checkpoint is not None:
+                self.cleanup(job, checkpoint)
+                Job.objects.filter(id=job.id).update(checkpoint=None)
+
+        job.checkpoint = None
+
+    def before_delete(self, job: AnyJob):
+        # A failed job that has never been cleaned up, for example because its
+        # worker died, still has committed work that must be undone.
+        if job.state == JOB_FAILED:
+            self.clean_up_committed_work(job)
+
+    def can_be_resumed(self, job: AnyJob) -> bool:
+        return job.resume_count < self.max_resume_count
+
+    def run(self, job: AnyJob, progress: Progress) -> Any:
+        # The progress object always starts at zero, so it must be restored to the
+        # percentage of the last committed chunk when the job is resumed.
+        progress.increment(job.progress_percentage)
+
+        checkpoint: Optional[Any] = (
+            self.get_initial_checkpoint(job)
+            if job.checkpoint is None
+            else job.checkpoint
+        )
+
+        while checkpoint is not None:
+            with transaction_atomic():
+                # Locking the job row makes sure that a cancellation can't happen
+                # halfway a chunk.
+                state = (
+                    Job.objects.select_for_update()
+                    .values_list("state", flat=True)
+                    .get(id=job.id)
+                )
+                if state == JOB_FAILED:
+                    break
+
+                checkpoint = self.run_chunk(job, progress, checkpoint)
+                # The progress is committed with the checkpoint, so that it's
+                # restored correctly when the job is resumed.
+                update_fields = ["progress_percentage", "updated_on"]
+                if checkpoint is None:
+                    # Marking the job as finished in the same transaction as the last
+                    # chunk prevents it from being resumed from an older checkpoint.
+                    job.state = JOB_FINISHED
+                    update_fields.append("state")
+                else:
+                    job.checkpoint = checkpoint
+                    update_fields.append("checkpoint")
+                job.save(update_fields=update_fields)
+        else:
+            return
+
+        # The cancellation might already have cleaned up the work if no chunk was
+        # running at that moment.
+        self.clean_up_committed_work(job)
+
+        raise JobCancelled(f"The job with id {job.id} has been cancelled.")
+
 
 class JobTypeRegistry(
     CustomFieldsRegistryMixin,
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent whenever the progress or the state of a job has been persisted. This can
+# happen while the job's transaction is still open, so receivers must not wait for
+# `transaction.on_commit` before acting on it.
+job_updated = Signal()
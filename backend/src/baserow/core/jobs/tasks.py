@@ -20,17 +20,30 @@ def run_async_job(self, job_id: int):
     from celery.exceptions import SoftTimeLimitExceeded
 
     from baserow.core.jobs.constants import JOB_FAILED, JOB_FINISHED, JOB_STARTED
+    from baserow.core.jobs.exceptions import JobCancelled
     from baserow.core.jobs.handler import JobHandler
     from baserow.core.jobs.models import Job
 
     from .cache import job_progress_key
+    from .signals import job_updated
 
     with transaction.atomic():
-        job = Job.objects.get(id=job_id).specific
+        job = Job.objects.select_for_update().get(id=job_id).specific
         job_type = job_type_registry.get_by_model(job)
+
+        # The job could have been cancelled before it was picked up by a worker. If
+        # it was cancelled while waiting to be resumed, the chunks that have already
+        # been committed must still be cleaned up.
+        if job.state in [JOB_FINISHED, JOB_FAILED]:
+            if job.state == JOB_FAILED and job_type.checkpointed:
+                job_type.clean_up_committed_work(job)
+            return
+
         job.state = JOB_STARTED
         job.save(update_fields=("state",))
 
+    job_updated.send(run_async_job, job=job)
+
     try:
         with job_type.transaction_atomic_context(job):
             JobHandler().run(job)
@@ -39,7 +52,16 @@ def run_async_job(self, job_id: int):
         # Don't override the other properties that have been set during the
         # progress update.
         job.save(update_fields=("state",))
+    except JobCancelled:
+        # The job has already been marked as failed when it was cancelled.
+        job.refresh_from_db(fields=("state", "error", "human_readable_error"))
     except Exception as e:
+        if isinstance(e, SoftTimeLimitExceeded) and job_type.can_be_resumed(job):
+            # The work of the committed chunks is kept, so instead of failing, the
+            # job continues from its last checkpoint in a new task.
+            JobHandler().resume_job(job)
+            return
+
         error = f"Something went wrong during the {job_type.type} job execution."
 
         exception_mapping = {
@@ -75,6 +97,7 @@ def run_async_job(self, job_id: int):
         # Delete the import job cached entry because the transaction has been committed
         # and the AirtableImportJob entry now contains the latest data.
         cache.delete(job_progress_key(job.id))
+        job_updated.send(run_async_job, job=job)
 
 
 # noinspection PyUnusedLocal
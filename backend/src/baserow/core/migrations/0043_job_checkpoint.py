@@ -0,0 +1,32 @@
+# Generated by Django 3.2.13 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0042_add_ip_address_to_jobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="checkpoint",
+            field=models.JSONField(
+                default=None,
+                help_text="The state of a checkpointed job after the last committed "
+                "chunk. It's used to resume the job where it left off.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="resume_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="How many times a checkpointed job has been resumed after "
+                "it was interrupted.",
+            ),
+        ),
+    ]
@@ -0,0 +1,467 @@
+import heapq
+import hmac
+import json
+import logging
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import wraps
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import Http404, HttpRequest, HttpResponse
+
+from django_redis import get_redis_connection
+from django_redis.cache import RedisCache
+from django_redis.client import DefaultClient
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+# The parts of a request or task of which the time spent in them is measured. The
+# database time is also included in the time of the other sections if the queries are
+# executed in them.
+PROFILED_SECTIONS = (
+    "db",
+    "cache",
+    "model_generation",
+    "serialization",
+    "permission_check",
+)
+
+
+def get_metrics_redis_connection():
+    """
+    Returns the redis connection of the default cache, which is shared by all the
+    processes, or None if the default cache isn't backed by redis.
+    """
+
+    if not isinstance(caches["default"], RedisCache):
+        return None
+    return get_redis_connection("default")
+
+
+class Histogram:
+    """
+    A Prometheus histogram that renders its observed values in the Prometheus text
+    exposition format. The values are stored in a redis hash if the default cache is
+    backed by redis, so that the metrics endpoint exposes the values observed by all
+    the web and celery processes. Otherwise, which is only the case in development
+    and tests, the values are kept in the memory of the process.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.redis_key = f"baserow_metrics_{name}"
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Sequence[str], value: float, pipeline=None):
+        """
+        Observes the value for the series with the provided labels.
+
+        :param labels: The values of the labels of the series.
+        :param value: The observed value.
+        :param pipeline: An optional redis pipeline to which the commands are added
+            instead of executing them right away.
+        """
+
+        # The series contains the count per bucket, including the +Inf bucket,
+        # followed by the sum of all observed values.
+        index = bisect_left(self.buckets, value)
+
+        connection = get_metrics_redis_connection()
+        if connection is not None:
+            execute = pipeline is None
+            if execute:
+                pipeline = connection.pipeline(transaction=False)
+            field_prefix = json.dumps(list(labels))
+            pipeline.hincrby(self.redis_key, f"{field_prefix}|{index}", 1)
+            pipeline.hincrbyfloat(self.redis_key, f"{field_prefix}|sum", value)
+            if execute:
+                pipeline.execute()
+            return
+
+        with self._lock:
+            series = self._series.setdefault(
+                tuple(labels), [0] * (len(self.buckets) + 2)
+            )
+            series[index] += 1
+            series[-1] += value
+
+    def clear(self):
+        connection = get_metrics_redis_connection()
+        if connection is not None:
+            connection.delete(self.redis_key)
+
+        with self._lock:
+            self._series = {}
+
+    def _get_series(self) -> Dict[Tuple[str, ...], List[float]]:
+        connection = get_metrics_redis_connection()
+        if connection is None:
+            with self._lock:
+                return {labels: list(values) for labels, values in self._series.items()}
+
+        series = {}
+        for field, value in connection.hgetall(self.redis_key).items():
+            field_prefix, position = field.decode().rsplit("|", 1)
+            values = series.setdefault(
+                tuple(json.loads(field_prefix)), [0] * (len(self.buckets) + 2)
+            )
+            if position == "sum":
+                values[-1] = float(value)
+            else:
+                values[int(position)] = int(value)
+        return series
+
+    def _format_labels(self, labels: Sequence[str], **extra: str) -> str:
+        pairs = [*zip(self.label_names, labels), *extra.items()]
+        formatted = ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value)
+                .replace("\\", "\\\\")
+                .replace("\n", "\\n")
+                .replace('"', '\\"'),
+            )
+            for name, value in pairs
+        )
+        return f"{{{formatted}}}" if formatted else ""
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, values in sorted(self._get_series().items()):
+            cumulative = 0
+            for bucket, count in zip([*self.buckets, "+Inf"], values[:-1]):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(labels, le=str(bucket))} "
+                    f"{cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(labels)} {values[-1]}")
+            lines.append(f"{self.name}_count{self._format_labels(labels)} {cumulative}")
+        return lines
+
+
+def _create_histograms(kind: str, label_names: Sequence[str]) -> Dict[str, Histogram]:
+    histograms = {
+        "duration": Histogram(
+            f"baserow_{kind}_duration_seconds",
+            f"The total duration of the {kind}.",
+            label_names,
+            DURATION_BUCKETS,
+        ),
+        "query_count": Histogram(
+            f"baserow_{kind}_queries",
+            f"The number of SQL queries executed during the {kind}.",
+            label_names,
+            QUERY_COUNT_BUCKETS,
+        ),
+    }
+    for section in PROFILED_SECTIONS:
+        histograms[section] = Histogram(
+            f"baserow_{kind}_{section}_duration_seconds",
+            f"The time spent in {section.replace('_', ' ')} during the {kind}.",
+            label_names,
+            DURATION_BUCKETS,
+        )
+    return histograms
+
+
+request_histograms = _create_histograms("request", ("endpoint", "table"))
+task_histograms = _create_histograms("task", ("task",))
+
+
+class Profile:
+    """
+    Collects the measurements of a single request or task. The profile that is
+    currently active is stored in a context variable so that the instrumented code
+    doesn't need a reference to it.
+    """
+
+    def __init__(self, top_queries: int = 0):
+        self.start = perf_counter()
+        self.query_count = 0
+        self.timings: Dict[str, float] = defaultdict(float)
+        self.top_queries = top_queries
+        # A min heap containing the slowest queries as (duration, sql) tuples.
+        self.slowest_queries: List[Tuple[float, str]] = []
+        self._section_depths: Dict[str, int] = defaultdict(int)
+        self._section_starts: Dict[str, float] = {}
+
+    @property
+    def duration(self) -> float:
+        return perf_counter() - self.start
+
+    def add_query(self, sql: str, duration: float):
+        self.query_count += 1
+        self.timings["db"] += duration
+        if self.top_queries:
+            if len(self.slowest_queries) < self.top_queries:
+                heapq.heappush(self.slowest_queries, (duration, sql))
+            else:
+                heapq.heappushpop(self.slowest_queries, (duration, sql))
+
+    def enter_section(self, name: str):
+        # Only the outermost section of the same name is timed, so that recursive
+        # calls, like generating the models of related tables, are not counted twice.
+        self._section_depths[name] += 1
+        if self._section_depths[name] == 1:
+            self._section_starts[name] = perf_counter()
+
+    def exit_section(self, name: str):
+        self._section_depths[name] -= 1
+        if self._section_depths[name] == 0:
+            self.timings[name] += perf_counter() - self._section_starts.pop(name)
+
+
+_current_profile: ContextVar[Optional[Profile]] = ContextVar(
+    "baserow_current_profile", default=None
+)
+
+
+def get_current_profile() -> Optional[Profile]:
+    return _current_profile.get()
+
+
+def _create_profile() -> Profile:
+    # The slowest queries are only kept if the slow request log is enabled.
+    top_queries = (
+        settings.BASEROW_SLOW_REQUEST_LOG_TOP_QUERIES
+        if settings.BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS
+        else 0
+    )
+    return Profile(top_queries=top_queries)
+
+
+@contextmanager
+def start_profile():
+    """
+    Starts a new profile that is active until the context exits.
+    """
+
+    profile = _create_profile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+class profile_section:
+    """
+    Measures the time spent in the wrapped code as part of the named section of the
+    active profile. Can be used as a context manager and as a decorator and does
+    nothing if no profile is active.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.enter_section(self.name)
+        return profile
+
+    def __exit__(self, *exc_info):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.exit_section(self.name)
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def profile_query(execute, sql, params, many, context):
+    """
+    A database execute wrapper that counts the executed queries and the time spent
+    in them for the active profile.
+    """
+
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(sql, perf_counter() - start)
+
+
+def install_query_profiler(sender, connection, **kwargs):
+    """
+    Adds the query profiler to the execute wrappers of every new database
+    connection. The wrappers are kept when the connection is reopened.
+    """
+
+    if profile_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(profile_query)
+
+
+def observe_profile(
+    histograms: Dict[str, Histogram], labels: Sequence[str], profile: Profile
+):
+    """
+    Observes the measurements of the profile in the histograms. Failing to store
+    them doesn't fail the request or task.
+    """
+
+    connection = get_metrics_redis_connection()
+    # All the histograms are updated in a single round trip.
+    pipeline = connection.pipeline(transaction=False) if connection else None
+    try:
+        histograms["duration"].observe(labels, profile.duration, pipeline)
+        histograms["query_count"].observe(labels, profile.query_count, pipeline)
+        for section in PROFILED_SECTIONS:
+            histograms[section].observe(
+                labels, profile.timings.get(section, 0.0), pipeline
+            )
+        if pipeline is not None:
+            pipeline.execute()
+    except RedisError:
+        logger.exception("Failed to store the profiling metrics.")
+
+
+def log_if_slow(description: str, profile: Profile):
+    """
+    Logs a warning containing the timings and the slowest queries of the profile if
+    it took longer than `BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS`.
+    """
+
+    threshold = settings.BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS
+    duration = profile.duration
+    if not threshold or duration * 1000 < threshold:
+        return
+
+    timings = ", ".join(
+        f"{section}={profile.timings.get(section, 0.0) * 1000:.1f}ms"
+        for section in PROFILED_SECTIONS
+    )
+    queries = "".join(
+        f"\n  {query_duration * 1000:.1f}ms {sql}"
+        for query_duration, sql in sorted(profile.slowest_queries, reverse=True)
+    )
+    logger.warning(
+        f"Slow {description} took {duration * 1000:.1f}ms with "
+        f"{profile.query_count} queries ({timings}). Slowest queries:{queries}"
+    )
+
+
+def _profile_cache_method(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with profile_section("cache"):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class ProfilingCacheClient(DefaultClient):
+    """
+    A django-redis client that adds the time spent in the most common cache
+    operations to the cache section of the active profile.
+    """
+
+    get = _profile_cache_method(DefaultClient.get)
+    set = _profile_cache_method(DefaultClient.set)
+    add = _profile_cache_method(DefaultClient.add)
+    delete = _profile_cache_method(DefaultClient.delete)
+    get_many = _profile_cache_method(DefaultClient.get_many)
+    set_many = _profile_cache_method(DefaultClient.set_many)
+    delete_many = _profile_cache_method(DefaultClient.delete_many)
+    incr = _profile_cache_method(DefaultClient.incr)
+    has_key = _profile_cache_method(DefaultClient.has_key)
+
+
+# The tokens to reset the active profile and the profiles of the running celery tasks
+# keyed by the task id.
+_running_task_profiles: Dict[str, Tuple[Token, Profile]] = {}
+
+
+def on_task_prerun(task_id=None, task=None, **kwargs):
+    # Tasks that are executed eagerly as part of a profiled request are included in
+    # the profile of the request instead.
+    if not settings.BASEROW_REQUEST_PROFILING_ENABLED or get_current_profile():
+        return
+
+    profile = _create_profile()
+    _running_task_profiles[task_id] = (_current_profile.set(profile), profile)
+
+
+def on_task_postrun(task_id=None, task=None, **kwargs):
+    if task_id not in _running_task_profiles:
+        return
+
+    token, profile = _running_task_profiles.pop(task_id)
+    _current_profile.reset(token)
+    observe_profile(task_histograms, (task.name,), profile)
+    log_if_slow(f"task {task.name}", profile)
+
+
+def render_metrics() -> str:
+    lines = []
+    for histograms in [request_histograms, task_histograms]:
+        for histogram in histograms.values():
+            lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Exposes the profiling histograms of all the processes in the Prometheus text
+    format. If `BASEROW_REQUEST_PROFILING_METRICS_TOKEN` is set, the scraper must
+    provide it as bearer token.
+    """
+
+    if not settings.BASEROW_REQUEST_PROFILING_ENABLED:
+        raise Http404()
+
+    token = settings.BASEROW_REQUEST_PROFILING_METRICS_TOKEN
+    if token and not hmac.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401)
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
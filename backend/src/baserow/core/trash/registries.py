@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -52,6 +52,38 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    can_permanently_delete_in_bulk = False
+    """
+    Indicates whether the `permanently_delete_items` method is implemented. If so, the
+    marked trash entries of this type are permanently deleted in chunks per parent
+    instead of one by one.
+    """
+
+    def permanently_delete_items(
+        self,
+        trash_item_ids: List[int],
+        parent_id: Optional[int],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ):
+        """
+        Should be implemented when `can_permanently_delete_in_bulk` is True to delete
+        all the specified trashed items at once. Items that don't exist anymore must
+        be ignored.
+
+        :param trash_item_ids: The ids of the trashed items to delete permanently.
+        :param parent_id: If required for this type, the id of the parent of the
+            items.
+        :param trash_item_lookup_cache: If a cache is being used to speed up trash
+            item lookups it should be provided here.
+        :raises TrashItemDoesNotExist: If the parent of the items doesn't exist
+            anymore.
+        """
+
+        raise NotImplementedError(
+            "The permanently_delete_items method must be implemented if "
+            "can_permanently_delete_in_bulk is True."
+        )
+
     @property
     def requires_parent_id(self) -> bool:
         """
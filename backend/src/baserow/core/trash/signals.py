@@ -9,3 +9,12 @@ Sent when any trashable item in Baserow is permanently deleted with kwargs conta
     None.
 :param parent_id: The parent id of the trashable item if required for that type.
 """
+
+permanently_deleted_in_bulk = django.dispatch.Signal()
+"""
+Sent instead of `permanently_deleted` when multiple trashable items of a type that
+supports it have been permanently deleted at once, with kwargs containing:
+
+:param trash_item_ids: The ids of the items that were deleted.
+:param parent_id: The parent id of the trashable items if required for that type.
+"""
@@ -1,11 +1,24 @@
 from typing import Callable
 
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import is_valid_path
 
 from rest_framework import status
 
+from baserow.core.db_router import (
+    get_authenticated_user_id,
+    get_sticky_user_cache_key,
+    use_read_replicas,
+)
+from baserow.core.profiling import (
+    log_if_slow,
+    observe_profile,
+    request_histograms,
+    start_profile,
+)
+
 
 def json_error_404_add_trailing_slash(path: str) -> HttpResponse:
     """
@@ -60,3 +73,76 @@ class BaserowCustomHttp404Middleware:
             else:
                 return json_error_404_not_found(path)
         return response
+
+
+class ReadReplicaMiddleware:
+    """
+    Allows the read queries of safe requests to be executed on the read replicas.
+    After a user has written something, all their requests are executed on the
+    default database for `BASEROW_READ_REPLICA_STICKY_SECONDS` so that they can
+    read their own changes.
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.BASEROW_READ_REPLICA_DATABASES:
+            return self.get_response(request)
+
+        if request.method in self.SAFE_METHODS:
+            with use_read_replicas(request) as state:
+                response = self.get_response(request)
+            written = state.written
+        else:
+            # Unsafe requests are never executed on a replica because they could
+            # otherwise base their changes on stale data.
+            response = self.get_response(request)
+            written = True
+
+        user_id = get_authenticated_user_id(request)
+        if written and user_id is not None:
+            cache.set(
+                get_sticky_user_cache_key(user_id),
+                True,
+                timeout=settings.BASEROW_READ_REPLICA_STICKY_SECONDS,
+            )
+
+        return response
+
+
+class RequestProfilingMiddleware:
+    """
+    Profiles every request if `BASEROW_REQUEST_PROFILING_ENABLED` is set and records
+    the query count and the time spent in the profiled sections in the request
+    histograms, labelled by the name of the endpoint and optionally by the table.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.BASEROW_REQUEST_PROFILING_ENABLED:
+            return self.get_response(request)
+
+        with start_profile() as profile:
+            response = self.get_response(request)
+
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None:
+            # Requests that don't match an url are grouped together, so that the
+            # number of endpoints can't grow unbounded.
+            endpoint, table_id = "unresolved", ""
+        else:
+            endpoint = resolver_match.view_name
+            table_id = (
+                resolver_match.kwargs.get("table_id", "")
+                if settings.BASEROW_REQUEST_PROFILING_TABLE_LABEL
+                else ""
+            )
+
+        observe_profile(request_histograms, (endpoint, str(table_id)), profile)
+        log_if_slow(f"request {request.method} {request.path}", profile)
+        return response
@@ -0,0 +1,259 @@
+import contextlib
+import json
+import platform
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.table.models import Table
+
+# The field types that are cycled through when creating the regular fields of a
+# benchmark table, together with the kwargs needed to create them.
+BENCHMARK_FIELD_TYPES = [
+    ("text", {}),
+    ("long_text", {}),
+    ("number", {"number_decimal_places": 2, "number_negative": True}),
+    ("boolean", {}),
+    ("date", {"date_include_time": True}),
+    (
+        "single_select",
+        {
+            "select_options": [
+                {"value": "Option A", "color": "blue"},
+                {"value": "Option B", "color": "red"},
+                {"value": "Option C", "color": "green"},
+            ]
+        },
+    ),
+]
+
+
+class BenchmarkTableShape(NamedTuple):
+    """
+    Describes the shape of a generated benchmark table. The densities are the
+    fraction of the `width` that consists of link row and formula fields.
+    """
+
+    width: int
+    rows: int
+    link_density: float = 0.0
+    formula_density: float = 0.0
+
+    @property
+    def link_count(self) -> int:
+        return round(self.width * self.link_density)
+
+    @property
+    def formula_count(self) -> int:
+        return round(self.width * self.formula_density)
+
+    @property
+    def label(self) -> str:
+        return (
+            f"w{self.width}-r{self.rows}-"
+            f"l{self.link_density:g}-f{self.formula_density:g}"
+        )
+
+
+def create_benchmark_table(
+    data_fixture, user, shape: BenchmarkTableShape, related_rows: int = 100
+) -> Table:
+    """
+    Creates a table in a new database of the user that matches the provided shape
+    and fills it with random rows using `fill_table_rows`. The link row fields all
+    link to a separate table containing `related_rows` rows and the formula fields
+    all reference the primary text field, so that changing that field updates all
+    of them.
+
+    :param data_fixture: The fixtures used to create the database and tables.
+    :param user: The user on whose behalf the fields are created.
+    :param shape: The shape of the table that must be created.
+    :param related_rows: The number of rows in the table that is linked to.
+    :return: The filled benchmark table.
+    """
+
+    field_handler = FieldHandler()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(
+        database=database, name=f"Benchmark {shape.label}"
+    )
+    field_handler.create_field(user, table, "text", name="Text", primary=True)
+
+    regular_count = max(shape.width - shape.link_count - shape.formula_count - 1, 0)
+    for index in range(regular_count):
+        field_type, kwargs = BENCHMARK_FIELD_TYPES[index % len(BENCHMARK_FIELD_TYPES)]
+        field_handler.create_field(
+            user, table, field_type, name=f"{field_type} {index}", **kwargs
+        )
+
+    if shape.link_count:
+        related_table = data_fixture.create_database_table(
+            database=database, name=f"Related {shape.label}"
+        )
+        field_handler.create_field(
+            user, related_table, "text", name="Name", primary=True
+        )
+        fill_table_rows(related_rows, related_table)
+        for index in range(shape.link_count):
+            field_handler.create_field(
+                user,
+                table,
+                "link_row",
+                name=f"link_row {index}",
+                link_row_table=related_table,
+                has_related_field=False,
+            )
+
+    for index in range(shape.formula_count):
+        field_handler.create_field(
+            user,
+            table,
+            "formula",
+            name=f"formula {index}",
+            formula=f"concat(field('Text'), '-{index}')",
+        )
+
+    fill_table_rows(shape.rows, table)
+    return table
+
+
+def get_import_data(table: Table, count: int) -> List[List[Any]]:
+    """
+    Returns the internal values of the first `count` rows of the provided table in
+    the format that `RowHandler.import_rows` expects, so that the rows can be
+    imported again as if they were coming from a file. The rows are repeated if the
+    table contains less than `count` rows.
+    """
+
+    model = table.get_model()
+    field_objects = sorted(
+        (
+            field_object
+            for field_object in model._field_objects.values()
+            if not field_object["type"].read_only
+        ),
+        key=lambda field_object: (
+            field_object["field"].order,
+            field_object["field"].id,
+        ),
+    )
+    rows = list(model.objects.all().enhance_by_fields()[:count])
+    return [
+        [
+            field_object["type"].get_internal_value_from_db(
+                rows[index % len(rows)], field_object["name"]
+            )
+            for field_object in field_objects
+        ]
+        for index in range(count)
+    ]
+
+
+def get_text_field(table: Table) -> Field:
+    return Field.objects.get(table=table, name="Text").specific
+
+
+class BenchmarkRecorder:
+    """
+    Collects the measurements of the benchmarks that are run in a test session and
+    writes them to a JSON file, so that the results of different runs can be
+    compared with `compare_benchmark_results`.
+    """
+
+    def __init__(self):
+        self.results: List[Dict[str, Any]] = []
+        self.postgres_version: Optional[int] = None
+
+    @contextlib.contextmanager
+    def measure(self, name: str, **params: Any):
+        """
+        Measures the wall time, the number of executed queries and the peak Python
+        memory usage of the code in the context. Note that tracing the memory
+        allocations slows down the code, so the wall times are only comparable
+        between runs of this recorder.
+
+        :param name: The name of the benchmark.
+        :param params: The parameters of the benchmark, like the table shape.
+        """
+
+        self.postgres_version = connection.pg_version
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                start = perf_counter()
+                yield
+                wall_time = perf_counter() - start
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.results.append(
+            {
+                "name": name,
+                "params": params,
+                "wall_time": wall_time,
+                "query_count": len(queries),
+                "peak_memory": peak_memory,
+            }
+        )
+
+    def write(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created_on": datetime.now(tz=timezone.utc).isoformat(),
+                    "python_version": platform.python_version(),
+                    "postgres_version": self.postgres_version,
+                    "results": self.results,
+                },
+                f,
+                indent=2,
+            )
+
+
+def get_benchmark_key(result: Dict[str, Any]) -> str:
+    params = ",".join(
+        f"{key}={value}" for key, value in sorted(result["params"].items())
+    )
+    return f"{result['name']}[{params}]"
+
+
+def compare_benchmark_results(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Compares the results of two benchmark runs written by the `BenchmarkRecorder`.
+
+    :param baseline: The loaded JSON of the run to compare with.
+    :param current: The loaded JSON of the new run.
+    :return: For every benchmark in both runs, the ratio of the new measurements
+        to the baseline measurements, keyed by the name and parameters. The ratio is
+        `None` if the baseline measurement is zero.
+    """
+
+    baseline_results = {
+        get_benchmark_key(result): result for result in baseline["results"]
+    }
+    comparison = {}
+    for result in current["results"]:
+        key = get_benchmark_key(result)
+        if key not in baseline_results:
+            continue
+        comparison[key] = {
+            metric: (
+                result[metric] / baseline_results[key][metric]
+                if baseline_results[key][metric]
+                else None
+            )
+            for metric in ["wall_time", "query_count", "peak_memory"]
+        }
+    return comparison
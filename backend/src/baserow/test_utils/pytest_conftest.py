@@ -1,6 +1,8 @@
 import asyncio
 import contextlib
+import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -222,3 +224,48 @@ def profiler():
         profiler.reset()
 
     return profile_this
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder():
+    """
+    A fixture that collects the benchmark measurements of the whole test session and
+    writes them to the JSON file at `BASEROW_BENCHMARK_RESULTS_PATH`, or to a
+    timestamped file in the `.benchmarks` directory. If
+    `BASEROW_BENCHMARK_BASELINE_PATH` points to the results of a previous run, the
+    ratio of every measurement to the previous one is printed.
+    """
+
+    from baserow.test_utils.benchmarks import (
+        BenchmarkRecorder,
+        compare_benchmark_results,
+    )
+
+    recorder = BenchmarkRecorder()
+
+    yield recorder
+
+    if not recorder.results:
+        return
+
+    results_path = os.getenv("BASEROW_BENCHMARK_RESULTS_PATH")
+    if results_path:
+        results_file = Path(results_path)
+    else:
+        timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M%S")
+        results_file = Path.cwd() / ".benchmarks" / f"{timestamp}.json"
+    recorder.write(results_file)
+    print(f"Benchmark results written to {results_file}")
+
+    baseline_path = os.getenv("BASEROW_BENCHMARK_BASELINE_PATH")
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f_baseline:
+            baseline = json.load(f_baseline)
+        with open(results_file, encoding="utf-8") as f_current:
+            current = json.load(f_current)
+        for key, ratios in compare_benchmark_results(baseline, current).items():
+            formatted = ", ".join(
+                f"{metric}: {'-' if ratio is None else f'{ratio:.2f}x'}"
+                for metric, ratio in ratios.items()
+            )
+            print(f"{key} {formatted}")
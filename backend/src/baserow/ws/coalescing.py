@@ -0,0 +1,116 @@
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from redis.exceptions import LockNotOwnedError
+
+if TYPE_CHECKING:
+    from baserow.ws.registries import PageType
+
+# The buffered messages are discarded if they haven't been flushed within this number
+# of seconds, which can only happen if the flush task is lost.
+COALESCED_MESSAGES_TIMEOUT = 60
+COALESCED_MESSAGES_LOCK_TIMEOUT = 5
+
+
+def _get_messages_cache_key(group_name: str) -> str:
+    return f"ws_coalesced_messages_{group_name}"
+
+
+def _get_flush_scheduled_cache_key(group_name: str) -> str:
+    return f"ws_coalesced_messages_flush_scheduled_{group_name}"
+
+
+@contextmanager
+def _lock_messages(group_name: str):
+    # The lock makes sure that messages of concurrent requests aren't lost, but it's
+    # only available with a redis backed cache. Other caches are only used in
+    # development and tests, where it's fine to not lock.
+    if not hasattr(cache, "lock"):
+        yield
+        return
+
+    cache_lock = cache.lock(
+        f"{_get_messages_cache_key(group_name)}_lock",
+        timeout=COALESCED_MESSAGES_LOCK_TIMEOUT,
+    )
+    cache_lock.acquire()
+    try:
+        yield
+    finally:
+        try:
+            cache_lock.release()
+        except LockNotOwnedError:
+            pass
+
+
+def add_coalesced_message(
+    page_type: "PageType",
+    group_name: str,
+    payload: Dict[str, Any],
+    ignore_web_socket_id: Optional[str] = None,
+):
+    """
+    Buffers the payload that must be broadcast to the channel group. All the payloads
+    buffered within `BASEROW_WS_COALESCE_WINDOW_MS` after the first one are sent to
+    the group in a single message. If the payload can be merged with the previous
+    buffered payload, as determined by the `merge_payloads` method of the page type,
+    then the merged payload replaces the previous one. The buffered payloads are
+    sent earlier if there are `BASEROW_WS_COALESCE_MAX_MESSAGES` of them.
+
+    :param page_type: The page type of the channel group.
+    :param group_name: The name of the channel group where the payload must be
+        broadcast to.
+    :param payload: The payload that must be broadcast.
+    :param ignore_web_socket_id: The web socket id to which the payload must not be
+        sent.
+    """
+
+    from baserow.ws.tasks import broadcast_coalesced_to_channel_group
+
+    cache_key = _get_messages_cache_key(group_name)
+    with _lock_messages(group_name):
+        messages = cache.get(cache_key, [])
+        previous = messages[-1] if messages else None
+        merged_payload = None
+        if previous and previous["ignore_web_socket_id"] == ignore_web_socket_id:
+            merged_payload = page_type.merge_payloads(previous["payload"], payload)
+
+        if merged_payload is not None:
+            previous["payload"] = merged_payload
+        else:
+            messages.append(
+                {"payload": payload, "ignore_web_socket_id": ignore_web_socket_id}
+            )
+        cache.set(cache_key, messages, timeout=COALESCED_MESSAGES_TIMEOUT)
+
+    window_seconds = settings.BASEROW_WS_COALESCE_WINDOW_MS / 1000
+    if len(messages) >= settings.BASEROW_WS_COALESCE_MAX_MESSAGES:
+        broadcast_coalesced_to_channel_group.delay(group_name)
+    elif cache.add(
+        _get_flush_scheduled_cache_key(group_name),
+        True,
+        timeout=COALESCED_MESSAGES_TIMEOUT,
+    ):
+        broadcast_coalesced_to_channel_group.apply_async(
+            (group_name,), countdown=window_seconds
+        )
+
+
+def pop_coalesced_messages(group_name: str) -> List[Dict[str, Any]]:
+    """
+    Returns and removes the buffered messages of the channel group. A new flush is
+    scheduled when the next message is buffered.
+
+    :param group_name: The name of the channel group.
+    :return: The buffered messages in the order in which they were added. Every
+        message is a dict containing the `payload` and the `ignore_web_socket_id`.
+    """
+
+    cache_key = _get_messages_cache_key(group_name)
+    with _lock_messages(group_name):
+        messages = cache.get(cache_key, [])
+        cache.delete_many([cache_key, _get_flush_scheduled_cache_key(group_name)])
+    return messages
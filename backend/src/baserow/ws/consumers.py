@@ -166,6 +166,31 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
             await self.send_json(payload)
 
+    async def broadcast_batch_to_group(self, event):
+        """
+        Broadcasts a batch of coalesced messages to all the users that are in the
+        provided group name. The payloads of the messages that aren't ignored for
+        this web socket are sent as one `batch` message, in the order in which they
+        were broadcast.
+
+        :param event: The event containing the messages, which each contain the
+            payload and the web socket id that must be ignored.
+        :type event: dict
+        """
+
+        web_socket_id = self.scope["web_socket_id"]
+        payloads = [
+            message["payload"]
+            for message in event["messages"]
+            if not message["ignore_web_socket_id"]
+            or message["ignore_web_socket_id"] != web_socket_id
+        ]
+
+        if len(payloads) == 1:
+            await self.send_json(payloads[0])
+        elif len(payloads) > 1:
+            await self.send_json({"type": "batch", "payloads": payloads})
+
     async def remove_user_from_group(self, event):
         user_ids_to_remove = event["user_ids_to_remove"]
         user_id = self.scope["user"].id
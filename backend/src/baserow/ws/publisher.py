@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from django.db import transaction
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+# The event loop only keeps weak references to its tasks, so the pending send tasks
+# are referenced here until they're done.
+_pending_send_tasks: Set[asyncio.Task] = set()
+
+
+def _on_send_task_done(task: asyncio.Task):
+    _pending_send_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "Failed to send a message to the channel layer.",
+            exc_info=task.exception(),
+        )
+
+
+def send_to_channel_group(group_name: str, message: Dict[str, Any]):
+    """
+    Sends the message to the channel group without going through a celery task. If
+    this is called from within a running event loop, the message is sent in the
+    background of that loop. Otherwise it's sent using `async_to_sync`, which in the
+    ASGI server runs it in the event loop of the server. The redis channel layer keeps
+    a connection pool per event loop, so the connections are reused. Errors are
+    logged instead of raised.
+
+    :param group_name: The name of the channel group where the message must be sent
+        to.
+    :param message: The message that must be sent, including the `type` which
+        determines which method of the consumer handles it.
+    """
+
+    channel_layer = get_channel_layer()
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    # Realtime messages are delivered on a best effort basis. They're sent after the
+    # transaction has been committed, so a failure must not fail the request or
+    # prevent the other on commit callbacks from running.
+    try:
+        if loop is not None:
+            task = loop.create_task(channel_layer.group_send(group_name, message))
+            _pending_send_tasks.add(task)
+            task.add_done_callback(_on_send_task_done)
+        else:
+            async_to_sync(channel_layer.group_send)(group_name, message)
+    except Exception:
+        logger.exception("Failed to send a message to the channel layer.")
+
+
+def publish_to_channel_group(
+    group_name: str,
+    payload: Dict[str, Any],
+    ignore_web_socket_id: Optional[str] = None,
+):
+    """
+    Publishes the payload to all the users within the channel group once the current
+    transaction commits, or right away if there is no transaction.
+
+    :param group_name: The name of the channel group where the payload must be
+        published to.
+    :param payload: A dictionary object containing the payload that must be
+        published.
+    :param ignore_web_socket_id: The web socket id to which the payload must not be
+        sent. This is normally the web socket id that has originally made the change
+        request.
+    """
+
+    transaction.on_commit(
+        lambda: send_to_channel_group(
+            group_name,
+            {
+                "type": "broadcast_to_group",
+                "payload": payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+            },
+        )
+    )
+
+
+def publish_to_users(
+    user_ids: List[int],
+    payload: Dict[str, Any],
+    ignore_web_socket_id: Optional[str] = None,
+    send_to_all_users: bool = False,
+):
+    """
+    Publishes the payload to the provided users once the current transaction
+    commits, or right away if there is no transaction.
+
+    :param user_ids: A list containing the user ids that will be sent the payload.
+    :param payload: A dictionary object containing the payload that must be
+        published.
+    :param ignore_web_socket_id: An optional web socket id which will not be sent the
+        payload if provided. This is normally the web socket id that has originally
+        made the change request.
+    :param send_to_all_users: If set to True all users will be sent the payload and
+        the user_ids parameter will be ignored. ignore_web_socket_id however will still
+        be respected.
+    """
+
+    transaction.on_commit(
+        lambda: send_to_channel_group(
+            "users",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": user_ids,
+                "payload": payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+                "send_to_all_users": send_to_all_users,
+            },
+        )
+    )
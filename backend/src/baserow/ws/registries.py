@@ -1,5 +1,10 @@
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
 from baserow.core.registry import Instance, Registry
-from baserow.ws.tasks import broadcast_to_channel_group
+from baserow.ws.coalescing import add_coalesced_message
+from baserow.ws.publisher import publish_to_channel_group
 
 
 class PageType(Instance):
@@ -24,6 +29,13 @@ class PageType(Instance):
     dynamic groups.
     """
 
+    coalesce_broadcasts = False
+    """
+    Indicates whether the broadcasts to the page must be buffered for
+    `BASEROW_WS_COALESCE_WINDOW_MS` and sent to the group as a single batch. This is
+    useful for pages that can receive many events in a short time.
+    """
+
     def can_add(self, user, web_socket_id, **kwargs):
         """
         Indicates whether the user can be added to the page group. Here can for
@@ -74,9 +86,26 @@ class PageType(Instance):
         :type kwargs: dict
         """
 
-        broadcast_to_channel_group.delay(
-            self.get_group_name(**kwargs), payload, ignore_web_socket_id
-        )
+        group_name = self.get_group_name(**kwargs)
+        if self.coalesce_broadcasts and settings.BASEROW_WS_COALESCE_WINDOW_MS:
+            add_coalesced_message(self, group_name, payload, ignore_web_socket_id)
+        else:
+            publish_to_channel_group(group_name, payload, ignore_web_socket_id)
+
+    def merge_payloads(
+        self, payload: Dict[str, Any], next_payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Called when a payload is broadcast right after another one to the same group
+        with the same `ignore_web_socket_id` within the coalesce window. If the
+        payloads can be merged, then the merged payload is sent instead of both.
+
+        :param payload: The payload that was broadcast first.
+        :param next_payload: The payload that is broadcast after it.
+        :return: The merged payload or None if the payloads can't be merged.
+        """
+
+        return None
 
 
 class PageRegistry(Registry):
@@ -11,9 +11,13 @@ from baserow.api.groups.serializers import (
     GroupUserGroupSerializer,
     GroupUserSerializer,
 )
+from baserow.api.jobs.serializers import JobSerializer
 from baserow.api.user.serializers import PublicUserSerializer
 from baserow.core import signals
 from baserow.core.handler import CoreHandler
+from baserow.core.jobs.constants import JOB_FAILED, JOB_FINISHED
+from baserow.core.jobs.registries import job_type_registry
+from baserow.core.jobs.signals import job_updated as job_updated_signal
 from baserow.core.models import Application, GroupUser
 from baserow.core.operations import (
     ListApplicationsGroupOperationType,
@@ -22,6 +26,7 @@ from baserow.core.operations import (
 from baserow.core.registries import object_scope_type_registry
 from baserow.core.utils import generate_hash
 
+from .publisher import publish_to_users
 from .tasks import (
     broadcast_application_created,
     broadcast_to_group,
@@ -110,12 +115,10 @@ def group_updated(sender, group, user, **kwargs):
 
 @receiver(signals.group_deleted)
 def group_deleted(sender, group_id, group, group_users, user=None, **kwargs):
-    transaction.on_commit(
-        lambda: broadcast_to_users.delay(
-            [u.id for u in group_users],
-            {"type": "group_deleted", "group_id": group_id},
-            getattr(user, "web_socket_id", None),
-        )
+    publish_to_users(
+        [u.id for u in group_users],
+        {"type": "group_deleted", "group_id": group_id},
+        getattr(user, "web_socket_id", None),
     )
 
 
@@ -165,7 +168,7 @@ def group_user_deleted(sender, group_user_id, group_user, user, **kwargs):
             payload,
             getattr(user, "web_socket_id", None),
         )
-        broadcast_to_users.delay(
+        publish_to_users(
             [group_user.user_id],
             payload,
             getattr(user, "web_socket_id", None),
@@ -195,28 +198,24 @@ def group_restored(sender, group_user, user, **kwargs):
         for application in applications_qs
     ]
 
-    transaction.on_commit(
-        lambda: broadcast_to_users.delay(
-            [group_user.user_id],
-            {
-                "type": "group_restored",
-                "group_id": group_user.group_id,
-                "group": GroupUserGroupSerializer(groupuser_groups).data,
-                "applications": applications,
-            },
-            getattr(user, "web_socket_id", None),
-        )
+    publish_to_users(
+        [group_user.user_id],
+        {
+            "type": "group_restored",
+            "group_id": group_user.group_id,
+            "group": GroupUserGroupSerializer(groupuser_groups).data,
+            "applications": applications,
+        },
+        getattr(user, "web_socket_id", None),
     )
 
 
 @receiver(signals.groups_reordered)
 def groups_reordered(sender, group_ids, user, **kwargs):
-    transaction.on_commit(
-        lambda: broadcast_to_users.delay(
-            [user.id],
-            {"type": "groups_reordered", "group_ids": group_ids},
-            getattr(user, "web_socket_id", None),
-        )
+    publish_to_users(
+        [user.id],
+        {"type": "groups_reordered", "group_ids": group_ids},
+        getattr(user, "web_socket_id", None),
     )
 
 
@@ -281,3 +280,29 @@ def applications_reordered(sender, group, order, user, **kwargs):
             getattr(user, "web_socket_id", None),
         )
     )
+
+
+@receiver(job_updated_signal)
+def job_updated(sender, job, **kwargs):
+    job_type = job_type_registry.get_by_model(job)
+
+    if job.state in [JOB_FINISHED, JOB_FAILED]:
+        # The job type specific properties are only relevant when the job is done,
+        # so only then it's worth serializing the complete job.
+        serialized_job = job_type.get_serializer(job, JobSerializer).data
+    else:
+        serialized_job = {
+            "id": job.id,
+            "type": job_type.type,
+            "progress_percentage": job.progress_percentage,
+            "state": job.state,
+            "human_readable_error": job.human_readable_error,
+        }
+
+    # The progress of a job is updated while its transaction is still open, so
+    # the message is sent right away instead of waiting for the commit. This code
+    # normally already runs in a celery worker, so there is no need for another task.
+    broadcast_to_users(
+        [job.user_id],
+        {"type": "job_updated", "job": serialized_job},
+    )
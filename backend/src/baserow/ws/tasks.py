@@ -25,11 +25,9 @@ def broadcast_to_users(
         be respected.
     """
 
-    from asgiref.sync import async_to_sync
-    from channels.layers import get_channel_layer
+    from baserow.ws.publisher import send_to_channel_group
 
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
+    send_to_channel_group(
         "users",
         {
             "type": "broadcast_to_users",
@@ -116,11 +114,9 @@ def broadcast_to_users_individual_payloads(
         made the change request.
     """
 
-    from asgiref.sync import async_to_sync
-    from channels.layers import get_channel_layer
+    from baserow.ws.publisher import send_to_channel_group
 
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
+    send_to_channel_group(
         "users",
         {
             "type": "broadcast_to_users_individual_payloads",
@@ -148,11 +144,9 @@ def broadcast_to_channel_group(self, group, payload, ignore_web_socket_id=None):
     :type ignore_web_socket_id: str
     """
 
-    from asgiref.sync import async_to_sync
-    from channels.layers import get_channel_layer
+    from baserow.ws.publisher import send_to_channel_group
 
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
+    send_to_channel_group(
         group,
         {
             "type": "broadcast_to_group",
@@ -162,6 +156,29 @@ def broadcast_to_channel_group(self, group, payload, ignore_web_socket_id=None):
     )
 
 
+@app.task(bind=True)
+def broadcast_coalesced_to_channel_group(self, group):
+    """
+    Broadcasts all the payloads that have been buffered for the channel group
+    because its page type coalesces broadcasts in a single message.
+
+    :param group: The name of the channel group where the buffered payloads must be
+        broadcasted to.
+    :type group: str
+    """
+
+    from baserow.ws.coalescing import pop_coalesced_messages
+    from baserow.ws.publisher import send_to_channel_group
+
+    messages = pop_coalesced_messages(group)
+    if len(messages) == 0:
+        return
+
+    send_to_channel_group(
+        group, {"type": "broadcast_batch_to_group", "messages": messages}
+    )
+
+
 @app.task(bind=True)
 def broadcast_to_group(self, group_id, payload, ignore_web_socket_id=None):
     """
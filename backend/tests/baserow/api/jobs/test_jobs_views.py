@@ -263,3 +263,40 @@ def test_get_job(data_fixture, api_client):
         "human_readable_error": "Wrong",
         "test_field": 42,
     }
+
+
+@pytest.mark.django_db
+def test_cancel_job(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    job_1 = data_fixture.create_fake_job(user=user)
+    job_2 = data_fixture.create_fake_job()
+
+    response = api_client.post(
+        reverse("api:jobs:cancel", kwargs={"job_id": job_2.id}),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_JOB_DOES_NOT_EXIST"
+
+    # The temporary job types don't commit their work in chunks.
+    response = api_client.post(
+        reverse("api:jobs:cancel", kwargs={"job_id": job_1.id}),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_JOB_NOT_CANCELLABLE"
+
+    with patch("baserow.core.jobs.registries.JobType.checkpointed", new=True), patch(
+        "baserow.core.jobs.registries.JobType.clean_up_committed_work", create=True
+    ) as mock_clean_up_committed_work:
+        response = api_client.post(
+            reverse("api:jobs:cancel", kwargs={"job_id": job_1.id}),
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["state"] == "failed"
+    assert (
+        response.json()["human_readable_error"]
+        == "The tmp_job_type_1 job has been cancelled."
+    )
+    mock_clean_up_committed_work.assert_called_once()
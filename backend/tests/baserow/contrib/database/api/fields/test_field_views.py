@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.conf import settings
 from django.shortcuts import reverse
 
@@ -6,12 +8,14 @@ from rest_framework.status import (
     HTTP_200_OK,
     HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
     HTTP_409_CONFLICT,
 )
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, NumberField, TextField
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.test_utils.helpers import (
@@ -919,3 +923,91 @@ def test_async_duplicate_field(api_client, data_fixture):
     assert field_set.count() == original_field_count + 2
     for row in response_json["results"]:
         assert row[f"{primary_field.name} 3"] == row[primary_field.name]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_convert_field(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    _, token_2 = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "12"})
+    url = reverse("api:database:fields:async_convert", kwargs={"field_id": field.id})
+
+    response = api_client.post(
+        url, {"type": "number"}, format="json", HTTP_AUTHORIZATION=f"JWT {token_2}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = api_client.post(
+        reverse("api:database:fields:async_convert", kwargs={"field_id": 99999}),
+        {"type": "number"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    response = api_client.post(
+        url,
+        {"type": "number", "number_decimal_places": "wrong"},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    response = api_client.post(
+        url, {"type": "single_select"}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_FIELD_CANNOT_BE_CONVERTED_ONLINE"
+
+    response = api_client.post(
+        url,
+        {"type": "number", "number_decimal_places": 2},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_202_ACCEPTED
+    job = response.json()
+    assert job["type"] == "convert_field"
+
+    response = api_client.get(
+        reverse("api:jobs:item", kwargs={"job_id": job["id"]}),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json()["state"] == "finished"
+    assert response.json()["field"]["type"] == "number"
+    row = table.get_model().objects.get()
+    assert getattr(row, f"field_{field.id}") == Decimal("12.00")
+
+
+@pytest.mark.django_db
+def test_list_fields_conditional_get(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    url = reverse("api:database:fields:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, field, name="Renamed")
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()[0]["name"] == "Renamed"
@@ -2166,3 +2166,73 @@ def test_batch_delete_rows_num_of_queries(api_client, data_fixture):
     assert len(delete_one_row_ctx.captured_queries) == len(
         delete_multiple_rows_ctx.captured_queries
     )
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_upsert_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    external_id_field = data_fixture.create_text_field(table=table, name="Id")
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    existing_row = model.objects.create(
+        **{f"field_{external_id_field.id}": "a", f"field_{name_field.id}": "Old"}
+    )
+    url = reverse("api:database:rows:batch-upsert", kwargs={"table_id": table.id})
+
+    response = api_client.post(
+        f"{url}?user_field_names&match_field=Id",
+        {"items": [{"Id": "b", "Name": "Created"}, {"Id": "a", "Name": "Updated"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    items = response.json()["items"]
+    assert [(item["Id"], item["Name"]) for item in items] == [
+        ("b", "Created"),
+        ("a", "Updated"),
+    ]
+    assert items[1]["id"] == existing_row.id
+    assert model.objects.count() == 2
+
+    response = api_client.post(
+        f"{url}?match_field={external_id_field.id}",
+        {"items": [{f"field_{name_field.id}": "Without id"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert model.objects.count() == 3
+
+    response = api_client.post(
+        f"{url}?match_field=0",
+        {"items": [{f"field_{name_field.id}": "Test"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    response = api_client.post(
+        f"{url}?match_field={external_id_field.id}",
+        {
+            "items": [
+                {f"field_{external_id_field.id}": "a"},
+                {f"field_{external_id_field.id}": "a"},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_UPSERT_MATCH_VALUES_NOT_UNIQUE"
+
+    response = api_client.post(
+        url,
+        {"items": [{f"field_{name_field.id}": "Test"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
@@ -1,11 +1,15 @@
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import connection
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -16,6 +20,7 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.core.db_router import get_sticky_user_cache_key
 from baserow.test_utils.helpers import setup_interesting_test_table
 
 
@@ -2048,3 +2053,357 @@ def test_get_row_adjacent_search(api_client, data_fixture):
         HTTP_AUTHORIZATION=f"JWT {jwt_token}",
     )
     assert response.status_code == HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_CHANGE_LOG_ENABLED=True)
+def test_list_row_changes(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = RowHandler().create_row(user, table, {field.id: "a"})
+    RowHandler().update_row_by_id(user, table, row.id, {field.id: "b"})
+    url = reverse("api:database:rows:changes", kwargs={"table_id": table.id})
+
+    response = api_client.get(
+        f"{url}?limit=1", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["has_more"] is True
+    assert len(response_json["changes"]) == 1
+    assert response_json["changes"][0]["action"] == "created"
+    assert response_json["changes"][0]["row_ids"] == [row.id]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['cursor']}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["has_more"] is False
+    assert [
+        (change["action"], change["row_ids"], change["field_ids"])
+        for change in response_json["changes"]
+    ] == [("updated", [row.id], [field.id])]
+
+    response = api_client.get(
+        f"{url}?cursor=invalid", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_ROW_CHANGE_CURSOR"
+
+    other_user, other_token = data_fixture.create_user_and_token()
+    response = api_client.get(
+        url, format="json", HTTP_AUTHORIZATION=f"JWT {other_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_related_values_limit(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    related_primary = data_fixture.create_text_field(
+        name="Name", table=related_table, primary=True
+    )
+    link_field = data_fixture.create_link_row_field(
+        name="Link", table=table, link_row_table=related_table
+    )
+    select_field = data_fixture.create_multiple_select_field(name="Select", table=table)
+    options = [
+        data_fixture.create_select_option(field=select_field, value=value)
+        for value in ["A", "B", "C"]
+    ]
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(**{f"field_{related_primary.id}": name})
+        for name in ["r1", "r2", "r3"]
+    ]
+    trashed_row = related_model.objects.create(
+        **{f"field_{related_primary.id}": "trashed"}
+    )
+
+    row_handler = RowHandler()
+    row_1 = row_handler.create_row(
+        user,
+        table,
+        {
+            f"field_{link_field.id}": [row.id for row in related_rows]
+            + [trashed_row.id],
+            f"field_{select_field.id}": [option.id for option in options],
+        },
+    )
+    row_2 = row_handler.create_row(
+        user, table, {f"field_{link_field.id}": [related_rows[1].id]}
+    )
+    row_3 = row_handler.create_row(user, table, {})
+    trashed_row.trashed = True
+    trashed_row.save()
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?related_values_limit=2&user_field_names=true",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["results"][0]["Link"] == [
+        {"id": related_rows[0].id, "value": "r1"},
+        {"id": related_rows[1].id, "value": "r2"},
+    ]
+    # The select options are related in the order of the through table, which
+    # doesn't have to match the order of the option ids.
+    select_ids = [
+        option.id
+        for option in getattr(
+            table.get_model().objects.get(id=row_1.id), f"field_{select_field.id}"
+        ).all()
+    ]
+    assert [value["id"] for value in response_json["results"][0]["Select"]] == (
+        select_ids[:2]
+    )
+    assert response_json["results"][1]["Link"] == [
+        {"id": related_rows[1].id, "value": "r2"},
+    ]
+    assert response_json["results"][2]["Link"] == []
+    assert response_json["related_values_counts"] == {
+        str(row_1.id): {"Link": 3, "Select": 3},
+        str(row_2.id): {"Link": 1, "Select": 0},
+        str(row_3.id): {"Link": 0, "Select": 0},
+    }
+
+    response = api_client.get(
+        f"{url}?related_values_limit=0",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+    response = api_client.get(url, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    response_json = response.json()
+    assert len(response_json["results"][0][f"field_{link_field.id}"]) == 3
+    assert "related_values_counts" not in response_json
+
+
+@pytest.mark.django_db
+def test_list_row_related_values(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    text_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    related_primary = data_fixture.create_text_field(
+        name="Name", table=related_table, primary=True
+    )
+    link_field = data_fixture.create_link_row_field(
+        name="Link", table=table, link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(**{f"field_{related_primary.id}": f"r{i}"})
+        for i in range(5)
+    ]
+    row = RowHandler().create_row(
+        user, table, {f"field_{link_field.id}": [row.id for row in related_rows]}
+    )
+
+    def get_url(field_id, row_id=row.id):
+        return reverse(
+            "api:database:rows:related_values",
+            kwargs={"table_id": table.id, "row_id": row_id, "field_id": field_id},
+        )
+
+    response = api_client.get(
+        f"{get_url(link_field.id)}?size=2&page=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 5
+    assert response_json["results"] == [
+        {"id": related_rows[2].id, "value": "r2"},
+        {"id": related_rows[3].id, "value": "r3"},
+    ]
+
+    response = api_client.get(
+        get_url(text_field.id),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert (
+        response.json()["error"] == "ERROR_INCOMPATIBLE_FIELD_TYPE_FOR_RELATED_VALUES"
+    )
+
+    response = api_client.get(
+        get_url(related_primary.id),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    response = api_client.get(
+        get_url(link_field.id, row_id=0),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+
+@pytest.mark.django_db
+def test_list_row_related_values_of_collaborators(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    collaborators_field = data_fixture.create_multiple_collaborators_field(table=table)
+    users = [user]
+    for _ in range(4):
+        collaborator = data_fixture.create_user()
+        data_fixture.create_user_group(group=database.group, user=collaborator)
+        users.append(collaborator)
+
+    # The collaborators are added one by one in the reverse order of their ids.
+    row = RowHandler().create_row(user, table, {})
+    for index in range(len(users)):
+        RowHandler().update_row_by_id(
+            user,
+            table,
+            row.id,
+            {
+                f"field_{collaborators_field.id}": [
+                    {"id": collaborator.id} for collaborator in users[-index - 1 :]
+                ]
+            },
+        )
+    # Updating the first users moves them to the end of the table, so that they're
+    # not returned in a stable order by accident if the relations aren't ordered.
+    for collaborator in users[:3]:
+        collaborator.save()
+
+    url = reverse(
+        "api:database:rows:related_values",
+        kwargs={
+            "table_id": table.id,
+            "row_id": row.id,
+            "field_id": collaborators_field.id,
+        },
+    )
+
+    # The pages are ordered in the order in which the collaborators were added,
+    # like the cell and its related values preview, so they never overlap.
+    ids = []
+    for page in [1, 2, 3]:
+        response = api_client.get(
+            f"{url}?size=2&page={page}",
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["count"] == 5
+        ids += [collaborator["id"] for collaborator in response.json()["results"]]
+
+    assert ids == [collaborator.id for collaborator in reversed(users)]
+
+    response = api_client.get(
+        reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+        {"related_values_limit": 2},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert [
+        collaborator["id"]
+        for collaborator in response.json()["results"][0][
+            f"field_{collaborators_field.id}"
+        ]
+    ] == ids[:2]
+
+
+@pytest.mark.django_db
+def test_list_rows_conditional_get(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    RowHandler().create_row(user, table, {text_field.id: "a"})
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+    assert etag.startswith('W/"')
+    assert "no-cache" in response["Cache-Control"]
+
+    response = api_client.get(
+        url, {"search": "a"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert response.content == b""
+
+    # The not modified response doesn't query or serialize the rows.
+    with CaptureQueriesContext(connection) as captured:
+        api_client.get(
+            url,
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            HTTP_IF_NONE_MATCH=f'"other", {etag}',
+        )
+    assert not any(
+        f"database_table_{table.id}" in query["sql"]
+        for query in captured.captured_queries
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, table, {text_field.id: "b"})
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 2
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "default-copy"])
+@override_settings(BASEROW_READ_REPLICA_DATABASES=["default-copy"])
+def test_list_rows_read_from_a_replica_has_no_etag(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    RowHandler().create_row(user, table, {})
+    cache.delete(get_sticky_user_cache_key(user.id))
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    # The replica can lag behind the data version, so the response must not get the
+    # etag of the latest data.
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    assert "ETag" not in response
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH="*"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert "ETag" not in response
+
+    # Once the user sticks to the default database, the etag is served again.
+    cache.set(get_sticky_user_cache_key(user.id), True)
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"].startswith('W/"')
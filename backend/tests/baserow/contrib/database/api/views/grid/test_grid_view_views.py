@@ -2,7 +2,9 @@ from decimal import Decimal
 from typing import Any, Dict, List
 
 from django.core.cache import cache
+from django.db import connections
 from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from rest_framework import serializers
@@ -700,14 +702,12 @@ def test_view_aggregations(api_client, data_fixture):
         "value": None,
         "version": 1,
     }
-    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
+    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 1
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
     }
-    assert (
-        cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
-    )
+    assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 1
 
     # Test normal response that use cache
     cache.set(
@@ -733,11 +733,11 @@ def test_view_aggregations(api_client, data_fixture):
 
     cache.set(
         f"aggregation_value__{grid.id}_{number_field.db_column}",
-        {"value": "sentinel", "version": 1},
+        {"value": 100, "version": 1},
     )
     cache.set(
         f"aggregation_value__{grid.id}_{boolean_field.db_column}",
-        {"value": "sentinel", "version": 3},
+        {"value": 100, "version": 3},
     )
     cache.set(
         f"aggregation_version__{grid.id}_{boolean_field.db_column}",
@@ -757,12 +757,12 @@ def test_view_aggregations(api_client, data_fixture):
     )
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": "sentinel",
+        "value": 100,
         "version": 1,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 2
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
-        "value": "sentinel",
+        "value": 100,
         "version": 3,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 4
@@ -2462,3 +2462,63 @@ def test_user_with_wrong_password_cant_get_info_about_a_public_password_protecte
         format="json",
     )
     assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_list_rows_public_is_cached_until_the_table_data_changes(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    grid_view = data_fixture.create_grid_view(table=table, user=user, public=True)
+    data_fixture.create_grid_view_field_option(grid_view, text_field, hidden=False)
+    RowHandler().create_row(user, table, values={text_field.id: "a"})
+    url = reverse(
+        "api:database:views:grid:public_rows", kwargs={"slug": grid_view.slug}
+    )
+
+    response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 1
+    assert api_client.get(url, {"count": ""}).json() == {"count": 1}
+
+    # A row created without the row handler doesn't change the data version, so the
+    # cached responses are still returned.
+    table.get_model().objects.create()
+    assert api_client.get(url).json()["count"] == 1
+    assert api_client.get(url, {"count": ""}).json() == {"count": 1}
+    assert api_client.get(url, {"search": ""}).json()["count"] == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, table, values={text_field.id: "b"})
+
+    assert api_client.get(url).json()["count"] == 3
+    assert api_client.get(url, {"count": ""}).json() == {"count": 3}
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "default-copy"])
+@override_settings(BASEROW_READ_REPLICA_DATABASES=["default-copy"])
+def test_list_rows_public_cached_response_is_not_read_from_a_replica(
+    api_client, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    grid_view = data_fixture.create_grid_view(table=table, user=user, public=True)
+    data_fixture.create_grid_view_field_option(grid_view, text_field, hidden=False)
+    RowHandler().create_row(user, table, values={text_field.id: "a"})
+    url = reverse(
+        "api:database:views:grid:public_rows", kwargs={"slug": grid_view.slug}
+    )
+    cache.clear()
+
+    # A lagging replica could otherwise return rows that are older than the data
+    # version under which they are cached.
+    with CaptureQueriesContext(connections["default-copy"]) as replica_queries:
+        response = api_client.get(url)
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 1
+    assert not any(
+        table.get_database_table_name() in query["sql"] for query in replica_queries
+    )
@@ -9,12 +9,14 @@ import pytest
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_204_NO_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
 )
 
 from baserow.contrib.database.api.constants import PUBLIC_PLACEHOLDER_ENTITY_ID
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView, View
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.contrib.database.views.view_types import GridViewType
@@ -963,3 +965,40 @@ def test_view_cant_update_show_logo(data_fixture, api_client):
 
     response_data = response.json()
     assert response_data["show_logo"] is True
+
+
+@pytest.mark.django_db
+def test_list_views_conditional_get(
+    api_client, data_fixture, django_capture_on_commit_callbacks
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    url = reverse("api:database:views:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(
+        url, {"include": "filters"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    response = api_client.get(
+        url,
+        {"include": "filters"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().create_filter(user, grid_view, field, "equal", "a")
+
+    response = api_client.get(
+        url,
+        {"include": "filters"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()[0]["filters"]) == 1
@@ -0,0 +1,168 @@
+from django.core.cache import cache
+
+import pytest
+
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db
+def test_table_data_version_is_bumped_on_commit(django_capture_on_commit_callbacks):
+    cache.clear()
+    version = TableDataVersionHandler.get_version(1)
+    assert version == TableDataVersionHandler.get_version(1)
+    assert version != TableDataVersionHandler.get_version(2)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        TableDataVersionHandler.bump_versions_on_commit([1])
+        assert TableDataVersionHandler.get_version(1) == version
+
+    for callback in callbacks:
+        callback()
+    assert TableDataVersionHandler.get_version(1) != version
+
+
+@pytest.mark.django_db
+def test_table_data_version_is_bumped_when_data_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    other_table = data_fixture.create_database_table(database=table.database)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    def get_versions():
+        return [
+            TableDataVersionHandler.get_version(t.id)
+            for t in [table, related_table, other_table]
+        ]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().create_field(
+            user, table, "link_row", name="Link", link_row_table=related_table
+        )
+
+    versions = get_versions()
+    with django_capture_on_commit_callbacks(execute=True):
+        row = RowHandler().create_row(user, table, {field.id: "a"})
+    new_versions = get_versions()
+    assert new_versions[0] != versions[0]
+    assert new_versions[1] != versions[1]
+    assert new_versions[2] == versions[2]
+
+    versions = new_versions
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().delete_row_by_id(user, table, row.id)
+    new_versions = get_versions()
+    assert new_versions[0] != versions[0]
+    assert new_versions[2] == versions[2]
+
+    versions = new_versions
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().create_filter(user, grid_view, field, "equal", "a")
+    new_versions = get_versions()
+    assert new_versions[0] != versions[0]
+    assert new_versions[1] == versions[1]
+    assert new_versions[2] == versions[2]
+
+    versions = new_versions
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, field, name="Renamed")
+    new_versions = get_versions()
+    assert new_versions[0] != versions[0]
+    assert new_versions[2] == versions[2]
+
+
+@pytest.mark.django_db
+def test_table_data_version_is_bumped_for_one_way_link(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    linking_table = data_fixture.create_database_table(database=table.database)
+    other_table = data_fixture.create_database_table(database=table.database)
+    primary_field = data_fixture.create_text_field(table=table, primary=True)
+    FieldHandler().create_field(
+        user,
+        linking_table,
+        "link_row",
+        name="Link",
+        link_row_table=table,
+        has_related_field=False,
+    )
+
+    # The linking table shows the primary values of the table, even though the
+    # table has no field related to it.
+    linking_version = TableDataVersionHandler.get_version(linking_table.id)
+    other_version = TableDataVersionHandler.get_version(other_table.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        row = RowHandler().create_row(user, table, {primary_field.id: "a"})
+    assert TableDataVersionHandler.get_version(linking_table.id) != linking_version
+    assert TableDataVersionHandler.get_version(other_table.id) == other_version
+
+    linking_version = TableDataVersionHandler.get_version(linking_table.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(user, table, row.id, {primary_field.id: "b"})
+    assert TableDataVersionHandler.get_version(linking_table.id) != linking_version
+
+    linking_version = TableDataVersionHandler.get_version(linking_table.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, primary_field, new_type_name="number")
+    assert TableDataVersionHandler.get_version(linking_table.id) != linking_version
+
+
+@pytest.mark.django_db
+def test_table_data_version_is_bumped_for_lookup_two_hops_away(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table_a = data_fixture.create_database_table(user=user)
+    table_b = data_fixture.create_database_table(database=table_a.database)
+    table_c = data_fixture.create_database_table(database=table_a.database)
+    data_fixture.create_text_field(table=table_a, primary=True)
+    value_field = data_fixture.create_text_field(table=table_a, name="Value")
+    data_fixture.create_text_field(table=table_b, primary=True)
+    data_fixture.create_text_field(table=table_c, primary=True)
+
+    field_handler = FieldHandler()
+    link_b_a = field_handler.create_field(
+        user, table_b, "link_row", name="A", link_row_table=table_a
+    )
+    lookup_b = field_handler.create_field(
+        user,
+        table_b,
+        "lookup",
+        name="A value",
+        through_field_id=link_b_a.id,
+        target_field_id=value_field.id,
+    )
+    link_c_b = field_handler.create_field(
+        user,
+        table_c,
+        "link_row",
+        name="B",
+        link_row_table=table_b,
+        has_related_field=False,
+    )
+    field_handler.create_field(
+        user,
+        table_c,
+        "lookup",
+        name="B value",
+        through_field_id=link_c_b.id,
+        target_field_id=lookup_b.id,
+    )
+
+    row_a = RowHandler().create_row(user, table_a, {value_field.id: "a"})
+    row_b = RowHandler().create_row(user, table_b, {link_b_a.id: [row_a.id]})
+    RowHandler().create_row(user, table_c, {link_c_b.id: [row_b.id]})
+
+    # The lookup in table C changes although table C doesn't link to table A.
+    version = TableDataVersionHandler.get_version(table_c.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(user, table_a, row_a.id, {value_field.id: "b"})
+    assert TableDataVersionHandler.get_version(table_c.id) != version
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.db import transaction
 
 import pytest
 from pytest_unordered import unordered
@@ -331,3 +332,58 @@ def test_get_dependant_fields_with_type(data_fixture):
     assert results == unordered(
         expected_text_field_1_dependants + expected_text_field_2_dependants
     )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_dependant_fields_with_type_uses_cached_graph(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    other_field = data_fixture.create_text_field(table=table, name="other")
+    formula_field = data_fixture.create_formula_field(
+        table=table, name="formula", formula="field('text')", formula_type="text"
+    )
+
+    field_cache = FieldCache()
+    results = FieldDependencyHandler.get_dependant_fields_with_type(
+        table.id, [text_field.id], False, field_cache
+    )
+    assert [field.id for field, _, _ in results] == [formula_field.id]
+
+    # Nothing depends on the other field, so the cached graph tells us that without
+    # executing any query.
+    with django_assert_num_queries(0):
+        results = FieldDependencyHandler.get_dependant_fields_with_type(
+            table.id, [other_field.id], True, field_cache
+        )
+    assert results == []
+
+    second_formula = data_fixture.create_formula_field(
+        table=table, name="formula 2", formula="field('other')", formula_type="text"
+    )
+    results = FieldDependencyHandler.get_dependant_fields_with_type(
+        table.id, [other_field.id], True, field_cache
+    )
+    assert [field.id for field, _, _ in results] == [second_formula.id]
+
+    # Within a transaction that changes the dependencies the graph isn't used
+    # because it doesn't contain the uncommitted changes yet.
+    with transaction.atomic():
+        FieldHandler().update_field(
+            user,
+            second_formula,
+            formula="field('text')",
+        )
+        results = FieldDependencyHandler.get_dependant_fields_with_type(
+            table.id, [text_field.id], True, field_cache
+        )
+        assert sorted(field.id for field, _, _ in results) == sorted(
+            [formula_field.id, second_formula.id]
+        )
+
+    results = FieldDependencyHandler.get_dependant_fields_with_type(
+        table.id, [other_field.id], True, field_cache
+    )
+    assert results == []
@@ -0,0 +1,285 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import override_settings
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+
+from baserow.contrib.database.fields.exceptions import (
+    FailedToLockFieldDueToConflict,
+    FieldCannotBeConvertedOnline,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import BooleanField, NumberField
+from baserow.contrib.database.fields.online_conversion_handler import (
+    OnlineFieldConversionHandler,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.jobs.constants import JOB_FAILED, JOB_FINISHED, JOB_STARTED
+from baserow.core.jobs.handler import JobHandler
+from baserow.core.jobs.registries import job_type_registry
+from baserow.core.jobs.tasks import run_async_job
+from baserow.core.utils import Progress
+
+
+def get_column_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+            [table.get_database_table_name()],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE=2)
+def test_convert_field_job_type(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, name="Value")
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": value})
+        for value in ["1", "abc", "3.45", None, "-2"]
+    ]
+
+    job = JobHandler().create_and_start_job(
+        user,
+        "convert_field",
+        field_id=field.id,
+        new_type="number",
+        field_values={"number_decimal_places": 1, "number_negative": True},
+        sync=True,
+    )
+
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert job.checkpoint["max_id"] == rows[-1].id
+
+    field = NumberField.objects.get(id=field.id)
+    assert field.number_decimal_places == 1
+    assert f"field_{field.id}_conversion" not in get_column_names(table)
+
+    model = table.get_model()
+    assert list(model.objects.values_list(f"field_{field.id}", flat=True)) == [
+        Decimal("1.0"),
+        None,
+        Decimal("3.5"),
+        None,
+        Decimal("-2.0"),
+    ]
+
+    # The trigger must have been removed together with the shadow column.
+    row = RowHandler().create_row(user, table, {f"field_{field.id}": "2.5"})
+    assert getattr(row, f"field_{field.id}") == Decimal("2.5")
+
+
+@pytest.mark.django_db
+def test_convert_field_job_type_converts_concurrent_writes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "yes"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "no"})
+
+    job_type = job_type_registry.get("convert_field")
+    job = job_type.model_class.objects.create(
+        user=user, field=field, new_type="boolean"
+    )
+    progress = Progress(100)
+
+    checkpoint = job_type.run_chunk(job, progress, {"last_id": None})
+    assert checkpoint["max_id"] == row_2.id
+    shadow_column = f"field_{field.id}_conversion"
+    assert shadow_column in get_column_names(table)
+
+    # Rows that are written while the existing rows are converted are converted by
+    # the trigger.
+    RowHandler().update_row_by_id(user, table, row_2.id, {f"field_{field.id}": "1"})
+    row_3 = RowHandler().create_row(user, table, {f"field_{field.id}": "true"})
+    row_4 = RowHandler().create_row(user, table, {})
+
+    checkpoint = job_type.run_chunk(job, progress, checkpoint)
+    assert checkpoint["last_id"] == row_2.id
+    assert progress.progress == 99
+    assert job_type.run_chunk(job, progress, checkpoint) is None
+    assert progress.progress == 100
+
+    assert BooleanField.objects.filter(id=field.id).exists()
+    model = table.get_model()
+    assert {
+        row.id: getattr(row, f"field_{field.id}") for row in model.objects.all()
+    } == {row_1.id: True, row_2.id: True, row_3.id: True, row_4.id: False}
+
+
+@pytest.mark.django_db
+def test_convert_field_job_type_cleanup(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    data_fixture.create_text_field(table=table)
+
+    job_type = job_type_registry.get("convert_field")
+    job = job_type.model_class.objects.create(user=user, field=field, new_type="number")
+    checkpoint = job_type.run_chunk(job, Progress(100), {"last_id": None})
+    assert f"field_{field.id}_conversion" in get_column_names(table)
+
+    job_type.cleanup(job, checkpoint)
+
+    assert f"field_{field.id}_conversion" not in get_column_names(table)
+    row = RowHandler().create_row(user, table, {f"field_{field.id}": "1"})
+    assert getattr(row, f"field_{field.id}") == "1"
+
+    # Nothing happens if the conversion has already been cleaned up.
+    OnlineFieldConversionHandler.clean_up(table.id, field.id)
+
+
+@pytest.mark.django_db
+def test_convert_field_job_type_without_data_conversion(data_fixture):
+    user = data_fixture.create_user()
+    field = data_fixture.create_text_field(user=user, name="Old")
+
+    job = JobHandler().create_and_start_job(
+        user,
+        "convert_field",
+        field_id=field.id,
+        new_type="text",
+        field_values={"name": "New"},
+        sync=True,
+    )
+
+    assert job.state == JOB_FINISHED
+    assert job.checkpoint is None
+    field.refresh_from_db()
+    assert field.name == "New"
+
+
+@pytest.mark.django_db
+def test_convert_field_job_type_not_possible_online(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+
+    with pytest.raises(FieldCannotBeConvertedOnline):
+        JobHandler().create_and_start_job(
+            user,
+            "convert_field",
+            field_id=field.id,
+            new_type="single_select",
+        )
+
+    with pytest.raises(FieldCannotBeConvertedOnline):
+        JobHandler().create_and_start_job(
+            user,
+            "convert_field",
+            field_id=field.id,
+            new_type="formula",
+            field_values={"formula": "'a'"},
+        )
+
+
+def get_trigger_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tgname FROM pg_trigger WHERE tgrelid = %s::regclass",
+            [table.get_database_table_name()],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_convert_field_job_type_cancelled_before_pickup(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{f"field_{field.id}": "1"})
+
+    job_type = job_type_registry.get("convert_field")
+    job = job_type.model_class.objects.create(user=user, field=field, new_type="number")
+
+    JobHandler().cancel_job(job)
+    run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert f"field_{field.id}_conversion" not in get_column_names(table)
+    assert OnlineFieldConversionHandler.get_trigger_name(
+        field.id
+    ) not in get_trigger_names(table)
+    assert not NumberField.objects.filter(id=field.id).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.handler.JobHandler.resume_job")
+@patch(
+    "baserow.contrib.database.fields.online_conversion_handler."
+    "OnlineFieldConversionHandler.convert_rows",
+    side_effect=SoftTimeLimitExceeded("test"),
+)
+def test_convert_field_job_type_cancelled_after_checkpoint(
+    mock_convert_rows, mock_resume_job, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{f"field_{field.id}": "1"})
+
+    job_type = job_type_registry.get("convert_field")
+    job = job_type.model_class.objects.create(user=user, field=field, new_type="number")
+
+    # The first chunk creates the shadow column and trigger, after which the job
+    # times out and waits to be resumed.
+    run_async_job(job.id)
+    mock_resume_job.assert_called_once()
+    job.refresh_from_db()
+    assert job.state == JOB_STARTED
+    assert job.checkpoint["table_id"] == table.id
+    trigger_name = OnlineFieldConversionHandler.get_trigger_name(field.id)
+    assert trigger_name in get_trigger_names(table)
+
+    JobHandler().cancel_job(job)
+
+    assert f"field_{field.id}_conversion" not in get_column_names(table)
+    assert trigger_name not in get_trigger_names(table)
+    row = RowHandler().create_row(user, table, {f"field_{field.id}": "2"})
+    assert getattr(row, f"field_{field.id}") == "2"
+
+    # The queued resume task doesn't continue the conversion.
+    run_async_job(job.id)
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert not NumberField.objects.filter(id=field.id).exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_field_cannot_be_updated_while_converted_online(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{f"field_{field.id}": "1"})
+
+    job_type = job_type_registry.get("convert_field")
+    job = job_type.model_class.objects.create(
+        user=user,
+        field=field,
+        new_type="number",
+        field_values={"number_decimal_places": 1},
+    )
+
+    # The job would overwrite the changes when it swaps the columns.
+    with pytest.raises(FailedToLockFieldDueToConflict):
+        FieldHandler().update_field(user, field, name="Changed")
+    with pytest.raises(FailedToLockFieldDueToConflict):
+        FieldHandler().update_field(user, field, "boolean")
+
+    run_async_job(job.id)
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+
+    field = FieldHandler().update_field(
+        user, NumberField.objects.get(id=field.id), number_decimal_places=2
+    )
+    assert field.number_decimal_places == 2
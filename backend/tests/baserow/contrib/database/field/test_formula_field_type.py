@@ -1,5 +1,6 @@
 import inspect
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.db import transaction
 from django.db.models import TextField
@@ -23,6 +24,9 @@ from baserow.contrib.database.formula import (
     BaserowFormulaTextType,
 )
 from baserow.contrib.database.formula.ast.tree import BaserowFunctionDefinition
+from baserow.contrib.database.formula.parser.ast_mapper import (
+    raw_formula_to_untyped_expression,
+)
 from baserow.contrib.database.formula.registries import formula_function_registry
 from baserow.contrib.database.formula.types.exceptions import InvalidFormulaType
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
@@ -1415,3 +1419,37 @@ def test_formula_field_adjacent_row(data_fixture):
 
     assert previous_row.id == row_c.id
     assert next_row.id == row_a.id
+
+
+@pytest.mark.django_db
+def test_parsed_formulas_are_cached_and_copied(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    formula = "concat('cached ', 'formula')"
+
+    with patch(
+        "baserow.contrib.database.formula.handler.raw_formula_to_untyped_expression",
+        wraps=raw_formula_to_untyped_expression,
+    ) as mock_parse:
+        first_formula_field = data_fixture.create_formula_field(
+            table=table, formula=formula, formula_type="text"
+        )
+        second_formula_field = data_fixture.create_formula_field(
+            table=table, formula=formula, formula_type="text"
+        )
+        first_expression = first_formula_field.cached_typed_internal_expression
+        second_expression = second_formula_field.cached_typed_internal_expression
+        parsed_formulas = [c.args[0] for c in mock_parse.call_args_list]
+
+    # Both the formula and its internal formula are only parsed once.
+    assert formula in parsed_formulas
+    assert len(parsed_formulas) == len(set(parsed_formulas))
+    assert str(first_expression) == str(second_expression)
+    # Typing modifies the expressions so they must never be shared.
+    assert first_expression is not second_expression
+    assert first_expression.args[0] is not second_expression.args[0]
+
+    model = table.get_model()
+    row = model.objects.create()
+    assert getattr(row, f"field_{first_formula_field.id}") == "cached formula"
+    assert getattr(row, f"field_{second_formula_field.id}") == "cached formula"
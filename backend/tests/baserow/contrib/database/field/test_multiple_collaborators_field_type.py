@@ -390,6 +390,54 @@ def test_multiple_collaborators_model_enhanced_field(
         assert row_3_relation_ids == [user_2.id, user.id]
 
 
+@pytest.mark.django_db
+def test_multiple_collaborators_model_related_values_preview(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user(email="user1@baserow.io", first_name="User 1")
+    user_2 = data_fixture.create_user(email="user2@baserow.io", first_name="User 2")
+    user_3 = data_fixture.create_user(email="user3@baserow.io", first_name="User 3")
+    database = data_fixture.create_database_application(user=user, name="Placeholder")
+    data_fixture.create_user_group(group=database.group, user=user_2)
+    group_user_3 = data_fixture.create_user_group(group=database.group, user=user_3)
+    table = data_fixture.create_database_table(name="Example", database=database)
+
+    field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="Multiple Collaborators",
+        type_name="multiple_collaborators",
+    )
+
+    data_fixture.create_row_for_many_to_many_field(
+        table=table,
+        field=field,
+        values=[{"id": user_3.id}, {"id": user_2.id}, {"id": user.id}],
+        user=user,
+    )
+    data_fixture.create_row_for_many_to_many_field(
+        table=table, field=field, values=[{"id": user.id}], user=user
+    )
+    group_user_3.delete()
+
+    model = table.get_model()
+
+    # The rows, the ids of the first related values and the related values
+    # themselves.
+    with django_assert_num_queries(3):
+        rows = list(
+            model.objects.all().order_by("id").enhance_by_fields(related_values_limit=1)
+        )
+
+        row_1_relations = getattr(rows[0], f"field_{field.id}").all()
+        assert [u.id for u in row_1_relations] == [user_2.id]
+        assert rows[0]._related_values_counts == {field.id: 2}
+
+        row_2_relations = getattr(rows[1], f"field_{field.id}").all()
+        assert [u.id for u in row_2_relations] == [user.id]
+        assert rows[1]._related_values_counts == {field.id: 1}
+
+
 @pytest.mark.django_db
 def test_multiple_collaborators_field_type_random_value(data_fixture):
     group = data_fixture.create_group()
@@ -0,0 +1,197 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.field_indexes.handler import FieldIndexHandler
+from baserow.contrib.database.field_indexes.models import FieldIndex
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS=0)
+def test_sync_table_indexes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    date_field = data_fixture.create_date_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    unused_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    date_sort = data_fixture.create_view_sort(
+        view=grid_view, field=date_field, order="DESC"
+    )
+    data_fixture.create_view_sort(view=grid_view, field=single_select_field)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="equal", value="1"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=unused_field, type="contains", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=unused_field, type="not_equal", value="a"
+    )
+
+    created, dropped = FieldIndexHandler.sync_table_indexes(table)
+    assert dropped == []
+    assert {
+        (field_index.field_id, field_index.sort_count, field_index.filter_count)
+        for field_index in created
+    } == {(date_field.id, 1, 0), (number_field.id, 0, 2)}
+    date_index_name = FieldIndexHandler.get_index_name(date_field, descending=True)
+    existing_indexes = FieldIndexHandler.get_existing_indexes(table)
+    assert existing_indexes[date_index_name] is True
+    assert existing_indexes[FieldIndexHandler.get_index_name(number_field)] is True
+
+    # Nothing changes if the sync runs again.
+    assert FieldIndexHandler.sync_table_indexes(table) == ([], [])
+
+    # The index is created again if it disappeared because the column was
+    # recreated.
+    FieldIndexHandler.drop_index(FieldIndexHandler.get_index_name(number_field))
+    assert FieldIndexHandler.sync_table_indexes(table) == ([], [])
+    assert FieldIndexHandler.get_index_name(
+        number_field
+    ) in FieldIndexHandler.get_existing_indexes(table)
+
+    # The index is dropped when the field can't be indexed anymore.
+    FieldHandler().update_field(user, number_field, "boolean")
+    created, dropped = FieldIndexHandler.sync_table_indexes(table)
+    assert dropped == [FieldIndexHandler.get_index_name(number_field)]
+    assert FieldIndexHandler.get_index_name(
+        number_field
+    ) not in FieldIndexHandler.get_existing_indexes(table)
+
+    # And when it isn't used anymore.
+    ViewHandler().delete_sort(user, date_sort)
+    created, dropped = FieldIndexHandler.sync_table_indexes(table)
+    assert dropped == [date_index_name]
+    assert FieldIndex.objects.count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS=0)
+def test_sync_table_indexes_follows_sort_direction(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    view_sort = data_fixture.create_view_sort(
+        view=grid_view, field=number_field, order="DESC"
+    )
+    descending_name = FieldIndexHandler.get_index_name(number_field, descending=True)
+    ascending_name = FieldIndexHandler.get_index_name(number_field)
+
+    FieldIndexHandler.sync_table_indexes(table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = %s", [descending_name]
+        )
+        assert 'DESC NULLS LAST, "order", id)' in cursor.fetchone()[0]
+
+    # The rows of the descending sort are still tie-broken by the ascending order
+    # and id, so the index is replaced when the direction changes.
+    ViewHandler().update_sort(user, view_sort, order="ASC")
+    created, dropped = FieldIndexHandler.sync_table_indexes(table)
+    assert created == []
+    assert dropped == [descending_name]
+    existing_indexes = FieldIndexHandler.get_existing_indexes(table)
+    assert descending_name not in existing_indexes
+    assert existing_indexes[ascending_name] is True
+    assert FieldIndex.objects.get().name == ascending_name
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS=0)
+def test_sync_table_indexes_skips_unbounded_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    grid_view = data_fixture.create_grid_view(table=table)
+    for field in [
+        data_fixture.create_text_field(table=table),
+        data_fixture.create_long_text_field(table=table),
+        data_fixture.create_url_field(table=table),
+    ]:
+        data_fixture.create_view_sort(view=grid_view, field=field)
+        data_fixture.create_view_filter(
+            view=grid_view, field=field, type="equal", value="a"
+        )
+
+    # Writing a value larger than an index entry would fail if they were indexed.
+    assert FieldIndexHandler.get_field_usages(table) == {}
+    assert FieldIndexHandler.sync_table_indexes(table) == ([], [])
+
+
+@pytest.mark.django_db
+def test_sync_table_indexes_of_small_table(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    data_fixture.create_view_sort(
+        view=data_fixture.create_grid_view(table=table), field=number_field
+    )
+
+    assert FieldIndexHandler.sync_table_indexes(table) == ([], [])
+    assert FieldIndex.objects.count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_ENABLED=True)
+@patch("baserow.contrib.database.field_indexes.signals.sync_field_indexes")
+def test_view_sort_schedules_field_index_sync(
+    mock_sync_field_indexes, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().create_sort(user, grid_view, text_field, "ASC")
+
+    mock_sync_field_indexes.delay.assert_called_once_with(table.id)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS=0)
+def test_field_indexes_command(data_fixture):
+    table = data_fixture.create_database_table(name="Projects")
+    number_field = data_fixture.create_number_field(table=table, name="Budget")
+    data_fixture.create_view_sort(
+        view=data_fixture.create_grid_view(table=table), field=number_field
+    )
+
+    out = StringIO()
+    call_command("field_indexes", "--sync", stdout=out)
+    output = out.getvalue()
+    assert f"Table Projects({table.id}): created 1 and dropped 0 index(es)." in output
+    assert (
+        f"field Budget({number_field.id}): "
+        f"{FieldIndexHandler.get_index_name(number_field)} used by 1 sort(s) and 0 "
+        f"filter(s)"
+    ) in output
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_FIELD_INDEX_ADVISOR_MIN_ROWS=0)
+def test_sync_table_indexes_concurrently(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    view_sort = data_fixture.create_view_sort(
+        view=data_fixture.create_grid_view(table=table), field=number_field
+    )
+    index_name = FieldIndexHandler.get_index_name(number_field)
+
+    created, _ = FieldIndexHandler.sync_table_indexes(table)
+    assert [field_index.name for field_index in created] == [index_name]
+    assert FieldIndexHandler.get_existing_indexes(table)[index_name] is True
+
+    view_sort.delete()
+    assert FieldIndexHandler.sync_table_indexes(table) == ([], [index_name])
+    assert index_name not in FieldIndexHandler.get_existing_indexes(table)
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+from django.test.utils import override_settings
+
+import pytest
+from freezegun import freeze_time
+from pytz import UTC
+
+from baserow.contrib.database.row_changes.exceptions import (
+    InvalidRowChangeCursor,
+    RowChangeCursorExpired,
+    RowChangeLogDisabled,
+)
+from baserow.contrib.database.row_changes.handler import RowChangeHandler
+from baserow.contrib.database.row_changes.models import RowChange
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+def test_row_changes_are_not_recorded_when_disabled(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    RowHandler().create_rows(user, table, [{}])
+
+    assert RowChange.objects.count() == 0
+    with pytest.raises(RowChangeLogDisabled):
+        RowChangeHandler.get_changes(table)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_CHANGE_LOG_ENABLED=True)
+def test_row_changes_are_recorded(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    handler = RowHandler()
+
+    rows = handler.create_rows(user, table, [{}, {}])
+    handler.update_rows(user, table, [{"id": rows[0].id, f"field_{field.id}": "a"}])
+    handler.delete_rows(user, table, [rows[1].id])
+    handler.create_rows(user, other_table, [{}])
+
+    changes, cursor, has_more = RowChangeHandler.get_changes(table)
+    assert [
+        (change.get_action_display(), change.row_ids, change.field_ids)
+        for change in changes
+    ] == [
+        ("created", [rows[0].id, rows[1].id], None),
+        ("updated", [rows[0].id], [field.id]),
+        ("deleted", [rows[1].id], None),
+    ]
+    assert cursor == RowChangeHandler.encode_cursor(changes[-1])
+    assert has_more is False
+
+    changes, next_cursor, has_more = RowChangeHandler.get_changes(table, limit=2)
+    assert len(changes) == 2
+    assert has_more is True
+
+    changes, last_cursor, has_more = RowChangeHandler.get_changes(
+        table, next_cursor, limit=2
+    )
+    assert [change.get_action_display() for change in changes] == ["deleted"]
+    assert last_cursor == cursor
+    assert has_more is False
+
+    assert RowChangeHandler.get_changes(table, cursor) == ([], cursor, False)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_CHANGE_LOG_ENABLED=True)
+def test_get_row_changes_with_invalid_or_expired_cursor(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    with pytest.raises(InvalidRowChangeCursor):
+        RowChangeHandler.get_changes(table, "invalid")
+
+    with freeze_time("2020-01-01 12:00"):
+        RowHandler().create_rows(user, table, [{}])
+    changes, cursor, _ = RowChangeHandler.get_changes(table)
+    assert changes[0].created_on == datetime(2020, 1, 1, 12, 0, tzinfo=UTC)
+
+    with freeze_time("2020-01-08 11:00"):
+        assert RowChangeHandler.delete_expired_changes() == 0
+    with freeze_time("2020-01-08 13:00"):
+        assert RowChangeHandler.delete_expired_changes() == 1
+
+    with pytest.raises(RowChangeCursorExpired):
+        RowChangeHandler.get_changes(table, cursor)
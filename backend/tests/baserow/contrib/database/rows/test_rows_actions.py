@@ -16,6 +16,7 @@ from baserow.contrib.database.rows.actions import (
     MoveRowActionType,
     UpdateRowActionType,
     UpdateRowsActionType,
+    UpsertRowsActionType,
 )
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.action.handler import ActionHandler
@@ -1294,3 +1295,45 @@ def test_can_undo_redo_update_rows_interesting_field_types(data_fixture):
         )
     ) == [multi_select_option_2.id]
     assert getattr(row_table_1, f"field_{formula_field.id}") == "New value"
+
+
+@pytest.mark.django_db
+@pytest.mark.undo_redo
+def test_can_undo_redo_upsert_rows(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(user=user)
+    external_id_field = data_fixture.create_text_field(table=table, name="Id")
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    existing_row = model.objects.create(
+        **{f"field_{external_id_field.id}": "a", f"field_{name_field.id}": "Old"}
+    )
+
+    rows = action_type_registry.get_by_type(UpsertRowsActionType).do(
+        user,
+        table,
+        [
+            {f"field_{external_id_field.id}": "a", f"field_{name_field.id}": "New"},
+            {f"field_{external_id_field.id}": "b", f"field_{name_field.id}": "New"},
+        ],
+        external_id_field,
+    )
+    assert rows[0].id == existing_row.id
+    created_row_id = rows[1].id
+
+    action_undone = ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(action_undone, [UpsertRowsActionType])
+    assert list(model.objects.values_list("id", f"field_{name_field.id}")) == [
+        (existing_row.id, "Old")
+    ]
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+    assert_undo_redo_actions_are_valid(action_redone, [UpsertRowsActionType])
+    assert list(
+        model.objects.order_by("id").values_list("id", f"field_{name_field.id}")
+    ) == [(existing_row.id, "New"), (created_row_id, "New")]
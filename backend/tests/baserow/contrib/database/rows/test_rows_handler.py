@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from freezegun import freeze_time
@@ -14,7 +15,11 @@ from baserow.contrib.database.api.utils import (
     extract_field_ids_from_string,
     get_include_exclude_fields,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.rows.exceptions import (
+    InvalidUpsertMatchField,
+    RowDoesNotExist,
+    UpsertMatchValuesNotUnique,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInGroup
 from baserow.core.trash.handler import TrashHandler
@@ -560,6 +565,175 @@ def test_update_rows_created_on_and_last_modified(data_fixture):
         assert row.updated_on == datetime(2020, 1, 2, 12, 0, tzinfo=UTC)
 
 
+@pytest.mark.django_db
+def test_update_rows_only_updates_provided_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    date_field = data_fixture.create_date_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{
+            f"field_{text_field.id}": "a",
+            f"field_{number_field.id}": Decimal("1.50"),
+            f"field_{boolean_field.id}": True,
+        }
+    )
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "b"})
+
+    with CaptureQueriesContext(connection) as captured:
+        RowHandler().update_rows(
+            user,
+            table,
+            [
+                {"id": row_1.id, f"field_{text_field.id}": "c"},
+                {
+                    "id": row_2.id,
+                    f"field_{date_field.id}": "2020-01-02",
+                    f"field_{number_field.id}": "2.25",
+                },
+            ],
+            model=model,
+        )
+
+    update_queries = [
+        query["sql"] for query in captured if query["sql"].startswith("UPDATE")
+    ]
+    assert len(update_queries) == 1
+    assert "VALUES" in update_queries[0]
+    assert "CASE" not in update_queries[0]
+    assert f'"field_{boolean_field.id}"' not in update_queries[0]
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "c"
+    assert getattr(row_1, f"field_{number_field.id}") == Decimal("1.50")
+    assert getattr(row_1, f"field_{date_field.id}") is None
+    assert getattr(row_1, f"field_{boolean_field.id}") is True
+    assert getattr(row_2, f"field_{text_field.id}") == "b"
+    assert getattr(row_2, f"field_{number_field.id}") == Decimal("2.25")
+    assert getattr(row_2, f"field_{date_field.id}") == date(2020, 1, 2)
+
+
+@pytest.mark.django_db
+def test_update_rows_only_changes_changed_relations(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=related_table
+    )
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field)
+    option_b = data_fixture.create_select_option(field=multiple_select_field)
+    related_model = related_table.get_model()
+    related_1, related_2, related_3 = [related_model.objects.create() for _ in range(3)]
+    model = table.get_model()
+    row = model.objects.create()
+    getattr(row, f"field_{link_field.id}").set([related_1.id, related_2.id])
+    getattr(row, f"field_{multiple_select_field.id}").set([option_a.id, option_b.id])
+
+    link_through = getattr(model, f"field_{link_field.id}").through
+    kept_relation_id = link_through.objects.get(
+        **{f"{related_model._meta.model_name}_id": related_2.id}
+    ).id
+
+    (row,) = RowHandler().update_rows(
+        user,
+        table,
+        [
+            {
+                "id": row.id,
+                f"field_{link_field.id}": [related_2.id, related_3.id],
+                f"field_{multiple_select_field.id}": [option_b.id, option_a.id],
+            }
+        ],
+        model=model,
+    )
+
+    assert [r.id for r in getattr(row, f"field_{link_field.id}").all()] == [
+        related_2.id,
+        related_3.id,
+    ]
+    assert link_through.objects.filter(id=kept_relation_id).exists()
+    # The order of the select options is the order in which they have been added,
+    # so the reordered options must have been recreated.
+    assert [o.id for o in getattr(row, f"field_{multiple_select_field.id}").all()] == [
+        option_b.id,
+        option_a.id,
+    ]
+
+
+@pytest.mark.django_db
+def test_upsert_rows(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    external_id_field = data_fixture.create_text_field(table=table)
+    name_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    existing_row = model.objects.create(
+        **{f"field_{external_id_field.id}": "a", f"field_{name_field.id}": "Old"}
+    )
+    duplicate_row = model.objects.create(**{f"field_{external_id_field.id}": "a"})
+    handler = RowHandler()
+
+    rows_values = [
+        {f"field_{external_id_field.id}": "b", f"field_{name_field.id}": "New"},
+        {f"field_{external_id_field.id}": "a", f"field_{name_field.id}": "Updated"},
+        {f"field_{name_field.id}": "Without id"},
+    ]
+    with django_assert_num_queries(1):
+        matched_row_ids = handler.get_upsert_matched_row_ids(
+            model, external_id_field, rows_values
+        )
+    assert matched_row_ids == [None, existing_row.id, None]
+
+    rows = handler.upsert_rows(user, table, rows_values, external_id_field, model)
+
+    assert rows[1].id == existing_row.id
+    assert [getattr(row, f"field_{name_field.id}") for row in rows] == [
+        "New",
+        "Updated",
+        "Without id",
+    ]
+    assert model.objects.count() == 4
+    duplicate_row.refresh_from_db()
+    assert getattr(duplicate_row, f"field_{name_field.id}") is None
+
+
+@pytest.mark.django_db
+def test_upsert_rows_invalid_match_field(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula="'a'", formula_type="text"
+    )
+    other_field = data_fixture.create_text_field(user=user)
+    model = table.get_model()
+    handler = RowHandler()
+
+    with pytest.raises(InvalidUpsertMatchField):
+        handler.upsert_rows(user, table, [{}], formula_field, model)
+
+    with pytest.raises(InvalidUpsertMatchField):
+        handler.upsert_rows(user, table, [{}], other_field, model)
+
+    with pytest.raises(UpsertMatchValuesNotUnique) as exc:
+        handler.upsert_rows(
+            user,
+            table,
+            [{f"field_{text_field.id}": "a"}, {f"field_{text_field.id}": "a"}],
+            text_field,
+            model,
+        )
+    assert exc.value.values == ["a"]
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_created.send")
 def test_import_rows(send_mock, data_fixture):
@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.slow_queries.handler import SlowTableQueryHandler
+from baserow.contrib.database.slow_queries.models import SlowTableQuery
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db
+def test_slow_table_queries_are_not_captured_by_default(data_fixture):
+    table = data_fixture.create_database_table()
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    list(ViewHandler().get_queryset(grid_view))
+
+    assert SlowTableQuery.objects.count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SLOW_TABLE_QUERY_THRESHOLD_MS=0.0001)
+def test_capture_slow_view_query(data_fixture):
+    cache.clear()
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="abc"
+    )
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "xabcx"})
+
+    rows = list(ViewHandler().get_queryset(grid_view, search="x", model=model))
+    assert len(rows) == 1
+
+    slow_query = SlowTableQuery.objects.get()
+    assert slow_query.table_id == table.id
+    assert slow_query.view_id == grid_view.id
+    assert slow_query.duration_ms > 0
+    assert slow_query.sql.startswith("SELECT")
+    assert "%abc%" in slow_query.params
+    assert "actual time=" in slow_query.explain
+    assert slow_query.context == {
+        "search": "x",
+        "filter_type": "AND",
+        "filters_disabled": False,
+        "filters": [{"field_id": text_field.id, "type": "contains", "value": "abc"}],
+        "sorts": [{"field_id": text_field.id, "order": "DESC"}],
+    }
+
+    # Only one query per view is captured during the cooldown.
+    ViewHandler().get_queryset(grid_view, model=model).count()
+    assert SlowTableQuery.objects.count() == 1
+
+    # Queries that don't come from a view are captured separately.
+    model.objects.all().count()
+    slow_query = SlowTableQuery.objects.first()
+    assert SlowTableQuery.objects.count() == 2
+    assert slow_query.view_id is None
+    assert slow_query.context == {"search": None}
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_SLOW_TABLE_QUERY_LOG_MAX_ENTRIES=2)
+def test_slow_table_query_log_is_rotated(data_fixture):
+    table = data_fixture.create_database_table()
+
+    slow_queries = [
+        SlowTableQueryHandler.store(
+            table.id, None, "SELECT 1", [], "SELECT 1", duration_ms
+        )
+        for duration_ms in [1, 2, 3]
+    ]
+
+    assert list(SlowTableQuery.objects.values_list("id", flat=True)) == [
+        slow_queries[2].id,
+        slow_queries[1].id,
+    ]
+    assert slow_queries[2].explain.startswith("Result")
+
+    assert SlowTableQueryHandler.store(0, None, "SELECT 1", [], "SELECT 1", 1) is None
+
+
+@pytest.mark.django_db
+def test_slow_table_query_explain_only_analyzes_select_queries():
+    assert SlowTableQueryHandler.explain("DELETE FROM database_table") is None
+    for locking_clause in ["FOR UPDATE", "for no key update", "FOR SHARE NOWAIT"]:
+        assert (
+            SlowTableQueryHandler.explain(
+                f"SELECT * FROM database_table WHERE id = 1 {locking_clause}"
+            )
+            is None
+        )
+    assert "actual time=" in SlowTableQueryHandler.explain("SELECT 1")
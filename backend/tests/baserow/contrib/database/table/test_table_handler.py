@@ -6,7 +6,7 @@ from unittest.mock import patch
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
 from django.db import connection
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from pyinstrument import Profiler
@@ -272,6 +272,32 @@ def test_fill_table_with_initial_data(data_fixture):
     assert table.field_set.count() == 5
 
 
+@pytest.mark.django_db
+def test_create_table_with_many_fields_in_bulk(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    data = [[f"Field {index}" for index in range(100)], ["value"] * 100]
+
+    with CaptureQueriesContext(connection) as captured:
+        table, _ = TableHandler().create_table(
+            user, database, name="Table 1", data=data, first_row_header=True
+        )
+
+    field_inserts = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].startswith('INSERT INTO "database_field"')
+    ]
+    assert len(field_inserts) == 1
+    fields = list(TextField.objects.filter(table=table).order_by("order"))
+    assert len(fields) == 100
+    assert fields[0].primary
+    assert not any(field.primary for field in fields[1:])
+    model = table.get_model()
+    row = model.objects.get()
+    assert getattr(row, f"field_{fields[99].id}") == "value"
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.table.signals.table_updated.send")
 def test_update_database_table(send_mock, data_fixture):
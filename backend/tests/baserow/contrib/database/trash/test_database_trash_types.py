@@ -69,7 +69,7 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    with django_assert_num_queries(14):
+    with django_assert_num_queries(16):
         TrashHandler.permanently_delete_marked_trash()
 
     row_2 = handler.create_row(user=user, table=table)
@@ -88,18 +88,11 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id)
-    # We only want seven more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
-    # If we weren't caching the table models an extra number of queries would be first
-    # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(21):
+    # Rows of the same table are deleted in bulk, so deleting 2 rows doesn't need
+    # any more queries than deleting 1 row. If we weren't caching the table models
+    # an extra number of queries would be first performed to lookup the table
+    # information which breaks this assertion.
+    with django_assert_num_queries(16):
         TrashHandler.permanently_delete_marked_trash()
 
 
@@ -5,7 +5,11 @@ import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
+    FieldAggregationNotSupported,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 from baserow.core.trash.handler import TrashHandler
@@ -443,3 +447,157 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
     TrashHandler().restore_item(user, "view", grid_view_one.id)
     aggregations_restored_view = view_handler.get_view_field_aggregations(grid_view_one)
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_apply_delta():
+    def apply_delta(aggregation_type_name, *args):
+        aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+        return aggregation_type.apply_delta(*args)
+
+    assert apply_delta("empty_count", 3, 1, None) == 2
+    assert apply_delta("not_empty_count", 3, None, 2) == 5
+
+    assert apply_delta("sum", Decimal("10"), Decimal("2"), Decimal("5")) == 13
+    assert apply_delta("sum", None, None, Decimal("5")) == 5
+    assert apply_delta("sum", Decimal("10"), Decimal("10"), Decimal("0")) == 0
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        apply_delta("sum", Decimal("10"), Decimal("10"), None)
+
+    assert apply_delta("min", 2, None, 1) == 1
+    assert apply_delta("min", 2, 3, 4) == 2
+    assert apply_delta("min", 2, 2, 1) == 1
+    assert apply_delta("min", None, None, None) is None
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        apply_delta("min", 2, 2, 3)
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        apply_delta("max", 2, 2, None)
+    assert apply_delta("max", 2, 1, 4) == 4
+
+    assert not view_aggregation_type_registry.get("median").can_be_updated_incrementally
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        apply_delta("median", 2, 1, 4)
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_updated_incrementally_on_row_changes(
+    data_fixture, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "min",
+                "aggregation_raw_type": "min",
+            },
+            text_field.id: {
+                "aggregation_type": "empty_count",
+                "aggregation_raw_type": "empty_count",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1 = row_handler.create_row(
+        user, table, {number_field.id: 5, text_field.id: "a"}, model=model
+    )
+    row_2 = row_handler.create_row(
+        user, table, {number_field.id: 10, text_field.id: ""}, model=model
+    )
+
+    def get_expected_aggregations():
+        return view_handler.get_field_aggregations(
+            grid_view, [(number_field, "min"), (text_field, "empty_count")]
+        )
+
+    assert view_handler.get_view_field_aggregations(grid_view) == {
+        number_field.db_column: 5,
+        text_field.db_column: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_3 = row_handler.create_row(
+            user, table, {number_field.id: 1, text_field.id: ""}, model=model
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_row(
+            user, table, row_2, {number_field.id: 3, text_field.id: "b"}, model
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        # Moving a row out of the view filter removes it from the aggregations.
+        row_handler.update_rows(
+            user, table, [{"id": row_1.id, text_field.db_column: "hidden"}], model
+        )
+
+    # All the values are still cached, so only the aggregations are fetched.
+    with django_assert_num_queries(1):
+        aggregations = view_handler.get_view_field_aggregations(grid_view)
+    assert aggregations == get_expected_aggregations()
+    assert aggregations == {number_field.db_column: 1, text_field.db_column: 1}
+
+    # Deleting the row holding the minimum requires the minimum to be recomputed,
+    # the empty count is still updated incrementally.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_rows(user, table, [row_3.id], model=model)
+
+    _, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, [(number_field, "min"), (text_field, "empty_count")]
+    )
+    assert list(need_computation.keys()) == [number_field.db_column]
+    aggregations = view_handler.get_view_field_aggregations(grid_view)
+    assert aggregations == get_expected_aggregations()
+    assert aggregations == {number_field.db_column: 3, text_field.db_column: 0}
+
+    # Changes within the same transaction are only applied incrementally once, the
+    # other ones fall back to a full recomputation.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row(user, table, row_2, model=model)
+        row_handler.update_row(user, table, row_1, {text_field.id: ""}, model)
+
+    assert (
+        view_handler.get_view_field_aggregations(grid_view)
+        == get_expected_aggregations()
+    )
+    assert get_expected_aggregations() == {
+        number_field.db_column: 5,
+        text_field.db_column: 1,
+    }
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_not_updated_incrementally_with_cross_row_dependencies(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    data_fixture.create_link_row_field(table=table, link_row_table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"}
+        },
+    )
+    view_handler.get_view_field_aggregations(grid_view)
+
+    model = table.get_model()
+    assert (
+        view_handler.prepare_field_aggregations_delta(
+            table, model, [number_field], [1], rows_created=True
+        )
+        is None
+    )
@@ -2496,6 +2496,103 @@ def test_date_equals_day_week_month_year_filter_type(data_fixture):
         assert row_3.id in ids
 
 
+@pytest.mark.django_db
+def test_date_filters_compare_the_column_with_a_range(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    grid_view = data_fixture.create_grid_view(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    date_time_field = data_fixture.create_date_field(
+        table=table, date_include_time=True
+    )
+    last_modified_field = data_fixture.create_last_modified_field(
+        table=table, date_include_time=True, timezone="Europe/Amsterdam"
+    )
+
+    handler = ViewHandler()
+    model = table.get_model()
+    utc = timezone("UTC")
+
+    with freeze_time("2020-12-29 22:30"):
+        row = model.objects.create(
+            **{
+                f"field_{date_field.id}": date(2020, 12, 29),
+                f"field_{date_time_field.id}": make_aware(
+                    datetime(2020, 12, 29, 22, 30), utc
+                ),
+            }
+        )
+    with freeze_time("2021-01-04 00:30"):
+        row_2 = model.objects.create(
+            **{
+                f"field_{date_field.id}": date(2021, 1, 4),
+                f"field_{date_time_field.id}": make_aware(
+                    datetime(2021, 1, 4, 0, 30), utc
+                ),
+            }
+        )
+
+    view_filter = data_fixture.create_view_filter(
+        view=grid_view, field=date_field, type="date_equals_week", value="UTC"
+    )
+    for field in [date_field, date_time_field, last_modified_field]:
+        view_filter.field = field
+        for filter_type, value in [
+            ("date_equal", "2021-01-01"),
+            ("date_before", "2021-01-01"),
+            ("date_after", "2021-01-01"),
+            ("date_equals_today", "UTC"),
+            ("date_before_today", "UTC"),
+            ("date_after_today", "UTC"),
+            ("date_equals_days_ago", "UTC?1"),
+            ("date_equals_months_ago", "UTC?1"),
+            ("date_equals_years_ago", "UTC?1"),
+            ("date_equals_week", "UTC"),
+            ("date_equals_month", "UTC"),
+            ("date_equals_year", "UTC"),
+        ]:
+            view_filter.type = filter_type
+            view_filter.value = value
+            view_filter.save()
+            sql = str(handler.apply_filters(grid_view, model.objects.all()).query)
+            assert "EXTRACT" not in sql
+            assert "AT TIME ZONE" not in sql.upper()
+
+    # The ISO week containing the 1st of January 2021 starts in 2020.
+    view_filter.field = date_field
+    view_filter.type = "date_equals_week"
+    view_filter.value = "UTC"
+    view_filter.save()
+    with freeze_time("2021-01-01 12:00"):
+        ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+        assert ids == [row.id]
+
+    # The last modified field compares the dates in its own timezone, the row was
+    # modified on the 29th in UTC, but on the 29th at 23:30 in Amsterdam.
+    view_filter.field = last_modified_field
+    view_filter.type = "date_equal"
+    view_filter.value = "2020-12-29"
+    view_filter.save()
+    ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+    assert ids == [row.id]
+
+    # The row modified on the 4th at 00:30 UTC was modified at 01:30 in Amsterdam.
+    view_filter.type = "date_before"
+    view_filter.value = "2021-01-04T01:00:00"
+    view_filter.save()
+    ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+    assert ids == [row.id]
+
+    view_filter.field = date_time_field
+    view_filter.type = "date_equals_days_ago"
+    view_filter.value = "Europe/Amsterdam?6"
+    view_filter.save()
+    with freeze_time("2021-01-03 23:30"):
+        # It's already the 4th in Amsterdam, so 6 days ago is the 29th.
+        ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+        assert ids == [row.id]
+
+
 @pytest.mark.django_db
 def test_date_before_after_today_filter_type(data_fixture):
     user = data_fixture.create_user()
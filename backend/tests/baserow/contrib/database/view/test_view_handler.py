@@ -1972,16 +1972,29 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         only_include_views_which_want_realtime_events=True,
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             public_grid_view.view_ptr,
             another_public_grid_view.view_ptr,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [visible_row, invisible_row]
+        ) == [
+            PublicViewRows(
+                view=public_grid_view.view_ptr, allowed_row_ids={visible_row.id}
+            ),
+            PublicViewRows(
+                view=another_public_grid_view.view_ptr,
+                allowed_row_ids={visible_row.id},
+            ),
+        ]
+
 
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
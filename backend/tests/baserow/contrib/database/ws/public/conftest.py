@@ -35,7 +35,7 @@ class PublicWebsocketTester(Generic[T], abc.ABC):
         pass
 
     def create_other_views_that_should_not_get_realtime_signals(
-        self, user: AbstractUser, table: Table, mock_broadcast_to_channel_group
+        self, user: AbstractUser, table: Table, mock_publish_to_channel_group
     ):
         for view_type in view_type_registry.get_all():
             ViewHandler().create_view(user, table, view_type.type, public=False)
@@ -43,7 +43,7 @@ class PublicWebsocketTester(Generic[T], abc.ABC):
                 ViewHandler().create_view(user, table, view_type.type, public=True)
         # Reset away all the signals we just triggered by creating these other
         # views.
-        mock_broadcast_to_channel_group.reset_mock()
+        mock_publish_to_channel_group.reset_mock()
 
 
 class GridViewPublicWebsocketTester(PublicWebsocketTester[GridView]):
@@ -21,9 +21,9 @@ class MatchDictSubSet(object):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_created_public_views_are_sent_field_created_with_restricted_related(
-    mock_broadcast_to_channel_group,
+    mock_publish_to_channel_group,
     data_fixture,
     django_assert_num_queries,
     public_realtime_view_tester,
@@ -44,7 +44,7 @@ def test_when_field_created_public_views_are_sent_field_created_with_restricted_
         hidden_fields=[hidden_broken_field],
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     new_field = FieldHandler().create_field(user, table, "text", name="a", order=1)
 
@@ -77,13 +77,13 @@ def test_when_field_created_public_views_are_sent_field_created_with_restricted_
                 None,
             ),
         )
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (expected_calls)
+    assert mock_publish_to_channel_group.mock_calls == (expected_calls)
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_deleted_public_views_are_field_deleted_with_restricted_related(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -103,12 +103,12 @@ def test_when_field_deleted_public_views_are_field_deleted_with_restricted_relat
     deleted_field_id = visible_field.id
 
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     FieldHandler().delete_field(user, visible_field)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -134,9 +134,9 @@ def test_when_field_deleted_public_views_are_field_deleted_with_restricted_relat
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_restored_public_views_sent_event_with_restricted_related_fields(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -154,13 +154,13 @@ def test_when_field_restored_public_views_sent_event_with_restricted_related_fie
         hidden_fields=[hidden_broken_field],
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     deleted_field_id = visible_field.id
     FieldHandler().delete_field(user, visible_field)
     TrashHandler().restore_item(user, "field", visible_field.id)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(f"view-{public_view.slug}", ANY, ANY),
@@ -193,9 +193,9 @@ def test_when_field_restored_public_views_sent_event_with_restricted_related_fie
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_updated_public_views_are_sent_event_with_restricted_related(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -214,12 +214,12 @@ def test_when_field_updated_public_views_are_sent_event_with_restricted_related(
     )
 
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     updated_field = FieldHandler().update_field(user, visible_field, name="a")
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -251,9 +251,9 @@ def test_when_field_updated_public_views_are_sent_event_with_restricted_related(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_cover_image_is_always_included_in_field_update_signal(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -267,7 +267,7 @@ def test_cover_image_is_always_included_in_field_update_signal(
 
     updated_field = FieldHandler().update_field(user, file_field, name="a")
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -12,9 +12,9 @@ from baserow.core.trash.handler import TrashHandler
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_created_public_views_receive_restricted_row_created_ws_event(
-    mock_broadcast_to_channel_group,
+    mock_publish_to_channel_group,
     data_fixture,
     public_realtime_view_tester,
 ):
@@ -37,7 +37,7 @@ def test_when_row_created_public_views_receive_restricted_row_created_ws_event(
     )
     # No public events should be sent to this form view
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     row = RowHandler().create_row(
         user=user,
@@ -48,7 +48,7 @@ def test_when_row_created_public_views_receive_restricted_row_created_ws_event(
         },
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -94,9 +94,9 @@ def test_when_row_created_public_views_receive_restricted_row_created_ws_event(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_created_public_views_receive_row_created_only_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -117,7 +117,7 @@ def test_when_row_created_public_views_receive_row_created_only_when_filters_mat
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -147,7 +147,7 @@ def test_when_row_created_public_views_receive_row_created_only_when_filters_mat
         },
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -173,9 +173,9 @@ def test_when_row_created_public_views_receive_row_created_only_when_filters_mat
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_rows_created_public_views_receive_restricted_row_created_ws_event(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -205,7 +205,7 @@ def test_batch_rows_created_public_views_receive_restricted_row_created_ws_event
         rows_values=rows_to_create,
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -265,9 +265,9 @@ def test_batch_rows_created_public_views_receive_restricted_row_created_ws_event
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_rows_created_public_views_receive_row_created_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -288,7 +288,7 @@ def test_batch_rows_created_public_views_receive_row_created_when_filters_match(
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -316,7 +316,7 @@ def test_batch_rows_created_public_views_receive_row_created_when_filters_match(
         rows_values=rows_to_create,
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -348,9 +348,9 @@ def test_batch_rows_created_public_views_receive_row_created_when_filters_match(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_deleted_public_views_receive_restricted_row_deleted_ws_event(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -377,7 +377,7 @@ def test_when_row_deleted_public_views_receive_restricted_row_deleted_ws_event(
     )
     RowHandler().delete_row_by_id(user, table, row.id, model)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -421,9 +421,9 @@ def test_when_row_deleted_public_views_receive_restricted_row_deleted_ws_event(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_deleted_public_views_receive_row_deleted_only_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -444,7 +444,7 @@ def test_when_row_deleted_public_views_receive_row_deleted_only_when_filters_mat
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -474,7 +474,7 @@ def test_when_row_deleted_public_views_receive_row_deleted_only_when_filters_mat
     )
     RowHandler().delete_row_by_id(user, table, row.id, model)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -499,9 +499,9 @@ def test_when_row_deleted_public_views_receive_row_deleted_only_when_filters_mat
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_rows_deleted_public_views_receive_restricted_row_deleted_ws_event(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -536,7 +536,7 @@ def test_batch_rows_deleted_public_views_receive_restricted_row_deleted_ws_event
 
     RowHandler().delete_rows(user, table, [row.id, row2.id], model)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -594,9 +594,9 @@ def test_batch_rows_deleted_public_views_receive_restricted_row_deleted_ws_event
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_rows_deleted_public_views_receive_row_deleted_only_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -617,7 +617,7 @@ def test_batch_rows_deleted_public_views_receive_row_deleted_only_when_filters_m
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -655,7 +655,7 @@ def test_batch_rows_deleted_public_views_receive_row_deleted_only_when_filters_m
 
     RowHandler().delete_rows(user, table, [row.id, row2.id], model)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -680,9 +680,9 @@ def test_batch_rows_deleted_public_views_receive_row_deleted_only_when_filters_m
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_given_row_not_visible_in_public_view_when_updated_to_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -699,7 +699,7 @@ def test_given_row_not_visible_in_public_view_when_updated_to_be_visible_event_s
         )
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -738,7 +738,7 @@ def test_given_row_not_visible_in_public_view_when_updated_to_be_visible_event_s
         values={f"field_{hidden_field.id}": "ValueWhichMatchesFilter"},
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -766,9 +766,9 @@ def test_given_row_not_visible_in_public_view_when_updated_to_be_visible_event_s
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_rows_not_visible_in_public_view_to_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -785,7 +785,7 @@ def test_batch_update_rows_not_visible_in_public_view_to_be_visible_event_sent(
         )
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -845,7 +845,7 @@ def test_batch_update_rows_not_visible_in_public_view_to_be_visible_event_sent(
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -879,9 +879,9 @@ def test_batch_update_rows_not_visible_in_public_view_to_be_visible_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -898,7 +898,7 @@ def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_s
         )
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -956,7 +956,7 @@ def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_s
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1007,9 +1007,9 @@ def test_batch_update_rows_some_not_visible_in_public_view_to_be_visible_event_s
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1026,7 +1026,7 @@ def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_s
         )
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1090,7 +1090,7 @@ def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_s
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1140,9 +1140,9 @@ def test_batch_update_rows_visible_in_public_view_to_some_not_be_visible_event_s
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_given_row_visible_in_public_view_when_updated_to_be_not_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1157,7 +1157,7 @@ def test_given_row_visible_in_public_view_when_updated_to_be_not_visible_event_s
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1202,7 +1202,7 @@ def test_given_row_visible_in_public_view_when_updated_to_be_not_visible_event_s
         },
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1230,9 +1230,9 @@ def test_given_row_visible_in_public_view_when_updated_to_be_not_visible_event_s
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_rows_visible_in_public_view_to_be_not_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1247,7 +1247,7 @@ def test_batch_update_rows_visible_in_public_view_to_be_not_visible_event_sent(
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1312,7 +1312,7 @@ def test_batch_update_rows_visible_in_public_view_to_be_not_visible_event_sent(
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1347,9 +1347,9 @@ def test_batch_update_rows_visible_in_public_view_to_be_not_visible_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_given_row_visible_in_public_view_when_updated_to_still_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1364,7 +1364,7 @@ def test_given_row_visible_in_public_view_when_updated_to_still_be_visible_event
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1409,7 +1409,7 @@ def test_given_row_visible_in_public_view_when_updated_to_still_be_visible_event
         },
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1442,9 +1442,9 @@ def test_given_row_visible_in_public_view_when_updated_to_still_be_visible_event
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_rows_visible_in_public_view_still_be_visible_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1459,7 +1459,7 @@ def test_batch_update_rows_visible_in_public_view_still_be_visible_event_sent(
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1524,7 +1524,7 @@ def test_batch_update_rows_visible_in_public_view_still_be_visible_event_sent(
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1569,9 +1569,9 @@ def test_batch_update_rows_visible_in_public_view_still_be_visible_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_update_subset_rows_visible_in_public_view_no_filters(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1620,7 +1620,7 @@ def test_batch_update_subset_rows_visible_in_public_view_no_filters(
             ],
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1651,9 +1651,9 @@ def test_batch_update_subset_rows_visible_in_public_view_no_filters(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_restored_public_views_receive_restricted_row_created_ws_event(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1683,7 +1683,7 @@ def test_when_row_restored_public_views_receive_restricted_row_created_ws_event(
     )
     TrashHandler.restore_item(user, "row", row.id, parent_trash_item_id=table.id)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1729,9 +1729,9 @@ def test_when_row_restored_public_views_receive_restricted_row_created_ws_event(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_row_restored_public_views_receive_row_created_only_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1752,7 +1752,7 @@ def test_when_row_restored_public_views_receive_row_created_only_when_filters_ma
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1785,7 +1785,7 @@ def test_when_row_restored_public_views_receive_row_created_only_when_filters_ma
     )
     TrashHandler.restore_item(user, "row", row.id, parent_trash_item_id=table.id)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1811,9 +1811,9 @@ def test_when_row_restored_public_views_receive_row_created_only_when_filters_ma
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_batch_rows_restored_public_views_receive_rows_created_only_when_filters_match(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1834,7 +1834,7 @@ def test_batch_rows_restored_public_views_receive_rows_created_only_when_filters
         order=1,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1880,7 +1880,7 @@ def test_batch_rows_restored_public_views_receive_rows_created_only_when_filters
         user, "rows", trash_entry.trash_item_id, parent_trash_item_id=table.id
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -1912,9 +1912,9 @@ def test_batch_rows_restored_public_views_receive_rows_created_only_when_filters
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_given_row_visible_in_public_view_when_moved_row_updated_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -1929,7 +1929,7 @@ def test_given_row_visible_in_public_view_when_moved_row_updated_sent(
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -1975,7 +1975,7 @@ def test_given_row_visible_in_public_view_when_moved_row_updated_sent(
             user, table, visible_moving_row.id, before_row=invisible_row, model=model
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -2010,9 +2010,9 @@ def test_given_row_visible_in_public_view_when_moved_row_updated_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_given_row_invisible_in_public_view_when_moved_no_update_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -2027,7 +2027,7 @@ def test_given_row_invisible_in_public_view_when_moved_no_update_sent(
         order=0,
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # Match the visible field
@@ -2071,7 +2071,7 @@ def test_given_row_invisible_in_public_view_when_moved_no_update_sent(
             user, table, invisible_moving_row.id, before_row=visible_row, model=model
         )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
         ]
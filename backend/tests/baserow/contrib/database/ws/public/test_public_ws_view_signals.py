@@ -10,9 +10,9 @@ from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_view_filter_created_for_public_view_force_refresh_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -21,13 +21,13 @@ def test_when_view_filter_created_for_public_view_force_refresh_sent(
         user, table, visible_fields=[field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     ViewHandler().create_filter(
         user=user, view=public_view, type_name="equal", value="test", field=field
     )
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -40,9 +40,9 @@ def test_when_view_filter_created_for_public_view_force_refresh_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_view_filter_updated_for_public_view_force_refresh_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -51,14 +51,14 @@ def test_when_view_filter_updated_for_public_view_force_refresh_event_sent(
         user, table, visible_fields=[field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     view_filter = data_fixture.create_view_filter(
         user=user, view=public_view, field=field
     )
     ViewHandler().update_filter(user=user, view_filter=view_filter, value="test2")
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -71,9 +71,9 @@ def test_when_view_filter_updated_for_public_view_force_refresh_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_view_filter_deleted_for_public_view_force_refresh_event_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -82,14 +82,14 @@ def test_when_view_filter_deleted_for_public_view_force_refresh_event_sent(
         user, table, visible_fields=[field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     view_filter = data_fixture.create_view_filter(
         user=user, view=public_view, field=field
     )
     ViewHandler().delete_filter(user=user, view_filter=view_filter)
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(
@@ -102,9 +102,9 @@ def test_when_view_filter_deleted_for_public_view_force_refresh_event_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_hidden_in_public_view_field_force_refresh_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -113,7 +113,7 @@ def test_when_field_hidden_in_public_view_field_force_refresh_sent(
         user, table, visible_fields=[text_field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
 
     # No public events should be sent to form views
@@ -141,7 +141,7 @@ def test_when_field_hidden_in_public_view_field_force_refresh_sent(
         fields=[],
     ).data
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(f"table-{table.id}", ANY, ANY),
@@ -160,9 +160,9 @@ def test_when_field_hidden_in_public_view_field_force_refresh_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_field_unhidden_in_public_view_force_refresh_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -171,7 +171,7 @@ def test_when_field_unhidden_in_public_view_force_refresh_sent(
         user, table, visible_fields=[text_field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     handler = ViewHandler()
 
@@ -199,7 +199,7 @@ def test_when_field_unhidden_in_public_view_force_refresh_sent(
         fields=[],
     ).data
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(f"table-{table.id}", ANY, ANY),
@@ -229,9 +229,9 @@ def test_when_field_unhidden_in_public_view_force_refresh_sent(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
 def test_when_only_field_options_updated_in_public_grid_view_force_refresh_sent(
-    mock_broadcast_to_channel_group, data_fixture, public_realtime_view_tester
+    mock_publish_to_channel_group, data_fixture, public_realtime_view_tester
 ):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -241,7 +241,7 @@ def test_when_only_field_options_updated_in_public_grid_view_force_refresh_sent(
         user, table, visible_fields=[visible_field], hidden_fields=[hidden_field]
     )
     public_realtime_view_tester.create_other_views_that_should_not_get_realtime_signals(
-        user, table, mock_broadcast_to_channel_group
+        user, table, mock_publish_to_channel_group
     )
     handler = ViewHandler()
 
@@ -274,7 +274,7 @@ def test_when_only_field_options_updated_in_public_grid_view_force_refresh_sent(
         fields=[],
     ).data
 
-    assert mock_broadcast_to_channel_group.delay.mock_calls == (
+    assert mock_publish_to_channel_group.mock_calls == (
         [
             call(f"table-{table.id}", ANY, ANY),
             call(f"table-{table.id}", ANY, ANY),
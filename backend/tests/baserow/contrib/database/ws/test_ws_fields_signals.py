@@ -10,16 +10,16 @@ from baserow.core.trash.handler import TrashHandler
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_field_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_field_created(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = FieldHandler().create_field(
         user=user, table=table, type_name="text", name="Grid"
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "field_created"
     assert args[0][1]["field"]["id"] == field.id
@@ -27,8 +27,8 @@ def test_field_created(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_field_restored(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_field_restored(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user)
     data_fixture.create_grid_view(user, table=table)
@@ -38,7 +38,7 @@ def test_field_restored(mock_broadcast_to_channel_group, data_fixture):
     FieldHandler().delete_field(user, field)
     TrashHandler.restore_item(user, "field", field.id)
 
-    args = mock_broadcast_to_channel_group.delay.call_args
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{field.table.id}"
     assert args[0][1]["type"] == "field_restored"
     assert args[0][1]["field"]["id"] == field.id, args[0]
@@ -77,14 +77,14 @@ def test_field_restored_doesnt_do_n_plus_some_queries(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_field_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_field_updated(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     field = data_fixture.create_text_field(user=user)
     FieldHandler().update_field(user=user, field=field, name="field")
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{field.table.id}"
     assert args[0][1]["type"] == "field_updated"
     assert args[0][1]["field_id"] == field.id
@@ -93,16 +93,16 @@ def test_field_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_field_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_field_deleted(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     field = data_fixture.create_text_field(user=user)
     field_id = field.id
     table_id = field.table_id
     FieldHandler().delete_field(user=user, field=field)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{field.table.id}"
     assert args[0][1]["type"] == "field_deleted"
     assert args[0][1]["field_id"] == field_id
@@ -14,8 +14,8 @@ from baserow.test_utils.helpers import register_instance_temporarily
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_created(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -23,8 +23,8 @@ def test_row_created(mock_broadcast_to_channel_group, data_fixture):
         user=user, table=table, values={f"field_{field.id}": "Test"}
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_created"
     assert args[0][1]["table_id"] == table.id
@@ -36,7 +36,7 @@ def test_row_created(mock_broadcast_to_channel_group, data_fixture):
     row_2 = RowHandler().create_row(
         user=user, table=table, before_row=row, values={f"field_{field.id}": "Test2"}
     )
-    args = mock_broadcast_to_channel_group.delay.call_args
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_created"
     assert args[0][1]["table_id"] == table.id
@@ -47,8 +47,8 @@ def test_row_created(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_created_with_metadata(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_created_with_metadata(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -59,8 +59,8 @@ def test_row_created_with_metadata(mock_broadcast_to_channel_group, data_fixture
             user=user, table=table, values={f"field_{field.id}": "Test"}
         )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_created"
     assert args[0][1]["table_id"] == table.id
@@ -86,8 +86,8 @@ def test_populates_with_row_id_metadata():
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_updated(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -97,8 +97,8 @@ def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
         user=user, table=table, row_id=row.id, values={f"field_{field.id}": "Test"}
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_updated"
     assert args[0][1]["table_id"] == table.id
@@ -117,7 +117,7 @@ def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
         user=user, table=table, row_id=row.id, values={f"field_{field.id}": "First"}
     )
 
-    args = mock_broadcast_to_channel_group.delay.call_args
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_updated"
     assert args[0][1]["table_id"] == table.id
@@ -128,8 +128,8 @@ def test_row_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_updated_with_metadata(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -143,8 +143,8 @@ def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture
             user=user, table=table, row_id=row.id, values={f"field_{field.id}": "Test"}
         )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_updated"
     assert args[0][1]["table_id"] == table.id
@@ -158,8 +158,8 @@ def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_deleted(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(
@@ -169,8 +169,8 @@ def test_row_deleted(mock_broadcast_to_channel_group, data_fixture):
     row_id = row.id
     RowHandler().delete_row_by_id(user=user, table=table, row_id=row_id)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "rows_deleted"
     assert args[0][1]["row_ids"] == [row_id]
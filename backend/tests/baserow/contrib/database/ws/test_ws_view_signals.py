@@ -8,16 +8,16 @@ from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_created(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     view = ViewHandler().create_view(
         user=user, table=table, type_name="grid", name="Grid"
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "view_created"
     assert args[0][1]["view"]["id"] == view.id
@@ -26,14 +26,14 @@ def test_view_created(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_updated(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view = data_fixture.create_grid_view(user=user)
     ViewHandler().update_view(user=user, view=view, name="View")
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view.table.id}"
     assert args[0][1]["type"] == "view_updated"
     assert args[0][1]["view_id"] == view.id
@@ -43,16 +43,16 @@ def test_view_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_deleted(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view = data_fixture.create_grid_view(user=user)
     view_id = view.id
     table_id = view.table_id
     ViewHandler().delete_view(user=user, view=view)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view.table.id}"
     assert args[0][1]["type"] == "view_deleted"
     assert args[0][1]["view_id"] == view_id
@@ -60,14 +60,14 @@ def test_view_deleted(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_views_reordered(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_views_reordered(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view = data_fixture.create_grid_view(user=user)
     ViewHandler().order_views(user=user, table=view.table, order=[view.id])
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view.table.id}"
     assert args[0][1]["type"] == "views_reordered"
     assert args[0][1]["table_id"] == view.table.id
@@ -75,8 +75,8 @@ def test_views_reordered(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_filter_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_filter_created(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -85,24 +85,24 @@ def test_view_filter_created(mock_broadcast_to_channel_group, data_fixture):
         user=user, view=view, type_name="equal", value="test", field=field
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "view_filter_created"
     assert args[0][1]["view_filter"]["id"] == view_filter.id
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_filter_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_filter_updated(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view_filter = data_fixture.create_view_filter(user=user)
     view_filter = ViewHandler().update_filter(
         user=user, view_filter=view_filter, value="test2"
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_filter.view.table.id}"
     assert args[0][1]["type"] == "view_filter_updated"
     assert args[0][1]["view_filter_id"] == view_filter.id
@@ -110,16 +110,16 @@ def test_view_filter_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_filter_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_filter_deleted(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view_filter = data_fixture.create_view_filter(user=user)
     view_id = view_filter.view.id
     view_filter_id = view_filter.id
     ViewHandler().delete_filter(user=user, view_filter=view_filter)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_filter.view.table.id}"
     assert args[0][1]["type"] == "view_filter_deleted"
     assert args[0][1]["view_id"] == view_id
@@ -127,8 +127,8 @@ def test_view_filter_deleted(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_sort_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_sort_created(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(table=table)
@@ -137,22 +137,22 @@ def test_view_sort_created(mock_broadcast_to_channel_group, data_fixture):
         user=user, view=view, field=field, order="ASC"
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "view_sort_created"
     assert args[0][1]["view_sort"]["id"] == view_sort.id
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_sort_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_sort_updated(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view_sort = data_fixture.create_view_sort(user=user)
     view_sort = ViewHandler().update_sort(user=user, view_sort=view_sort, order="DESC")
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_sort.view.table.id}"
     assert args[0][1]["type"] == "view_sort_updated"
     assert args[0][1]["view_sort_id"] == view_sort.id
@@ -160,16 +160,16 @@ def test_view_sort_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_sort_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_sort_deleted(mock_publish_to_channel_group, data_fixture):
     user = data_fixture.create_user()
     view_sort = data_fixture.create_view_sort(user=user)
     view_id = view_sort.view.id
     view_sort_id = view_sort.id
     ViewHandler().delete_sort(user=user, view_sort=view_sort)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_sort.view.table.id}"
     assert args[0][1]["type"] == "view_sort_deleted"
     assert args[0][1]["view_id"] == view_id
@@ -177,8 +177,8 @@ def test_view_sort_deleted(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_decoration_created(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_decoration_created(mock_publish_to_channel_group, data_fixture):
     data_fixture.register_temp_decorators_and_value_providers()
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -192,16 +192,16 @@ def test_view_decoration_created(mock_broadcast_to_channel_group, data_fixture):
         value_provider_conf={},
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "view_decoration_created"
     assert args[0][1]["view_decoration"]["id"] == view_decoration.id
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_decoration_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_decoration_updated(mock_publish_to_channel_group, data_fixture):
     data_fixture.register_temp_decorators_and_value_providers()
     user = data_fixture.create_user()
     view_decoration = data_fixture.create_view_decoration(user=user)
@@ -211,8 +211,8 @@ def test_view_decoration_updated(mock_broadcast_to_channel_group, data_fixture):
         decorator_type_name="tmp_decorator_type_2",
     )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_decoration.view.table.id}"
     assert args[0][1]["type"] == "view_decoration_updated"
     assert args[0][1]["view_decoration_id"] == view_decoration.id
@@ -220,8 +220,8 @@ def test_view_decoration_updated(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_decoration_deleted(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_decoration_deleted(mock_publish_to_channel_group, data_fixture):
     data_fixture.register_temp_decorators_and_value_providers()
     user = data_fixture.create_user()
     view_decoration = data_fixture.create_view_decoration(user=user)
@@ -229,8 +229,8 @@ def test_view_decoration_deleted(mock_broadcast_to_channel_group, data_fixture):
     view_decoration_id = view_decoration.id
     ViewHandler().delete_decoration(user=user, view_decoration=view_decoration)
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{view_decoration.view.table.id}"
     assert args[0][1]["type"] == "view_decoration_deleted"
     assert args[0][1]["view_id"] == view_id
@@ -238,8 +238,8 @@ def test_view_decoration_deleted(mock_broadcast_to_channel_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_view_field_options_updated(mock_broadcast_to_channel_group, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_view_field_options_updated(mock_publish_to_channel_group, data_fixture):
     data_fixture.register_temp_decorators_and_value_providers()
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(user=user)
@@ -253,8 +253,8 @@ def test_view_field_options_updated(mock_broadcast_to_channel_group, data_fixtur
             field_options={str(text_field.id): {"width": 150}},
         )
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "view_field_options_updated"
     assert args[0][1]["view_id"] == grid_view.id
@@ -1,6 +1,9 @@
+import time
+from threading import Event, Thread
 from unittest.mock import Mock, patch
 
 from django.core.cache import cache
+from django.db import connection
 from django.utils import timezone
 
 import pytest
@@ -15,11 +18,32 @@ from baserow.core.jobs.constants import (
     JOB_PENDING,
     JOB_STARTED,
 )
+from baserow.core.jobs.exceptions import JobNotCancellable
+from baserow.core.jobs.handler import JobHandler
 from baserow.core.jobs.models import Job
-from baserow.core.jobs.registries import JobType
+from baserow.core.jobs.registries import CheckpointedJobType, JobType
 from baserow.core.jobs.tasks import clean_up_jobs, run_async_job
 
 
+def wait_until_blocked_by_lock(connection, timeout=10):
+    """
+    Waits until another connection to the database is waiting for a lock that is
+    held by the given connection.
+    """
+
+    deadline = time.monotonic() + timeout
+    with connection.cursor() as cursor:
+        while time.monotonic() < deadline:
+            cursor.execute(
+                "SELECT count(*) FROM pg_stat_activity "
+                "WHERE pg_backend_pid() = ANY(pg_blocking_pids(pid))"
+            )
+            if cursor.fetchone()[0]:
+                return
+            time.sleep(0.01)
+    raise AssertionError("No connection is waiting for a lock.")
+
+
 class TmpCustomJobType(JobType):
     type = "custom_job_type"
 
@@ -196,3 +220,297 @@ def test_cleanup_file_import_job(storage_mock, data_fixture, settings):
     assert Job.objects.is_running().count() == 2
     assert Job.objects.is_finished().count() == 2
     assert Job.objects.is_pending_or_running().count() == 4
+
+
+class TmpCheckpointedJobType(CheckpointedJobType):
+    type = "checkpointed_job_type"
+
+    max_count = 1
+
+    model_class = Job
+
+    def get_initial_checkpoint(self, job):
+        return {"chunk": 0}
+
+    def run_chunk(self, job, progress, checkpoint):
+        progress.increment(25)
+        if checkpoint["chunk"] == 3:
+            return None
+        return {"chunk": checkpoint["chunk"] + 1}
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_run_checkpointed_task(mock_get_by_model, data_fixture):
+    job_type = TmpCheckpointedJobType()
+    job_type.run_chunk = Mock(side_effect=job_type.run_chunk)
+    mock_get_by_model.return_value = job_type
+
+    job = data_fixture.create_fake_job()
+
+    run_async_job(job.id)
+
+    assert job_type.run_chunk.call_count == 4
+    assert [call[0][2] for call in job_type.run_chunk.call_args_list] == [
+        {"chunk": 0},
+        {"chunk": 1},
+        {"chunk": 2},
+        {"chunk": 3},
+    ]
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert job.checkpoint == {"chunk": 3}
+    assert job.resume_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_checkpointed_task_is_resumed_after_time_limit(mock_get_by_model, data_fixture):
+    job_type = TmpCheckpointedJobType()
+    run_chunk = job_type.run_chunk
+    timed_out = False
+
+    def run_chunk_with_time_limit(job, progress, checkpoint):
+        nonlocal timed_out
+        if checkpoint["chunk"] == 2 and not timed_out:
+            timed_out = True
+            raise SoftTimeLimitExceeded("test")
+        return run_chunk(job, progress, checkpoint)
+
+    job_type.run_chunk = Mock(side_effect=run_chunk_with_time_limit)
+    mock_get_by_model.return_value = job_type
+
+    job = data_fixture.create_fake_job()
+
+    # The resumed task runs eagerly in the tests.
+    run_async_job(job.id)
+
+    # The chunks committed before the time limit are not executed again.
+    assert [call[0][2] for call in job_type.run_chunk.call_args_list] == [
+        {"chunk": 0},
+        {"chunk": 1},
+        {"chunk": 2},
+        {"chunk": 2},
+        {"chunk": 3},
+    ]
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert job.resume_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_checkpointed_task_fails_after_max_resume_count(
+    mock_get_by_model, data_fixture
+):
+    job_type = TmpCheckpointedJobType()
+    job_type.run_chunk = Mock(side_effect=SoftTimeLimitExceeded("test"))
+    mock_get_by_model.return_value = job_type
+
+    job = data_fixture.create_fake_job()
+
+    with pytest.raises(SoftTimeLimitExceeded):
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert job.resume_count == job_type.max_resume_count
+    assert (
+        job.human_readable_error
+        == "The checkpointed_job_type job took too long and was timed out."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_cancel_checkpointed_task(mock_get_by_model, data_fixture):
+    job_type = TmpCheckpointedJobType()
+    run_chunk = job_type.run_chunk
+
+    cancelling = Event()
+
+    def cancel_job():
+        job_to_cancel = Job.objects.get(id=job.id)
+        cancelling.set()
+        JobHandler().cancel_job(job_to_cancel)
+        connection.close()
+
+    cancel_thread = Thread(target=cancel_job)
+
+    def run_chunk_and_cancel(job, progress, checkpoint):
+        if checkpoint["chunk"] == 1:
+            # The cancellation waits until the running chunk has been committed, so
+            # the chunk can only continue once the cancel update is blocked on the
+            # lock of the job row.
+            cancel_thread.start()
+            assert cancelling.wait(timeout=10)
+            wait_until_blocked_by_lock(connection)
+        return run_chunk(job, progress, checkpoint)
+
+    job_type.run_chunk = Mock(side_effect=run_chunk_and_cancel)
+    job_type.cleanup = Mock()
+    mock_get_by_model.return_value = job_type
+
+    job = data_fixture.create_fake_job()
+
+    run_async_job(job.id)
+    cancel_thread.join()
+
+    assert job_type.run_chunk.call_count == 2
+    job_type.cleanup.assert_called_once()
+    assert job_type.cleanup.call_args[0][1] == {"chunk": 2}
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert (
+        job.human_readable_error == "The checkpointed_job_type job has been cancelled."
+    )
+
+    with pytest.raises(JobNotCancellable):
+        JobHandler().cancel_job(job)
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_cancel_checkpointed_task_before_it_is_resumed(mock_get_by_model, data_fixture):
+    job_type = TmpCheckpointedJobType()
+    job_type.run_chunk = Mock()
+    job_type.cleanup = Mock()
+    mock_get_by_model.return_value = job_type
+
+    # The job has been interrupted and its resumed task is still queued.
+    job = data_fixture.create_fake_job(
+        state=JOB_STARTED, checkpoint={"chunk": 2}, resume_count=1
+    )
+
+    JobHandler().cancel_job(job)
+
+    job_type.cleanup.assert_called_once()
+    assert job_type.cleanup.call_args[0][1] == {"chunk": 2}
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert job.checkpoint is None
+
+    # The work is not cleaned up again when the queued task is picked up.
+    run_async_job(job.id)
+
+    job_type.run_chunk.assert_not_called()
+    job_type.cleanup.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_checkpointed_task_cancelled_before_pickup_is_cleaned_up(
+    mock_get_by_model, data_fixture
+):
+    job_type = TmpCheckpointedJobType()
+    job_type.run_chunk = Mock()
+    job_type.cleanup = Mock()
+    mock_get_by_model.return_value = job_type
+
+    # The cancellation has marked the job as failed without cleaning it up, for
+    # example because the resumed task was just picking up the job.
+    job = data_fixture.create_fake_job(
+        state=JOB_FAILED, error="Cancelled", checkpoint={"chunk": 2}
+    )
+
+    run_async_job(job.id)
+
+    job_type.run_chunk.assert_not_called()
+    job_type.cleanup.assert_called_once()
+    assert job_type.cleanup.call_args[0][1] == {"chunk": 2}
+    job.refresh_from_db()
+    assert job.checkpoint is None
+
+
+@pytest.mark.django_db
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_cancel_job_not_checkpointed(mock_get_by_model, data_fixture):
+    mock_get_by_model.return_value = TmpCustomJobType()
+
+    job = data_fixture.create_fake_job()
+
+    with pytest.raises(JobNotCancellable):
+        JobHandler().cancel_job(job)
+
+    job.refresh_from_db()
+    assert job.state == JOB_PENDING
+
+
+@pytest.mark.django_db
+@patch("baserow.core.jobs.handler.run_async_job")
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_all")
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_cleanup_resumes_stale_checkpointed_jobs(
+    mock_get_by_model,
+    mock_get_all,
+    mock_run_async_job,
+    data_fixture,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    job_type = TmpCheckpointedJobType()
+    job_type.cleanup = Mock()
+    mock_get_by_model.return_value = job_type
+    mock_get_all.return_value = [job_type]
+
+    now = timezone.now()
+    time_before_soft_limit = now - timezone.timedelta(
+        seconds=settings.BASEROW_JOB_SOFT_TIME_LIMIT + 2
+    )
+    with freeze_time(time_before_soft_limit):
+        job_1 = data_fixture.create_fake_job(state=JOB_STARTED)
+        job_2 = data_fixture.create_fake_job(
+            state=JOB_STARTED,
+            resume_count=job_type.max_resume_count,
+            checkpoint={"chunk": 1},
+        )
+        job_3 = data_fixture.create_fake_job(state=JOB_STARTED)
+
+    # The third job has committed a chunk recently, so it's still alive.
+    with freeze_time(now), django_capture_on_commit_callbacks(execute=True):
+        job_3.save()
+        clean_up_jobs()
+
+    job_1.refresh_from_db()
+    assert job_1.state == JOB_STARTED
+    assert job_1.resume_count == 1
+    mock_run_async_job.delay.assert_called_once_with(job_1.id)
+
+    job_2.refresh_from_db()
+    assert job_2.state == JOB_FAILED
+    # The job can't be resumed anymore, so its committed work is cleaned up.
+    job_type.cleanup.assert_called_once()
+    assert job_type.cleanup.call_args[0][0].id == job_2.id
+    assert job_type.cleanup.call_args[0][1] == {"chunk": 1}
+    assert job_2.checkpoint is None
+
+    job_3.refresh_from_db()
+    assert job_3.state == JOB_STARTED
+    assert job_3.resume_count == 0
+
+
+@pytest.mark.django_db
+@patch("baserow.core.jobs.registries.JobTypeRegistry.get_by_model")
+def test_cleanup_expired_checkpointed_jobs(mock_get_by_model, data_fixture, settings):
+    job_type = TmpCheckpointedJobType()
+    job_type.cleanup = Mock()
+    mock_get_by_model.return_value = job_type
+
+    time_before_expiration = timezone.now() - timezone.timedelta(
+        minutes=settings.BASEROW_JOB_EXPIRATION_TIME_LIMIT + 1
+    )
+    with freeze_time(time_before_expiration):
+        data_fixture.create_fake_job(state=JOB_FAILED, checkpoint={"chunk": 1})
+        data_fixture.create_fake_job(state=JOB_FINISHED, checkpoint={"chunk": 3})
+
+    clean_up_jobs()
+
+    # Only the work of the failed job must be undone.
+    job_type.cleanup.assert_called_once()
+    assert job_type.cleanup.call_args[0][1] == {"chunk": 1}
+    assert Job.objects.count() == 0
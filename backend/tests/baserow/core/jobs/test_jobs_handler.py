@@ -1,9 +1,12 @@
 from unittest.mock import patch
 
+from django.core.cache import cache
+
 import pytest
 
+from baserow.core.jobs.cache import job_progress_key
 from baserow.core.jobs.exceptions import JobDoesNotExist, MaxJobCountExceeded
-from baserow.core.jobs.handler import JobHandler
+from baserow.core.jobs.handler import JobHandler, JobProgressPersister
 from baserow.core.jobs.models import Job
 
 
@@ -53,3 +56,46 @@ def test_get_job(data_fixture):
     job = JobHandler().get_job(user, job_1.id)
     assert isinstance(job, Job)
     assert job.id == job_1.id
+
+
+@pytest.mark.django_db
+@patch("baserow.core.jobs.handler.job_updated")
+def test_job_progress_persister_coalesces_updates(mock_job_updated, data_fixture):
+    job = data_fixture.create_fake_job()
+    progress_persister = JobProgressPersister(job, interval=60)
+
+    # The first update is always persisted immediately.
+    progress_persister(1, None)
+    assert mock_job_updated.send.call_count == 1
+    assert cache.get(job_progress_key(job.id))["progress_percentage"] == 1
+
+    # Percentage updates within the interval are only kept in memory.
+    for percentage in range(2, 50):
+        progress_persister(percentage, None)
+    assert mock_job_updated.send.call_count == 1
+    assert cache.get(job_progress_key(job.id))["progress_percentage"] == 1
+    job.refresh_from_db()
+    assert job.progress_percentage == 1
+
+    # A state change is persisted immediately, including the coalesced percentage.
+    progress_persister(50, "importing")
+    assert mock_job_updated.send.call_count == 2
+    job.refresh_from_db()
+    assert job.progress_percentage == 50
+    assert job.state == "importing"
+
+    progress_persister(60, None)
+    assert mock_job_updated.send.call_count == 2
+    progress_persister.flush()
+    assert mock_job_updated.send.call_count == 3
+    job.refresh_from_db()
+    assert job.progress_percentage == 60
+
+    # Nothing is written if there is nothing pending.
+    progress_persister.flush()
+    assert mock_job_updated.send.call_count == 3
+
+    # Reaching 100% is always persisted immediately.
+    progress_persister(100, None)
+    assert mock_job_updated.send.call_count == 4
+    assert cache.get(job_progress_key(job.id))["progress_percentage"] == 100
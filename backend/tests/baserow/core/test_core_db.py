@@ -8,9 +8,18 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import Field, LongTextField, TextField
+from baserow.contrib.database.fields.models import (
+    Field,
+    LongTextField,
+    NumberField,
+    TextField,
+)
 from baserow.contrib.database.views.models import GalleryView, GridView, View
-from baserow.core.db import LockedAtomicTransaction, specific_iterator
+from baserow.core.db import (
+    LockedAtomicTransaction,
+    bulk_create_specific,
+    specific_iterator,
+)
 from baserow.core.models import Settings
 
 
@@ -270,3 +279,46 @@ def test_specific_iterator_per_content_type_with_nested_prefetch(
         list(specific_objects[1].table.field_set.all())
         list(specific_objects[2].table.field_set.all())
         list(specific_objects[3].table.field_set.all())
+
+
+@pytest.mark.django_db
+def test_bulk_create_specific(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    fields = [
+        TextField(table=table, order=0, name="Text 1", text_default="a"),
+        LongTextField(table=table, order=1, name="Long text"),
+        TextField(table=table, order=2, name="Text 2"),
+    ]
+    # Make sure that the content types are cached so that they're not queried.
+    ContentType.objects.get_for_models(TextField, LongTextField)
+
+    # One query for the base table and one for every specific table.
+    with django_assert_num_queries(3):
+        bulk_create_specific(Field, fields)
+
+    assert all(field.id for field in fields)
+    assert fields[0].field_ptr_id == fields[0].id
+    assert list(
+        Field.objects.filter(table=table).values_list("content_type", flat=True)
+    ) == [
+        ContentType.objects.get_for_model(TextField).id,
+        ContentType.objects.get_for_model(LongTextField).id,
+        ContentType.objects.get_for_model(TextField).id,
+    ]
+    assert TextField.objects.get(id=fields[0].id).text_default == "a"
+    assert LongTextField.objects.get(id=fields[1].id).name == "Long text"
+    assert TextField.objects.filter(table=table).count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_create_specific_saves_models_with_custom_save(data_fixture):
+    table = data_fixture.create_database_table()
+    fields = [
+        NumberField(table=table, order=0, name="Number", number_decimal_places=2),
+        TextField(table=table, order=1, name="Text"),
+    ]
+
+    bulk_create_specific(Field, fields)
+
+    assert NumberField.objects.get(id=fields[0].id).number_decimal_places == 2
+    assert TextField.objects.get(id=fields[1].id).name == "Text"
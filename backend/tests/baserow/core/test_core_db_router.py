@@ -0,0 +1,115 @@
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.shortcuts import reverse
+from django.test.utils import CaptureQueriesContext, override_settings
+
+import pytest
+from rest_framework.status import HTTP_200_OK
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.db_router import (
+    ReadReplicaRouter,
+    get_sticky_user_cache_key,
+    reads_from_read_replicas,
+    use_default_database,
+    use_read_replicas,
+)
+from baserow.core.models import Group
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_READ_REPLICA_DATABASES=["default-copy"])
+def test_read_replica_router(data_fixture):
+    router = ReadReplicaRouter()
+    user = data_fixture.create_user()
+
+    assert router.db_for_read(Group) == "default"
+
+    assert reads_from_read_replicas() is False
+
+    with use_read_replicas():
+        assert router.db_for_read(Group) == "default-copy"
+        assert reads_from_read_replicas() is True
+        with transaction.atomic():
+            assert router.db_for_read(Group) == "default"
+            assert reads_from_read_replicas() is False
+        with use_default_database():
+            assert router.db_for_read(Group) == "default"
+            assert reads_from_read_replicas() is False
+        assert router.db_for_read(Group) == "default-copy"
+        assert router.db_for_write(Group) == "default"
+        assert router.db_for_read(Group) == "default"
+
+    with use_read_replicas(stick_after_write=False):
+        assert router.db_for_write(Group) == "default"
+        assert router.db_for_read(Group) == "default-copy"
+
+    class FakeRequest:
+        pass
+
+    request = FakeRequest()
+    request.user = user
+    cache.delete(get_sticky_user_cache_key(user.id))
+    with use_read_replicas(request):
+        assert router.db_for_read(Group) == "default-copy"
+
+    cache.set(get_sticky_user_cache_key(user.id), True)
+    with use_read_replicas(request):
+        assert router.db_for_read(Group) == "default"
+
+    assert router.allow_migrate("default-copy", "core") is False
+    assert router.allow_migrate("default", "core") is None
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_READ_REPLICA_DATABASES=["replica-1", "replica-2"])
+def test_read_replica_router_uses_one_replica_per_block():
+    router = ReadReplicaRouter()
+    used_replicas = set()
+
+    for _ in range(50):
+        with use_read_replicas() as state:
+            # The replicas can lag behind differently, so all the reads of the block
+            # must see the same data.
+            replicas_of_block = {router.db_for_read(Group) for _ in range(10)}
+            assert replicas_of_block == {state.replica}
+            used_replicas |= replicas_of_block
+
+    assert used_replicas == {"replica-1", "replica-2"}
+
+
+@pytest.mark.django_db
+def test_read_replica_router_without_replicas():
+    router = ReadReplicaRouter()
+
+    with use_read_replicas():
+        assert router.db_for_read(Group) is None
+        assert router.db_for_write(Group) is None
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "default-copy"])
+@override_settings(BASEROW_READ_REPLICA_DATABASES=["default-copy"])
+def test_read_replica_middleware(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    RowHandler().create_row(user, table, {})
+    cache.delete(get_sticky_user_cache_key(user.id))
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    with CaptureQueriesContext(connections["default-copy"]) as replica_queries:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 1
+    assert len(replica_queries) > 0
+
+    response = api_client.post(url, {}, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert cache.get(get_sticky_user_cache_key(user.id)) is True
+
+    with CaptureQueriesContext(connections["default-copy"]) as replica_queries:
+        response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 2
+    # Only the authentication happens before it's known that the user has to stick
+    # to the default database.
+    assert len(replica_queries) == 1
+    assert 'FROM "auth_user"' in replica_queries.captured_queries[0]["sql"]
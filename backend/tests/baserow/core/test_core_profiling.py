@@ -0,0 +1,241 @@
+from collections import defaultdict
+from unittest.mock import patch
+
+from django.shortcuts import reverse
+from django.test.utils import override_settings
+
+import pytest
+from rest_framework.status import HTTP_200_OK, HTTP_401_UNAUTHORIZED, HTTP_404_NOT_FOUND
+
+from baserow.core.models import Group
+from baserow.core.profiling import (
+    QUERY_COUNT_BUCKETS,
+    Histogram,
+    get_current_profile,
+    observe_profile,
+    on_task_postrun,
+    on_task_prerun,
+    profile_section,
+    request_histograms,
+    start_profile,
+    task_histograms,
+)
+
+
+def test_histogram_render():
+    histogram = Histogram("test_seconds", "Test.", ("endpoint",), (0.1, 1.0))
+    histogram.observe(("a",), 0.05)
+    histogram.observe(("a",), 0.5)
+    histogram.observe(("a",), 5)
+    histogram.observe(('b"',), 0.1)
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{endpoint="a",le="0.1"} 1',
+        'test_seconds_bucket{endpoint="a",le="1.0"} 2',
+        'test_seconds_bucket{endpoint="a",le="+Inf"} 3',
+        'test_seconds_sum{endpoint="a"} 5.55',
+        'test_seconds_count{endpoint="a"} 3',
+        'test_seconds_bucket{endpoint="b\\"",le="0.1"} 1',
+        'test_seconds_bucket{endpoint="b\\"",le="1.0"} 1',
+        'test_seconds_bucket{endpoint="b\\"",le="+Inf"} 1',
+        'test_seconds_sum{endpoint="b\\""} 0.1',
+        'test_seconds_count{endpoint="b\\""} 1',
+    ]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+        self.executed_pipelines = 0
+
+    def hincrby(self, key, field, amount):
+        self.hashes[key][field] = self.hashes[key].get(field, 0) + amount
+
+    def hincrbyfloat(self, key, field, amount):
+        self.hashes[key][field] = self.hashes[key].get(field, 0.0) + amount
+
+    def hgetall(self, key):
+        return {
+            field.encode(): str(value).encode()
+            for field, value in self.hashes[key].items()
+        }
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class FakePipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args: self.commands.append((name, args))
+
+            def execute(self):
+                redis.executed_pipelines += 1
+                for name, args in self.commands:
+                    getattr(redis, name)(*args)
+
+        return FakePipeline()
+
+
+def test_histogram_is_shared_between_processes_with_redis():
+    redis = FakeRedis()
+    with patch(
+        "baserow.core.profiling.get_metrics_redis_connection", return_value=redis
+    ):
+        # Every process has its own instance of the same histogram.
+        histogram = Histogram("test_seconds", "Test.", ("endpoint",), (0.1, 1.0))
+        other_process_histogram = Histogram(
+            "test_seconds", "Test.", ("endpoint",), (0.1, 1.0)
+        )
+        histogram.observe(("a",), 0.05)
+        other_process_histogram.observe(("a",), 0.5)
+        other_process_histogram.observe(("a",), 5)
+
+        assert histogram.render() == other_process_histogram.render()
+        assert histogram.render() == [
+            "# HELP test_seconds Test.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{endpoint="a",le="0.1"} 1',
+            'test_seconds_bucket{endpoint="a",le="1.0"} 2',
+            'test_seconds_bucket{endpoint="a",le="+Inf"} 3',
+            'test_seconds_sum{endpoint="a"} 5.55',
+            'test_seconds_count{endpoint="a"} 3',
+        ]
+
+        histogram.clear()
+        assert other_process_histogram.render()[2:] == []
+
+        # The histograms of a profile are all stored in one round trip.
+        redis.executed_pipelines = 0
+        with start_profile() as profile:
+            pass
+        observe_profile(task_histograms, ("task",), profile)
+        assert redis.executed_pipelines == 1
+        assert task_histograms["duration"].render()[-1] == (
+            'baserow_task_duration_seconds_count{task="task"} 1'
+        )
+
+
+@pytest.mark.django_db
+def test_profile_counts_queries_and_sections(data_fixture):
+    table = data_fixture.create_database_table()
+
+    # Nothing is measured without an active profile.
+    with profile_section("model_generation") as profile:
+        assert profile is None
+
+    with start_profile() as profile:
+        list(Group.objects.all())
+        table.get_model()
+        with profile_section("cache"):
+            with profile_section("cache"):
+                pass
+
+    assert profile.query_count >= 2
+    assert profile.timings["db"] > 0
+    assert profile.timings["model_generation"] > 0
+    assert profile.timings["cache"] > 0
+    assert profile.timings["permission_check"] == 0
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_REQUEST_PROFILING_ENABLED=True)
+def test_request_profiling_middleware_and_metrics(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    for histogram in request_histograms.values():
+        histogram.clear()
+
+    response = api_client.get(
+        reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+
+    response = api_client.get(reverse("api:metrics"))
+    assert response.status_code == HTTP_200_OK
+    content = response.content.decode()
+    assert (
+        'baserow_request_duration_seconds_count{endpoint="api:database:rows:list",'
+        'table=""} 1' in content
+    )
+    assert (
+        'baserow_request_permission_check_duration_seconds_count{endpoint="api:'
+        'database:rows:list",table=""} 1' in content
+    )
+
+    with override_settings(BASEROW_REQUEST_PROFILING_TABLE_LABEL=True):
+        api_client.get(
+            reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+    content = api_client.get(reverse("api:metrics")).content.decode()
+    assert (
+        f'baserow_request_queries_count{{endpoint="api:database:rows:list",'
+        f'table="{table.id}"}} 1' in content
+    )
+
+    with override_settings(BASEROW_REQUEST_PROFILING_METRICS_TOKEN="secret"):
+        response = api_client.get(reverse("api:metrics"))
+        assert response.status_code == HTTP_401_UNAUTHORIZED
+        response = api_client.get(
+            reverse("api:metrics"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        assert response.status_code == HTTP_200_OK
+
+    with override_settings(BASEROW_REQUEST_PROFILING_ENABLED=False):
+        response = api_client.get(reverse("api:metrics"))
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_REQUEST_PROFILING_ENABLED=True,
+    BASEROW_SLOW_REQUEST_LOG_THRESHOLD_MS=1,
+    BASEROW_SLOW_REQUEST_LOG_TOP_QUERIES=2,
+)
+@patch("baserow.core.profiling.logger")
+def test_slow_request_log(mock_logger, data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+
+    with patch("baserow.core.profiling.perf_counter", side_effect=range(0, 100000)):
+        api_client.get(
+            reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    message = mock_logger.warning.call_args[0][0]
+    assert message.startswith(f"Slow request GET /api/database/rows/table/{table.id}/")
+    # Only the two slowest queries are included.
+    assert message.count("\n") == 2
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_REQUEST_PROFILING_ENABLED=True)
+def test_task_profiling():
+    class FakeTask:
+        name = "baserow.test_task"
+
+    for histogram in task_histograms.values():
+        histogram.clear()
+
+    on_task_prerun(task_id="1", task=FakeTask())
+    assert get_current_profile() is not None
+    list(Group.objects.all())
+    on_task_postrun(task_id="1", task=FakeTask())
+    assert get_current_profile() is None
+
+    assert task_histograms["query_count"].render()[2:] == [
+        f'baserow_task_queries_bucket{{task="baserow.test_task",le="{bucket}"}} 1'
+        for bucket in [*QUERY_COUNT_BUCKETS, "+Inf"]
+    ] + [
+        'baserow_task_queries_sum{task="baserow.test_task"} 1',
+        'baserow_task_queries_count{task="baserow.test_task"} 1',
+    ]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.db import connection
 from django.utils import timezone
 
@@ -489,3 +491,49 @@ def test_cant_trash_same_row_twice(
     model = table.get_model()
     assert model.objects.count() == 1
     assert model.trash.count() == 1
+
+
+@pytest.mark.django_db
+@patch("baserow.core.trash.handler.permanently_deleted_in_bulk")
+def test_marked_trashed_rows_are_permanently_deleted_in_bulk_chunks(
+    mock_permanently_deleted_in_bulk, data_fixture, settings
+):
+    settings.BASEROW_TRASH_PERMANENT_DELETION_CHUNK_SIZE = 2
+
+    user = data_fixture.create_user()
+    group = data_fixture.create_group(user=user)
+    database = data_fixture.create_database_application(group=group)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+
+    table_1_model = table_1.get_model()
+    table_2_model = table_2.get_model()
+    rows_1 = [table_1_model.objects.create() for _ in range(3)]
+    kept_row = table_1_model.objects.create()
+    rows_2 = [table_2_model.objects.create() for _ in range(2)]
+
+    for row in rows_1:
+        TrashHandler.trash(user, group, database, row, parent_id=table_1.id)
+    for row in rows_2:
+        TrashHandler.trash(user, group, database, row, parent_id=table_2.id)
+    TrashHandler.trash(user, group, database, kept_row, parent_id=table_1.id)
+    TrashHandler.restore_item(user, "row", kept_row.id, parent_trash_item_id=table_1.id)
+
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    assert list(table_1_model.objects_and_trash.values_list("id", flat=True)) == [
+        kept_row.id
+    ]
+    assert table_2_model.objects_and_trash.count() == 0
+
+    calls = sorted(
+        (c[1]["parent_id"], c[1]["trash_item_ids"])
+        for c in mock_permanently_deleted_in_bulk.send.call_args_list
+    )
+    assert calls == [
+        (table_1.id, [rows_1[0].id, rows_1[1].id]),
+        (table_1.id, [rows_1[2].id]),
+        (table_2.id, [rows_2[0].id, rows_2[1].id]),
+    ]
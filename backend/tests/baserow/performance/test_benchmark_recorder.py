@@ -0,0 +1,79 @@
+import json
+
+from django.contrib.auth import get_user_model
+
+import pytest
+
+from baserow.test_utils.benchmarks import (
+    BenchmarkRecorder,
+    compare_benchmark_results,
+    get_benchmark_key,
+)
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_benchmark_recorder(tmp_path):
+    recorder = BenchmarkRecorder()
+
+    with recorder.measure("count_users", rows=10, width=2):
+        User.objects.count()
+        User.objects.exists()
+        data = [0] * 100_000
+
+    assert len(data) == 100_000
+    [result] = recorder.results
+    assert result["name"] == "count_users"
+    assert result["params"] == {"rows": 10, "width": 2}
+    assert result["query_count"] == 2
+    assert result["wall_time"] > 0
+    assert result["peak_memory"] >= 100_000 * 8
+    assert get_benchmark_key(result) == "count_users[rows=10,width=2]"
+
+    results_file = tmp_path / "benchmarks" / "results.json"
+    recorder.write(results_file)
+    with open(results_file, encoding="utf-8") as f:
+        written = json.load(f)
+    assert written["results"] == recorder.results
+    assert written["postgres_version"] == recorder.postgres_version
+    assert "python_version" in written
+
+
+def test_compare_benchmark_results():
+    def result(name, wall_time, query_count, peak_memory, **params):
+        return {
+            "name": name,
+            "params": params,
+            "wall_time": wall_time,
+            "query_count": query_count,
+            "peak_memory": peak_memory,
+        }
+
+    baseline = {
+        "results": [
+            result("list_rows", 2.0, 10, 1000, rows=10),
+            result("list_rows", 1.0, 0, 1000, rows=100),
+            result("removed", 1.0, 1, 1),
+        ]
+    }
+    current = {
+        "results": [
+            result("list_rows", 1.0, 5, 3000, rows=10),
+            result("list_rows", 1.5, 2, 1000, rows=100),
+            result("added", 1.0, 1, 1),
+        ]
+    }
+
+    assert compare_benchmark_results(baseline, current) == {
+        "list_rows[rows=10]": {
+            "wall_time": 0.5,
+            "query_count": 0.5,
+            "peak_memory": 3.0,
+        },
+        "list_rows[rows=100]": {
+            "wall_time": 1.5,
+            "query_count": None,
+            "peak_memory": 1.0,
+        },
+    }
@@ -0,0 +1,159 @@
+from django.test.utils import override_settings
+from django.urls import reverse
+
+import pytest
+from rest_framework.status import HTTP_200_OK, HTTP_204_NO_CONTENT
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.test_utils.benchmarks import (
+    BenchmarkTableShape,
+    create_benchmark_table,
+    get_import_data,
+    get_text_field,
+)
+
+# You must add --run-disabled-in-ci -s to pytest to run these benchmarks. The
+# results are written to `BASEROW_BENCHMARK_RESULTS_PATH` so that they can be
+# compared with a previous run by setting `BASEROW_BENCHMARK_BASELINE_PATH`.
+BENCHMARK_SHAPES = [
+    BenchmarkTableShape(width=10, rows=1000),
+    BenchmarkTableShape(width=30, rows=1000, link_density=0.2, formula_density=0.2),
+    BenchmarkTableShape(width=10, rows=10000, link_density=0.1, formula_density=0.1),
+]
+BATCH_SIZE = 100
+
+
+@pytest.fixture(
+    params=BENCHMARK_SHAPES, ids=[shape.label for shape in BENCHMARK_SHAPES]
+)
+def benchmark_table(request, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = create_benchmark_table(data_fixture, user, request.param)
+    return user, token, table, request.param
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_list_rows(benchmark_table, benchmark_recorder, api_client):
+    user, token, table, shape = benchmark_table
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    with benchmark_recorder.measure("list_rows", **shape._asdict()):
+        response = api_client.get(url, {"size": 100}, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_search_rows(benchmark_table, benchmark_recorder, api_client):
+    user, token, table, shape = benchmark_table
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    with benchmark_recorder.measure("search_rows", **shape._asdict()):
+        response = api_client.get(
+            url, {"size": 100, "search": "a"}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_batch_create_rows(benchmark_table, benchmark_recorder, api_client):
+    user, token, table, shape = benchmark_table
+    text_field = get_text_field(table)
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+    items = [{f"field_{text_field.id}": f"Row {i}"} for i in range(BATCH_SIZE)]
+
+    with benchmark_recorder.measure("batch_create_rows", **shape._asdict()):
+        response = api_client.post(
+            url, {"items": items}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_batch_update_rows(benchmark_table, benchmark_recorder, api_client):
+    user, token, table, shape = benchmark_table
+    text_field = get_text_field(table)
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+    row_ids = table.get_model().objects.values_list("id", flat=True)[:BATCH_SIZE]
+    # Updating the primary text field also updates all the formula fields.
+    items = [{"id": row_id, f"field_{text_field.id}": "Updated"} for row_id in row_ids]
+
+    with benchmark_recorder.measure("batch_update_rows", **shape._asdict()):
+        response = api_client.patch(
+            url, {"items": items}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_batch_delete_rows(benchmark_table, benchmark_recorder, api_client):
+    user, token, table, shape = benchmark_table
+    url = reverse("api:database:rows:batch-delete", kwargs={"table_id": table.id})
+    row_ids = list(table.get_model().objects.values_list("id", flat=True)[:BATCH_SIZE])
+
+    with benchmark_recorder.measure("batch_delete_rows", **shape._asdict()):
+        response = api_client.post(
+            url, {"items": row_ids}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+    assert response.status_code == HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_field_aggregations(
+    benchmark_table, benchmark_recorder, api_client, data_fixture
+):
+    user, token, table, shape = benchmark_table
+    grid_view = data_fixture.create_grid_view(table=table)
+    grid_view.get_field_options(create_if_missing=True).update(
+        aggregation_type="not_empty_count", aggregation_raw_type="not_empty_count"
+    )
+    url = reverse(
+        "api:database:views:grid:field-aggregations", kwargs={"view_id": grid_view.id}
+    )
+
+    with benchmark_recorder.measure("field_aggregations", **shape._asdict()):
+        response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_export_table(benchmark_table, benchmark_recorder, tmp_path):
+    user, token, table, shape = benchmark_table
+    handler = ExportHandler()
+
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        job = handler.create_pending_export_job(
+            user, table, None, {"exporter_type": "csv"}
+        )
+        with benchmark_recorder.measure("export_table_csv", **shape._asdict()):
+            handler.run_export_job(job)
+    assert job.exported_file_name
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_import_rows(benchmark_table, benchmark_recorder):
+    user, token, table, shape = benchmark_table
+    data = get_import_data(table, BATCH_SIZE * 10)
+
+    with benchmark_recorder.measure("import_rows", **shape._asdict()):
+        rows, error_report = RowHandler().import_rows(user, table, data)
+    assert len(rows) == len(data)
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+def test_benchmark_field_conversion(benchmark_table, benchmark_recorder):
+    user, token, table, shape = benchmark_table
+    text_field = get_text_field(table)
+
+    with benchmark_recorder.measure("convert_text_to_long_text", **shape._asdict()):
+        FieldHandler().update_field(user, text_field, new_type_name="long_text")
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.db import transaction
+
+import pytest
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+from baserow.ws.publisher import (
+    _pending_send_tasks,
+    publish_to_channel_group,
+    publish_to_users,
+    send_to_channel_group,
+)
+
+
+def test_send_to_channel_group():
+    channel_layer = get_channel_layer()
+    channel_name = async_to_sync(channel_layer.new_channel)()
+    async_to_sync(channel_layer.group_add)("test-group", channel_name)
+
+    send_to_channel_group("test-group", {"type": "test"})
+
+    message = async_to_sync(channel_layer.receive)(channel_name)
+    assert message == {"type": "test"}
+
+
+@pytest.mark.asyncio
+async def test_send_to_channel_group_in_running_event_loop():
+    channel_layer = get_channel_layer()
+    channel_name = await channel_layer.new_channel()
+    await channel_layer.group_add("test-group-async", channel_name)
+
+    send_to_channel_group("test-group-async", {"type": "test"})
+
+    message = await channel_layer.receive(channel_name)
+    assert message == {"type": "test"}
+
+
+@pytest.mark.django_db
+@patch("baserow.ws.publisher.send_to_channel_group")
+def test_publish_to_channel_group(
+    mock_send_to_channel_group, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        publish_to_channel_group("table-1", {"type": "test"}, "123")
+        mock_send_to_channel_group.assert_not_called()
+
+    mock_send_to_channel_group.assert_called_once_with(
+        "table-1",
+        {
+            "type": "broadcast_to_group",
+            "payload": {"type": "test"},
+            "ignore_web_socket_id": "123",
+        },
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.ws.publisher.send_to_channel_group")
+def test_publish_to_users(
+    mock_send_to_channel_group, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        publish_to_users([1, 2], {"type": "test"}, "123")
+        mock_send_to_channel_group.assert_not_called()
+
+    mock_send_to_channel_group.assert_called_once_with(
+        "users",
+        {
+            "type": "broadcast_to_users",
+            "user_ids": [1, 2],
+            "payload": {"type": "test"},
+            "ignore_web_socket_id": "123",
+            "send_to_all_users": False,
+        },
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.ws.publisher.get_channel_layer")
+def test_publish_to_channel_group_failure_does_not_break_the_commit(
+    mock_get_channel_layer, django_capture_on_commit_callbacks
+):
+    mock_get_channel_layer.return_value.group_send = AsyncMock(
+        side_effect=ConnectionError("test")
+    )
+    callback = Mock()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        publish_to_channel_group("table-1", {"type": "test"})
+        transaction.on_commit(callback)
+
+    mock_get_channel_layer.return_value.group_send.assert_called_once()
+    callback.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("baserow.ws.publisher.logger")
+@patch("baserow.ws.publisher.get_channel_layer")
+async def test_send_to_channel_group_failure_in_running_event_loop(
+    mock_get_channel_layer, mock_logger
+):
+    mock_get_channel_layer.return_value.group_send = AsyncMock(
+        side_effect=ConnectionError("test")
+    )
+
+    send_to_channel_group("test-group", {"type": "test"})
+    assert len(_pending_send_tasks) == 1
+    await asyncio.gather(*_pending_send_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert len(_pending_send_tasks) == 0
+    mock_logger.error.assert_called_once()
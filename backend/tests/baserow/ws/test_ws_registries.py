@@ -1,21 +1,76 @@
 from unittest.mock import patch
 
+from django.core.cache import cache
+
+from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
+from baserow.ws.coalescing import pop_coalesced_messages
 from baserow.ws.registries import page_registry
 
 
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_broadcast(mock_broadcast, data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_broadcast(mock_publish, data_fixture):
     table_page = page_registry.get("table")
 
     table_page.broadcast({"message": "test"}, table_id=1)
-    mock_broadcast.delay.assert_called_once()
-    args = mock_broadcast.delay.call_args
+    mock_publish.assert_called_once()
+    args = mock_publish.call_args
     assert args[0][0] == "table-1"
     assert args[0][1]["message"] == "test"
     assert args[0][2] is None
 
     table_page.broadcast({"message": "test2"}, ignore_web_socket_id="123", table_id=2)
-    args = mock_broadcast.delay.call_args
+    args = mock_publish.call_args
     assert args[0][0] == "table-2"
     assert args[0][1]["message"] == "test2"
     assert args[0][2] == "123"
+
+
+@patch("baserow.ws.tasks.broadcast_coalesced_to_channel_group")
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_broadcast_coalesced(mock_publish, mock_broadcast_coalesced, settings):
+    settings.BASEROW_WS_COALESCE_WINDOW_MS = 200
+    settings.BASEROW_WS_COALESCE_MAX_MESSAGES = 4
+    cache.clear()
+    table_page = page_registry.get("table")
+
+    def rows_updated(row_id, value_before, value):
+        return RealtimeRowMessages.rows_updated(
+            table_id=1,
+            serialized_rows_before_update=[{"id": row_id, "value": value_before}],
+            serialized_rows=[{"id": row_id, "value": value}],
+            metadata={row_id: {"value": value}},
+        )
+
+    table_page.broadcast(rows_updated(1, "a", "b"), table_id=1)
+    table_page.broadcast(rows_updated(2, "a", "b"), table_id=1)
+    table_page.broadcast(rows_updated(1, "b", "c"), table_id=1)
+    table_page.broadcast(rows_updated(1, "c", "d"), "123", table_id=1)
+    table_page.broadcast({"type": "field_created"}, table_id=1)
+    table_page.broadcast(rows_updated(1, "d", "e"), table_id=1)
+
+    mock_publish.assert_not_called()
+    mock_broadcast_coalesced.apply_async.assert_called_once_with(
+        ("table-1",), countdown=0.2
+    )
+    mock_broadcast_coalesced.delay.assert_called_once_with("table-1")
+
+    messages = pop_coalesced_messages("table-1")
+    assert messages == [
+        {
+            "payload": {
+                "type": "rows_updated",
+                "table_id": 1,
+                "rows_before_update": [
+                    {"id": 1, "value": "a"},
+                    {"id": 2, "value": "a"},
+                ],
+                "rows": [{"id": 1, "value": "c"}, {"id": 2, "value": "b"}],
+                "metadata": {1: {"value": "c"}, 2: {"value": "b"}},
+            },
+            "ignore_web_socket_id": None,
+        },
+        {"payload": rows_updated(1, "c", "d"), "ignore_web_socket_id": "123"},
+        {"payload": {"type": "field_created"}, "ignore_web_socket_id": None},
+        {"payload": rows_updated(1, "d", "e"), "ignore_web_socket_id": None},
+    ]
+    assert pop_coalesced_messages("table-1") == []
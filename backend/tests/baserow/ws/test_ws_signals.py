@@ -7,6 +7,7 @@ from django.utils import timezone
 import pytest
 
 from baserow.core.handler import CoreHandler
+from baserow.core.jobs.signals import job_updated
 from baserow.core.models import (
     GROUP_USER_PERMISSION_ADMIN,
     GROUP_USER_PERMISSION_MEMBER,
@@ -103,8 +104,8 @@ def test_group_created(mock_broadcast_to_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.signals.broadcast_to_users")
-def test_group_restored(mock_broadcast_to_users, data_fixture):
+@patch("baserow.ws.signals.publish_to_users")
+def test_group_restored(mock_publish_to_users, data_fixture):
     user = data_fixture.create_user()
     member_user = data_fixture.create_user()
     # This user should not be sent the restore signal
@@ -121,7 +122,7 @@ def test_group_restored(mock_broadcast_to_users, data_fixture):
 
     TrashHandler.restore_item(user, "group", group.id)
 
-    args = mock_broadcast_to_users.delay.call_args_list
+    args = mock_publish_to_users.call_args_list
     assert len(args) == 2
     member_call = args[1][0]
     admin_call = args[0][0]
@@ -166,8 +167,8 @@ def test_group_updated(mock_broadcast_to_group, data_fixture):
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.signals.broadcast_to_users")
-def test_group_deleted(mock_broadcast_to_users, data_fixture):
+@patch("baserow.ws.signals.publish_to_users")
+def test_group_deleted(mock_publish_to_users, data_fixture):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
     group_id = group.id
@@ -175,8 +176,8 @@ def test_group_deleted(mock_broadcast_to_users, data_fixture):
         group = CoreHandler().get_group_for_update(group_id)
         CoreHandler().delete_group(user=user, group=group)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1]["type"] == "group_deleted"
     assert args[0][1]["group_id"] == group_id
@@ -229,9 +230,9 @@ def test_group_user_updated(mock_broadcast_to_group, data_fixture):
 
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.signals.broadcast_to_group")
-@patch("baserow.ws.signals.broadcast_to_users")
+@patch("baserow.ws.signals.publish_to_users")
 def test_group_user_deleted(
-    mock_broadcast_to_users, mock_broadcast_to_group, data_fixture
+    mock_publish_to_users, mock_broadcast_to_group, data_fixture
 ):
     user_1 = data_fixture.create_user()
     user_2 = data_fixture.create_user()
@@ -241,8 +242,8 @@ def test_group_user_deleted(
     data_fixture.create_user_group(user=user_2, group=group)
     CoreHandler().delete_group_user(user=user_2, group_user=group_user_1)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user_1.id]
     assert args[0][1]["type"] == "group_user_deleted"
     assert args[0][1]["id"] == group_user_id
@@ -260,9 +261,9 @@ def test_group_user_deleted(
 
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.signals.broadcast_to_group")
-@patch("baserow.ws.signals.broadcast_to_users")
+@patch("baserow.ws.signals.publish_to_users")
 def test_user_leaves_group(
-    mock_broadcast_to_users, mock_broadcast_to_group, data_fixture
+    mock_publish_to_users, mock_broadcast_to_group, data_fixture
 ):
     user_1 = data_fixture.create_user()
     user_2 = data_fixture.create_user()
@@ -272,8 +273,8 @@ def test_user_leaves_group(
     data_fixture.create_user_group(user=user_2, group=group)
     CoreHandler().leave_group(user_1, group)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user_1.id]
     assert args[0][1]["type"] == "group_user_deleted"
     assert args[0][1]["id"] == group_user_id
@@ -290,8 +291,8 @@ def test_user_leaves_group(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow.ws.signals.broadcast_to_users")
-def test_groups_reordered(mock_broadcast_to_users, data_fixture):
+@patch("baserow.ws.signals.publish_to_users")
+def test_groups_reordered(mock_publish_to_users, data_fixture):
     user = data_fixture.create_user()
     group_1 = data_fixture.create_group(user=user)
     group_2 = data_fixture.create_group(user=user)
@@ -301,8 +302,8 @@ def test_groups_reordered(mock_broadcast_to_users, data_fixture):
         user=user, group_ids=[group_1.id, group_2.id, group_3.id]
     )
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1]["type"] == "groups_reordered"
     assert args[0][1]["group_ids"] == [group_1.id, group_2.id, group_3.id]
@@ -384,3 +385,25 @@ def test_duplicate_application(mock_broadcast_to_permitted_users, data_fixture):
     mock_broadcast_to_permitted_users.delay.assert_called_once()
     args = mock_broadcast_to_permitted_users.delay.call_args
     assert args[0][0] == application_clone.id
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.signals.broadcast_to_users")
+def test_job_updated(mock_broadcast_to_users, data_fixture):
+    user = data_fixture.create_user()
+    job = data_fixture.create_fake_job(user=user, state="importing")
+    job.progress_percentage = 10
+
+    job_updated.send(None, job=job)
+
+    mock_broadcast_to_users.assert_called_once()
+    args = mock_broadcast_to_users.call_args
+    assert args[0][0] == [user.id]
+    assert args[0][1]["type"] == "job_updated"
+    assert args[0][1]["job"] == {
+        "id": job.id,
+        "type": "tmp_job_type_1",
+        "progress_percentage": 10,
+        "state": "importing",
+        "human_readable_error": "",
+    }
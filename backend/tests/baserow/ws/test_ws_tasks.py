@@ -1,10 +1,17 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
+from baserow.ws.coalescing import add_coalesced_message
+from baserow.ws.registries import page_registry
 from baserow.ws.tasks import (
+    broadcast_coalesced_to_channel_group,
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
@@ -463,3 +470,66 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+@pytest.mark.run(order=11)
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_broadcast_coalesced_to_channel_group(data_fixture):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    user_2, token_2 = data_fixture.create_user_and_token()
+    group = data_fixture.create_group(users=[user_1, user_2])
+    database = data_fixture.create_database_application(group=group)
+    table = data_fixture.create_database_table(database=database)
+    table_page = page_registry.get("table")
+    group_name = f"table-{table.id}"
+
+    communicators, web_socket_ids = [], []
+    for token in [token_1, token_2]:
+        communicator = WebsocketCommunicator(
+            application,
+            f"ws/core/?jwt_token={token}",
+            headers=[(b"origin", b"http://localhost")],
+        )
+        await communicator.connect()
+        response = await communicator.receive_json_from()
+        await communicator.send_json_to({"page": "table", "table_id": table.id})
+        await communicator.receive_json_from(0.1)
+        communicators.append(communicator)
+        web_socket_ids.append(response["web_socket_id"])
+    communicator_1, communicator_2 = communicators
+    web_socket_id_1 = web_socket_ids[0]
+
+    # Nothing is sent if nothing has been buffered.
+    await sync_to_async(cache.clear)()
+    await sync_to_async(broadcast_coalesced_to_channel_group)(group_name)
+    await communicator_1.receive_nothing(0.1)
+
+    # The flush task is executed immediately in the tests, so it's not scheduled
+    # while buffering the messages and executed afterwards instead.
+    with patch(
+        "baserow.ws.tasks.broadcast_coalesced_to_channel_group.apply_async"
+    ) as mock_apply_async:
+        await sync_to_async(add_coalesced_message)(
+            table_page, group_name, {"type": "first"}, web_socket_id_1
+        )
+        await sync_to_async(add_coalesced_message)(
+            table_page, group_name, {"type": "second"}
+        )
+    mock_apply_async.assert_called_once()
+    await communicator_1.receive_nothing(0.1)
+
+    await sync_to_async(broadcast_coalesced_to_channel_group)(group_name)
+    response_1 = await communicator_1.receive_json_from(0.1)
+    assert response_1 == {"type": "second"}
+    response_2 = await communicator_2.receive_json_from(0.1)
+    assert response_2 == {
+        "type": "batch",
+        "payloads": [{"type": "first"}, {"type": "second"}],
+    }
+
+    assert communicator_1.output_queue.qsize() == 0
+    assert communicator_2.output_queue.qsize() == 0
+
+    await communicator_1.disconnect()
+    await communicator_2.disconnect()
@@ -1,6 +1,5 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
 
@@ -8,7 +7,7 @@ from baserow.core.models import Group, GroupUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import group_user_updated, permissions_updated
 from baserow.core.types import Subject
-from baserow.ws.tasks import broadcast_to_users
+from baserow.ws.publisher import publish_to_users
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
@@ -54,10 +53,8 @@ def notify_users_about_updated_permissions(
     associated_users = subject_type.get_associated_users(subject)
     associated_user_ids = [user.id for user in associated_users]
 
-    transaction.on_commit(
-        lambda: broadcast_to_users.delay(
-            associated_user_ids, {"type": "permissions_updated", "group_id": group.id}
-        )
+    publish_to_users(
+        associated_user_ids, {"type": "permissions_updated", "group_id": group.id}
     )
 
 
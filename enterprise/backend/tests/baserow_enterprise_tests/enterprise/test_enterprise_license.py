@@ -528,17 +528,17 @@ def test_cant_manually_remove_all_users_from_seats_in_enterprise_version(
 
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
+@patch("baserow_premium.license.handler.publish_to_users")
 def test_enterprise_license_being_registered_sends_signal_to_all(
-    mock_broadcast_to_users, data_fixture, django_capture_on_commit_callbacks
+    mock_publish_to_users, data_fixture, django_capture_on_commit_callbacks
 ):
 
     Settings.objects.update_or_create(defaults={"instance_id": "1"})
     user = data_fixture.create_user(is_staff=True)
     with django_capture_on_commit_callbacks(execute=True):
         LicenseHandler.register_license(user, VALID_ONE_SEAT_ENTERPRISE_LICENSE)
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args == call(
         send_to_all_users=True,
         user_ids=[],
@@ -551,9 +551,9 @@ def test_enterprise_license_being_registered_sends_signal_to_all(
 
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
+@patch("baserow_premium.license.handler.publish_to_users")
 def test_enterprise_license_being_unregistered_sends_signal_to_all(
-    mock_broadcast_to_users, data_fixture, django_capture_on_commit_callbacks
+    mock_publish_to_users, data_fixture, django_capture_on_commit_callbacks
 ):
 
     Settings.objects.update_or_create(defaults={"instance_id": "1"})
@@ -563,8 +563,8 @@ def test_enterprise_license_being_unregistered_sends_signal_to_all(
             user, VALID_ONE_SEAT_ENTERPRISE_LICENSE
         )
         LicenseHandler.remove_license(user, license_obj)
-    args = mock_broadcast_to_users.delay.call_args
-    assert mock_broadcast_to_users.delay.call_count == 2
+    args = mock_publish_to_users.call_args
+    assert mock_publish_to_users.call_count == 2
     assert args == call(
         send_to_all_users=True,
         user_ids=[],
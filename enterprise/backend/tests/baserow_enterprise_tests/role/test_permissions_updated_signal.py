@@ -15,9 +15,9 @@ def enable_enterprise_and_synced_roles_for_all_tests_here(
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_assignment_created(
-    mock_broadcast_to_users, data_fixture
+    mock_publish_to_users, data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
@@ -26,16 +26,16 @@ def test_permissions_updated_signal_role_assignment_created(
 
     RoleAssignmentHandler().assign_role(user, group, role_admin, scope=database)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_assignment_updated(
-    mock_broadcast_to_users, data_fixture
+    mock_publish_to_users, data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
@@ -44,20 +44,20 @@ def test_permissions_updated_signal_role_assignment_updated(
     role_builder = Role.objects.get(uid="BUILDER")
 
     RoleAssignmentHandler().assign_role(user, group, role_admin, scope=database)
-    mock_broadcast_to_users.delay.reset_mock()
+    mock_publish_to_users.reset_mock()
 
     RoleAssignmentHandler().assign_role(user, group, role_builder, scope=database)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_assignment_deleted(
-    mock_broadcast_to_users, data_fixture
+    mock_publish_to_users, data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
@@ -65,20 +65,20 @@ def test_permissions_updated_signal_role_assignment_deleted(
     role_admin = Role.objects.get(uid="ADMIN")
 
     RoleAssignmentHandler().assign_role(user, group, role_admin, scope=database)
-    mock_broadcast_to_users.delay.reset_mock()
+    mock_publish_to_users.reset_mock()
 
     RoleAssignmentHandler().remove_role(user, group, scope=database)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_group_level_permissions_updated(
-    mock_broadcast_to_users, data_fixture
+    mock_publish_to_users, data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(members=[user])
@@ -86,16 +86,16 @@ def test_permissions_updated_signal_role_group_level_permissions_updated(
 
     RoleAssignmentHandler().assign_role(user, group, role_viewer)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_team_trashed(
-    mock_broadcast_to_users, data_fixture, enterprise_data_fixture
+    mock_publish_to_users, data_fixture, enterprise_data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
@@ -105,16 +105,16 @@ def test_permissions_updated_signal_role_team_trashed(
 
     TeamHandler().delete_team(user, team)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_team_restored(
-    mock_broadcast_to_users, data_fixture, enterprise_data_fixture
+    mock_publish_to_users, data_fixture, enterprise_data_fixture
 ):
     user = data_fixture.create_user()
     group = data_fixture.create_group(user=user)
@@ -123,20 +123,20 @@ def test_permissions_updated_signal_role_team_restored(
     enterprise_data_fixture.create_subject(team, user)
 
     TeamHandler().delete_team(user, team)
-    mock_broadcast_to_users.delay.reset_mock()
+    mock_publish_to_users.reset_mock()
 
     TeamHandler().restore_team_by_id(user, team.id)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0] == [user.id]
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
 
 
 @pytest.mark.django_db(transaction=True)
-@patch("baserow_enterprise.role.receivers.broadcast_to_users")
+@patch("baserow_enterprise.role.receivers.publish_to_users")
 def test_permissions_updated_signal_role_many_users(
-    mock_broadcast_to_users, data_fixture, enterprise_data_fixture
+    mock_publish_to_users, data_fixture, enterprise_data_fixture
 ):
     user_amount = 20
     owner = data_fixture.create_user()
@@ -150,7 +150,7 @@ def test_permissions_updated_signal_role_many_users(
 
     TeamHandler().delete_team(owner, team)
 
-    mock_broadcast_to_users.delay.assert_called_once()
-    args = mock_broadcast_to_users.delay.call_args
+    mock_publish_to_users.assert_called_once()
+    args = mock_publish_to_users.call_args
     assert args[0][0].sort() == user_ids.sort()
     assert args[0][1] == {"type": "permissions_updated", "group_id": group.id}
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from baserow.contrib.database.slow_queries.models import SlowTableQuery
+
+
+class SlowTableQueryAdminResponseSerializer(serializers.ModelSerializer):
+    table_name = serializers.CharField(source="table.name")
+
+    class Meta:
+        model = SlowTableQuery
+        fields = (
+            "id",
+            "table_id",
+            "table_name",
+            "view_id",
+            "duration_ms",
+            "sql",
+            "params",
+            "explain",
+            "context",
+            "created_on",
+        )
@@ -0,0 +1,9 @@
+from django.urls import re_path
+
+from baserow_premium.api.admin.slow_table_queries.views import SlowTableQueriesAdminView
+
+app_name = "baserow_premium.api.admin.slow_table_queries"
+
+urlpatterns = [
+    re_path(r"^$", SlowTableQueriesAdminView.as_view(), name="list"),
+]
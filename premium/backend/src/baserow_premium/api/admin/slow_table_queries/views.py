@@ -0,0 +1,39 @@
+from baserow_premium.api.admin.views import AdminListingView
+from baserow_premium.license.features import PREMIUM
+from baserow_premium.license.handler import LicenseHandler
+from drf_spectacular.utils import extend_schema
+
+from baserow.contrib.database.slow_queries.models import SlowTableQuery
+
+from .serializers import SlowTableQueryAdminResponseSerializer
+
+
+class SlowTableQueriesAdminView(AdminListingView):
+    serializer_class = SlowTableQueryAdminResponseSerializer
+    search_fields = ["id", "sql"]
+    filters_field_mapping = {"table_id": "table_id", "view_id": "view_id"}
+    sort_field_mapping = {
+        "id": "id",
+        "duration_ms": "duration_ms",
+        "created_on": "created_on",
+    }
+
+    def get_queryset(self, request):
+        return SlowTableQuery.objects.select_related("table")
+
+    @extend_schema(
+        tags=["Admin"],
+        operation_id="admin_list_slow_table_queries",
+        description="Returns the queries on the rows of tables that took longer than "
+        "the configured threshold, including the SQL, an `EXPLAIN` sample and the "
+        "filter and sort configuration of the view, if the requesting user is "
+        "staff.\n\nThis is a **premium** feature.",
+        **AdminListingView.get_extend_schema_parameters(
+            "slow table queries", serializer_class, search_fields, sort_field_mapping
+        ),
+    )
+    def get(self, request):
+        LicenseHandler.raise_if_user_doesnt_have_feature_instance_wide(
+            PREMIUM, request.user
+        )
+        return super().get(request)
@@ -2,6 +2,7 @@ from django.urls import include, path
 
 from .dashboard import urls as dashboard_urls
 from .groups import urls as groups_urls
+from .slow_table_queries import urls as slow_table_queries_urls
 from .users import urls as users_urls
 
 app_name = "baserow_premium.api.admin"
@@ -10,4 +11,8 @@ urlpatterns = [
     path("dashboard/", include(dashboard_urls, namespace="dashboard")),
     path("users/", include(users_urls, namespace="users")),
     path("groups/", include(groups_urls, namespace="groups")),
+    path(
+        "slow-table-queries/",
+        include(slow_table_queries_urls, namespace="slow_table_queries"),
+    ),
 ]
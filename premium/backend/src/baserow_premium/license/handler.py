@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Union
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser, Group
-from django.db import DatabaseError, transaction
+from django.db import DatabaseError
 from django.db.models import Q
 from django.utils.timezone import make_aware, now, utc
 
@@ -32,7 +32,7 @@ from baserow.api.user.registries import user_data_registry
 from baserow.core.exceptions import IsNotAdminError
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import plugin_registry
-from baserow.ws.signals import broadcast_to_users
+from baserow.ws.publisher import publish_to_users
 
 from .constants import (
     AUTHORITY_RESPONSE_DOES_NOT_EXIST,
@@ -495,16 +495,14 @@ class LicenseHandler:
         license_object.save()
 
         if instance_wide:
-            transaction.on_commit(
-                lambda: broadcast_to_users.delay(
-                    send_to_all_users=True,
-                    user_ids=[],
-                    payload=user_data_registry.get_by_type(
-                        ActiveLicensesDataType
-                    ).realtime_message_to_enable_instancewide_license(
-                        license_object.license_type
-                    ),
-                )
+            publish_to_users(
+                send_to_all_users=True,
+                user_ids=[],
+                payload=user_data_registry.get_by_type(
+                    ActiveLicensesDataType
+                ).realtime_message_to_enable_instancewide_license(
+                    license_object.license_type
+                ),
             )
         return license_object
 
@@ -542,14 +540,12 @@ class LicenseHandler:
 
         license_type = license.license_type
         if license_type.instance_wide:
-            transaction.on_commit(
-                lambda: broadcast_to_users.delay(
-                    send_to_all_users=True,
-                    user_ids=[],
-                    payload=user_data_registry.get_by_type(
-                        ActiveLicensesDataType
-                    ).realtime_message_to_disable_instancewide_license(license_type),
-                )
+            publish_to_users(
+                send_to_all_users=True,
+                user_ids=[],
+                payload=user_data_registry.get_by_type(
+                    ActiveLicensesDataType
+                ).realtime_message_to_disable_instancewide_license(license_type),
             )
         license.delete()
 
@@ -591,13 +587,11 @@ class LicenseHandler:
         al = user_data_registry.get_by_type(ActiveLicensesDataType)
 
         if license_object.is_active:
-            transaction.on_commit(
-                lambda: broadcast_to_users.delay(
-                    [user.id],
-                    al.realtime_message_to_enable_instancewide_license(
-                        license_object.license_type
-                    ),
-                )
+            publish_to_users(
+                [user.id],
+                al.realtime_message_to_enable_instancewide_license(
+                    license_object.license_type
+                ),
             )
 
         return LicenseUser.objects.create(license=license_object, user=user)
@@ -626,13 +620,11 @@ class LicenseHandler:
         al = user_data_registry.get_by_type(ActiveLicensesDataType)
 
         if license_object.is_active:
-            transaction.on_commit(
-                lambda: broadcast_to_users.delay(
-                    [user.id],
-                    al.realtime_message_to_disable_instancewide_license(
-                        license_object.license_type
-                    ),
-                )
+            publish_to_users(
+                [user.id],
+                al.realtime_message_to_disable_instancewide_license(
+                    license_object.license_type
+                ),
             )
 
     @classmethod
@@ -670,13 +662,11 @@ class LicenseHandler:
             if license_object.is_active:
                 al = user_data_registry.get_by_type(ActiveLicensesDataType)
 
-                transaction.on_commit(
-                    lambda: broadcast_to_users.delay(
-                        [user_license.user_id for user_license in user_licenses],
-                        al.realtime_message_to_enable_instancewide_license(
-                            license_object.license_type
-                        ),
-                    )
+                publish_to_users(
+                    [user_license.user_id for user_license in user_licenses],
+                    al.realtime_message_to_enable_instancewide_license(
+                        license_object.license_type
+                    ),
                 )
 
             return user_licenses
@@ -707,11 +697,9 @@ class LicenseHandler:
         if license_object.is_active:
             al = user_data_registry.get_by_type(ActiveLicensesDataType)
 
-            transaction.on_commit(
-                lambda: broadcast_to_users.delay(
-                    license_user_ids,
-                    al.realtime_message_to_disable_instancewide_license(
-                        license_object.license_type
-                    ),
-                )
+            publish_to_users(
+                license_user_ids,
+                al.realtime_message_to_disable_instancewide_license(
+                    license_object.license_type
+                ),
             )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from baserow_premium.row_comments.handler import RowCommentHandler
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the maintained comment counts of the rows from the existing row "
+        "comments, in case they have gotten out of sync."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table-id",
+            type=int,
+            help="Only rebuild the comment counts of the rows in the table with this "
+            "ID.",
+        )
+
+    def handle(self, *args, **options):
+        count = RowCommentHandler.rebuild_comment_counts(options["table_id"])
+        self.stdout.write(f"Rebuilt the comment counts of {count} row(s).")
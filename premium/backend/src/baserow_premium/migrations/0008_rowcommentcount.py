@@ -0,0 +1,61 @@
+# Generated by Django 3.2.13 on 2026-10-19 12:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0100_convert_field_job"),
+        ("baserow_premium", "0007_fix_missing_colors_ids"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RowCommentCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_id",
+                    models.PositiveIntegerField(
+                        help_text="The id of the row the comments are for."
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="The number of comments of the row."
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        help_text="The table the row of the comments is found in.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("table", "row_id")},
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO baserow_premium_rowcommentcount (table_id, row_id, count)
+            SELECT table_id, row_id, COUNT(*)
+            FROM database_rowcomment
+            GROUP BY table_id, row_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,4 +1,4 @@
 from .license.models import License, LicenseUser
-from .row_comments.models import RowComment
+from .row_comments.models import RowComment, RowCommentCount
 
-__all__ = ["License", "LicenseUser", "RowComment"]
+__all__ = ["License", "LicenseUser", "RowComment", "RowCommentCount"]
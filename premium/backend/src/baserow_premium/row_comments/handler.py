@@ -1,10 +1,13 @@
+from typing import Optional
+
 from django.contrib.auth import get_user_model
+from django.db import connection, transaction
 from django.db.models import QuerySet
 
 from baserow_premium.license.features import PREMIUM
 from baserow_premium.license.handler import LicenseHandler
 from baserow_premium.row_comments.exceptions import InvalidRowCommentException
-from baserow_premium.row_comments.models import RowComment
+from baserow_premium.row_comments.models import RowComment, RowCommentCount
 from baserow_premium.row_comments.operations import (
     CreateRowCommentsOperationType,
     ReadRowCommentsOperationType,
@@ -91,12 +94,71 @@ class RowCommentHandler:
         )
 
         RowHandler().has_row(requesting_user, table, row_id, raise_error=True)
-        row_comment = RowComment.objects.create(
-            user=requesting_user, table=table, row_id=row_id, comment=comment
-        )
+        with transaction.atomic():
+            row_comment = RowComment.objects.create(
+                user=requesting_user, table=table, row_id=row_id, comment=comment
+            )
+            RowCommentHandler.increment_comment_count(table.id, row_id)
         row_comment_created.send(
             RowHandler,
             row_comment=row_comment,
             user=requesting_user,
         )
         return row_comment
+
+    @staticmethod
+    def increment_comment_count(table_id: int, row_id: int, amount: int = 1):
+        """
+        Changes the maintained comment count of the row by the provided amount in a
+        single upsert query, which also works when comments of the same row are
+        created concurrently. Must be called in the same transaction in which the
+        comments are created or deleted.
+
+        :param table_id: The id of the table the row is in.
+        :param row_id: The id of the row of which the comment count must change.
+        :param amount: The number of comments that have been created, or a negative
+            number if comments have been deleted.
+        """
+
+        table_name = RowCommentCount._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table_name} (table_id, row_id, count)
+                VALUES (%(table_id)s, %(row_id)s, GREATEST(%(amount)s, 0))
+                ON CONFLICT (table_id, row_id) DO UPDATE
+                SET count = GREATEST({table_name}.count + %(amount)s, 0)
+                """,  # nosec B608
+                {"table_id": table_id, "row_id": row_id, "amount": amount},
+            )
+
+    @staticmethod
+    def rebuild_comment_counts(table_id: Optional[int] = None) -> int:
+        """
+        Recalculates the maintained comment counts of the rows from the existing
+        comments, in case they have gotten out of sync.
+
+        :param table_id: If provided, only the counts of the rows in this table are
+            rebuilt.
+        :return: The number of rows that have comments.
+        """
+
+        table_filter = "WHERE table_id = %s" if table_id is not None else ""
+        params = [table_id] if table_id is not None else []
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {RowCommentCount._meta.db_table} "  # nosec B608
+                f"{table_filter}",
+                params,
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {RowCommentCount._meta.db_table} (table_id, row_id, count)
+                SELECT table_id, row_id, COUNT(*)
+                FROM {RowComment._meta.db_table}
+                {table_filter}
+                GROUP BY table_id, row_id
+                """,  # nosec B608
+                params,
+            )
+            return cursor.rowcount
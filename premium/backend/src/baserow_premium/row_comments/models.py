@@ -32,3 +32,27 @@ class RowComment(CreatedAndUpdatedOnMixin, models.Model):
         db_table = "database_rowcomment"
         ordering = ("-created_on",)
         indexes = [models.Index(fields=["table", "row_id", "-created_on"])]
+
+
+class RowCommentCount(models.Model):
+    """
+    The number of comments of a row, maintained when comments are created so that
+    the comment counts of the listed rows can be looked up by the row metadata
+    without counting the comments every time. Can be rebuilt using the
+    `rebuild_row_comment_counts` management command.
+    """
+
+    table = models.ForeignKey(
+        Table,
+        on_delete=models.CASCADE,
+        help_text="The table the row of the comments is found in.",
+    )
+    row_id = models.PositiveIntegerField(
+        help_text="The id of the row the comments are for."
+    )
+    count = models.PositiveIntegerField(
+        default=0, help_text="The number of comments of the row."
+    )
+
+    class Meta:
+        unique_together = ("table", "row_id")
@@ -1,8 +1,10 @@
 from django.dispatch import receiver
 
-from baserow_premium.row_comments.models import RowComment
+from baserow_premium.row_comments.models import RowComment, RowCommentCount
+from baserow_premium.row_comments.signals import row_comment_created
 
-from baserow.core.trash.signals import permanently_deleted
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
+from baserow.core.trash.signals import permanently_deleted, permanently_deleted_in_bulk
 
 
 @receiver(permanently_deleted, sender="row", dispatch_uid="row_comment_cleanup")
@@ -10,3 +12,24 @@ def permanently_deleted(sender, **kwargs):
     table_id = kwargs["parent_id"]
     trash_item_id = kwargs["trash_item_id"]
     RowComment.objects.filter(table_id=table_id, row_id=trash_item_id).delete()
+    RowCommentCount.objects.filter(table_id=table_id, row_id=trash_item_id).delete()
+
+
+@receiver(
+    permanently_deleted_in_bulk,
+    sender="row",
+    dispatch_uid="row_comment_bulk_cleanup",
+)
+def permanently_deleted_in_bulk(sender, **kwargs):
+    table_id = kwargs["parent_id"]
+    trash_item_ids = kwargs["trash_item_ids"]
+    RowComment.objects.filter(table_id=table_id, row_id__in=trash_item_ids).delete()
+    RowCommentCount.objects.filter(
+        table_id=table_id, row_id__in=trash_item_ids
+    ).delete()
+
+
+@receiver(row_comment_created, dispatch_uid="row_comment_data_version")
+def bump_data_version_of_commented_table(sender, row_comment, **kwargs):
+    # The comment count is part of the row metadata of the listed rows.
+    TableDataVersionHandler.bump_versions_on_commit([row_comment.table_id])
@@ -1,8 +1,6 @@
 from typing import Any, Dict, List
 
-from django.db.models import Count
-
-from baserow_premium.row_comments.models import RowComment
+from baserow_premium.row_comments.models import RowCommentCount
 from rest_framework import serializers
 from rest_framework.fields import Field
 
@@ -13,15 +11,13 @@ class RowCommentCountMetadataType(RowMetadataType):
     type = "row_comment_count"
 
     def generate_metadata_for_rows(self, table, row_ids: List[int]) -> Dict[int, Any]:
-        return {
-            r["row_id"]: r["count"]
-            for r in (
-                RowComment.objects.filter(table=table, row_id__in=row_ids)
-                .values("row_id")
-                .order_by("row_id")
-                .annotate(count=Count("row_id"))
-            )
-        }
+        # The counts are maintained when comments are created, so they can be
+        # looked up using the unique index instead of counting the comments.
+        return dict(
+            RowCommentCount.objects.filter(
+                table=table, row_id__in=row_ids, count__gt=0
+            ).values_list("row_id", "count")
+        )
 
     def get_example_serializer_field(self) -> Field:
         return serializers.IntegerField(
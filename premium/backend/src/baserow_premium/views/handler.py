@@ -1,7 +1,20 @@
 from collections import defaultdict
-from typing import Dict, Optional, Union
-
-from django.db.models import Count, Q, QuerySet
+from typing import Dict, List, Optional, Union
+
+from django.db import connection
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OrderBy,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber
 
 from baserow.contrib.database.fields.models import SingleSelectField
 from baserow.contrib.database.table.models import GeneratedTableModel
@@ -25,6 +38,10 @@ def get_rows_grouped_by_single_select_field(
     will be fetched. If one or more options have been provided, then only the rows
     for those will be fetched.
 
+    The rows of all the lanes and the count per lane are found in a single query
+    that numbers the rows within every lane with a window function, so the query
+    doesn't grow with the number of select options.
+
     Example:
 
     get_rows_grouped_by_single_select_field(
@@ -52,31 +69,26 @@ def get_rows_grouped_by_single_select_field(
     :return: The fetched rows including the total count.
     """
 
-    table = view.table
-
     if option_settings is None:
         option_settings = {}
 
     if model is None:
-        model = table.get_model()
+        model = view.table.get_model()
 
     if base_queryset is None:
         base_queryset = model.objects.all().enhance_by_fields().order_by("order", "id")
 
     base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
-    all_filters = Q()
-    count_aggregates = {}
-    all_options = list(single_select_field.select_options.all())
-    all_option_ids = [option.id for option in all_options]
-
-    def get_id_and_string(option):
-        return (
-            option.id if option else None,
-            str(option.id) if option else "null",
-        )
+    all_option_ids = list(
+        single_select_field.select_options.values_list("id", flat=True)
+    )
+    field_name = f"field_{single_select_field.id}_id"
 
-    for select_option in [None] + all_options:
-        option_id, option_string = get_id_and_string(select_option)
+    # The settings of every lane that must be fetched keyed by the option id, where
+    # the rows that don't have an existing option belong to the `None` lane.
+    lanes = {}
+    for option_id in [None] + all_option_ids:
+        option_string = "null" if option_id is None else str(option_id)
 
         # If option settings have been provided, we only want to return rows for
         # those options, otherwise we will include all options.
@@ -84,45 +96,119 @@ def get_rows_grouped_by_single_select_field(
             continue
 
         option_setting = option_settings.get(option_string, {})
-        limit = option_setting.get("limit", default_limit)
-        offset = option_setting.get("offset", default_offset)
-
-        if option_id is None:
-            # Somehow the `Count` aggregate doesn't support an empty `__in` lookup.
-            # That's why we always add the `-1` value that never exists to make sure
-            # there is always a value in there.
-            filters = ~Q(
-                **{f"field_{single_select_field.id}_id__in": all_option_ids + [-1]}
+        lanes[option_id] = (
+            option_string,
+            option_setting.get("limit", default_limit),
+            option_setting.get("offset", default_offset),
+        )
+
+    # Rows referencing a select option that doesn't exist anymore belong to the
+    # `None` lane. A `When` with an empty `__in` lookup is skipped by Django.
+    lane_expression = Case(
+        When(**{f"{field_name}__in": all_option_ids}, then=F(field_name)),
+        default=Value(None),
+        output_field=IntegerField(),
+    )
+    lane_queryset = base_option_queryset.annotate(kanban_lane=lane_expression)
+    if len(option_settings) > 0:
+        lane_filter = Q(kanban_lane__in=[i for i in lanes if i is not None])
+        if None in lanes:
+            lane_filter |= Q(kanban_lane__isnull=True)
+        lane_queryset = lane_queryset.filter(lane_filter)
+
+    # Every row is numbered within its lane in the order of the queryset and the
+    # total count of the lane is added, so that the rows of all the lanes and their
+    # counts can be found in a single scan, regardless of the number of options.
+    partition_by = [F("kanban_lane")]
+    lane_queryset = (
+        lane_queryset.annotate(
+            kanban_lane_row_number=Window(
+                expression=RowNumber(),
+                partition_by=partition_by,
+                order_by=_get_window_order_by(base_option_queryset),
+            ),
+            kanban_lane_count=Window(expression=Count("id"), partition_by=partition_by),
+        )
+        .order_by()
+        .values_list("id", "kanban_lane", "kanban_lane_row_number", "kanban_lane_count")
+    )
+
+    # Django can't filter on window functions, so the numbered rows are filtered in
+    # an outer query. The first row of every lane is always included so that the
+    # count of a lane is known, even if its offset exceeds the number of rows.
+    lane_conditions = ["numbered.kanban_lane_row_number = 1"]
+    lane_params = []
+    for option_id, (_, limit, offset) in lanes.items():
+        if len(option_settings) == 0:
+            lane_conditions.append(
+                "numbered.kanban_lane_row_number > %s "
+                "AND numbered.kanban_lane_row_number <= %s"
+            )
+            lane_params += [offset, offset + limit]
+            break
+        elif option_id is None:
+            lane_conditions.append(
+                "numbered.kanban_lane IS NULL "
+                "AND numbered.kanban_lane_row_number > %s "
+                "AND numbered.kanban_lane_row_number <= %s"
             )
+            lane_params += [offset, offset + limit]
         else:
-            filters = Q(**{f"field_{single_select_field.id}_id": option_id})
-
-        # We don't want to execute a single query for each select option,
-        # so we create a subquery that finds the ids of the rows related to the
-        # option group. After the single query has been executed we can group the rows.
-        sub_queryset = base_option_queryset.filter(filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        # Same goes for fetching the total count. We will construct a single query,
-        # that calculates to total amount of rows per option.
-        count_aggregates[option_string] = Count(
-            "pk",
-            filter=filters,
+            lane_conditions.append(
+                "numbered.kanban_lane = %s "
+                "AND numbered.kanban_lane_row_number > %s "
+                "AND numbered.kanban_lane_row_number <= %s"
+            )
+            lane_params += [option_id, offset, offset + limit]
+
+    sql, params = lane_queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT * FROM ({sql}) numbered WHERE "  # nosec B608
+            + " OR ".join(f"({condition})" for condition in lane_conditions)
+            + " ORDER BY numbered.kanban_lane_row_number",
+            [*params, *lane_params],
         )
-
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
+        numbered_rows = cursor.fetchall()
+
+    counts = {}
+    row_ids_per_lane = defaultdict(list)
+    for row_id, option_id, row_number, count in numbered_rows:
+        _, limit, offset = lanes[option_id]
+        counts[option_id] = count
+        if offset < row_number <= offset + limit:
+            row_ids_per_lane[option_id].append(row_id)
+
+    all_row_ids = [i for row_ids in row_ids_per_lane.values() for i in row_ids]
+    rows_by_id = (
+        {row.id: row for row in base_queryset.filter(id__in=all_row_ids)}
+        if all_row_ids
+        else {}
+    )
 
     rows = defaultdict(lambda: {"count": 0, "results": []})
+    for option_id, (option_string, _, _) in lanes.items():
+        rows[option_string]["count"] = counts.get(option_id, 0)
+        rows[option_string]["results"] = [
+            rows_by_id[row_id]
+            for row_id in row_ids_per_lane[option_id]
+            if row_id in rows_by_id
+        ]
 
-    for row in queryset:
-        option_id = getattr(row, f"field_{single_select_field.id}_id")
-        option_string = str(option_id) if option_id in all_option_ids else "null"
-        rows[option_string]["results"].append(row)
+    return rows
 
-    for key, value in counts.items():
-        rows[key]["count"] = value
 
-    return rows
+def _get_window_order_by(queryset: QuerySet) -> List[OrderBy]:
+    """
+    Converts the ordering of the queryset into expressions that can be used to
+    order the rows within a window function.
+    """
+
+    order_by = []
+    for order in queryset.query.order_by or queryset.model._meta.ordering:
+        if isinstance(order, str):
+            descending = order.startswith("-")
+            order = F(order.lstrip("-"))
+            order = order.desc() if descending else order.asc()
+        order_by.append(order)
+    return order_by
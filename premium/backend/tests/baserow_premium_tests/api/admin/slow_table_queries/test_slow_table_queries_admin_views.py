@@ -0,0 +1,82 @@
+import json
+
+from django.shortcuts import reverse
+from django.test.utils import override_settings
+
+import pytest
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_402_PAYMENT_REQUIRED,
+    HTTP_403_FORBIDDEN,
+)
+
+from baserow.contrib.database.slow_queries.handler import SlowTableQueryHandler
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_list_admin_slow_table_queries(api_client, premium_data_fixture):
+    staff_user, staff_token = premium_data_fixture.create_user_and_token(
+        is_staff=True, has_active_premium_license=True
+    )
+    normal_user, normal_token = premium_data_fixture.create_user_and_token(
+        has_active_premium_license=True
+    )
+    table = premium_data_fixture.create_database_table(name="Customers")
+    grid_view = premium_data_fixture.create_grid_view(table=table)
+    slow_query_1 = SlowTableQueryHandler.store(
+        table.id, grid_view.id, "SELECT %s", [1], "SELECT 1", 150.5, "search"
+    )
+    slow_query_2 = SlowTableQueryHandler.store(
+        table.id, None, "SELECT %s", [2], "SELECT 2", 300
+    )
+
+    url = reverse("api:premium:admin:slow_table_queries:list")
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {normal_token}")
+    assert response.status_code == HTTP_403_FORBIDDEN
+
+    response = api_client.get(
+        url, {"sorts": "-duration_ms"}, HTTP_AUTHORIZATION=f"JWT {staff_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["count"] == 2
+    assert [result["id"] for result in response_json["results"]] == [
+        slow_query_2.id,
+        slow_query_1.id,
+    ]
+    result = response_json["results"][1]
+    assert result["table_id"] == table.id
+    assert result["table_name"] == "Customers"
+    assert result["view_id"] == grid_view.id
+    assert result["duration_ms"] == 150.5
+    assert result["sql"] == "SELECT %s"
+    assert result["params"] == [1]
+    assert "actual time=" in result["explain"]
+    assert result["context"] == {
+        "search": "search",
+        "filter_type": "AND",
+        "filters_disabled": False,
+        "filters": [],
+        "sorts": [],
+    }
+
+    response = api_client.get(
+        url,
+        {"filters": json.dumps({"view_id": grid_view.id})},
+        HTTP_AUTHORIZATION=f"JWT {staff_token}",
+    )
+    assert [result["id"] for result in response.json()["results"]] == [slow_query_1.id]
+
+
+@pytest.mark.django_db
+def test_list_admin_slow_table_queries_without_license(
+    api_client, premium_data_fixture
+):
+    staff_user, staff_token = premium_data_fixture.create_user_and_token(is_staff=True)
+
+    response = api_client.get(
+        reverse("api:premium:admin:slow_table_queries:list"),
+        HTTP_AUTHORIZATION=f"JWT {staff_token}",
+    )
+    assert response.status_code == HTTP_402_PAYMENT_REQUIRED
@@ -797,8 +797,8 @@ def test_remove_license(data_fixture):
 
 @pytest.mark.django_db(transaction=True)
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
-def test_add_user_to_license(mock_broadcast_to_users, data_fixture):
+@patch("baserow_premium.license.handler.publish_to_users")
+def test_add_user_to_license(mock_publish_to_users, data_fixture):
     with freeze_time("2021-09-01 12:00"):
         user_1 = data_fixture.create_user()
         user_2 = data_fixture.create_user()
@@ -815,8 +815,8 @@ def test_add_user_to_license(mock_broadcast_to_users, data_fixture):
         assert license_user.user_id == user_1.id
         assert license_user.license_id == license_object.id
 
-        mock_broadcast_to_users.delay.assert_called_once()
-        args = mock_broadcast_to_users.delay.call_args
+        mock_publish_to_users.assert_called_once()
+        args = mock_publish_to_users.call_args
         assert args[0][0] == [user_1.id]
         assert args[0][1]["type"] == "user_data_updated"
         assert args[0][1]["user_data"] == {
@@ -832,8 +832,8 @@ def test_add_user_to_license(mock_broadcast_to_users, data_fixture):
 
 @pytest.mark.django_db(transaction=True)
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
-def test_remove_user_from_license(mock_broadcast_to_users, data_fixture):
+@patch("baserow_premium.license.handler.publish_to_users")
+def test_remove_user_from_license(mock_publish_to_users, data_fixture):
     with freeze_time("2021-09-01 12:00"):
         user_1 = data_fixture.create_user()
         admin_1 = data_fixture.create_user(is_staff=True)
@@ -849,8 +849,8 @@ def test_remove_user_from_license(mock_broadcast_to_users, data_fixture):
 
         assert LicenseUser.objects.all().count() == 0
 
-        mock_broadcast_to_users.delay.assert_called_once()
-        args = mock_broadcast_to_users.delay.call_args
+        mock_publish_to_users.assert_called_once()
+        args = mock_publish_to_users.call_args
         assert args[0][0] == [user_1.id]
         assert args[0][1]["type"] == "user_data_updated"
         assert args[0][1]["user_data"] == {
@@ -860,8 +860,8 @@ def test_remove_user_from_license(mock_broadcast_to_users, data_fixture):
 
 @pytest.mark.django_db(transaction=True)
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
-def test_fill_remaining_seats_in_license(mock_broadcast_to_users, data_fixture):
+@patch("baserow_premium.license.handler.publish_to_users")
+def test_fill_remaining_seats_in_license(mock_publish_to_users, data_fixture):
     with freeze_time("2021-09-01 12:00"):
         user_1 = data_fixture.create_user()
         user_2 = data_fixture.create_user()
@@ -884,8 +884,8 @@ def test_fill_remaining_seats_in_license(mock_broadcast_to_users, data_fixture):
         assert license_users[1].license_id == license_object.id
         assert license_users[1].user_id == user_2.id
 
-        mock_broadcast_to_users.delay.assert_called_once()
-        args = mock_broadcast_to_users.delay.call_args
+        mock_publish_to_users.assert_called_once()
+        args = mock_publish_to_users.call_args
         assert len(args[0][0]) == 1
         assert args[0][0][0] == user_2.id
         assert args[0][1]["type"] == "user_data_updated"
@@ -913,8 +913,8 @@ def test_fill_remaining_seats_in_license(mock_broadcast_to_users, data_fixture):
 
 @pytest.mark.django_db(transaction=True)
 @override_settings(DEBUG=True)
-@patch("baserow_premium.license.handler.broadcast_to_users")
-def test_remove_all_users_from_license(mock_broadcast_to_users, data_fixture):
+@patch("baserow_premium.license.handler.publish_to_users")
+def test_remove_all_users_from_license(mock_publish_to_users, data_fixture):
     with freeze_time("2021-09-01 12:00"):
         user_1 = data_fixture.create_user()
         user_2 = data_fixture.create_user()
@@ -938,8 +938,8 @@ def test_remove_all_users_from_license(mock_broadcast_to_users, data_fixture):
         assert license_users[0].user_id == user_1.id
         assert LicenseUser.objects.all().count() == 1
 
-        mock_broadcast_to_users.delay.assert_called_once()
-        args = mock_broadcast_to_users.delay.call_args
+        mock_publish_to_users.assert_called_once()
+        args = mock_publish_to_users.call_args
         assert len(args[0][0]) == 2
         assert user_1.id in args[0][0]
         assert user_2.id in args[0][0]
@@ -1,14 +1,20 @@
+from io import StringIO
 from unittest.mock import call, patch
 
+from django.core.management import call_command
 from django.test.utils import override_settings
 
 import pytest
 from baserow_premium.license.exceptions import FeaturesNotAvailableError
 from baserow_premium.row_comments.exceptions import InvalidRowCommentException
 from baserow_premium.row_comments.handler import RowCommentHandler
+from baserow_premium.row_comments.models import RowCommentCount
 from freezegun import freeze_time
 
+from baserow.contrib.database.data_versions.handler import TableDataVersionHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.core.trash.handler import TrashHandler
 
 
 @pytest.mark.django_db
@@ -91,3 +97,80 @@ def test_row_comment_created_signal_called(
     args = mock_row_comment_created.call_args
 
     assert args == call(RowHandler, row_comment=c, user=user)
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_row_comment_counts_are_maintained(premium_data_fixture):
+    user = premium_data_fixture.create_user(
+        first_name="Test User", has_active_premium_license=True
+    )
+    table, fields, rows = premium_data_fixture.build_table(
+        columns=[("text", "text")], rows=["first row", "second_row"], user=user
+    )
+    metadata_type = row_metadata_registry.get("row_comment_count")
+
+    RowCommentHandler.create_comment(user, table.id, rows[0].id, "First")
+    RowCommentHandler.create_comment(user, table.id, rows[0].id, "Second")
+    RowCommentHandler.create_comment(user, table.id, rows[1].id, "Third")
+
+    assert metadata_type.generate_metadata_for_rows(
+        table, [rows[0].id, rows[1].id]
+    ) == {rows[0].id: 2, rows[1].id: 1}
+
+    RowCommentHandler.increment_comment_count(table.id, rows[1].id, -1)
+    assert metadata_type.generate_metadata_for_rows(
+        table, [rows[0].id, rows[1].id]
+    ) == {rows[0].id: 2}
+
+    TrashHandler.permanently_delete(rows[0], table.id)
+    assert not RowCommentCount.objects.filter(table=table, row_id=rows[0].id).exists()
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_creating_a_row_comment_changes_the_table_data_version(
+    premium_data_fixture, django_capture_on_commit_callbacks
+):
+    user = premium_data_fixture.create_user(
+        first_name="Test User", has_active_premium_license=True
+    )
+    table, fields, rows = premium_data_fixture.build_table(
+        columns=[("text", "text")], rows=["first row"], user=user
+    )
+    version = TableDataVersionHandler.get_version(table.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowCommentHandler.create_comment(user, table.id, rows[0].id, "First")
+
+    assert TableDataVersionHandler.get_version(table.id) != version
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_rebuild_row_comment_counts(premium_data_fixture):
+    user = premium_data_fixture.create_user(
+        first_name="Test User", has_active_premium_license=True
+    )
+    table, fields, rows = premium_data_fixture.build_table(
+        columns=[("text", "text")], rows=["first row", "second_row"], user=user
+    )
+    other_table, _, other_rows = premium_data_fixture.build_table(
+        columns=[("text", "text")], rows=["first row"], user=user
+    )
+    RowCommentHandler.create_comment(user, table.id, rows[0].id, "First")
+    RowCommentHandler.create_comment(user, table.id, rows[0].id, "Second")
+    RowCommentHandler.create_comment(user, other_table.id, other_rows[0].id, "Third")
+    RowCommentCount.objects.update(count=10)
+    RowCommentCount.objects.create(table=table, row_id=rows[1].id, count=1)
+
+    assert RowCommentHandler.rebuild_comment_counts(table.id) == 1
+    assert dict(
+        RowCommentCount.objects.filter(table=table).values_list("row_id", "count")
+    ) == {rows[0].id: 2}
+    assert RowCommentCount.objects.get(table=other_table).count == 10
+
+    out = StringIO()
+    call_command("rebuild_row_comment_counts", stdout=out)
+    assert out.getvalue() == "Rebuilt the comment counts of 2 row(s).\n"
+    assert RowCommentCount.objects.get(table=other_table).count == 1
@@ -1,6 +1,7 @@
 import pytest
 from baserow_premium.views.handler import get_rows_grouped_by_single_select_field
 
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 
 
@@ -232,3 +233,69 @@ def test_get_rows_grouped_by_single_select_field_with_empty_table(
     assert len(rows) == 1
     assert rows["null"]["count"] == 0
     assert len(rows["null"]["results"]) == 0
+
+
+@pytest.mark.django_db
+def test_get_rows_grouped_by_single_select_field_sorted_lanes(
+    premium_data_fixture, django_assert_num_queries
+):
+    table = premium_data_fixture.create_database_table()
+    view = premium_data_fixture.create_grid_view(table=table)
+    text_field = premium_data_fixture.create_text_field(table=table, primary=True)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    options = [
+        premium_data_fixture.create_select_option(
+            field=single_select_field, value=str(i)
+        )
+        for i in range(20)
+    ]
+    premium_data_fixture.create_view_sort(view=view, field=text_field, order="DESC")
+
+    model = table.get_model()
+    rows_per_option = {
+        option.id: [
+            model.objects.create(
+                **{
+                    f"field_{text_field.id}": f"{option.value} {letter}",
+                    f"field_{single_select_field.id}_id": option.id,
+                }
+            )
+            for letter in "abc"
+        ]
+        for option in options
+    }
+    queryset = ViewHandler().apply_sorting(view, model.objects.all())
+
+    # The number of queries doesn't depend on the number of options.
+    with django_assert_num_queries(4):
+        rows = get_rows_grouped_by_single_select_field(
+            view,
+            single_select_field,
+            default_limit=2,
+            model=model,
+            base_queryset=queryset,
+        )
+
+    assert len(rows) == 21
+    assert rows["null"] == {"count": 0, "results": []}
+    for option in options:
+        lane = rows[str(option.id)]
+        assert lane["count"] == 3
+        assert [row.id for row in lane["results"]] == [
+            rows_per_option[option.id][2].id,
+            rows_per_option[option.id][1].id,
+        ]
+
+    rows = get_rows_grouped_by_single_select_field(
+        view,
+        single_select_field,
+        option_settings={str(options[0].id): {"limit": 2, "offset": 2}},
+        model=model,
+        base_queryset=queryset,
+    )
+
+    assert len(rows) == 1
+    assert rows[str(options[0].id)]["count"] == 3
+    assert [row.id for row in rows[str(options[0].id)]["results"]] == [
+        rows_per_option[options[0].id][0].id
+    ]
@@ -9,8 +9,8 @@ from freezegun import freeze_time
 
 @pytest.mark.django_db(transaction=True)
 @override_settings(DEBUG=True)
-@patch("baserow.ws.registries.broadcast_to_channel_group")
-def test_row_comment_created(mock_broadcast_to_channel_group, premium_data_fixture):
+@patch("baserow.ws.registries.publish_to_channel_group")
+def test_row_comment_created(mock_publish_to_channel_group, premium_data_fixture):
     user = premium_data_fixture.create_user(
         first_name="test_user", has_active_premium_license=True
     )
@@ -21,8 +21,8 @@ def test_row_comment_created(mock_broadcast_to_channel_group, premium_data_fixtu
     with freeze_time("2020-01-02 12:00"):
         c = RowCommentHandler.create_comment(user, table.id, rows[0].id, "comment")
 
-    mock_broadcast_to_channel_group.delay.assert_called_once()
-    args = mock_broadcast_to_channel_group.delay.call_args
+    mock_publish_to_channel_group.assert_called_once()
+    args = mock_publish_to_channel_group.call_args
 
     assert args[0][0] == f"table-{table.id}"
     assert args[0][1]["type"] == "row_comment_created"
@@ -195,6 +195,16 @@ export class RealTimeHandler {
       this.authenticationSuccess = data.success
     })
 
+    // Pages that receive many events in a short time can send them in one batch. The
+    // events are handled one after the other in the order in which they happened.
+    this.registerEvent('batch', async (context, data) => {
+      for (const payload of data.payloads) {
+        if (Object.prototype.hasOwnProperty.call(this.events, payload.type)) {
+          await this.events[payload.type](context, payload)
+        }
+      }
+    })
+
     this.registerEvent('user_data_updated', ({ store }, data) => {
       store.dispatch('auth/forceUpdateUserData', data.user_data)
     })
@@ -313,6 +323,13 @@ export class RealTimeHandler {
         })
       }
     })
+
+    this.registerEvent('job_updated', ({ store }, data) => {
+      const job = store.getters['job/get'](data.job.id)
+      if (job !== undefined) {
+        store.dispatch('job/forceUpdate', { job, data: data.job })
+      }
+    })
   }
 }
 
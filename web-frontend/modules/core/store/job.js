@@ -46,12 +46,12 @@ export const mutations = {
       state.items.splice(index, 1)
     }
   },
-  COMPUTE_NEXT_TIMEOUT_MS(state, unfinishedJobIds) {
+  COMPUTE_NEXT_TIMEOUT_MS(state, { unfinishedJobIds, realtimeConnected }) {
     const newJobsToUpdate = !_.isEqual(unfinishedJobIds, state.lastUpdateJobIds)
     const maxTimeout = this.$env.BASEROW_FRONTEND_JOBS_POLLING_TIMEOUT_MS
-    if (unfinishedJobIds.length === 0) {
-      // no unfinished jobs to update, so we can relax the refresh until
-      // a new job is added.
+    if (unfinishedJobIds.length === 0 || realtimeConnected) {
+      // no unfinished jobs to update or the progress is pushed via the real time
+      // connection, so we can relax the refresh until a new job is added.
       state.nextTimeoutInMs = maxTimeout
     } else if (newJobsToUpdate) {
       // we want to update quickly the UI for new jobs because they can
@@ -104,7 +104,10 @@ export const actions = {
     const unfinishedJobIds = unfinishedJobs
       ? unfinishedJobs.map((job) => job.id)
       : []
-    commit('COMPUTE_NEXT_TIMEOUT_MS', unfinishedJobIds)
+    commit('COMPUTE_NEXT_TIMEOUT_MS', {
+      unfinishedJobIds,
+      realtimeConnected: Boolean(this.$realtime && this.$realtime.connected),
+    })
     const nextTimeoutInMs = state.nextTimeoutInMs
     // too many attempts for the same pending jobs, stop polling
     // at least until a new pending job is added